@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the MJPEG passthrough of `OpenCVCamera` against the decoding of the frames by the backend.
+
+A synthetic camera frame of the capture resolution is compressed to JPEG, as an MJPEG camera does. Without
+passthrough, the backend decodes it at full resolution, then `OpenCVCamera` resizes it to the output
+resolution and converts it to RGB. With `mjpeg_passthrough`, the camera decodes it at a reduced scale, then
+resizes and converts the smaller frame. Reports the time per frame of both, and the mean absolute difference
+between their frames.
+
+Example:
+```bash
+python benchmarks/cameras/benchmark_mjpeg_decode.py --capture-size 1920 1080 --output-size 224 224 640 360
+```
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+
+
+def make_jpeg(width: int, height: int, seed: int) -> np.ndarray:
+    """Smooth image with some noise, which compresses like a camera frame rather than like pure noise."""
+    rng = np.random.default_rng(seed)
+    small = rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8)
+    frame = cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC)
+    noise = rng.integers(-8, 8, frame.shape, dtype=np.int16)
+    frame = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    _, jpeg = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
+    return jpeg
+
+
+def time_per_frame(fn, num_frames: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_frames):
+        fn()
+    return (time.perf_counter() - start) / num_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--capture-size", type=int, nargs=2, default=[1920, 1080], metavar=("W", "H"))
+    parser.add_argument(
+        "--output-size", type=int, nargs="+", default=[224, 224, 640, 360, 1920, 1080], metavar="W H"
+    )
+    parser.add_argument("--num-frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    capture_w, capture_h = args.capture_size
+    jpeg = make_jpeg(capture_w, capture_h, args.seed)
+    print(f"{capture_w}x{capture_h} JPEG of {jpeg.nbytes / 1e3:.0f} kB (ms/frame):")
+    for output_w, output_h in zip(args.output_size[::2], args.output_size[1::2], strict=True):
+        config = OpenCVCameraConfig(
+            index_or_path=0,
+            width=output_w,
+            height=output_h,
+            capture_width=capture_w,
+            capture_height=capture_h,
+            mjpeg_passthrough=True,
+        )
+        camera = OpenCVCamera(config)
+
+        def decoded_by_backend(camera=camera):
+            return camera._postprocess_image(cv2.imdecode(jpeg, cv2.IMREAD_COLOR))
+
+        def passthrough(camera=camera):
+            return camera._postprocess_image(camera._decode_jpeg(jpeg))
+
+        difference = np.abs(decoded_by_backend().astype(np.int16) - passthrough()).mean()
+        print(
+            f"  -> {output_w}x{output_h}: decoded by backend {1e3 * time_per_frame(decoded_by_backend, args.num_frames):6.2f}"
+            f"  passthrough {1e3 * time_per_frame(passthrough, args.num_frames):6.2f}"
+            f"  mean abs difference {difference:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the post-processing of the frames of `OpenCVCamera`, with and without a pool of frames.
+
+Post-processes synthetic BGR frames of the capture resolution (color conversion to RGB, rotation, resizing to
+the output resolution when it differs) as `OpenCVCamera.read` does, into new arrays or into a pool of
+preallocated frames (`num_buffers`), checks that both give the same frames, and reports the time per frame
+and the peak memory allocated while post-processing. No camera is needed.
+
+Example:
+```bash
+python benchmarks/cameras/benchmark_opencv_postprocess.py --capture-size 1920 1080 --output-size 640 360
+```
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from lerobot.cameras.configs import Cv2Rotation
+from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+
+
+def benchmark(camera: OpenCVCamera, frames: list[np.ndarray], num_frames: int) -> tuple[float, float]:
+    """Mean time per frame, and peak memory allocated over all frames."""
+    # Warm up, which allocates the pool
+    for frame in frames:
+        camera._postprocess_image(frame)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(num_frames):
+        camera._postprocess_image(frames[i % len(frames)])
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / num_frames, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--capture-size", type=int, nargs=2, default=[1920, 1080], metavar=("W", "H"))
+    parser.add_argument("--output-size", type=int, nargs=2, default=None, metavar=("W", "H"))
+    parser.add_argument("--rotation", type=int, default=0, choices=[r.value for r in Cv2Rotation])
+    parser.add_argument("--num-buffers", type=int, default=4)
+    parser.add_argument("--num-frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    capture_w, capture_h = args.capture_size
+    output_w, output_h = args.output_size or args.capture_size
+    rotation = Cv2Rotation(args.rotation)
+    if rotation in (Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_270):
+        output_w, output_h = output_h, output_w
+
+    rng = np.random.default_rng(args.seed)
+    frames = [rng.integers(0, 256, (capture_h, capture_w, 3), dtype=np.uint8) for _ in range(4)]
+
+    results = {}
+    for num_buffers in [0, args.num_buffers]:
+        config = OpenCVCameraConfig(
+            index_or_path=0,
+            width=output_w,
+            height=output_h,
+            rotation=rotation,
+            capture_width=capture_w,
+            capture_height=capture_h,
+            num_buffers=num_buffers,
+        )
+        camera = OpenCVCamera(config)
+        results[num_buffers] = benchmark(camera, frames, args.num_frames)
+        reference = OpenCVCamera(OpenCVCameraConfig(**{**vars(config), "num_buffers": 0}))
+        assert np.array_equal(camera._postprocess_image(frames[0]), reference._postprocess_image(frames[0]))
+
+    print(f"{capture_w}x{capture_h} -> {output_w}x{output_h}, rotation {rotation.value}:")
+    for num_buffers, (time_per_frame, allocated) in results.items():
+        print(
+            f"  num_buffers={num_buffers:<3} {1e3 * time_per_frame:6.2f} ms/frame  "
+            f"peak allocation {allocated / 1e6:8.2f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the wire formats of the ZMQ image streams over a loopback TCP connection.
+
+Streams messages of synthetic camera frames, as sent by `ImageServer` and `LeKiwiHost`, from a sender thread
+to a receiver which decodes every image, in the former JSON format (base64 JPEGs) and in the binary format
+(JPEG or raw pixels). Reports the message size, the frame rate, and the CPU time per message of the sender
+and of the receiver.
+
+Example:
+```bash
+python benchmarks/cameras/benchmark_zmq_wire_format.py --num-cameras 2 --height 480 --width 640
+```
+"""
+
+import argparse
+import base64
+import json
+import threading
+import time
+
+import cv2
+import numpy as np
+import zmq
+
+from lerobot.cameras.zmq.protocol import decode_message, encode_frame, encode_message
+
+
+def make_frames(num_cameras: int, height: int, width: int, seed: int) -> dict[str, np.ndarray]:
+    """Smooth images with some noise, which compress like camera frames rather than like pure noise."""
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for i in range(num_cameras):
+        small = rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8)
+        frame = cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC)
+        noise = rng.integers(-8, 8, frame.shape, dtype=np.int16)
+        frames[f"camera_{i}"] = np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    return frames
+
+
+def encode_json(frames: dict[str, np.ndarray], quality: int) -> bytes:
+    timestamps = dict.fromkeys(frames, time.time())
+    # As `ImageServer` does for the JSON wire format
+    images = {
+        name: base64.b64encode(encode_frame(name, frame, "jpeg", quality)[1]).decode("utf-8")
+        for name, frame in frames.items()
+    }
+    return json.dumps({"timestamps": timestamps, "images": images}).encode("utf-8")
+
+
+def decode_json(message: bytes) -> dict[str, np.ndarray]:
+    images = json.loads(bytes(message))["images"]
+    return {
+        name: cv2.imdecode(np.frombuffer(base64.b64decode(image), np.uint8), cv2.IMREAD_COLOR)
+        for name, image in images.items()
+    }
+
+
+def benchmark(
+    encode_fn, decode_fn, frames: dict[str, np.ndarray], num_messages: int, port: int
+) -> dict[str, float]:
+    context = zmq.Context()
+    receiver = context.socket(zmq.PULL)
+    receiver.bind(f"tcp://127.0.0.1:{port}")
+    sender = context.socket(zmq.PUSH)
+    sender.connect(f"tcp://127.0.0.1:{port}")
+
+    sender_cpu = {}
+
+    def send():
+        start = time.thread_time()
+        for _ in range(num_messages):
+            sender.send(encode_fn(frames), copy=False)
+        sender_cpu["s"] = time.thread_time() - start
+
+    size = len(encode_fn(frames))
+    thread = threading.Thread(target=send)
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+    thread.start()
+    for _ in range(num_messages):
+        images = decode_fn(receiver.recv(copy=False).buffer)
+        assert all(images[name].shape == frame.shape for name, frame in frames.items())
+    receiver_cpu_s = time.thread_time() - cpu_start
+    elapsed = time.perf_counter() - start
+    thread.join()
+
+    sender.close()
+    receiver.close()
+    context.term()
+    return {
+        "size_kb": size / 1e3,
+        "fps": num_messages / elapsed,
+        "sender_ms": 1e3 * sender_cpu["s"] / num_messages,
+        "receiver_ms": 1e3 * receiver_cpu_s / num_messages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-cameras", type=int, default=2)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--num-messages", type=int, default=300)
+    parser.add_argument("--quality", type=int, default=80)
+    parser.add_argument("--port", type=int, default=5599)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = make_frames(args.num_cameras, args.height, args.width, args.seed)
+    cases = {
+        "json (base64 jpeg)": (
+            lambda frames: encode_json(frames, args.quality),
+            decode_json,
+        ),
+        "binary jpeg": (
+            lambda frames: encode_message(
+                {"timestamps": dict.fromkeys(frames, time.time())}, frames, "jpeg", args.quality
+            ),
+            lambda message: decode_message(message)[1],
+        ),
+        "binary raw": (
+            lambda frames: encode_message({"timestamps": dict.fromkeys(frames, time.time())}, frames, "raw"),
+            lambda message: decode_message(message)[1],
+        ),
+    }
+    print(f"{args.num_cameras} x {args.width}x{args.height} frames per message:")
+    print(f"  {'':<20} {'size (kB)':>10} {'fps':>8} {'sender CPU (ms)':>16} {'receiver CPU (ms)':>18}")
+    for name, (encode_fn, decode_fn) in cases.items():
+        result = benchmark(encode_fn, decode_fn, frames, args.num_messages, args.port)
+        print(
+            f"  {name:<20} {result['size_kb']:10.1f} {result['fps']:8.1f} "
+            f"{result['sender_ms']:16.2f} {result['receiver_ms']:18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
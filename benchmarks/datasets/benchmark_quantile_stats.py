@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark `RunningQuantileStats` and the aggregation of per-episode quantiles.
+
+Compares the vectorized histograms against per-dimension `np.histogram` loops, and the quantiles
+aggregated from merged per-episode sketches against count-weighted quantile averaging, using
+`np.quantile` over all the data as the reference.
+
+Example:
+```bash
+python benchmarks/datasets/benchmark_quantile_stats.py --dims 32 1000 --num-episodes 50
+```
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lerobot.datasets.compute_stats import RunningQuantileStats, aggregate_stats, get_feature_stats
+
+
+class PerDimensionQuantileStats(RunningQuantileStats):
+    """Reference implementation rebinning, updating and reading the histograms one dimension at a time."""
+
+    def _adjust_histograms(self):
+        for i in range(len(self._histograms)):
+            old_edges = self._bin_edges[i].copy()
+            old_hist = self._histograms[i].copy()
+            padding = (self._max[i] - self._min[i]) * 1e-10
+            self._bin_edges[i] = np.linspace(
+                self._min[i] - padding, self._max[i] + padding, self._num_quantile_bins + 1
+            )
+            old_centers = (old_edges[:-1] + old_edges[1:]) / 2
+            self._histograms[i] = 0
+            for old_center, count in zip(old_centers, old_hist, strict=False):
+                if count > 0:
+                    bin_idx = np.searchsorted(self._bin_edges[i], old_center) - 1
+                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
+                    self._histograms[i, bin_idx] += count
+
+    def _update_histograms(self, batch: np.ndarray) -> None:
+        for i in range(batch.shape[1]):
+            hist, _ = np.histogram(batch[:, i], bins=self._bin_edges[i])
+            self._histograms[i] += hist
+
+    def _compute_quantiles(self) -> list[np.ndarray]:
+        results = []
+        for q in self._quantile_list:
+            target_count = q * self._count
+            q_values = []
+            for hist, edges in zip(self._histograms, self._bin_edges, strict=True):
+                cumsum = np.cumsum(hist)
+                idx = np.searchsorted(cumsum, target_count)
+                if idx == 0:
+                    q_values.append(edges[0])
+                elif idx >= len(cumsum):
+                    q_values.append(edges[-1])
+                else:
+                    count_before = cumsum[idx - 1]
+                    count_in_bin = cumsum[idx] - count_before
+                    fraction = (target_count - count_before) / count_in_bin if count_in_bin else 0.0
+                    q_values.append(edges[idx] + fraction * (edges[idx + 1] - edges[idx]))
+            results.append(np.array(q_values))
+        return results
+
+
+def make_episodes(num_episodes: int, episode_length: int, dim: int, seed: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # Episodes with different offsets and scales, so their quantiles differ
+    return [
+        rng.normal(loc=rng.uniform(-2, 2, dim), scale=rng.uniform(0.5, 2, dim), size=(episode_length, dim))
+        for _ in range(num_episodes)
+    ]
+
+
+def time_running_stats(cls: type[RunningQuantileStats], episodes: list[np.ndarray]) -> float:
+    start = time.perf_counter()
+    running_stats = cls()
+    for episode in episodes:
+        running_stats.update(episode)
+    running_stats.get_statistics()
+    return time.perf_counter() - start
+
+
+def quantile_errors(episodes: list[np.ndarray]) -> tuple[float, float]:
+    """Max absolute error of the aggregated q01..q99 against np.quantile, without and with sketches."""
+    stats_list, sketches_list = [], []
+    for episode in episodes:
+        stats, sketch = get_feature_stats(episode, axis=0, keepdims=False, return_sketch=True)
+        stats_list.append({"feature": stats})
+        sketches_list.append({"feature": sketch})
+
+    data = np.concatenate(episodes)
+    averaged = aggregate_stats(stats_list)["feature"]
+    merged = aggregate_stats(stats_list, sketches_list)["feature"]
+
+    errors = []
+    for aggregated in (averaged, merged):
+        errors.append(
+            max(
+                np.abs(aggregated[key] - np.quantile(data, int(key[1:]) / 100, axis=0)).max()
+                for key in ("q01", "q10", "q50", "q90", "q99")
+            )
+        )
+    return errors[0], errors[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--dims", type=int, nargs="+", default=[32, 1000])
+    parser.add_argument("--num-episodes", type=int, default=50)
+    parser.add_argument("--episode-length", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for dim in args.dims:
+        episodes = make_episodes(args.num_episodes, args.episode_length, dim, args.seed)
+        loop_s = time_running_stats(PerDimensionQuantileStats, episodes)
+        vectorized_s = time_running_stats(RunningQuantileStats, episodes)
+        averaged_error, merged_error = quantile_errors(episodes)
+        print(
+            f"dim={dim:5d}  per-dimension: {loop_s:7.3f}s  vectorized: {vectorized_s:7.3f}s  "
+            f"speedup: {loop_s / vectorized_s:5.1f}x  |  quantile error averaged: {averaged_error:.4f}  "
+            f"merged sketches: {merged_error:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
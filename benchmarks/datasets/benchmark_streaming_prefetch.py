@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the read-ahead of `StreamingLeRobotDataset` against sequential iteration.
+
+Without `--root`, shards are simulated with a fixed latency per Arrow row read (e.g. a remote file store)
+and per video decode, to measure the overlap obtained by `StreamingPrefetcher`. With `--root`, a local
+dataset is streamed with and without prefetching.
+
+Example:
+```bash
+python benchmarks/datasets/benchmark_streaming_prefetch.py --read-latency-ms 2 --decode-latency-ms 5
+python benchmarks/datasets/benchmark_streaming_prefetch.py --repo-id lerobot/pusht --root /path/to/pusht
+```
+"""
+
+import argparse
+import time
+from collections.abc import Iterator
+
+import numpy as np
+
+from lerobot.datasets.streaming_dataset import StreamingLeRobotDataset
+from lerobot.datasets.streaming_prefetch import StreamingPrefetcher
+
+
+def make_shards(num_shards: int, frames_per_shard: int) -> dict[int, Iterator[int]]:
+    return {
+        key: iter(range(key * frames_per_shard, (key + 1) * frames_per_shard)) for key in range(num_shards)
+    }
+
+
+def benchmark_simulated(args: argparse.Namespace) -> None:
+    def read_fn(shard):
+        time.sleep(args.read_latency_ms / 1e3)
+        return next(shard)
+
+    def decode_fn(index, decoder_cache):
+        time.sleep(args.decode_latency_ms / 1e3)
+        return {"index": index}
+
+    num_frames = args.num_shards * args.frames_per_shard
+    start = time.perf_counter()
+    for shard in make_shards(args.num_shards, args.frames_per_shard).values():
+        for _ in range(args.frames_per_shard):
+            decode_fn(read_fn(shard), None)
+    sequential_s = time.perf_counter() - start
+    print(f"sequential: {num_frames / sequential_s:8.1f} frames/s")
+
+    for num_active_shards in args.num_prefetch_shards:
+        prefetcher = StreamingPrefetcher(
+            make_shards(args.num_shards, args.frames_per_shard),
+            read_fn=read_fn,
+            decode_fn=decode_fn,
+            rng=np.random.default_rng(args.seed),
+            num_active_shards=num_active_shards,
+            num_decode_threads=args.num_decode_threads,
+            window=args.window,
+        )
+        indices = [frame["index"] for frame in prefetcher]
+        assert sorted(indices) == list(range(num_frames))
+        summary = prefetcher.stats.summary()
+        print(
+            f"prefetch shards={num_active_shards:2d}: {summary['frames_per_s']:8.1f} frames/s  "
+            f"speedup: {summary['frames_per_s'] * sequential_s / num_frames:5.1f}x  "
+            f"wait: {summary['wait_ms_per_frame']:.2f} ms/frame  latency: {summary['latency_ms']:.1f} ms"
+        )
+
+
+def benchmark_dataset(args: argparse.Namespace) -> None:
+    for num_prefetch_shards in [0, *args.num_prefetch_shards]:
+        dataset = StreamingLeRobotDataset(
+            args.repo_id,
+            root=args.root,
+            max_num_shards=args.num_shards,
+            num_prefetch_shards=num_prefetch_shards,
+            num_decode_threads=args.num_decode_threads,
+            prefetch_window=args.window,
+        )
+        start = time.perf_counter()
+        for num_frames, _ in enumerate(dataset, start=1):
+            if num_frames == args.max_frames:
+                break
+        elapsed = time.perf_counter() - start
+        print(f"prefetch shards={num_prefetch_shards:2d}: {num_frames / elapsed:8.1f} frames/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repo-id", type=str, default=None)
+    parser.add_argument("--root", type=str, default=None)
+    parser.add_argument("--max-frames", type=int, default=2000)
+    parser.add_argument("--num-shards", type=int, default=16)
+    parser.add_argument("--frames-per-shard", type=int, default=50)
+    parser.add_argument("--num-prefetch-shards", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--num-decode-threads", type=int, default=8)
+    parser.add_argument("--window", type=int, default=32)
+    parser.add_argument("--read-latency-ms", type=float, default=2.0)
+    parser.add_argument("--decode-latency-ms", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.root is not None:
+        benchmark_dataset(args)
+    else:
+        benchmark_simulated(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark of the value conversions of `SerialMotorsBus`, per call, on a full bus.
+
+Compares the former per-motor conversions, which looked up the calibration and encoding of every motor at
+every call (kept below as reference), with the conversions of the bus on precomputed tables, through its
+dict API and its vectorized array API, and checks that they all give the same values. No motor SDK is
+needed, as no packet is sent.
+
+Example:
+```bash
+python benchmarks/motors/benchmark_conversions.py --num-motors 6 12 --num-calls 20000
+```
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from lerobot.motors import Motor, MotorCalibration, MotorNormMode
+from lerobot.motors.dynamixel import DynamixelMotorsBus
+from lerobot.motors.encoding_utils import (
+    decode_sign_magnitude,
+    decode_twos_complement,
+    encode_sign_magnitude,
+    encode_twos_complement,
+)
+from lerobot.motors.feetech import FeetechMotorsBus
+from lerobot.motors.motors_bus import SerialMotorsBus
+
+NORM_MODES = [MotorNormMode.RANGE_M100_100, MotorNormMode.RANGE_0_100, MotorNormMode.DEGREES]
+
+
+def make_bus(bus_cls: type[SerialMotorsBus], model: str, num_motors: int) -> SerialMotorsBus:
+    motors = {f"motor_{i}": Motor(i + 1, model, NORM_MODES[i % len(NORM_MODES)]) for i in range(num_motors)}
+    calibration = {
+        name: MotorCalibration(
+            id=motor.id, drive_mode=i % 2, homing_offset=0, range_min=500 + 10 * i, range_max=3500 - 10 * i
+        )
+        for i, (name, motor) in enumerate(motors.items())
+    }
+    bus = bus_cls.__new__(bus_cls)
+    # The SDK is not needed by the conversions
+    SerialMotorsBus.__init__(bus, "/dev/null", motors, calibration)
+    bus.protocol_version = 0 if bus_cls is FeetechMotorsBus else 2.0
+    return bus
+
+
+def reference_normalize(bus: SerialMotorsBus, ids_values: dict[int, int]) -> dict[int, float]:
+    normalized_values = {}
+    for id_, val in ids_values.items():
+        motor = bus._id_to_name(id_)
+        min_ = bus.calibration[motor].range_min
+        max_ = bus.calibration[motor].range_max
+        drive_mode = bus.apply_drive_mode and bus.calibration[motor].drive_mode
+        bounded_val = min(max_, max(min_, val))
+        if bus.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
+            normalized_values[id_] = -norm if drive_mode else norm
+        elif bus.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            norm = ((bounded_val - min_) / (max_ - min_)) * 100
+            normalized_values[id_] = 100 - norm if drive_mode else norm
+        else:
+            mid = (min_ + max_) / 2
+            max_res = bus.model_resolution_table[bus._id_to_model(id_)] - 1
+            normalized_values[id_] = (val - mid) * 360 / max_res
+    return normalized_values
+
+
+def reference_unnormalize(bus: SerialMotorsBus, ids_values: dict[int, float]) -> dict[int, int]:
+    unnormalized_values = {}
+    for id_, val in ids_values.items():
+        motor = bus._id_to_name(id_)
+        min_ = bus.calibration[motor].range_min
+        max_ = bus.calibration[motor].range_max
+        drive_mode = bus.apply_drive_mode and bus.calibration[motor].drive_mode
+        if bus.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            val = -val if drive_mode else val
+            bounded_val = min(100.0, max(-100.0, val))
+            unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
+        elif bus.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            val = 100 - val if drive_mode else val
+            bounded_val = min(100.0, max(0.0, val))
+            unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
+        else:
+            mid = (min_ + max_) / 2
+            max_res = bus.model_resolution_table[bus._id_to_model(id_)] - 1
+            unnormalized_values[id_] = int((val * max_res / 360) + mid)
+    return unnormalized_values
+
+
+def reference_sign(bus: SerialMotorsBus, data_name: str, ids_values: dict[int, int], encode: bool):
+    if isinstance(bus, FeetechMotorsBus):
+        fn = encode_sign_magnitude if encode else decode_sign_magnitude
+    else:
+        fn = encode_twos_complement if encode else decode_twos_complement
+    values = {}
+    for id_, value in ids_values.items():
+        encoding_table = bus.model_encoding_table.get(bus._id_to_model(id_))
+        values[id_] = fn(value, encoding_table[data_name])
+    return values
+
+
+def benchmark(bus: SerialMotorsBus, num_calls: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    ids = tuple(bus.ids)
+    raw = {id_: int(v) for id_, v in zip(ids, rng.integers(0, 4096, len(ids)), strict=True)}
+    signed = {id_: int(v) for id_, v in zip(ids, rng.integers(-2000, 2000, len(ids)), strict=True)}
+    normalized = reference_normalize(bus, raw)
+    encoded = reference_sign(bus, "Present_Position", signed, encode=True)
+
+    raw_array = np.array(list(raw.values()), dtype=np.int64)
+    normalized_array = np.array(list(normalized.values()))
+    signed_array = np.array(list(signed.values()), dtype=np.int64)
+    encoded_array = np.array(list(encoded.values()), dtype=np.int64)
+
+    assert bus._normalize(raw) == normalized
+    assert bus._unnormalize(normalized) == reference_unnormalize(bus, normalized)
+    assert bus._encode_sign("Present_Position", dict(signed)) == encoded
+    assert bus._decode_sign("Present_Position", dict(encoded)) == signed
+    assert bus._normalize_array(ids, raw_array).tolist() == list(normalized.values())
+    assert bus._unnormalize_array(ids, normalized_array).tolist() == list(
+        reference_unnormalize(bus, normalized).values()
+    )
+    assert bus._encode_sign_array("Present_Position", ids, signed_array).tolist() == list(encoded.values())
+    assert bus._decode_sign_array("Present_Position", ids, encoded_array).tolist() == list(signed.values())
+
+    cases = {
+        "normalize": (
+            lambda: reference_normalize(bus, raw),
+            lambda: bus._normalize(raw),
+            lambda: bus._normalize_array(ids, raw_array),
+        ),
+        "unnormalize": (
+            lambda: reference_unnormalize(bus, normalized),
+            lambda: bus._unnormalize(normalized),
+            lambda: bus._unnormalize_array(ids, normalized_array),
+        ),
+        "encode_sign": (
+            lambda: reference_sign(bus, "Present_Position", signed, encode=True),
+            lambda: bus._encode_sign("Present_Position", dict(signed)),
+            lambda: bus._encode_sign_array("Present_Position", ids, signed_array),
+        ),
+        "decode_sign": (
+            lambda: reference_sign(bus, "Present_Position", encoded, encode=False),
+            lambda: bus._decode_sign("Present_Position", dict(encoded)),
+            lambda: bus._decode_sign_array("Present_Position", ids, encoded_array),
+        ),
+    }
+    print(f"{bus.__class__.__name__}, {len(ids)} motors (us/call):")
+    print(f"  {'':<12} {'reference':>10} {'dict':>10} {'array':>10}")
+    for name, fns in cases.items():
+        timings = [1e6 * min(timeit.repeat(fn, number=num_calls, repeat=3)) / num_calls for fn in fns]
+        print(f"  {name:<12} " + " ".join(f"{t:10.2f}" for t in timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-motors", type=int, nargs="+", default=[6, 12])
+    parser.add_argument("--num-calls", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for num_motors in args.num_motors:
+        benchmark(make_bus(FeetechMotorsBus, "sts3215", num_motors), args.num_calls, args.seed)
+        benchmark(make_bus(DynamixelMotorsBus, "xl330-m288", num_motors), args.num_calls, args.seed)
+
+
+if __name__ == "__main__":
+    main()
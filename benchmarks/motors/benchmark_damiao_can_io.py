@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the control loop of `DamiaoMotorsBus`, with synchronous and asynchronous CAN I/O.
+
+The motors are simulated on a python-can virtual bus: every frame sent to a motor is answered with its state
+frame after `--response-delay-us`, with the last commanded position. A control step writes the goal positions
+then reads the states of all motors. With `async_io`, the write does not wait for the responses, and the read
+uses the states they carry when they are at most one period old (`max_age_s`).
+
+Requires python-can (`pip install -e ".[damiao]"`).
+
+Example:
+```bash
+python benchmarks/motors/benchmark_damiao_can_io.py --num-motors 8 --response-delay-us 200 --fps 200
+```
+"""
+
+import argparse
+import threading
+import time
+
+import can
+import numpy as np
+
+from lerobot.motors import Motor, MotorNormMode
+from lerobot.motors.damiao import CAN_CMD_REFRESH, CAN_PARAM_ID, DamiaoMotorsBus
+
+CHANNEL = "lerobot-damiao-benchmark"
+RECV_ID_OFFSET = 0x10
+
+
+class SimulatedMotors(threading.Thread):
+    """Answers every frame sent to a motor with its state frame, on its own end of the virtual bus."""
+
+    def __init__(self, motor_ids: list[int], response_delay_s: float):
+        super().__init__(daemon=True)
+        self.motor_ids = set(motor_ids)
+        self.response_delay_s = response_delay_s
+        # Encoded position of every motor, at the middle of the range
+        self.positions = dict.fromkeys(motor_ids, 1 << 15)
+        self.bus = can.Bus(interface="virtual", channel=CHANNEL)
+        self.stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self.stop_event.is_set():
+            msg = self.bus.recv(timeout=0.1)
+            if msg is None:
+                continue
+            if msg.arbitration_id == CAN_PARAM_ID and msg.data[2] == CAN_CMD_REFRESH:
+                motor_id = msg.data[0] | (msg.data[1] << 8)
+            elif msg.arbitration_id in self.motor_ids:
+                motor_id = msg.arbitration_id
+                if any(byte != 0xFF for byte in msg.data[:7]):
+                    # MIT control frame
+                    self.positions[motor_id] = (msg.data[0] << 8) | msg.data[1]
+            else:
+                continue
+
+            # Sleep rather than spin, not to hold the GIL against the bus under test
+            time.sleep(self.response_delay_s)
+            position = self.positions[motor_id]
+            data = [motor_id, position >> 8, position & 0xFF, 0x7F, 0xF7, 0xFF, 30, 30]
+            self.bus.send(
+                can.Message(arbitration_id=motor_id + RECV_ID_OFFSET, data=data, is_extended_id=False)
+            )
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.join()
+        self.bus.shutdown()
+
+
+def run_control_loop(bus: DamiaoMotorsBus, num_steps: int, fps: float) -> tuple[np.ndarray, float]:
+    """Run the control loop, and return the I/O time of every step and the final position error."""
+    period = 1 / fps
+    io_times = []
+    goal = {}
+    for step in range(num_steps):
+        start = time.perf_counter()
+        goal = {motor: 10.0 * np.sin(step * period + i) for i, motor in enumerate(bus.motors)}
+        bus.sync_write("Goal_Position", goal)
+        bus.sync_read_all_states(max_age_s=period if bus.async_io else None)
+        io_times.append(time.perf_counter() - start)
+        time.sleep(max(period - (time.perf_counter() - start), 0.0))
+
+    # Let the last responses come back before checking the final positions
+    time.sleep(0.01)
+    states = bus.sync_read_all_states()
+    error = max(abs(states[motor]["position"] - goal[motor]) for motor in bus.motors)
+    return np.array(io_times), error
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-motors", type=int, default=8)
+    parser.add_argument("--num-steps", type=int, default=1000)
+    parser.add_argument("--fps", type=float, default=200.0)
+    parser.add_argument("--response-delay-us", type=float, default=200.0)
+    args = parser.parse_args()
+
+    motor_ids = list(range(1, args.num_motors + 1))
+    motors = {
+        f"joint_{id_}": Motor(id_, "dm4310", MotorNormMode.DEGREES, "dm4310", id_ + RECV_ID_OFFSET)
+        for id_ in motor_ids
+    }
+    simulated_motors = SimulatedMotors(motor_ids, args.response_delay_us / 1e6)
+    simulated_motors.start()
+    try:
+        for async_io in [False, True]:
+            bus = DamiaoMotorsBus(CHANNEL, motors, can_interface="virtual", async_io=async_io)
+            # The handshake waits 1 ms per motor, which the simulated motors do not always meet
+            bus.connect(handshake=False)
+            io_times, error = run_control_loop(bus, args.num_steps, args.fps)
+            bus.disconnect()
+            print(
+                f"async_io={async_io!s:<5}  I/O per step: mean {1e3 * io_times.mean():.2f} ms  "
+                f"p99 {1e3 * np.percentile(io_times, 99):.2f} ms  max {1e3 * io_times.max():.2f} ms  "
+                f"final position error: {error:.3f} deg"
+            )
+    finally:
+        simulated_motors.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the sync reads of `SerialMotorsBus`: plain, pipelined, and fused reads of adjacent registers.
+
+The serial port is simulated: a sync read request and the response of every motor take the time needed to
+send their bytes at the given baud rate (10 bits per byte), plus the return delay of every motor and the
+latency of the USB-serial adapter. `--work-ms` of host work (e.g. a policy step) is done between reads, which
+the transmit-ahead of pipelined reads overlaps with the response of the motors.
+
+Example:
+```bash
+python benchmarks/motors/benchmark_sync_read.py --baudrate 1000000 --usb-latency-ms 1 --work-ms 2
+```
+"""
+
+import argparse
+import time
+
+from lerobot.motors import Motor, MotorNormMode
+from lerobot.motors.feetech import FeetechMotorsBus
+from lerobot.motors.motors_bus import SerialMotorsBus
+
+COMM_SUCCESS = 0
+COMM_RX_TIMEOUT = -3001
+# Header, id, length, instruction, start address, data length and checksum of a sync read request
+REQUEST_OVERHEAD = 8
+# Header, id, length, error and checksum of a status packet
+RESPONSE_OVERHEAD = 6
+
+
+class MockPortHandler:
+    def __init__(self, baudrate: int, usb_latency_s: float):
+        self.baudrate = baudrate
+        self.usb_latency_s = usb_latency_s
+        self.is_open = True
+        self.is_using = False
+
+    def byte_time(self, num_bytes: int) -> float:
+        return num_bytes * 10 / self.baudrate
+
+    def getBaudRate(self):  # noqa: N802
+        return self.baudrate
+
+
+class MockPacketHandler:
+    def getTxRxResult(self, comm):  # noqa: N802
+        return f"[TxRxResult] {comm}"
+
+
+class MockGroupSyncRead:
+    """Sync reader of a simulated bus, whose response is ready some time after its request is sent."""
+
+    def __init__(self, port: MockPortHandler, return_delay_s: float):
+        self.port = port
+        self.return_delay_s = return_delay_s
+        self.start_address = 0
+        self.data_length = 0
+        self.ids = []
+        self.response_ready_at = None
+
+    def clearParam(self):  # noqa: N802
+        self.ids = []
+
+    def addParam(self, id_):  # noqa: N802
+        self.ids.append(id_)
+        return True
+
+    def txPacket(self):  # noqa: N802
+        now = time.perf_counter()
+        request_s = self.port.byte_time(REQUEST_OVERHEAD + len(self.ids))
+        response_s = len(self.ids) * (
+            self.port.byte_time(RESPONSE_OVERHEAD + self.data_length) + self.return_delay_s
+        )
+        self.response_ready_at = now + request_s + response_s + self.port.usb_latency_s
+        return COMM_SUCCESS
+
+    def rxPacket(self):  # noqa: N802
+        if self.response_ready_at is None:
+            return COMM_RX_TIMEOUT
+        while (remaining := self.response_ready_at - time.perf_counter()) > 0:
+            time.sleep(remaining)
+        self.response_ready_at = None
+        return COMM_SUCCESS
+
+    def txRxPacket(self):  # noqa: N802
+        self.txPacket()
+        return self.rxPacket()
+
+    def getData(self, id_, address, data_length):  # noqa: N802
+        return 2048 if data_length == 2 else 0
+
+
+class MockFeetechMotorsBus(FeetechMotorsBus):
+    def __init__(self, num_motors: int, args: argparse.Namespace):
+        motors = {f"motor_{i}": Motor(i, "sts3215", MotorNormMode.RANGE_M100_100) for i in range(num_motors)}
+        SerialMotorsBus.__init__(self, "/dev/null", motors)
+        self.protocol_version = 0
+        self.port_handler = MockPortHandler(args.baudrate, args.usb_latency_ms / 1e3)
+        self.packet_handler = MockPacketHandler()
+        self.sync_reader = MockGroupSyncRead(self.port_handler, args.return_delay_us / 1e6)
+        self._comm_success = COMM_SUCCESS
+        self._no_error = 0x00
+
+
+def reads_per_s(read_fn, num_reads: int, work_s: float) -> float:
+    read_fn()
+    start = time.perf_counter()
+    for _ in range(num_reads):
+        read_fn()
+        time.sleep(work_s)
+    return num_reads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-motors", type=int, nargs="+", default=[6, 12])
+    parser.add_argument("--num-reads", type=int, default=500)
+    parser.add_argument("--baudrate", type=int, default=1_000_000)
+    parser.add_argument("--usb-latency-ms", type=float, default=1.0)
+    parser.add_argument("--return-delay-us", type=float, default=0.0)
+    parser.add_argument("--work-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    registers = ["Present_Position", "Present_Velocity", "Present_Load"]
+    work_s = args.work_ms / 1e3
+    for num_motors in args.num_motors:
+        bus = MockFeetechMotorsBus(num_motors, args)
+        results = {
+            "sync_read": reads_per_s(
+                lambda bus=bus: bus.sync_read("Present_Position", normalize=False), args.num_reads, work_s
+            ),
+            "sync_read pipelined": reads_per_s(
+                lambda bus=bus: bus.sync_read("Present_Position", normalize=False, pipelined=True),
+                args.num_reads,
+                work_s,
+            ),
+            f"{len(registers)} x sync_read": reads_per_s(
+                lambda bus=bus: [bus.sync_read(name, normalize=False) for name in registers],
+                args.num_reads,
+                work_s,
+            ),
+            "sync_read_registers": reads_per_s(
+                lambda bus=bus: bus.sync_read_registers(registers, normalize=False), args.num_reads, work_s
+            ),
+            "sync_read_registers pipelined": reads_per_s(
+                lambda bus=bus: bus.sync_read_registers(registers, normalize=False, pipelined=True),
+                args.num_reads,
+                work_s,
+            ),
+        }
+        print(f"{num_motors} motors:")
+        for name, value in results.items():
+            print(f"  {name:<30} {value:8.1f} reads/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the updates/second of a SAC-like learner loop with the different replay buffer iterators.
+
+Each "update" samples a batch and runs a forward/backward pass of a small convolutional critic, so the
+numbers reflect how much the sampling (gather + DrQ augmentation + host to device copy) slows down the
+training thread.
+
+Example:
+```bash
+python benchmarks/rl/benchmark_replay_buffer_sampling.py --device cuda --batch-size 256 --num-updates 500
+```
+"""
+
+import argparse
+import time
+
+import torch
+from torch import nn
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.utils.constants import OBS_IMAGE, OBS_STATE
+
+
+def make_buffer(args: argparse.Namespace) -> ReplayBuffer:
+    buffer = ReplayBuffer(
+        capacity=args.capacity,
+        device=args.device,
+        state_keys=[OBS_IMAGE, OBS_STATE],
+        storage_device="cpu",
+        optimize_memory=True,
+    )
+    # Fill in chunks to keep the peak memory of the benchmark low
+    chunk = 1000
+    for start in range(0, args.capacity, chunk):
+        n = min(chunk, args.capacity - start)
+        state = {
+            OBS_IMAGE: torch.rand(n, 3, args.image_size, args.image_size),
+            OBS_STATE: torch.randn(n, 18),
+        }
+        buffer.add_batch(
+            state=state,
+            action=torch.randn(n, 4),
+            reward=torch.randn(n),
+            next_state=state,
+            done=torch.zeros(n, dtype=torch.bool),
+            truncated=torch.zeros(n, dtype=torch.bool),
+            complementary_info={"discrete_penalty": torch.zeros(n)},
+        )
+    return buffer
+
+
+def make_model(args: argparse.Namespace) -> tuple[nn.Module, torch.optim.Optimizer]:
+    model = nn.Sequential(
+        nn.Conv2d(3, 32, 3, stride=2),
+        nn.ReLU(),
+        nn.Conv2d(32, 32, 3, stride=2),
+        nn.ReLU(),
+        nn.AdaptiveAvgPool2d(4),
+        nn.Flatten(),
+        nn.Linear(32 * 16, 256),
+        nn.ReLU(),
+        nn.Linear(256, 1),
+    ).to(args.device)
+    return model, torch.optim.Adam(model.parameters(), lr=3e-4)
+
+
+def run(args: argparse.Namespace, buffer: ReplayBuffer, mode: str) -> float:
+    model, optimizer = make_model(args)
+    iterator = buffer.get_iterator(
+        batch_size=args.batch_size,
+        async_prefetch=mode == "thread",
+        queue_size=2,
+        multiprocess_prefetch=mode == "process",
+    )
+
+    def update():
+        batch = next(iterator)
+        images = torch.cat([batch["state"][OBS_IMAGE], batch["next_state"][OBS_IMAGE]])
+        loss = model(images).pow(2).mean() + batch["reward"].mean()
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
+
+    for _ in range(args.warmup):
+        update()
+    if args.device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+    start = time.perf_counter()
+    for _ in range(args.num_updates):
+        update()
+    if args.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    elapsed = time.perf_counter() - start
+
+    iterator.close()
+    return args.num_updates / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--capacity", type=int, default=20_000)
+    parser.add_argument("--image-size", type=int, default=128)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--num-updates", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--modes", nargs="+", default=["naive", "thread", "process"])
+    args = parser.parse_args()
+
+    buffer = make_buffer(args)
+    # The default DrQ augmentation is compiled, keep the benchmark about the sampling engines
+    buffer.image_augmentation_function = buffer.base_image_augmentation_function
+
+    print(f"device={args.device} batch_size={args.batch_size} image_size={args.image_size}")
+    for mode in args.modes:
+        updates_per_s = run(args, buffer, mode)
+        print(f"{mode:>8}: {updates_per_s:8.1f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,5 +13,6 @@
 # limitations under the License.
 
 from .camera import Camera
+from .camera_group import CameraGroup, TimestampedFrame
 from .configs import CameraConfig, ColorMode, Cv2Rotation
 from .utils import make_cameras_from_configs
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time-aligned capture from several cameras.
+
+A `CameraGroup` reads every camera on its own thread and keeps the last frames of each with the time they
+were captured. Instead of the latest frame of every camera, whenever it arrived, the control loop gets the
+frame of every camera closest to a target time, e.g. the time the state of the motors was read, and the group
+keeps statistics of the skew between the frames it returns.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from numpy.typing import NDArray
+
+from lerobot.utils.errors import DeviceNotConnectedError
+
+from .camera import Camera
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimestampedFrame:
+    """A frame and the time it was captured."""
+
+    frame: NDArray[Any]
+    # `time.perf_counter()` when the camera returned the frame
+    timestamp: float
+    # Index of the frame among those captured from its camera
+    seq: int
+
+
+class CameraGroup:
+    """Capture frames from several cameras on background threads, and read them as time-aligned sets.
+
+    The capture time of a frame is taken on the host, with the same monotonic clock as `time.perf_counter()`,
+    when `Camera.read()` returns it. It includes the transfer and the decoding of the frame, which are about
+    the same for every frame of a camera: `stats()` reports the mean offset of every camera to the target
+    times, from which a constant latency can be told apart from jitter.
+
+    The cameras are read directly with `Camera.read()`: once the group is started, their `async_read()` must
+    not be used.
+
+    Args:
+        cameras: Connected cameras, by name.
+        tolerance_s: Maximum offset between the capture time of a frame and the target time of a read. Frames
+            further away are still returned, and counted in `stats()`.
+        history_size: Number of frames of every camera kept to choose from. It should cover the time between
+            two reads plus the tolerance, at the frame rate of the cameras.
+    """
+
+    def __init__(self, cameras: dict[str, Camera], tolerance_s: float = 0.02, history_size: int = 8):
+        if tolerance_s < 0:
+            raise ValueError(f"tolerance_s should be non-negative, got {tolerance_s}.")
+        if history_size < 1:
+            raise ValueError(f"history_size should be at least 1, got {history_size}.")
+
+        self.cameras = cameras
+        self.tolerance_s = tolerance_s
+        self.history_size = history_size
+
+        self._frames: dict[str, deque[TimestampedFrame]] = {
+            name: deque(maxlen=history_size) for name in cameras
+        }
+        self._new_frame = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads: dict[str, threading.Thread] = {}
+        self.reset_stats()
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads.values())
+
+    def _capture_loop(self, name: str) -> None:
+        camera = self.cameras[name]
+        seq = 0
+        while not self._stop_event.is_set():
+            try:
+                frame = camera.read()
+            except DeviceNotConnectedError:
+                break
+            except Exception as e:
+                logger.warning(f"Error reading frame from {name} in {self}: {e}")
+                self._stop_event.wait(0.1)
+                continue
+
+            timestamp = time.perf_counter()
+            if not frame.flags.writeable:
+                # Views of a pool of frames reused by the camera (e.g. `OpenCVCamera` with `num_buffers`) would
+                # be overwritten while still in the history
+                frame = frame.copy()
+            with self._new_frame:
+                self._frames[name].append(TimestampedFrame(frame, timestamp, seq))
+                self._new_frame.notify_all()
+            seq += 1
+
+    def start(self, timeout_s: float = 5.0) -> None:
+        """Start capturing from every camera, and wait for a first frame of each.
+
+        Raises:
+            TimeoutError: A camera did not return a frame within `timeout_s` seconds.
+        """
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        for frames in self._frames.values():
+            frames.clear()
+        for name in self.cameras:
+            self._threads[name] = threading.Thread(
+                target=self._capture_loop, args=(name,), name=f"{self}_{name}", daemon=True
+            )
+            self._threads[name].start()
+
+        with self._new_frame:
+            ready = self._new_frame.wait_for(lambda: all(self._frames.values()), timeout_s)
+        if not ready:
+            missing = [name for name, frames in self._frames.items() if not frames]
+            self.stop()
+            raise TimeoutError(f"{self}: no frame from {missing} within {timeout_s}s.")
+
+    def stop(self) -> None:
+        """Stop capturing, once the current read of every camera is done."""
+        self._stop_event.set()
+        for thread in self._threads.values():
+            thread.join()
+        self._threads = {}
+
+    def latest(self) -> dict[str, TimestampedFrame]:
+        """Latest frame of every camera, without waiting."""
+        with self._new_frame:
+            if not all(self._frames.values()):
+                raise RuntimeError(f"{self}: no frame was captured yet. Run `start()` first.")
+            return {name: frames[-1] for name, frames in self._frames.items()}
+
+    def _nearest(self, name: str, target_time: float) -> TimestampedFrame:
+        return min(self._frames[name], key=lambda frame: abs(frame.timestamp - target_time))
+
+    def read_aligned(
+        self, target_time: float | None = None, timeout_s: float = 0.2
+    ) -> dict[str, TimestampedFrame]:
+        """Frame of every camera captured closest to `target_time`.
+
+        When the latest frame of a camera is older than `target_time` by more than the tolerance, a closer one
+        may still come: the read waits for it, up to `timeout_s` seconds, then returns the closest frame
+        available.
+
+        Args:
+            target_time: `time.perf_counter()` value to align the frames to. Now when None.
+            timeout_s: Maximum time to wait for the next frame of a camera.
+
+        Raises:
+            TimeoutError: A camera has no frame at all.
+        """
+        if target_time is None:
+            target_time = time.perf_counter()
+
+        deadline = time.perf_counter() + timeout_s
+        aligned = {}
+        with self._new_frame:
+            for name, frames in self._frames.items():
+                self._new_frame.wait_for(
+                    lambda frames=frames: frames and frames[-1].timestamp >= target_time - self.tolerance_s,
+                    max(deadline - time.perf_counter(), 0.0),
+                )
+                if not frames:
+                    raise TimeoutError(f"{self}: no frame from {name} within {timeout_s}s.")
+                aligned[name] = self._nearest(name, target_time)
+
+        self._update_stats(aligned, target_time)
+        return aligned
+
+    def _update_stats(self, aligned: dict[str, TimestampedFrame], target_time: float) -> None:
+        timestamps = [frame.timestamp for frame in aligned.values()]
+        skew_s = max(timestamps) - min(timestamps)
+        self._num_reads += 1
+        self._skew_sum_s += skew_s
+        self._max_skew_s = max(self._max_skew_s, skew_s)
+        for name, frame in aligned.items():
+            offset_s = frame.timestamp - target_time
+            self._offset_sums_s[name] += offset_s
+            if abs(offset_s) > self.tolerance_s:
+                self._out_of_tolerance[name] += 1
+                logger.debug(f"{self} {name} frame is {offset_s * 1e3:+.1f}ms away from the target time")
+
+    def reset_stats(self) -> None:
+        self._num_reads = 0
+        self._skew_sum_s = 0.0
+        self._max_skew_s = 0.0
+        self._offset_sums_s = dict.fromkeys(self.cameras, 0.0)
+        self._out_of_tolerance = dict.fromkeys(self.cameras, 0)
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics of the reads since the group was created or `reset_stats()` was last called.
+
+        Returns:
+            dict: the number of aligned reads, the mean and max skew between the frames of a read in
+            milliseconds, the mean offset of the frames of every camera to the target times in milliseconds,
+            and the number of frames of every camera further than the tolerance from their target time.
+        """
+        num_reads = max(self._num_reads, 1)
+        return {
+            "num_reads": self._num_reads,
+            "mean_skew_ms": 1e3 * self._skew_sum_s / num_reads,
+            "max_skew_ms": 1e3 * self._max_skew_s,
+            "mean_offset_ms": {name: 1e3 * s / num_reads for name, s in self._offset_sums_s.items()},
+            "out_of_tolerance": dict(self._out_of_tolerance),
+        }
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self.cameras)})"
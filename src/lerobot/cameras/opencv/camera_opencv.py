@@ -25,6 +25,7 @@ from pathlib import Path
 from threading import Event, Lock, Thread
 from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
 
 # Fix MSMF hardware transform compatibility for Windows before importing cv2
@@ -45,6 +46,14 @@ from .configuration_opencv import ColorMode, OpenCVCameraConfig
 # treat the same cameras as new devices. Thus we select a higher bound to search indices.
 MAX_OPENCV_INDEX = 60
 
+# Flags decoding a JPEG at 1/factor of its resolution, in the DCT of libjpeg rather than after decoding
+JPEG_REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -123,8 +132,18 @@ class OpenCVCamera(Camera):
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
         self.latest_frame: NDArray[Any] | None = None
+        self.latest_frame_seq: int = -1
         self.new_frame_event: Event = Event()
 
+        # Index of the last frame post-processed, and pool of frames it is done into when `num_buffers` > 0
+        self.frame_seq: int = -1
+        self.num_buffers = config.num_buffers
+        self._frame_buffers: list[NDArray[Any]] = []
+        self._work_buffers: dict[str, NDArray[Any]] = {}
+        self._raw_frame: NDArray[Any] | None = None
+        # Whether the backend delivers compressed MJPEG frames, once connected
+        self.mjpeg_passthrough = config.mjpeg_passthrough
+
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
 
@@ -133,6 +152,13 @@ class OpenCVCamera(Camera):
             if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE]:
                 self.capture_width, self.capture_height = self.height, self.width
 
+        # Size (width, height) the captured frames are resized to before rotation, when it differs
+        self.resize_dsize: tuple[int, int] | None = None
+        capture_size = (config.capture_width, config.capture_height)
+        if config.capture_width is not None and capture_size != (self.capture_width, self.capture_height):
+            self.resize_dsize = (self.capture_width, self.capture_height)
+            self.capture_width, self.capture_height = capture_size
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.index_or_path})"
 
@@ -225,6 +251,16 @@ class OpenCVCamera(Camera):
         else:
             self._validate_fps()
 
+        if self.config.mjpeg_passthrough:
+            # Deliver the MJPEG frames compressed, to be decoded at a reduced scale in `read`
+            success = self.videocapture.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            if not success:
+                logger.warning(
+                    f"{self} failed to disable the decoding of MJPEG frames by the {self.videocapture.getBackendName()} "
+                    f"backend. Continuing with decoded frames."
+                )
+                self.mjpeg_passthrough = False
+
     def _validate_fps(self) -> None:
         """Validates and sets the camera's frames per second (FPS)."""
 
@@ -370,11 +406,21 @@ class OpenCVCamera(Camera):
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
-        ret, frame = self.videocapture.read()
+        if self.num_buffers:
+            # The raw frame is only reused when frames are post-processed into the pool, as it may be returned
+            # as is otherwise
+            ret, frame = self.videocapture.read(self._raw_frame)
+            self._raw_frame = frame
+        else:
+            ret, frame = self.videocapture.read()
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
 
+        if frame.ndim != 3:
+            # Compressed frame, see `mjpeg_passthrough`
+            frame = self._decode_jpeg(frame)
+
         processed_frame = self._postprocess_image(frame, color_mode)
 
         read_duration_ms = (time.perf_counter() - start_time) * 1e3
@@ -408,7 +454,9 @@ class OpenCVCamera(Camera):
 
         h, w, c = image.shape
 
-        if h != self.capture_height or w != self.capture_width:
+        # Frames decoded from MJPEG are already resized
+        resize = self.resize_dsize is not None and (w, h) != self.resize_dsize
+        if (h != self.capture_height or w != self.capture_width) and (w, h) != self.resize_dsize:
             raise RuntimeError(
                 f"{self} frame width={w} or height={h} do not match configured width={self.capture_width} or height={self.capture_height}."
             )
@@ -416,15 +464,129 @@ class OpenCVCamera(Camera):
         if c != 3:
             raise RuntimeError(f"{self} frame channels={c} do not match expected 3 channels (RGB/BGR).")
 
+        self.frame_seq += 1
+        if self.num_buffers:
+            return self._postprocess_into_buffer(image, requested_color_mode, resize)
+
         processed_image = image
+        if resize:
+            processed_image = cv2.resize(image, self.resize_dsize, interpolation=cv2.INTER_AREA)
+
         if requested_color_mode == ColorMode.RGB:
-            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            processed_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB)
 
         if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
             processed_image = cv2.rotate(processed_image, self.rotation)
 
         return processed_image
 
+    def _work_buffer(self, name: str, shape: tuple[int, ...]) -> NDArray[Any]:
+        buffer = self._work_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._work_buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def _postprocess_into_buffer(
+        self, image: NDArray[Any], color_mode: ColorMode, resize: bool
+    ) -> NDArray[Any]:
+        """
+        Same as `_postprocess_image`, into the next frame of the pool, without allocating.
+
+        Every step writes into the frame of the pool when it is the last one, or into a work buffer kept
+        for the next frames otherwise.
+
+        Returns:
+            np.ndarray: A read-only view of the frame of the pool.
+        """
+        rotate = self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]
+        convert = color_mode == ColorMode.RGB
+
+        h, w = image.shape[:2]
+        if resize:
+            w, h = self.resize_dsize
+        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE]:
+            h, w = w, h
+        if not self._frame_buffers or self._frame_buffers[0].shape != (h, w, 3):
+            self._frame_buffers = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(self.num_buffers)]
+        frame = self._frame_buffers[self.frame_seq % self.num_buffers]
+
+        processed_image = image
+        if resize:
+            dst_w, dst_h = self.resize_dsize
+            dst = self._work_buffer("resized", (dst_h, dst_w, 3)) if convert or rotate else frame
+            processed_image = cv2.resize(
+                processed_image, self.resize_dsize, dst=dst, interpolation=cv2.INTER_AREA
+            )
+
+        if convert:
+            dst = self._work_buffer("converted", processed_image.shape) if rotate else frame
+            processed_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB, dst=dst)
+
+        if rotate:
+            processed_image = cv2.rotate(processed_image, self.rotation, dst=frame)
+
+        if processed_image is not frame:
+            np.copyto(frame, processed_image)
+
+        view = frame.view()
+        view.flags.writeable = False
+        return view
+
+    def _decode_jpeg(self, buffer: NDArray[Any]) -> NDArray[Any]:
+        """
+        Decodes a compressed MJPEG frame to BGR, at the size it is resized to if any.
+
+        The frame is decoded at the smallest scale (1/2, 1/4 or 1/8) that is not below that size, and then
+        resized to it, which is much faster than decoding it at full resolution first.
+        """
+        out_w, out_h = self.resize_dsize or (self.capture_width, self.capture_height)
+        factor = next(
+            (f for f in (8, 4, 2) if self.capture_width // f >= out_w and self.capture_height // f >= out_h),
+            1,
+        )
+        image = cv2.imdecode(buffer, JPEG_REDUCED_DECODE_FLAGS[factor])
+        if image is None:
+            raise RuntimeError(f"{self} failed to decode MJPEG frame.")
+        if image.shape[:2] != (out_h, out_w):
+            image = cv2.resize(image, (out_w, out_h), interpolation=cv2.INTER_AREA)
+        return image
+
+    def read_jpeg(self) -> bytes:
+        """
+        Reads the next frame as compressed by the camera, without decoding it.
+
+        The JPEG is of the capture resolution, without rotation, and holds the colors of the scene (OpenCV
+        decodes it to BGR). Requires `mjpeg_passthrough`, which is turned off when the backend turns out to
+        deliver decoded frames.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            RuntimeError: If reading the frame fails, or if the backend delivers decoded frames.
+        """
+        if not self.is_connected or self.videocapture is None:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if not self.mjpeg_passthrough:
+            raise RuntimeError(f"{self} does not deliver compressed frames, see `mjpeg_passthrough`.")
+
+        ret, frame = self.videocapture.read()
+        if not ret or frame is None:
+            raise RuntimeError(f"{self} read failed (status={ret}).")
+        if frame.ndim == 3:
+            self.mjpeg_passthrough = False
+            raise RuntimeError(f"{self} backend delivers decoded frames, MJPEG passthrough is not supported.")
+
+        self.frame_seq += 1
+        return frame.tobytes()
+
+    def is_frame_current(self, seq: int) -> bool:
+        """
+        Checks that the frame of index `seq` was not overwritten by a later frame of the pool.
+
+        Frames are never overwritten when `num_buffers` is 0.
+        """
+        return self.num_buffers == 0 or self.frame_seq - seq < self.num_buffers
+
     def _read_loop(self) -> None:
         """
         Internal loop run by the background thread for asynchronous reading.
@@ -445,6 +607,7 @@ class OpenCVCamera(Camera):
 
                 with self.frame_lock:
                     self.latest_frame = color_image
+                    self.latest_frame_seq = self.frame_seq
                 self.new_frame_event.set()
 
             except DeviceNotConnectedError:
@@ -490,12 +653,22 @@ class OpenCVCamera(Camera):
         Returns:
             np.ndarray: The latest captured frame as a NumPy array in the format
                        (height, width, channels), processed according to configuration.
+                       A read-only view of the pool of frames when `num_buffers` > 0.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
             TimeoutError: If no frame becomes available within the specified timeout.
             RuntimeError: If an unexpected error occurs.
         """
+        return self.async_read_with_seq(timeout_ms)[0]
+
+    def async_read_with_seq(self, timeout_ms: float = 200) -> tuple[NDArray[Any], int]:
+        """
+        Same as `async_read`, also returning the index of the frame.
+
+        With a pool of frames (`num_buffers` > 0), the index tells whether the frame was overwritten
+        since, see `is_frame_current`.
+        """
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
@@ -511,12 +684,13 @@ class OpenCVCamera(Camera):
 
         with self.frame_lock:
             frame = self.latest_frame
+            seq = self.latest_frame_seq
             self.new_frame_event.clear()
 
         if frame is None:
             raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
 
-        return frame
+        return frame, seq
 
     def disconnect(self) -> None:
         """
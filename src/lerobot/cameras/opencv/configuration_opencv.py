@@ -38,6 +38,12 @@ class OpenCVCameraConfig(CameraConfig):
     # Advanced configurations with FOURCC format
     OpenCVCameraConfig(128422271347, 30, 640, 480, rotation=Cv2Rotation.ROTATE_90, fourcc="MJPG")     # With 90° rotation and MJPG format
     OpenCVCameraConfig(0, 30, 1280, 720, fourcc="YUYV")     # With YUYV format
+
+    # Capture at 1920x1080 and downscale to 640x360 in the read thread, into a pool of 4 reused frames
+    OpenCVCameraConfig(0, 30, 640, 360, capture_width=1920, capture_height=1080, num_buffers=4)
+
+    # Same from the compressed MJPEG frames of the camera, decoded at 1/2 scale then resized
+    OpenCVCameraConfig(0, 30, 640, 360, capture_width=1920, capture_height=1080, mjpeg_passthrough=True)
     ```
 
     Attributes:
@@ -50,6 +56,20 @@ class OpenCVCameraConfig(CameraConfig):
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
         fourcc: FOURCC code for video format (e.g., "MJPG", "YUYV", "I420"). Defaults to None (auto-detect).
+        capture_width: Frame width requested from the camera, before rotation, when it differs from the
+            output `width`. Frames are resized to `width` x `height` in the read thread. Defaults to None
+            (no resizing).
+        capture_height: Frame height requested from the camera, before rotation, see `capture_width`.
+        num_buffers: Size of the pool of preallocated frames the read thread post-processes into. Frames
+            are then read-only views of the pool, reused every `num_buffers` frames: consumers keeping
+            frames longer must copy them, see `OpenCVCamera.is_frame_current`. `AsyncImageWriter` and
+            `CameraGroup`, which keep frames, copy read-only ones. Defaults to 0 (a new array for every
+            frame).
+        mjpeg_passthrough: Capture the frames as compressed by the camera (FOURCC "MJPG"), and decode them
+            at the smallest of 1/2, 1/4 or 1/8 of the capture resolution that is not below the output one,
+            instead of at full resolution by the backend. The compressed frames can also be read as is with
+            `OpenCVCamera.read_jpeg`. Requires a backend supporting `CAP_PROP_CONVERT_RGB` (e.g. V4L2).
+            Defaults to False.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -62,6 +82,10 @@ class OpenCVCameraConfig(CameraConfig):
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
     fourcc: str | None = None
+    capture_width: int | None = None
+    capture_height: int | None = None
+    num_buffers: int = 0
+    mjpeg_passthrough: bool = False
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -83,3 +107,20 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`fourcc` must be a 4-character string (e.g., 'MJPG', 'YUYV'), but '{self.fourcc}' is provided."
             )
+
+        if (self.capture_width is None) != (self.capture_height is None):
+            raise ValueError("`capture_width` and `capture_height` must be set together.")
+
+        if self.capture_width is not None and (self.width is None or self.height is None):
+            raise ValueError("`width` and `height` must be set to resize the frames captured.")
+
+        if self.mjpeg_passthrough:
+            if self.fourcc is None:
+                self.fourcc = "MJPG"
+            elif self.fourcc != "MJPG":
+                raise ValueError(
+                    f"`mjpeg_passthrough` requires the 'MJPG' fourcc, but '{self.fourcc}' is provided."
+                )
+
+        if self.num_buffers < 0 or self.num_buffers == 1:
+            raise ValueError(f"`num_buffers` must be 0 or at least 2, but {self.num_buffers} is provided.")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+SharedMemoryCamera - Reads the frames published in shared memory by another process on the same machine
+(see `frame_publisher.py`), so that several processes consume a camera without capturing or copying it
+each.
+"""
+
+import logging
+from typing import Any
+
+from numpy.typing import NDArray
+
+from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+from ..camera import Camera
+from ..configs import ColorMode
+from .configuration_shared_memory import SharedMemoryCameraConfig
+from .frame_ring import SharedFrameRing
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMemoryCamera(Camera):
+    """
+    Example usage:
+        ```bash
+        # Capture process
+        python -m lerobot.cameras.shared_memory.frame_publisher \\
+            --camera.type=opencv --camera.index_or_path=0 --name=front_camera
+        ```
+
+        ```python
+        from lerobot.cameras.shared_memory import SharedMemoryCamera, SharedMemoryCameraConfig
+
+        config = SharedMemoryCameraConfig(name="front_camera")
+        camera = SharedMemoryCamera(config)
+        camera.connect()
+        frame = camera.read()
+        camera.disconnect()
+        ```
+    """
+
+    def __init__(self, config: SharedMemoryCameraConfig):
+        super().__init__(config)
+        self.config = config
+        self.name = config.name
+        self.timeout_ms = config.timeout_ms
+        self.zero_copy = config.zero_copy
+
+        self.ring: SharedFrameRing | None = None
+        self.last_seq = -1
+        self.last_timestamp: float | None = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def is_connected(self) -> bool:
+        return self.ring is not None
+
+    def connect(self, warmup: bool = True) -> None:
+        """Map the frames published under the configured name."""
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        try:
+            ring = SharedFrameRing.attach(self.name)
+        except FileNotFoundError as e:
+            raise ConnectionError(
+                f"{self}: no frames published under this name, is the publisher running?"
+            ) from e
+
+        height, width, _ = ring.shape
+        if (self.height is not None and self.height != height) or (
+            self.width is not None and self.width != width
+        ):
+            ring.close()
+            raise RuntimeError(
+                f"{self} published frames are {width}x{height}, but {self.width}x{self.height} is configured."
+            )
+        self.height = height
+        self.width = width
+        self.ring = ring
+        self.last_seq = -1
+
+        if warmup:
+            self.read()
+
+        logger.info(f"{self} connected.")
+
+    @staticmethod
+    def find_cameras() -> list[dict[str, Any]]:
+        """Shared memory cameras are configured by the name given to their publisher."""
+        return []
+
+    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
+        """
+        Read the next frame published, waiting up to `timeout_ms` for it.
+
+        Returns:
+            np.ndarray: Frame (height, width, channels), a read-only view of the shared frame with `zero_copy`.
+        """
+        return self._read_next(self.timeout_ms)
+
+    def async_read(self, timeout_ms: float = 200) -> NDArray[Any]:
+        """Read the latest frame, waiting up to `timeout_ms` if it was already read."""
+        return self._read_next(timeout_ms)
+
+    def _read_next(self, timeout_ms: float) -> NDArray[Any]:
+        if self.ring is None:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.ring.latest_seq <= self.last_seq:
+            self.ring.wait_for_frame(self.last_seq, timeout_ms / 1000.0)
+        seq, timestamp, frame = self.ring.read_latest(copy=not self.zero_copy)
+
+        self.last_seq = seq
+        self.last_timestamp = timestamp
+        return frame
+
+    def disconnect(self) -> None:
+        """Unmap the shared frames, which stay published for the other readers."""
+        if self.ring is None:
+            raise DeviceNotConnectedError(f"{self} not connected.")
+
+        self.ring.close()
+        self.ring = None
+        logger.info(f"{self} disconnected.")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+from ..configs import CameraConfig
+
+__all__ = ["SharedMemoryCameraConfig"]
+
+
+@CameraConfig.register_subclass("shared_memory")
+@dataclass
+class SharedMemoryCameraConfig(CameraConfig):
+    """Configuration of a camera reading the frames published in shared memory by `frame_publisher.py`.
+
+    Frames are in the color mode and rotation of the publishing camera.
+    """
+
+    # Name of the shared memory block, as given to the publisher
+    name: str
+    timeout_ms: int = 5000
+    # Return read-only views of the shared frames instead of copies. A view is overwritten after
+    # `num_slots - 1` more frames of the publisher, so it should not be kept longer than that.
+    zero_copy: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("`name` cannot be empty.")
+
+        if self.timeout_ms <= 0:
+            raise ValueError(f"`timeout_ms` must be positive, but {self.timeout_ms} is provided.")
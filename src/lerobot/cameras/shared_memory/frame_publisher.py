@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Captures a camera and publishes its frames in shared memory, for `SharedMemoryCamera` readers in other
+processes on the same machine (control loop, visualization, dataset recording, ...).
+
+Example:
+```bash
+python -m lerobot.cameras.shared_memory.frame_publisher \\
+    --camera.type=opencv --camera.index_or_path=0 --camera.fps=30 --name=front_camera
+```
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from threading import Event
+
+import draccus
+
+from lerobot.cameras.camera import Camera
+from lerobot.cameras.configs import CameraConfig
+from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
+from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.utils import make_cameras_from_configs
+
+from .frame_ring import SharedFrameRing
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FramePublisherConfig:
+    camera: CameraConfig
+    # Name of the shared memory block, which readers are configured with
+    name: str
+    # Frames kept in the ring: a reader must be done with a frame view before this many more are published
+    num_slots: int = 8
+
+
+class SharedMemoryFramePublisher:
+    """Publishes the frames of a camera in a `SharedFrameRing`."""
+
+    def __init__(self, camera: Camera, name: str, num_slots: int = 8):
+        self.camera = camera
+        self.name = name
+        self.num_slots = num_slots
+        self.ring: SharedFrameRing | None = None
+        self.num_published = 0
+
+    def connect(self) -> None:
+        """Connect the camera, and create the ring from the shape of its first frame."""
+        self.camera.connect()
+        frame = self.camera.read()
+        self.ring = SharedFrameRing.create(self.name, frame.shape, self.num_slots)
+        self.ring.publish(frame)
+        logger.info(f"Publishing {frame.shape[1]}x{frame.shape[0]} frames to shared memory '{self.name}'")
+
+    def run(self, stop_event: Event | None = None) -> None:
+        frame_times = []
+        while stop_event is None or not stop_event.is_set():
+            t0 = time.perf_counter()
+            frame = self.camera.read()
+            self.ring.publish(frame, time.time())
+            self.num_published += 1
+
+            frame_times.append(time.perf_counter() - t0)
+            if len(frame_times) == 300:
+                logger.debug(f"FPS: {len(frame_times) / sum(frame_times):.1f}")
+                frame_times.clear()
+
+    def disconnect(self) -> None:
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+        self.camera.disconnect()
+
+
+@draccus.wrap()
+def main(cfg: FramePublisherConfig):
+    camera = make_cameras_from_configs({"camera": cfg.camera})["camera"]
+    publisher = SharedMemoryFramePublisher(camera, cfg.name, cfg.num_slots)
+    publisher.connect()
+    try:
+        publisher.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Ring buffer of camera frames in shared memory, written by one process and read by any number of others.
+
+Layout of the shared memory block:
+
+    header (int64 x 8): magic, version, number of slots, height, width, channels, latest sequence number
+    sequence number of every slot (int64), -1 while it is being written
+    capture timestamp of every slot (float64)
+    frames (uint8, num_slots x height x width x channels)
+
+The writer publishes frame `seq` into slot `seq % num_slots`, then makes it the latest one. Readers get a
+view of a slot without copying it: the view stays valid until the writer laps the ring, i.e. for
+`num_slots - 1` more frames, which `is_current` tells. `read_latest(copy=True)` copies the frame and
+checks that it was not overwritten meanwhile.
+"""
+
+import logging
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RING_MAGIC = 0x4C524652  # "LRFR"
+RING_VERSION = 1
+_HEADER_LEN = 8
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class SharedFrameRing:
+    """Ring buffer of frames in a named shared memory block. Use `create` to write, `attach` to read."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+
+        self._header = np.ndarray((_HEADER_LEN,), np.int64, shm.buf)
+        if self._header[0] != RING_MAGIC or self._header[1] != RING_VERSION:
+            raise ValueError(f"Shared memory '{shm.name}' is not a frame ring of version {RING_VERSION}.")
+        self.num_slots, height, width, channels = (int(v) for v in self._header[2:6])
+        self.shape = (height, width, channels)
+
+        offset = _HEADER_LEN * 8
+        self._seqs = np.ndarray((self.num_slots,), np.int64, shm.buf, offset)
+        offset += self.num_slots * 8
+        self._timestamps = np.ndarray((self.num_slots,), np.float64, shm.buf, offset)
+        offset = _align(offset + self.num_slots * 8)
+        self._frames = np.ndarray((self.num_slots, *self.shape), np.uint8, shm.buf, offset)
+
+    @staticmethod
+    def nbytes(shape: tuple[int, int, int], num_slots: int) -> int:
+        return _align(_HEADER_LEN * 8 + num_slots * 16) + num_slots * int(np.prod(shape))
+
+    @classmethod
+    def create(cls, name: str, shape: tuple[int, int, int], num_slots: int = 8) -> "SharedFrameRing":
+        """Create the ring of frames of the given (height, width, channels) shape, to write into."""
+        if num_slots < 2:
+            raise ValueError(f"`num_slots` must be at least 2, but {num_slots} is provided.")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls.nbytes(shape, num_slots))
+        header = np.ndarray((_HEADER_LEN,), np.int64, shm.buf)
+        header[:] = [RING_MAGIC, RING_VERSION, num_slots, *shape, -1, 0]
+        np.ndarray((num_slots,), np.int64, shm.buf, _HEADER_LEN * 8)[:] = -1
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Map the ring created by another process, to read from."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Otherwise the resource tracker of this process unlinks the block when it exits, while the
+            # writer and the other readers still use it
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the latest frame, -1 before the first one."""
+        return int(self._header[6])
+
+    def publish(self, frame: np.ndarray, timestamp: float | None = None) -> int:
+        """Write a frame into the next slot, and return its sequence number."""
+        if frame.shape != self.shape:
+            raise ValueError(f"Frame of shape {frame.shape} published to a ring of shape {self.shape}.")
+        seq = self.latest_seq + 1
+        slot = seq % self.num_slots
+        self._seqs[slot] = -1
+        self._frames[slot] = frame
+        self._timestamps[slot] = time.time() if timestamp is None else timestamp
+        self._seqs[slot] = seq
+        self._header[6] = seq
+        return seq
+
+    def is_current(self, seq: int) -> bool:
+        """Whether frame `seq` is still in its slot, i.e. its views were not overwritten."""
+        return int(self._seqs[seq % self.num_slots]) == seq
+
+    def read_latest(self, copy: bool = False) -> tuple[int, float, np.ndarray] | None:
+        """
+        Latest frame, as (sequence number, capture timestamp, frame), or None before the first one.
+
+        Without `copy`, the frame is a read-only view of its slot, see `is_current`.
+        """
+        while True:
+            seq = self.latest_seq
+            if seq < 0:
+                return None
+            slot = seq % self.num_slots
+            timestamp = float(self._timestamps[slot])
+            frame = self._frames[slot]
+            if copy:
+                frame = frame.copy()
+            else:
+                frame = frame.view()
+                frame.flags.writeable = False
+            if self.is_current(seq):
+                return seq, timestamp, frame
+            # Lapped by the writer while reading, retry with the new latest frame
+
+    def wait_for_frame(self, after_seq: int, timeout_s: float, poll_s: float = 0.0005) -> int:
+        """
+        Wait for a frame newer than `after_seq`, and return the latest sequence number.
+
+        Raises:
+            TimeoutError: No new frame was published within `timeout_s` seconds.
+        """
+        deadline = time.perf_counter() + timeout_s
+        while (seq := self.latest_seq) <= after_seq:
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"No new frame in '{self.name}' after {timeout_s}s.")
+            time.sleep(poll_s)
+        return seq
+
+    def close(self) -> None:
+        """Unmap the ring, and remove it when this process created it."""
+        del self._header, self._seqs, self._timestamps, self._frames
+        try:
+            self.shm.close()
+        except BufferError:
+            # Views of the frames are still in use, the block is unmapped when they are released
+            logger.debug(f"Frames of '{self.name}' still in use, leaving it mapped.")
+        if self.owner:
+            self.shm.unlink()
@@ -48,6 +48,11 @@ def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[s
 
             cameras[key] = ZMQCamera(cfg)
 
+        elif cfg.type == "shared_memory":
+            from .shared_memory.camera_shared_memory import SharedMemoryCamera
+
+            cameras[key] = SharedMemoryCamera(cfg)
+
         else:
             try:
                 cameras[key] = cast(Camera, make_device_from_device_class(cfg))
@@ -15,8 +15,8 @@
 # limitations under the License.
 
 """
-ZMQCamera - Captures frames from remote cameras via ZeroMQ using JSON protocol in the
-following format:
+ZMQCamera - Captures frames from remote cameras via ZeroMQ, sent in the binary format of `protocol.py`, or
+with the former JSON protocol in the following format:
     {
         "timestamps": {"camera_name": float},
         "images": {"camera_name": "<base64-jpeg>"}
@@ -39,6 +39,7 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 from ..camera import Camera
 from ..configs import ColorMode
 from .configuration_zmq import ZMQCameraConfig
+from .protocol import decode_message, is_binary_message, message_image_names
 
 logger = logging.getLogger(__name__)
 
@@ -145,14 +146,17 @@ class ZMQCamera(Camera):
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         try:
-            message = self.socket.recv_string()
+            message = self.socket.recv(copy=False).buffer
         except Exception as e:
             if type(e).__name__ == "Again":
                 raise TimeoutError(f"{self} timeout after {self.timeout_ms}ms") from e
             raise
 
+        if is_binary_message(message):
+            return self._decode_binary_message(message)
+
         # Decode JSON message
-        data = json.loads(message)
+        data = json.loads(bytes(message))
 
         if "images" not in data:
             raise RuntimeError(f"{self} invalid message: missing 'images' key")
@@ -176,6 +180,19 @@ class ZMQCamera(Camera):
 
         return frame
 
+    def _decode_binary_message(self, message: memoryview) -> NDArray[Any]:
+        # Get image by camera name or first available, and only decode this one
+        names = message_image_names(message)
+        if not names:
+            raise RuntimeError(f"{self} no images in message")
+        name = self.camera_name if self.camera_name in names else names[0]
+
+        _, images = decode_message(message, names=[name])
+        if name not in images:
+            raise RuntimeError(f"{self} failed to decode image")
+
+        return images[name]
+
     def _read_loop(self) -> None:
         while self.stop_event and not self.stop_event.is_set():
             try:
@@ -16,35 +16,128 @@
 
 """
 Streams camera images over ZMQ.
-Uses lerobot's OpenCVCamera for capture, encodes images to base64 and sends them over ZMQ.
+Uses lerobot's OpenCVCamera for capture, encodes images to JPEG and sends them over ZMQ, as base64 in JSON
+(the default, which every client reads), or in the binary format of `protocol.py` (which can also send raw
+pixels) for the clients which read it.
+
+Every camera is captured and encoded by its own thread (OpenCV releases the GIL while doing so), and the
+server sends the latest encoded frame of every camera at the target fps. With `mjpeg_passthrough`, the JPEGs
+compressed by a camera are sent as is, without being decoded and encoded again (binary format and "jpeg" codec,
+the frames are tagged with the "mjpeg" codec).
 """
 
 import base64
 import contextlib
 import json
 import logging
+import threading
 import time
 from collections import deque
+from typing import Any
 
-import cv2
-import numpy as np
 import zmq
 
 from lerobot.cameras.configs import ColorMode
 from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
 
+from .protocol import IMAGE_CODECS, WIRE_FORMATS, encode_frame, jpeg_frame, pack_message
+
 logger = logging.getLogger(__name__)
 
 
-def encode_image(image: np.ndarray, quality: int = 80) -> str:
-    """Encode RGB image to base64 JPEG string."""
-    _, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
-    return base64.b64encode(buffer).decode("utf-8")
+class CameraEncoder(threading.Thread):
+    """Captures and encodes the frames of a camera, and keeps the latest one for the server to send."""
+
+    def __init__(
+        self,
+        name: str,
+        camera: OpenCVCamera,
+        codec: str = "jpeg",
+        quality: int = 80,
+        passthrough: bool = False,
+    ):
+        super().__init__(name=f"{name}-encoder", daemon=True)
+        self.camera_name = name
+        self.camera = camera
+        self.codec = codec
+        self.quality = quality
+        # Send the JPEGs compressed by the camera, see `OpenCVCamera.read_jpeg`
+        self.passthrough = passthrough
+
+        self.lock = threading.Lock()
+        self.new_frame_event = threading.Event()
+        self.stop_event = threading.Event()
+        # (header entry, payload, capture timestamp) of the latest encoded frame
+        self.latest: tuple[dict[str, Any], memoryview, float] | None = None
+        self._latest_sent = False
+
+        self.num_encoded = 0
+        # Frames encoded but replaced by a newer one before being sent
+        self.num_dropped = 0
+        self.encode_times = deque(maxlen=60)
+
+    def run(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                if self.passthrough:
+                    jpeg = self.camera.read_jpeg()
+                    timestamp = time.time()
+                    shape = (self.camera.capture_height, self.camera.capture_width, 3)
+                    encoded = jpeg_frame(self.camera_name, jpeg, shape)
+                    self.encode_times.append(0.0)
+                else:
+                    image = self.camera.read()  # Returns RGB
+                    timestamp = time.time()
+                    t0 = time.perf_counter()
+                    encoded = encode_frame(self.camera_name, image, self.codec, self.quality)
+                    self.encode_times.append(time.perf_counter() - t0)
+            except Exception as e:
+                logger.warning(f"Camera {self.camera_name} read failed: {e}")
+                if self.passthrough and not self.camera.mjpeg_passthrough:
+                    logger.warning(f"Camera {self.camera_name}: encoding its frames instead of passing them.")
+                    self.passthrough = False
+                self.stop_event.wait(0.1)
+                continue
+            if encoded is None:
+                logger.warning(f"Camera {self.camera_name} frame failed to be encoded")
+                continue
+
+            with self.lock:
+                if self.latest is not None and not self._latest_sent:
+                    self.num_dropped += 1
+                self.latest = (*encoded, timestamp)
+                self._latest_sent = False
+                self.num_encoded += 1
+            self.new_frame_event.set()
+
+    def take_latest(self) -> tuple[dict[str, Any], memoryview, float]:
+        """Latest encoded frame, which may have been sent already if the camera is slower than the server."""
+        with self.lock:
+            self._latest_sent = True
+            return self.latest
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.join(timeout=2.0)
 
 
 class ImageServer:
     def __init__(self, config: dict, port: int = 5555):
         self.fps = config.get("fps", 30)
+        # Maximum time to wait for a first frame of every camera when the server starts
+        self.startup_timeout_s = config.get("startup_timeout_s", 5.0)
+        # "json" sends base64 JPEGs in a JSON string, "binary" the format of `protocol.py`, which older clients
+        # do not read
+        self.wire_format = config.get("wire_format", "json")
+        # "raw" sends the pixels uncompressed (binary format only), e.g. on a local network
+        self.codec = config.get("codec", "jpeg")
+        self.jpeg_quality = config.get("jpeg_quality", 80)
+        if self.wire_format not in WIRE_FORMATS:
+            raise ValueError(
+                f"`wire_format` is expected to be one of {WIRE_FORMATS}, got {self.wire_format}."
+            )
+        if self.codec not in IMAGE_CODECS or (self.wire_format == "json" and self.codec != "jpeg"):
+            raise ValueError(f"Unsupported codec {self.codec} for the {self.wire_format} wire format.")
         self.cameras: dict[str, OpenCVCamera] = {}
 
         for name, cfg in config.get("cameras", {}).items():
@@ -55,12 +148,26 @@ class ImageServer:
                 width=shape[1],
                 height=shape[0],
                 color_mode=ColorMode.RGB,
+                mjpeg_passthrough=cfg.get("mjpeg_passthrough", False),
             )
             camera = OpenCVCamera(cam_config)
             camera.connect()
             self.cameras[name] = camera
             logger.info(f"Camera {name}: {shape[1]}x{shape[0]}")
 
+        # JPEGs are passed as is to binary clients only, which tell them apart with the "mjpeg" codec
+        passthrough = self.wire_format == "binary" and self.codec == "jpeg"
+        self.encoders = {
+            name: CameraEncoder(
+                name,
+                camera,
+                self.codec,
+                self.jpeg_quality,
+                passthrough=passthrough and camera.mjpeg_passthrough,
+            )
+            for name, camera in self.cameras.items()
+        }
+
         # ZMQ PUB socket
         self.context = zmq.Context()
         self.socket = self.context.socket(zmq.PUB)
@@ -75,25 +182,53 @@ class ImageServer:
         frame_times = deque(maxlen=60)
 
         try:
+            for encoder in self.encoders.values():
+                encoder.start()
+            # Wait for a first frame of every camera
+            deadline = time.perf_counter() + self.startup_timeout_s
+            for encoder in self.encoders.values():
+                encoder.new_frame_event.wait(max(deadline - time.perf_counter(), 0.0))
+            missing = [
+                name for name, encoder in self.encoders.items() if not encoder.new_frame_event.is_set()
+            ]
+            if missing:
+                raise TimeoutError(f"ImageServer: no frame from {missing} within {self.startup_timeout_s}s.")
+
             while True:
                 t0 = time.time()
 
-                # Build message
-                message = {"timestamps": {}, "images": {}}
-                for name, cam in self.cameras.items():
-                    frame = cam.read()  # Returns RGB
-                    message["timestamps"][name] = time.time()
-                    message["images"][name] = encode_image(frame)
+                # Build message from the latest frame of every camera
+                timestamps = {}
+                encoded_frames = []
+                for name, encoder in self.encoders.items():
+                    frame, payload, timestamp = encoder.take_latest()
+                    encoded_frames.append((frame, payload))
+                    timestamps[name] = timestamp
 
-                # Send as JSON string (suppress if buffer full)
+                # Suppress if buffer full
                 with contextlib.suppress(zmq.Again):
-                    self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
+                    if self.wire_format == "binary":
+                        message = pack_message({"timestamps": timestamps}, encoded_frames)
+                        self.socket.send(message, zmq.NOBLOCK, copy=False)
+                    else:
+                        images = {
+                            frame["name"]: base64.b64encode(payload).decode("utf-8")
+                            for frame, payload in encoded_frames
+                        }
+                        message = {"timestamps": timestamps, "images": images}
+                        self.socket.send_string(json.dumps(message), zmq.NOBLOCK)
 
                 frame_count += 1
                 frame_times.append(time.time() - t0)
 
                 if frame_count % 60 == 0:
                     logger.debug(f"FPS: {len(frame_times) / sum(frame_times):.1f}")
+                    for name, encoder in self.encoders.items():
+                        encode_ms = 1e3 * sum(encoder.encode_times) / max(len(encoder.encode_times), 1)
+                        logger.debug(
+                            f"Camera {name}: encode {encode_ms:.1f} ms, "
+                            f"{encoder.num_dropped}/{encoder.num_encoded} frames dropped"
+                        )
 
                 sleep = (1.0 / self.fps) - (time.time() - t0)
                 if sleep > 0:
@@ -102,6 +237,9 @@ class ImageServer:
         except KeyboardInterrupt:
             pass
         finally:
+            for encoder in self.encoders.values():
+                if encoder.is_alive():
+                    encoder.stop()
             for cam in self.cameras.values():
                 cam.disconnect()
             self.socket.close()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# Copyright 2026 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary wire format of the image streams sent over ZMQ (ZMQ cameras, LeKiwi observations).
+
+A message is a single ZMQ frame, as the receiving sockets are conflated (`zmq.CONFLATE` drops multipart
+messages):
+
+    BINARY_MAGIC | header size (uint32, little endian) | JSON header | image payloads
+
+The header holds the JSON-serializable data of the message (timestamps, robot state) and the name, codec,
+shape, dtype and size of every image, whose payloads follow in the same order: the JPEG bytes for "jpeg",
+the pixels in C order for "raw". "mjpeg" images are JPEGs compressed by the camera itself and sent as is,
+whose colors are those of the scene: they are decoded to RGB, while "jpeg" images are encoded from and
+decoded to the channel order of the sender. Compared to base64 JPEGs in a JSON string, images are not inflated by a
+third and do not need to be encoded to and decoded from text.
+
+Messages of the JSON format start with "{", so receivers can tell both formats apart with
+`is_binary_message` and read from senders of either version. Senders keep the JSON format by default, as the
+sockets are one-way and older receivers only read it.
+"""
+
+import json
+import struct
+from typing import Any
+
+import cv2
+import numpy as np
+
+BINARY_MAGIC = b"LRB1"
+WIRE_FORMATS = ("binary", "json")
+IMAGE_CODECS = ("jpeg", "raw")
+
+_HEADER_SIZE = struct.Struct("<I")
+
+
+def is_binary_message(message: bytes | memoryview) -> bool:
+    return bytes(message[: len(BINARY_MAGIC)]) == BINARY_MAGIC
+
+
+def encode_frame(
+    name: str, image: np.ndarray, codec: str = "jpeg", quality: int = 80
+) -> tuple[dict[str, Any], memoryview] | None:
+    """
+    Encode an image into the header entry and the payload of a binary message, see `pack_message`.
+
+    Returns None when the image fails to be JPEG-encoded.
+    """
+    if codec not in IMAGE_CODECS:
+        raise ValueError(f"`codec` is expected to be one of {IMAGE_CODECS}, but {codec} is provided.")
+
+    if codec == "jpeg":
+        ok, buffer = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+        if not ok:
+            return None
+        payload = buffer.data
+    else:
+        payload = np.ascontiguousarray(image).data
+    frame = {
+        "name": name,
+        "codec": codec,
+        "shape": list(image.shape),
+        "dtype": image.dtype.str,
+        "size": payload.nbytes,
+    }
+    return frame, payload
+
+
+def jpeg_frame(name: str, jpeg: bytes, shape: tuple[int, ...]) -> tuple[dict[str, Any], memoryview]:
+    """
+    Header entry and payload of a JPEG compressed by the camera, e.g. with `OpenCVCamera.read_jpeg`, to be
+    sent without decoding and re-encoding it, see `pack_message`.
+
+    Args:
+        name: Name of the image.
+        jpeg: The JPEG bytes.
+        shape: Shape (height, width, channels) of the decoded image.
+    """
+    payload = memoryview(jpeg)
+    frame = {"name": name, "codec": "mjpeg", "shape": list(shape), "dtype": "|u1", "size": payload.nbytes}
+    return frame, payload
+
+
+def pack_message(data: dict[str, Any], encoded_frames: list[tuple[dict[str, Any], memoryview]]) -> bytes:
+    """
+    Pack JSON-serializable data and images encoded with `encode_frame` into a binary message.
+
+    The payloads are copied once, into the single frame of the message (see the module docstring).
+    """
+    frames = [frame for frame, _ in encoded_frames]
+    header = json.dumps({"data": data, "frames": frames}).encode("utf-8")
+    payloads = [payload for _, payload in encoded_frames]
+    return b"".join([BINARY_MAGIC, _HEADER_SIZE.pack(len(header)), header, *payloads])
+
+
+def encode_message(
+    data: dict[str, Any], images: dict[str, np.ndarray], codec: str = "jpeg", quality: int = 80
+) -> bytes:
+    """
+    Encode JSON-serializable data and images into a binary message.
+
+    Images which fail to be JPEG-encoded are left out of the message.
+    """
+    encoded_frames = [encode_frame(name, image, codec, quality) for name, image in images.items()]
+    return pack_message(data, [encoded for encoded in encoded_frames if encoded is not None])
+
+
+def _read_header(buffer: memoryview) -> tuple[dict[str, Any], int]:
+    """Parse the header of a binary message, and return it with the offset of the first payload."""
+    if not is_binary_message(buffer):
+        raise ValueError("Not a binary message.")
+    offset = len(BINARY_MAGIC)
+    (header_size,) = _HEADER_SIZE.unpack_from(buffer, offset)
+    offset += _HEADER_SIZE.size
+    header = json.loads(bytes(buffer[offset : offset + header_size]))
+    return header, offset + header_size
+
+
+def message_image_names(message: bytes | memoryview) -> list[str]:
+    """Names of the images of a binary message, without decoding them."""
+    header, _ = _read_header(memoryview(message))
+    return [frame["name"] for frame in header["frames"]]
+
+
+def decode_message(
+    message: bytes | memoryview, names: list[str] | None = None
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """
+    Decode a binary message into its data and images.
+
+    Args:
+        message: Binary message, see `encode_message`.
+        names: Images to decode, all of them when None. The payloads of the others are skipped.
+
+    Returns:
+        The data and the images of the message. Images which fail to be decoded are left out.
+    """
+    buffer = memoryview(message)
+    header, offset = _read_header(buffer)
+
+    images = {}
+    for frame in header["frames"]:
+        payload = buffer[offset : offset + frame["size"]]
+        offset += frame["size"]
+        if names is not None and frame["name"] not in names:
+            continue
+        if frame["codec"] in ("jpeg", "mjpeg"):
+            image = cv2.imdecode(np.frombuffer(payload, np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                continue
+            if frame["codec"] == "mjpeg":
+                image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        else:
+            # Copied out of the message buffer, which is read-only
+            image = np.frombuffer(payload, np.dtype(frame["dtype"])).reshape(frame["shape"]).copy()
+        images[frame["name"]] = image
+
+    return header["data"], images
@@ -44,6 +44,17 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Number of shards read ahead concurrently when streaming, 0 to read frames one at a time
+    streaming_prefetch_shards: int = 0
+    # When positive, whole episodes are streamed into a shuffle buffer of this many episode slices, and frames
+    # are sampled with their windows from random slices of the buffer, see `StreamingLeRobotDataset`
+    streaming_episode_buffer_size: int = 0
+    # Maximum number of frames per episode slice of the episode buffer, whole episodes when None
+    streaming_episode_slice_length: int | None = None
+    # When True, camera frames are loaded as uint8 and scaled on the training device by the normalizer, and
+    # `image_transforms` are applied on the device to the whole batch instead of in the dataloader workers.
+    # Not supported when streaming.
+    decode_to_uint8: bool = False
     # When True, load IBR images (observation.images.<cam>_ibr) as the main camera when present.
     use_ibr_images: bool = False
 
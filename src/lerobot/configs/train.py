@@ -62,6 +62,12 @@ class TrainPipelineConfig(HubMixin):
     save_checkpoint: bool = True
     # Checkpoint is saved every `save_freq` training iterations and after the last training step.
     save_freq: int = 20_000
+    # Write checkpoints in a background thread, training only stalls while the state is copied to CPU memory.
+    async_checkpoint: bool = False
+    # With `async_checkpoint`, policy weights larger than this are written as sharded safetensors.
+    checkpoint_max_shard_size: str = "5GB"
+    # Number of most recent checkpoints to keep, 0 to keep all of them.
+    keep_last_n_checkpoints: int = 0
     use_policy_training_preset: bool = True
     optimizer: OptimizerConfig | None = None
     scheduler: LRSchedulerConfig | None = None
@@ -28,6 +28,11 @@ class RunningQuantileStats:
     Statistics are computed per feature dimension and updated incrementally
     as new batches are observed. Quantiles are estimated using histograms,
     which adapt dynamically if the observed data range expands.
+
+    The histograms of all feature dimensions are stored in a single (num_dims, num_bins) array with
+    uniform bins per dimension, so binning, rebinning and quantile estimation are vectorized across
+    dimensions. Running stats can be merged (see `merge`) and serialized as a sketch of numpy arrays
+    (see `to_sketch` and `from_sketch`), e.g. to combine per-episode histograms in `aggregate_stats`.
     """
 
     def __init__(self, quantile_list: list[float] | None = None, num_quantile_bins: int = 5000):
@@ -45,6 +50,10 @@ class RunningQuantileStats:
             self._quantile_list = DEFAULT_QUANTILES
         self._quantile_keys = [f"q{int(q * 100):02d}" for q in self._quantile_list]
 
+    @property
+    def count(self) -> int:
+        return self._count
+
     def update(self, batch: np.ndarray) -> None:
         """Update the running statistics with a batch of vectors.
 
@@ -59,11 +68,10 @@ class RunningQuantileStats:
             self._mean_of_squares = np.mean(batch**2, axis=0)
             self._min = np.min(batch, axis=0)
             self._max = np.max(batch, axis=0)
-            self._histograms = [np.zeros(self._num_quantile_bins) for _ in range(vector_length)]
-            self._bin_edges = [
-                np.linspace(self._min[i] - 1e-10, self._max[i] + 1e-10, self._num_quantile_bins + 1)
-                for i in range(vector_length)
-            ]
+            self._histograms = np.zeros((vector_length, self._num_quantile_bins))
+            self._bin_edges = np.linspace(
+                self._min - 1e-10, self._max + 1e-10, self._num_quantile_bins + 1, axis=-1
+            )
         else:
             if vector_length != self._mean.size:
                 raise ValueError("The length of new vectors does not match the initialized vector length.")
@@ -91,6 +99,72 @@ class RunningQuantileStats:
 
         self._update_histograms(batch)
 
+    def merge(self, other: "RunningQuantileStats") -> None:
+        """Merge the statistics of `other` into these running statistics.
+
+        Moments, min and max are merged exactly. Histograms are added bin by bin when both share the same
+        bin edges, otherwise the bins of both are redistributed onto edges spanning the merged range.
+        """
+        if other._count == 0:
+            return
+        if self._count == 0:
+            self._set_state(other.to_sketch())
+            return
+        if other._mean.size != self._mean.size:
+            raise ValueError("Cannot merge running stats computed over vectors of different lengths.")
+
+        total_count = self._count + other._count
+        self._mean = self._mean + (other._mean - self._mean) * (other._count / total_count)
+        self._mean_of_squares = self._mean_of_squares + (other._mean_of_squares - self._mean_of_squares) * (
+            other._count / total_count
+        )
+        self._count = total_count
+
+        self._min = np.minimum(self._min, other._min)
+        self._max = np.maximum(self._max, other._max)
+
+        if self._histograms.shape == other._histograms.shape and np.array_equal(
+            self._bin_edges, other._bin_edges
+        ):
+            self._histograms = self._histograms + other._histograms
+            return
+
+        self._adjust_histograms()
+        self._histograms += self._rebin(other._histograms, other._bin_edges, self._bin_edges)
+
+    def to_sketch(self) -> dict[str, np.ndarray]:
+        """Return the full state of the running statistics as a dictionary of numpy arrays."""
+        if self._count == 0:
+            raise ValueError("Cannot build a sketch of empty running statistics.")
+        return {
+            "count": np.array([self._count]),
+            "mean": self._mean.copy(),
+            "mean_of_squares": self._mean_of_squares.copy(),
+            "min": self._min.copy(),
+            "max": self._max.copy(),
+            "histograms": self._histograms.copy(),
+            "bin_edges": self._bin_edges.copy(),
+        }
+
+    @classmethod
+    def from_sketch(
+        cls, sketch: dict[str, np.ndarray], quantile_list: list[float] | None = None
+    ) -> "RunningQuantileStats":
+        """Rebuild running statistics from a sketch returned by `to_sketch`."""
+        running_stats = cls(quantile_list=quantile_list, num_quantile_bins=sketch["histograms"].shape[1])
+        running_stats._set_state(sketch)
+        return running_stats
+
+    def _set_state(self, sketch: dict[str, np.ndarray]) -> None:
+        self._count = int(sketch["count"][0])
+        self._mean = np.array(sketch["mean"], dtype=np.float64)
+        self._mean_of_squares = np.array(sketch["mean_of_squares"], dtype=np.float64)
+        self._min = np.array(sketch["min"])
+        self._max = np.array(sketch["max"])
+        self._histograms = np.array(sketch["histograms"], dtype=np.float64)
+        self._bin_edges = np.array(sketch["bin_edges"], dtype=np.float64)
+        self._num_quantile_bins = self._histograms.shape[1]
+
     def get_statistics(self) -> dict[str, np.ndarray]:
         """Compute and return the statistics of the vectors processed so far.
 
@@ -121,75 +195,107 @@ class RunningQuantileStats:
 
         return stats
 
-    def _adjust_histograms(self):
-        """Adjust histograms when min or max changes."""
-        for i in range(len(self._histograms)):
-            old_edges = self._bin_edges[i]
-            old_hist = self._histograms[i]
-
-            # Create new edges with small padding to ensure range coverage
-            padding = (self._max[i] - self._min[i]) * 1e-10
-            new_edges = np.linspace(
-                self._min[i] - padding, self._max[i] + padding, self._num_quantile_bins + 1
-            )
+    @staticmethod
+    def _bin_indices(values: np.ndarray, dims: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """Return the bin of each value, given the feature dimension of each value and the bin edges.
 
-            # Redistribute existing histogram counts to new bins
-            # We need to map each old bin center to the new bins
-            old_centers = (old_edges[:-1] + old_edges[1:]) / 2
-            new_hist = np.zeros(self._num_quantile_bins)
+        Args:
+            values: Flat array of values.
+            dims: Flat array with the feature dimension (row of `edges`) of each value.
+            edges: (num_dims, num_bins + 1) array of uniform bin edges.
 
-            for old_center, count in zip(old_centers, old_hist, strict=False):
-                if count > 0:
-                    # Find which new bin this old center belongs to
-                    bin_idx = np.searchsorted(new_edges, old_center) - 1
-                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
-                    new_hist[bin_idx] += count
+        Values outside of the edges are clipped to the first or last bin.
+        """
+        num_bins = edges.shape[1] - 1
+        low = edges[:, 0]
+        width = (edges[:, -1] - low) / num_bins
+        width = np.where(width > 0, width, 1.0)
+
+        idx = np.clip(((values - low[dims]) / width[dims]).astype(np.int64), 0, num_bins - 1)
+
+        # Fix floating point errors of the uniform bin computation, like np.histogram does
+        idx -= (values < edges[dims, idx]) & (idx > 0)
+        idx += (values >= edges[dims, idx + 1]) & (idx < num_bins - 1)
+        return idx
+
+    def _accumulate(
+        self, dims: np.ndarray, idx: np.ndarray, num_dims: int, weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Count (or sum `weights`) per (dimension, bin) into a (num_dims, num_bins) histogram array."""
+        counts = np.bincount(
+            dims * self._num_quantile_bins + idx,
+            weights=weights,
+            minlength=num_dims * self._num_quantile_bins,
+        )
+        return counts.reshape(num_dims, self._num_quantile_bins)
+
+    def _rebin(self, histograms: np.ndarray, old_edges: np.ndarray, new_edges: np.ndarray) -> np.ndarray:
+        """Redistribute histograms with bin edges `old_edges` onto the bins of `new_edges`."""
+        # Map the center of every non empty old bin to the new bins
+        dims, bins = np.nonzero(histograms)
+        centers = (old_edges[dims, bins] + old_edges[dims, bins + 1]) / 2
+        idx = self._bin_indices(centers, dims, new_edges)
+        return self._accumulate(dims, idx, histograms.shape[0], weights=histograms[dims, bins])
+
+    def _adjust_histograms(self):
+        """Adjust the histograms of the dimensions whose min or max is no longer covered by their bins."""
+        changed = (self._min < self._bin_edges[:, 0]) | (self._max > self._bin_edges[:, -1])
+        if not changed.any():
+            return
+
+        # Create new edges with small padding to ensure range coverage
+        old_edges = self._bin_edges[changed]
+        padding = (self._max[changed] - self._min[changed]) * 1e-10
+        new_edges = np.linspace(
+            self._min[changed] - padding,
+            self._max[changed] + padding,
+            self._num_quantile_bins + 1,
+            axis=-1,
+        )
+        self._bin_edges[changed] = new_edges
 
-            self._histograms[i] = new_hist
-            self._bin_edges[i] = new_edges
+        # Redistribute existing histogram counts to new bins
+        self._histograms[changed] = self._rebin(self._histograms[changed], old_edges, new_edges)
 
     def _update_histograms(self, batch: np.ndarray) -> None:
         """Update histograms with new vectors."""
-        for i in range(batch.shape[1]):
-            hist, _ = np.histogram(batch[:, i], bins=self._bin_edges[i])
-            self._histograms[i] += hist
+        num_dims = batch.shape[1]
+        dims = np.broadcast_to(np.arange(num_dims), batch.shape).ravel()
+        idx = self._bin_indices(batch.ravel(), dims, self._bin_edges)
+        self._histograms += self._accumulate(dims, idx, num_dims)
 
     def _compute_quantiles(self) -> list[np.ndarray]:
         """Compute quantiles based on histograms."""
+        cumsum = np.cumsum(self._histograms, axis=1)
+        num_bins = cumsum.shape[1]
+        rows = np.arange(cumsum.shape[0])
+
         results = []
         for q in self._quantile_list:
             target_count = q * self._count
-            q_values = []
-
-            for hist, edges in zip(self._histograms, self._bin_edges, strict=True):
-                q_value = self._compute_single_quantile(hist, edges, target_count)
-                q_values.append(q_value)
+            # Vectorized np.searchsorted(cumsum[i], target_count) for every dimension i
+            idx = (cumsum < target_count).sum(axis=1)
+            safe_idx = np.clip(idx, 1, num_bins - 1)
+
+            count_before = cumsum[rows, safe_idx - 1]
+            count_in_bin = cumsum[rows, safe_idx] - count_before
+            bin_start = self._bin_edges[rows, safe_idx]
+            bin_width = self._bin_edges[rows, safe_idx + 1] - bin_start
+
+            # Linear interpolation within the bin, or the bin edge if there are no samples in this bin
+            fraction = np.divide(
+                target_count - count_before,
+                count_in_bin,
+                out=np.zeros_like(count_in_bin),
+                where=count_in_bin > 0,
+            )
+            q_values = bin_start + fraction * bin_width
 
-            results.append(np.array(q_values))
+            q_values = np.where(idx == 0, self._bin_edges[:, 0], q_values)
+            q_values = np.where(idx >= num_bins, self._bin_edges[:, -1], q_values)
+            results.append(q_values)
         return results
 
-    def _compute_single_quantile(self, hist: np.ndarray, edges: np.ndarray, target_count: float) -> float:
-        """Compute a single quantile value from histogram and bin edges."""
-        cumsum = np.cumsum(hist)
-        idx = np.searchsorted(cumsum, target_count)
-
-        if idx == 0:
-            return edges[0]
-        if idx >= len(cumsum):
-            return edges[-1]
-
-        # If not edge case, interpolate within the bin
-        count_before = cumsum[idx - 1]
-        count_in_bin = cumsum[idx] - count_before
-
-        # If no samples in this bin, use the bin edge
-        if count_in_bin == 0:
-            return edges[idx]
-
-        # Linear interpolation within the bin
-        fraction = (target_count - count_before) / count_in_bin
-        return edges[idx] + fraction * (edges[idx + 1] - edges[idx])
-
 
 def estimate_num_samples(
     dataset_len: int, min_num_samples: int = 100, max_num_samples: int = 10_000, power: float = 0.75
@@ -427,7 +533,8 @@ def get_feature_stats(
     axis: int | tuple[int, ...] | None,
     keepdims: bool,
     quantile_list: list[float] | None = None,
-) -> dict[str, np.ndarray]:
+    return_sketch: bool = False,
+) -> dict[str, np.ndarray] | tuple[dict[str, np.ndarray], RunningQuantileStats | None]:
     """Compute comprehensive statistics for array features along specified axes.
 
     This function calculates min, max, mean, std, and quantiles (1%, 10%, 50%, 90%, 99%)
@@ -445,6 +552,8 @@ def get_feature_stats(
             - (1,): For computing across features
             - None: For global statistics over entire array
         keepdims: If True, reduced axes are kept as dimensions with size 1
+        return_sketch: If True, also return the `RunningQuantileStats` the stats were computed with, so
+            they can be merged exactly with the ones of other arrays (see `aggregate_stats`).
 
     Returns:
         Dictionary containing:
@@ -454,6 +563,7 @@ def get_feature_stats(
             - 'std': Standard deviation
             - 'count': Number of samples (always shape (1,))
             - 'q01', 'q10', 'q50', 'q90', 'q99': Quantile values
+        and, if `return_sketch` is True, the running stats (None for an empty array).
 
     """
     if quantile_list is None:
@@ -462,15 +572,20 @@ def get_feature_stats(
     original_shape = array.shape
     reshaped, sample_count = _prepare_array_for_stats(array, axis)
 
+    running_stats = None
+    if reshaped.shape[0] > 0 and (return_sketch or reshaped.shape[0] >= 2):
+        running_stats = RunningQuantileStats(quantile_list)
+        running_stats.update(reshaped)
+
     if reshaped.shape[0] < 2:
         stats = _compute_basic_stats(reshaped, sample_count, quantile_list)
     else:
-        running_stats = RunningQuantileStats()
-        running_stats.update(reshaped)
         stats = running_stats.get_statistics()
         stats["count"] = np.array([sample_count])
 
     stats = _reshape_stats_by_axis(stats, axis, keepdims, original_shape)
+    if return_sketch:
+        return stats, running_stats
     return stats
 
 
@@ -562,8 +677,15 @@ def _assert_type_and_shape(stats_list: list[dict[str, dict]]):
                 _validate_stat_value(stat_value, stat_key, feature_key)
 
 
-def aggregate_feature_stats(stats_ft_list: list[dict[str, dict]]) -> dict[str, dict[str, np.ndarray]]:
-    """Aggregates stats for a single feature."""
+def aggregate_feature_stats(
+    stats_ft_list: list[dict[str, dict]], sketches: list[RunningQuantileStats] | None = None
+) -> dict[str, dict[str, np.ndarray]]:
+    """Aggregates stats for a single feature.
+
+    Quantiles are approximated by the count-weighted mean of the quantiles of each stats, unless the
+    running stats (`sketches`) the stats were computed with are given. The quantiles are then computed
+    from the merged histograms.
+    """
     means = np.stack([s["mean"] for s in stats_ft_list])
     variances = np.stack([s["std"] ** 2 for s in stats_ft_list])
     counts = np.stack([s["count"] for s in stats_ft_list])
@@ -599,10 +721,22 @@ def aggregate_feature_stats(stats_ft_list: list[dict[str, dict]]) -> dict[str, d
                 weighted_quantiles = quantile_values * counts
                 aggregated[q_key] = weighted_quantiles.sum(axis=0) / total_count
 
+    if sketches:
+        merged = RunningQuantileStats.from_sketch(
+            sketches[0].to_sketch(), quantile_list=sketches[0]._quantile_list
+        )
+        for sketch in sketches[1:]:
+            merged.merge(sketch)
+        for q_key, q_values in zip(merged._quantile_keys, merged._compute_quantiles(), strict=True):
+            aggregated[q_key] = q_values.reshape(total_mean.shape)
+
     return aggregated
 
 
-def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np.ndarray]]:
+def aggregate_stats(
+    stats_list: list[dict[str, dict]],
+    sketches_list: list[dict[str, RunningQuantileStats | None]] | None = None,
+) -> dict[str, dict[str, np.ndarray]]:
     """Aggregate stats from multiple compute_stats outputs into a single set of stats.
 
     The final stats will have the union of all data keys from each of the stats dicts.
@@ -612,6 +746,11 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
     - new_max = max(max_dataset_0, max_dataset_1, ...)
     - new_mean = (mean of all data, weighted by counts)
     - new_std = (std of all data)
+    - new_quantiles = (count-weighted mean of the quantiles)
+
+    If `sketches_list` holds, for each stats dict, the running stats of its features (see
+    `get_feature_stats(..., return_sketch=True)`), the quantiles of the features with a sketch in every
+    stats dict are instead computed from the merged histograms.
     """
 
     _assert_type_and_shape(stats_list)
@@ -621,6 +760,15 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
 
     for key in data_keys:
         stats_with_key = [stats[key] for stats in stats_list if key in stats]
-        aggregated_stats[key] = aggregate_feature_stats(stats_with_key)
+        sketches = None
+        if sketches_list is not None:
+            sketches = [
+                sketches.get(key)
+                for stats, sketches in zip(stats_list, sketches_list, strict=True)
+                if key in stats
+            ]
+            if any(sketch is None for sketch in sketches):
+                sketches = None
+        aggregated_stats[key] = aggregate_feature_stats(stats_with_key, sketches)
 
     return aggregated_stats
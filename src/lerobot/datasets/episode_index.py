@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compact on-disk index of the episodes metadata, memory-mapped when opening a dataset.
+
+Loading `meta/episodes` as a `datasets.Dataset` and fetching its rows is slow on datasets with thousands
+of episodes. The columns needed to locate the frames and videos of an episode (episode offsets, data and
+video chunk/file indices, video timestamps) are stored in a single structured `.npy` array, along with a
+manifest of the size and modification time of the episodes parquet files it was built from, so that a
+stale index is detected and rebuilt.
+"""
+
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import datasets
+import numpy as np
+
+from lerobot.datasets.utils import EPISODES_DIR
+
+EPISODES_INDEX_PATH = "meta/episodes_index.npy"
+EPISODES_INDEX_MANIFEST_PATH = "meta/episodes_index.json"
+# Bump when the layout of the index changes
+EPISODES_INDEX_VERSION = 1
+
+_INT_COLUMNS = [
+    "episode_index",
+    "dataset_from_index",
+    "dataset_to_index",
+    "data/chunk_index",
+    "data/file_index",
+]
+_VIDEO_INT_COLUMNS = ["chunk_index", "file_index"]
+_VIDEO_FLOAT_COLUMNS = ["from_timestamp", "to_timestamp"]
+
+
+def episodes_files_signature(root: Path) -> list[list]:
+    """Relative path, size and modification time of the episodes parquet files of a dataset."""
+    signature = []
+    for path in sorted((root / EPISODES_DIR).glob("*/*.parquet")):
+        stat = path.stat()
+        signature.append([str(path.relative_to(root)), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+class EpisodeIndex:
+    """Per-episode offsets and file locations, as a structured numpy array indexed by episode position.
+
+    Rows are accessed like the rows of `LeRobotDatasetMetadata.episodes`, restricted to the indexed columns.
+    """
+
+    def __init__(self, array: np.ndarray, video_keys: list[str]):
+        self.array = array
+        self.video_keys = video_keys
+
+    @classmethod
+    def from_episodes(cls, episodes: datasets.Dataset, video_keys: list[str]) -> "EpisodeIndex":
+        columns = _INT_COLUMNS + [
+            f"videos/{key}/{name}" for key in video_keys for name in _VIDEO_INT_COLUMNS + _VIDEO_FLOAT_COLUMNS
+        ]
+        table = episodes.with_format("arrow")[:]
+        dtype = [(name, np.float64 if name.endswith("timestamp") else np.int64) for name in columns]
+        array = np.empty(len(episodes), dtype=dtype)
+        for name in columns:
+            array[name] = table.column(name).to_numpy()
+        return cls(array, video_keys)
+
+    @classmethod
+    def load(cls, root: Path, video_keys: list[str]) -> "EpisodeIndex | None":
+        """Memory-map the index of a dataset, or return None when it is missing or stale."""
+        try:
+            manifest = json.loads((root / EPISODES_INDEX_MANIFEST_PATH).read_text())
+            if (
+                manifest["version"] != EPISODES_INDEX_VERSION
+                or manifest["video_keys"] != video_keys
+                or manifest["files"] != episodes_files_signature(root)
+            ):
+                return None
+            return cls(np.load(root / EPISODES_INDEX_PATH, mmap_mode="r"), video_keys)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, root: Path, signature: list[list]) -> None:
+        """Write the index, given the signature of the episodes files it was built from."""
+        manifest = {"version": EPISODES_INDEX_VERSION, "video_keys": self.video_keys, "files": signature}
+        index_path = root / EPISODES_INDEX_PATH
+        manifest_path = root / EPISODES_INDEX_MANIFEST_PATH
+        try:
+            # Written to temporary files then moved, so that concurrent readers (e.g. DDP ranks) never see
+            # a partially written index. The manifest is written last, as it validates the index.
+            tmp_index_path = index_path.with_name(f"{index_path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp_index_path, np.ascontiguousarray(self.array))
+            os.replace(tmp_index_path, index_path)
+            tmp_manifest_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+            tmp_manifest_path.write_text(json.dumps(manifest))
+            os.replace(tmp_manifest_path, manifest_path)
+        except OSError as e:
+            # e.g. read-only dataset root, the index is then rebuilt at every opening
+            logging.debug(f"Could not write the episodes index to {root}: {e}")
+            with contextlib.suppress(OSError):
+                tmp_index_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, ep_idx: int) -> dict:
+        row = self.array[ep_idx]
+        return {name: row[name].item() for name in self.array.dtype.names}
+
+    def data_files(self, episodes: list[int] | None = None) -> list[tuple[int, int]]:
+        """Unique (chunk_index, file_index) of the data files holding the given episodes (all when None)."""
+        rows = self.array if episodes is None else self.array[np.asarray(episodes, dtype=np.int64)]
+        return sorted(
+            set(zip(rows["data/chunk_index"].tolist(), rows["data/file_index"].tolist(), strict=True))
+        )
+
+    def video_files(self, video_key: str, episodes: list[int] | None = None) -> list[tuple[int, int]]:
+        """Unique (chunk_index, file_index) of the video files of a camera for the given episodes."""
+        rows = self.array if episodes is None else self.array[np.asarray(episodes, dtype=np.int64)]
+        chunks = rows[f"videos/{video_key}/chunk_index"].tolist()
+        files = rows[f"videos/{video_key}/file_index"].tolist()
+        return sorted(set(zip(chunks, files, strict=True)))
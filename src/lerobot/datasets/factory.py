@@ -83,6 +83,11 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
     image_transforms = (
         ImageTransforms(cfg.dataset.image_transforms) if cfg.dataset.image_transforms.enable else None
     )
+    if cfg.dataset.decode_to_uint8:
+        if cfg.dataset.streaming:
+            raise NotImplementedError("`decode_to_uint8` is not supported when streaming.")
+        # Applied on the training device to the float batch, see `lerobot_train.py`
+        image_transforms = None
 
     if isinstance(cfg.dataset.repo_id, str):
         ds_meta = LeRobotDatasetMetadata(
@@ -100,6 +105,7 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 video_backend=cfg.dataset.video_backend,
                 tolerance_s=cfg.tolerance_s,
                 use_ibr_images=getattr(cfg.dataset, "use_ibr_images", False),
+                return_uint8_images=cfg.dataset.decode_to_uint8,
             )
         else:
             dataset = StreamingLeRobotDataset(
@@ -111,6 +117,9 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 revision=cfg.dataset.revision,
                 max_num_shards=cfg.num_workers,
                 tolerance_s=cfg.tolerance_s,
+                num_prefetch_shards=cfg.dataset.streaming_prefetch_shards,
+                episode_buffer_size=cfg.dataset.streaming_episode_buffer_size,
+                episode_slice_length=cfg.dataset.streaming_episode_slice_length,
             )
     else:
         raise NotImplementedError("The MultiLeRobotDataset isn't supported for now.")
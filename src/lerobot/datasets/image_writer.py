@@ -175,6 +175,10 @@ class AsyncImageWriter:
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
+        elif isinstance(image, np.ndarray) and not image.flags.writeable:
+            # Read-only frames may be views of a pool of frames reused by the camera (e.g. `OpenCVCamera` with
+            # `num_buffers`), which could be overwritten before the image is written
+            image = image.copy()
         self.queue.put((image, fpath, compress_level))
 
     def wait_until_done(self):
@@ -19,6 +19,7 @@ import logging
 import shutil
 import tempfile
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 import datasets
@@ -34,6 +35,12 @@ from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.episode_index import (
+    EPISODES_INDEX_MANIFEST_PATH,
+    EPISODES_INDEX_PATH,
+    EpisodeIndex,
+    episodes_files_signature,
+)
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
@@ -162,9 +169,47 @@ class LeRobotDatasetMetadata:
         self.info = load_info(self.root)
         check_version_compatibility(self.repo_id, self._version, CODEBASE_VERSION)
         self.tasks = load_tasks(self.root)
-        self.episodes = load_episodes(self.root)
+        self.load_episode_index()
         self.stats = load_stats(self.root)
 
+    def load_episode_index(self) -> None:
+        """Memory-map the episodes index, building it from `meta/episodes` when it is missing or stale.
+
+        With a valid index, `episodes` is only loaded when accessed.
+        """
+        episode_index = EpisodeIndex.load(self.root, self.video_keys)
+        if episode_index is None:
+            # The signature is taken before reading the files, so that a concurrent write invalidates the index
+            signature = episodes_files_signature(self.root)
+            self.episodes = load_episodes(self.root)
+            episode_index = EpisodeIndex.from_episodes(self.episodes, self.video_keys)
+            episode_index.save(self.root, signature)
+        else:
+            self._episodes = None
+            self._load_episodes_lazily = True
+        self._episode_index = episode_index
+
+    @property
+    def episodes(self) -> datasets.Dataset | None:
+        """Metadata of every episode, loaded from `meta/episodes` on first access."""
+        if self._load_episodes_lazily:
+            self._episodes = load_episodes(self.root)
+            self._load_episodes_lazily = False
+        return self._episodes
+
+    @episodes.setter
+    def episodes(self, episodes: datasets.Dataset | None) -> None:
+        self._episodes = episodes
+        self._load_episodes_lazily = False
+        self._episode_index = None
+
+    @property
+    def episode_index(self) -> EpisodeIndex | None:
+        """Offsets and file locations of the episodes, see `EpisodeIndex`."""
+        if self._episode_index is None and self.episodes is not None:
+            self._episode_index = EpisodeIndex.from_episodes(self.episodes, self.video_keys)
+        return self._episode_index
+
     def pull_from_repo(
         self,
         allow_patterns: list[str] | str | None = None,
@@ -189,26 +234,22 @@ class LeRobotDatasetMetadata:
         return packaging.version.parse(self.info["codebase_version"])
 
     def get_data_file_path(self, ep_index: int) -> Path:
-        if self.episodes is None:
+        if self.episode_index is None:
             self.episodes = load_episodes(self.root)
-        if ep_index >= len(self.episodes):
-            raise IndexError(
-                f"Episode index {ep_index} out of range. Episodes: {len(self.episodes) if self.episodes else 0}"
-            )
-        ep = self.episodes[ep_index]
+        if ep_index >= len(self.episode_index):
+            raise IndexError(f"Episode index {ep_index} out of range. Episodes: {len(self.episode_index)}")
+        ep = self.episode_index[ep_index]
         chunk_idx = ep["data/chunk_index"]
         file_idx = ep["data/file_index"]
         fpath = self.data_path.format(chunk_index=chunk_idx, file_index=file_idx)
         return Path(fpath)
 
     def get_video_file_path(self, ep_index: int, vid_key: str) -> Path:
-        if self.episodes is None:
+        if self.episode_index is None:
             self.episodes = load_episodes(self.root)
-        if ep_index >= len(self.episodes):
-            raise IndexError(
-                f"Episode index {ep_index} out of range. Episodes: {len(self.episodes) if self.episodes else 0}"
-            )
-        ep = self.episodes[ep_index]
+        if ep_index >= len(self.episode_index):
+            raise IndexError(f"Episode index {ep_index} out of range. Episodes: {len(self.episode_index)}")
+        ep = self.episode_index[ep_index]
         chunk_idx = ep[f"videos/{vid_key}/chunk_index"]
         file_idx = ep[f"videos/{vid_key}/file_index"]
         fpath = self.video_path.format(video_key=vid_key, chunk_index=chunk_idx, file_index=file_idx)
@@ -568,6 +609,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         batch_encoding_size: int = 1,
         vcodec: str = "libsvtav1",
         use_ibr_images: bool = False,
+        return_uint8_images: bool = False,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -683,6 +725,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
             vcodec (str, optional): Video codec for encoding videos during recording. Options: 'h264', 'hevc',
                 'libsvtav1'. Defaults to 'libsvtav1'. Use 'h264' for faster encoding on systems where AV1
                 encoding is CPU-heavy.
+            return_uint8_images (bool, optional): Return the visual modalities as uint8 (C, H, W) tensors
+                instead of float32 tensors in [0, 1], to be scaled on the training device (see
+                `NormalizerProcessorStep`). This cuts the memory copied between the dataloader workers and
+                the main process by 4x. `image_transforms` then receive uint8 tensors. Defaults to False.
         """
         super().__init__()
         if vcodec not in VALID_VIDEO_CODECS:
@@ -700,6 +746,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.episodes_since_last_encoding = 0
         self.vcodec = vcodec
         self.use_ibr_images = use_ibr_images
+        self.return_uint8_images = return_uint8_images
 
         # Unused attributes
         self.image_writer = None
@@ -735,13 +782,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.hf_dataset = self.load_hf_dataset()
 
         # Create mapping from absolute indices to relative indices when only a subset of the episodes are loaded
-        # Build a mapping: absolute_index -> relative_index_in_filtered_dataset
+        # Sorted absolute indices of the loaded frames, and their relative index in the filtered dataset
         self._absolute_to_relative_idx = None
         if self.episodes is not None:
-            self._absolute_to_relative_idx = {
-                abs_idx.item() if isinstance(abs_idx, torch.Tensor) else abs_idx: rel_idx
-                for rel_idx, abs_idx in enumerate(self.hf_dataset["index"])
-            }
+            self._absolute_to_relative_idx = self._make_absolute_to_relative_idx()
 
         # Setup delta_indices
         if self.delta_timestamps is not None:
@@ -773,7 +817,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         upload_large_folder: bool = False,
         **card_kwargs,
     ) -> None:
-        ignore_patterns = ["images/"]
+        ignore_patterns = ["images/", EPISODES_INDEX_PATH, EPISODES_INDEX_MANIFEST_PATH]
         if not push_videos:
             ignore_patterns.append("videos/")
 
@@ -861,8 +905,17 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def load_hf_dataset(self) -> datasets.Dataset:
         """hf_dataset contains all the observations, states, actions, rewards, etc."""
         features = get_hf_features_from_features(self.features)
-        hf_dataset = load_nested_dataset(self.root / "data", features=features, episodes=self.episodes)
-        hf_dataset.set_transform(hf_transform_to_torch)
+        paths = None
+        if self.episodes is not None and self.meta.episode_index is not None:
+            # Only read the data files holding the requested episodes
+            paths = [
+                self.root / self.meta.data_path.format(chunk_index=chunk_idx, file_index=file_idx)
+                for chunk_idx, file_idx in self.meta.episode_index.data_files(self.episodes)
+            ]
+        hf_dataset = load_nested_dataset(
+            self.root / "data", features=features, episodes=self.episodes, paths=paths
+        )
+        hf_dataset.set_transform(partial(hf_transform_to_torch, uint8_images=self.return_uint8_images))
         return hf_dataset
 
     def _check_cached_episodes_sufficient(self) -> bool:
@@ -870,31 +923,46 @@ class LeRobotDataset(torch.utils.data.Dataset):
         if self.hf_dataset is None or len(self.hf_dataset) == 0:
             return False
 
-        # Get available episode indices from cached dataset
-        available_episodes = {
-            ep_idx.item() if isinstance(ep_idx, torch.Tensor) else ep_idx
-            for ep_idx in self.hf_dataset.unique("episode_index")
-        }
-
         # Determine requested episodes
         if self.episodes is None:
-            requested_episodes = set(range(self.meta.total_episodes))
+            requested_episodes = list(range(self.meta.total_episodes))
         else:
-            requested_episodes = set(self.episodes)
-
-        # Check if all requested episodes are available in cached data
-        if not requested_episodes.issubset(available_episodes):
+            requested_episodes = sorted(set(self.episodes))
+        if requested_episodes and requested_episodes[-1] >= len(self.meta.episode_index):
             return False
 
-        # Check if all required video files exist
-        if len(self.meta.video_keys) > 0:
-            for ep_idx in requested_episodes:
-                for vid_key in self.meta.video_keys:
-                    video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-                    if not video_path.exists():
-                        return False
+        # Every requested episode must be part of the cached data, read from the arrow table without the
+        # torch transform of the dataset
+        available_episodes = np.unique(self.hf_dataset.data.column("episode_index").to_numpy())
+        if not np.isin(requested_episodes, available_episodes).all():
+            return False
 
-        return True
+        # The episodes index maps the requested episodes to their files, which only need to exist
+        episode_index = self.meta.episode_index
+        required_paths = [
+            self.meta.data_path.format(chunk_index=chunk_idx, file_index=file_idx)
+            for chunk_idx, file_idx in episode_index.data_files(requested_episodes)
+        ]
+        for vid_key in self.meta.video_keys:
+            required_paths += [
+                self.meta.video_path.format(video_key=vid_key, chunk_index=chunk_idx, file_index=file_idx)
+                for chunk_idx, file_idx in episode_index.video_files(vid_key, requested_episodes)
+            ]
+        return all((self.root / path).exists() for path in required_paths)
+
+    def _make_absolute_to_relative_idx(self) -> tuple[np.ndarray, np.ndarray]:
+        # Read from the arrow table, without the torch transform of the dataset
+        absolute_indices = self.hf_dataset.data.column("index").to_numpy()
+        order = np.argsort(absolute_indices, kind="stable")
+        return absolute_indices[order], order
+
+    def _to_relative_indices(self, absolute_indices: list[int]) -> list[int]:
+        """Map absolute frame indices to their index in the filtered `hf_dataset`."""
+        sorted_absolute, order = self._absolute_to_relative_idx
+        positions = np.minimum(np.searchsorted(sorted_absolute, absolute_indices), len(sorted_absolute) - 1)
+        if (sorted_absolute[positions] != absolute_indices).any():
+            raise KeyError(f"Some of the frames {absolute_indices} are not part of the loaded episodes.")
+        return order[positions].tolist()
 
     def create_hf_dataset(self) -> datasets.Dataset:
         features = get_hf_features_from_features(self.features)
@@ -951,7 +1019,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             - query_indices: Dict mapping keys to lists of absolute indices to query
             - padding: Dict mapping "{key}_is_pad" to boolean tensors indicating padded positions
         """
-        ep = self.meta.episodes[ep_idx]
+        ep = self.meta.episode_index[ep_idx]
         ep_start = ep["dataset_from_index"]
         ep_end = ep["dataset_to_index"]
         query_indices = {
@@ -975,7 +1043,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         for key in self.meta.video_keys:
             if query_indices is not None and key in query_indices:
                 if self._absolute_to_relative_idx is not None:
-                    relative_indices = [self._absolute_to_relative_idx[idx] for idx in query_indices[key]]
+                    relative_indices = self._to_relative_indices(query_indices[key])
                     timestamps = self.hf_dataset[relative_indices]["timestamp"]
                 else:
                     timestamps = self.hf_dataset[query_indices[key]]["timestamp"]
@@ -1003,9 +1071,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 continue
             # Map absolute indices to relative indices if needed
             relative_indices = (
-                q_idx
-                if self._absolute_to_relative_idx is None
-                else [self._absolute_to_relative_idx[idx] for idx in q_idx]
+                q_idx if self._absolute_to_relative_idx is None else self._to_relative_indices(q_idx)
             )
             try:
                 result[key] = torch.stack(self.hf_dataset[key][relative_indices])
@@ -1019,7 +1085,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
         """
-        ep = self.meta.episodes[ep_idx]
+        ep = self.meta.episode_index[ep_idx]
         item = {}
         for vid_key, query_ts in query_timestamps.items():
             # Episodes are stored sequentially on a single mp4 to reduce the number of files.
@@ -1029,7 +1095,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
             shifted_query_ts = [from_timestamp + ts for ts in query_ts]
 
             video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self.tolerance_s, self.video_backend)
+            frames = decode_video_frames(
+                video_path,
+                shifted_query_ts,
+                self.tolerance_s,
+                self.video_backend,
+                return_uint8=self.return_uint8_images,
+            )
             item[vid_key] = frames.squeeze(0)
 
         return item
@@ -1611,6 +1683,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.episodes = None
         obj.hf_dataset = obj.create_hf_dataset()
         obj.image_transforms = None
+        obj.return_uint8_images = False
         obj.delta_timestamps = None
         obj.delta_indices = None
         obj._absolute_to_relative_idx = None
@@ -1630,6 +1703,11 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
 
     The underlying `LeRobotDataset`s are effectively concatenated, and this class adopts much of the API
     structure of `LeRobotDataset`.
+
+    For co-training mixtures, features of a source can be renamed to the common names with `feature_remaps`
+    (e.g. `{"lerobot/aloha": {"observation.images.top": "observation.images.front"}}`), and the sources are
+    given sampling `weights` to be drawn from with `WeightedMixtureSampler`. Video decoders are shared
+    across the sources through the process-wide decoder cache of `decode_video_frames`.
     """
 
     def __init__(
@@ -1642,11 +1720,15 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         tolerances_s: dict | None = None,
         download_videos: bool = True,
         video_backend: str | None = None,
+        feature_remaps: dict[str, dict[str, str]] | None = None,
+        weights: dict[str, float] | None = None,
+        return_uint8_images: bool = False,
     ):
         super().__init__()
         self.repo_ids = repo_ids
         self.root = Path(root) if root else HF_LEROBOT_HOME
         self.tolerances_s = tolerances_s if tolerances_s else dict.fromkeys(repo_ids, 0.0001)
+        self.feature_remaps = feature_remaps if feature_remaps else {}
         # Construct the underlying datasets passing everything but `transform` and `delta_timestamps` which
         # are handled by this class.
         self._datasets = [
@@ -1655,10 +1737,11 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
                 root=self.root / repo_id,
                 episodes=episodes[repo_id] if episodes else None,
                 image_transforms=image_transforms,
-                delta_timestamps=delta_timestamps,
+                delta_timestamps=self._source_delta_timestamps(repo_id, delta_timestamps),
                 tolerance_s=self.tolerances_s[repo_id],
                 download_videos=download_videos,
                 video_backend=video_backend,
+                return_uint8_images=return_uint8_images,
             )
             for repo_id in repo_ids
         ]
@@ -1667,28 +1750,74 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         # restriction in future iterations of this class. For now, this is necessary at least for being able
         # to use PyTorch's default DataLoader collate function.
         self.disabled_features = set()
-        intersection_features = set(self._datasets[0].features)
-        for ds in self._datasets:
-            intersection_features.intersection_update(ds.features)
+        source_features = [
+            {self._remap_key(repo_id, key) for key in ds.features}
+            for repo_id, ds in zip(self.repo_ids, self._datasets, strict=True)
+        ]
+        intersection_features = set.intersection(*source_features)
         if len(intersection_features) == 0:
             raise RuntimeError(
                 "Multiple datasets were provided but they had no keys common to all of them. "
                 "The multi-dataset functionality currently only keeps common keys."
             )
-        for repo_id, ds in zip(self.repo_ids, self._datasets, strict=True):
-            extra_keys = set(ds.features).difference(intersection_features)
+        for repo_id, features in zip(self.repo_ids, source_features, strict=True):
+            extra_keys = features.difference(intersection_features)
             logging.warning(
                 f"keys {extra_keys} of {repo_id} were disabled as they are not contained in all the "
                 "other datasets."
             )
             self.disabled_features.update(extra_keys)
 
+        # Renamings and removals applied to the items of every source, resolved once here
+        self._item_renames = []
+        self._item_removals = []
+        for repo_id, ds in zip(self.repo_ids, self._datasets, strict=True):
+            renames, removals = [], []
+            for key in ds.features:
+                common_key = self._remap_key(repo_id, key)
+                if common_key in self.disabled_features:
+                    removals.append(key)
+                elif common_key != key:
+                    renames += [(key, common_key), (f"{key}_is_pad", f"{common_key}_is_pad")]
+            self._item_renames.append(renames)
+            self._item_removals.append(removals)
+
+        # First global index of every source, to locate the source of an index by bisection
+        self._source_offsets = np.cumsum([0] + [ds.num_frames for ds in self._datasets])
+
+        weights = weights if weights else dict.fromkeys(repo_ids, 1.0)
+        if set(weights) != set(repo_ids) or any(w < 0 for w in weights.values()):
+            raise ValueError(f"weights should give a non-negative weight to each of {repo_ids}.")
+        self.weights = [weights[repo_id] for repo_id in repo_ids]
+
         self.image_transforms = image_transforms
         self.delta_timestamps = delta_timestamps
         # TODO(rcadene, aliberts): We should not perform this aggregation for datasets
         # with multiple robots of different ranges. Instead we should have one normalization
         # per robot.
-        self.stats = aggregate_stats([dataset.meta.stats for dataset in self._datasets])
+        self.stats = aggregate_stats(
+            [
+                {self._remap_key(repo_id, key): stats for key, stats in dataset.meta.stats.items()}
+                for repo_id, dataset in zip(self.repo_ids, self._datasets, strict=True)
+            ]
+        )
+
+    def _remap_key(self, repo_id: str, key: str) -> str:
+        return self.feature_remaps.get(repo_id, {}).get(key, key)
+
+    def _source_delta_timestamps(
+        self, repo_id: str, delta_timestamps: dict[str, list[float]] | None
+    ) -> dict[str, list[float]] | None:
+        """Delta timestamps given with the common feature names, keyed by the feature names of a source."""
+        if delta_timestamps is None:
+            return None
+        common_to_source = {common: key for key, common in self.feature_remaps.get(repo_id, {}).items()}
+        return {common_to_source.get(key, key): deltas for key, deltas in delta_timestamps.items()}
+
+    @property
+    def source_num_frames(self) -> list[int]:
+        """Number of frames of every source, in the order of `repo_ids`."""
+        return np.diff(self._source_offsets).tolist()
 
     @property
     def repo_id_to_index(self):
@@ -1719,8 +1848,11 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
     @property
     def features(self) -> datasets.Features:
         features = {}
-        for dataset in self._datasets:
-            features.update({k: v for k, v in dataset.hf_features.items() if k not in self.disabled_features})
+        for repo_id, dataset in zip(self.repo_ids, self._datasets, strict=True):
+            for key, feature in dataset.hf_features.items():
+                common_key = self._remap_key(repo_id, key)
+                if common_key not in self.disabled_features:
+                    features[common_key] = feature
         return features
 
     @property
@@ -1772,21 +1904,14 @@ class MultiLeRobotDataset(torch.utils.data.Dataset):
         if idx >= len(self):
             raise IndexError(f"Index {idx} out of bounds.")
         # Determine which dataset to get an item from based on the index.
-        start_idx = 0
-        dataset_idx = 0
-        for dataset in self._datasets:
-            if idx >= start_idx + dataset.num_frames:
-                start_idx += dataset.num_frames
-                dataset_idx += 1
-                continue
-            break
-        else:
-            raise AssertionError("We expect the loop to break out as long as the index is within bounds.")
-        item = self._datasets[dataset_idx][idx - start_idx]
+        dataset_idx = int(np.searchsorted(self._source_offsets, idx, side="right")) - 1
+        item = self._datasets[dataset_idx][idx - int(self._source_offsets[dataset_idx])]
         item["dataset_index"] = torch.tensor(dataset_idx)
-        for data_key in self.disabled_features:
+        for data_key in self._item_removals[dataset_idx]:
+            item.pop(data_key, None)
+        for data_key, common_key in self._item_renames[dataset_idx]:
             if data_key in item:
-                del item[data_key]
+                item[common_key] = item.pop(data_key)
 
         return item
 
@@ -337,8 +337,8 @@ def compute_sampler_weights(
     if len(offline_dataset) > 0:
         offline_data_mask_indices = []
         for start_index, end_index in zip(
-            offline_dataset.meta.episodes["dataset_from_index"],
-            offline_dataset.meta.episodes["dataset_to_index"],
+            offline_dataset.meta.episode_index.array["dataset_from_index"].tolist(),
+            offline_dataset.meta.episode_index.array["dataset_to_index"].tolist(),
             strict=True,
         ):
             offline_data_mask_indices.extend(range(start_index, end_index - offline_drop_n_last_frames))
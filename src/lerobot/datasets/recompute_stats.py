@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Recompute the stats of a LeRobotDataset in parallel, caching the stats of every episode.
+
+Episodes are processed in a process pool. Every worker reads the rows of its episode from the data
+parquet file, hashes their content together with the content of the referenced video segments, and only
+computes the episode stats (decoding the sampled video frames in a single batch) when no stats are cached
+for this hash. The episode stats are cached together with the running stats they were computed with, so
+that `aggregate_stats` computes the quantiles of the dataset from the merged histograms of the episodes.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import torch
+
+from lerobot.datasets.compute_stats import (
+    DEFAULT_QUANTILES,
+    RunningQuantileStats,
+    aggregate_stats,
+    auto_downsample_height_width,
+    get_feature_stats,
+    sample_indices,
+)
+from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+from lerobot.datasets.utils import flatten_dict, load_image_as_numpy, unflatten_dict
+from lerobot.datasets.video_utils import decode_video_frames
+
+# Bump when the way episode stats are computed changes, to invalidate the cached stats
+STATS_CACHE_VERSION = 2
+# Size of the blocks read when hashing video files
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_file(path: Path) -> str:
+    """Content hash of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=2)
+def _read_data_file(path: Path, columns: tuple[str, ...]):
+    # Consecutive episodes of a worker usually live in the same data file
+    return pq.read_table(path, columns=list(columns))
+
+
+def _load_episode_columns(
+    data_path: Path, episode_index: int, columns: tuple[str, ...]
+) -> dict[str, np.ndarray | list]:
+    table = _read_data_file(data_path, tuple(dict.fromkeys(("episode_index", *columns))))
+    mask = table.column("episode_index").to_numpy() == episode_index
+    episode = table.filter(mask)
+    data = {}
+    for key in columns:
+        values = episode.column(key).to_pylist()
+        # Images are stored as {"bytes": ..., "path": ...} structs, numerical features as (lists of) scalars
+        data[key] = values if values and isinstance(values[0], dict) else np.asarray(values)
+    return data
+
+
+def _episode_hash(task: dict, data: dict[str, np.ndarray | list]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    header = {
+        "version": STATS_CACHE_VERSION,
+        "quantiles": task["quantile_list"],
+        "features": {key: task["features"][key] for key in sorted(task["features"])},
+        # Not the video paths, so that moving the dataset keeps its cached stats valid
+        "videos": {
+            key: {k: v for k, v in video.items() if k != "path"} for key, video in task["videos"].items()
+        },
+    }
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+    for key in sorted(data):
+        digest.update(key.encode())
+        if isinstance(data[key], list):
+            for image in data[key]:
+                digest.update(image["bytes"] or b"")
+        else:
+            digest.update(str(data[key].dtype).encode())
+            digest.update(np.ascontiguousarray(data[key]).tobytes())
+    return digest.hexdigest()
+
+
+def _image_array_stats(
+    images: np.ndarray, quantile_list: list[float]
+) -> tuple[dict[str, np.ndarray], RunningQuantileStats | None]:
+    # Same convention as `compute_episode_stats`: per-channel stats of uint8 images, scaled to [0, 1]. The
+    # images are scaled before, so that the running stats are on the same scale as the stats.
+    images = images.astype(np.float32) / 255.0
+    stats, sketch = get_feature_stats(
+        images, axis=(0, 2, 3), keepdims=True, quantile_list=quantile_list, return_sketch=True
+    )
+    return {k: v if k == "count" else np.squeeze(v, axis=0) for k, v in stats.items()}, sketch
+
+
+def _sample_video_frames(
+    video_path: Path, from_timestamp: float, ep_length: int, fps: int, backend: str | None
+) -> np.ndarray:
+    timestamps = [from_timestamp + idx / fps for idx in sample_indices(ep_length)]
+    # All the sampled frames are decoded in one call, seeking once per keyframe instead of once per frame
+    frames = decode_video_frames(video_path, timestamps, tolerance_s=0.5 / fps, backend=backend)
+    frames = (frames * 255).round().to(dtype=torch.uint8).numpy()
+    return np.stack([auto_downsample_height_width(frame) for frame in frames])
+
+
+def _sample_encoded_images(images: list[dict]) -> np.ndarray:
+    sampled = []
+    for idx in sample_indices(len(images)):
+        image = images[idx]
+        source = io.BytesIO(image["bytes"]) if image["bytes"] is not None else image["path"]
+        img = load_image_as_numpy(source, dtype=np.uint8, channel_first=True)
+        sampled.append(auto_downsample_height_width(img))
+    return np.stack(sampled)
+
+
+def _compute_episode_stats(task: dict, data: dict[str, np.ndarray | list]) -> tuple[dict, dict]:
+    """Stats of the episode, and the sketches of the running stats they were computed with, by feature."""
+    features, quantile_list = task["features"], task["quantile_list"]
+    ep_length = task["dataset_to_index"] - task["dataset_from_index"]
+
+    ep_stats = {}
+    running_stats = {}
+    for key, ft in features.items():
+        if ft["dtype"] == "string":
+            continue
+        if ft["dtype"] == "video":
+            video = task["videos"][key]
+            images = _sample_video_frames(
+                Path(video["path"]), video["from_timestamp"], ep_length, task["fps"], task["video_backend"]
+            )
+            ep_stats[key], running_stats[key] = _image_array_stats(images, quantile_list)
+        elif ft["dtype"] == "image":
+            ep_stats[key], running_stats[key] = _image_array_stats(
+                _sample_encoded_images(data[key]), quantile_list
+            )
+        else:
+            values = data[key]
+            ep_stats[key], running_stats[key] = get_feature_stats(
+                values, axis=0, keepdims=values.ndim == 1, quantile_list=quantile_list, return_sketch=True
+            )
+    # Sketches are plain arrays, cached with the stats
+    ep_sketches = {key: rs.to_sketch() for key, rs in running_stats.items() if rs is not None}
+    return ep_stats, ep_sketches
+
+
+def _save_cached_stats(path: Path, ep_stats: dict, ep_sketches: dict) -> None:
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(tmp_path, **flatten_dict({"stats": ep_stats, "sketches": ep_sketches}))
+    # Atomic, so that concurrent runs never read a partially written file
+    os.replace(tmp_path, path)
+
+
+def _load_cached_stats(path: Path) -> tuple[dict, dict] | None:
+    try:
+        with np.load(path) as cached:
+            cached = unflatten_dict({key: cached[key] for key in cached.files})
+    except (OSError, ValueError):
+        return None
+    if "stats" not in cached:
+        return None
+    return cached["stats"], cached.get("sketches", {})
+
+
+def _process_episode(task: dict) -> tuple[int, dict, dict, bool]:
+    columns = tuple(key for key, ft in task["features"].items() if ft["dtype"] not in ["video", "string"])
+    data = _load_episode_columns(Path(task["data_path"]), task["episode_index"], columns)
+
+    cache_path = None
+    if task["cache_dir"] is not None:
+        cache_path = Path(task["cache_dir"]) / f"{_episode_hash(task, data)}.npz"
+        if cache_path.exists() and (cached := _load_cached_stats(cache_path)) is not None:
+            return task["episode_index"], *cached, True
+
+    ep_stats, ep_sketches = _compute_episode_stats(task, data)
+    if cache_path is not None:
+        _save_cached_stats(cache_path, ep_stats, ep_sketches)
+    return task["episode_index"], ep_stats, ep_sketches, False
+
+
+def _make_episode_tasks(
+    meta: LeRobotDatasetMetadata,
+    cache_dir: Path | None,
+    video_backend: str | None,
+    quantile_list: list[float],
+    num_workers: int,
+) -> list[dict]:
+    if meta.episodes is None:
+        raise ValueError(f"No episodes metadata found in {meta.root}.")
+
+    episodes = meta.episodes.to_list()
+    video_paths = {
+        (ep["episode_index"], key): meta.root / meta.get_video_file_path(ep["episode_index"], key)
+        for ep in episodes
+        for key in meta.video_keys
+    }
+    # Video segments are identified by the content of their file, hashed once per file
+    unique_paths = sorted(set(video_paths.values()))
+    with ThreadPoolExecutor(max_workers=max(num_workers, 1)) as executor:
+        file_hashes = dict(zip(unique_paths, executor.map(hash_file, unique_paths), strict=True))
+
+    tasks = []
+    for ep in episodes:
+        ep_idx = ep["episode_index"]
+        videos = {
+            key: {
+                "path": str(video_paths[ep_idx, key]),
+                "hash": file_hashes[video_paths[ep_idx, key]],
+                "from_timestamp": ep[f"videos/{key}/from_timestamp"],
+                "to_timestamp": ep[f"videos/{key}/to_timestamp"],
+            }
+            for key in meta.video_keys
+        }
+        tasks.append(
+            {
+                "episode_index": ep_idx,
+                "dataset_from_index": ep["dataset_from_index"],
+                "dataset_to_index": ep["dataset_to_index"],
+                "data_path": str(meta.root / meta.get_data_file_path(ep_idx)),
+                "videos": videos,
+                "features": meta.features,
+                "fps": meta.fps,
+                "quantile_list": quantile_list,
+                "video_backend": video_backend,
+                "cache_dir": str(cache_dir) if cache_dir is not None else None,
+            }
+        )
+    return tasks
+
+
+def recompute_dataset_stats(
+    meta: LeRobotDatasetMetadata,
+    num_workers: int = 8,
+    cache_dir: Path | None = None,
+    video_backend: str | None = None,
+    quantile_list: list[float] | None = None,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Compute the per-episode stats of a dataset in a process pool and aggregate them.
+
+    Args:
+        meta: Metadata of the dataset, whose data and videos are read from `meta.root`.
+        num_workers: Number of worker processes. Episodes are processed in the main process when 0.
+        cache_dir: Directory of the per-episode stats, keyed by a hash of the episode content. Only episodes
+            whose content changed since the stats were cached are recomputed. No caching when None.
+        video_backend: Backend used to decode the sampled video frames. Defaults to torchcodec when
+            available.
+        quantile_list: Quantiles to compute. Defaults to `DEFAULT_QUANTILES`.
+
+    Returns:
+        The aggregated stats of the dataset.
+    """
+    if quantile_list is None:
+        quantile_list = DEFAULT_QUANTILES
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = _make_episode_tasks(meta, cache_dir, video_backend, quantile_list, num_workers)
+    if num_workers > 0:
+        # Contiguous chunks keep the episodes of a data file on the same worker. Spawned workers, as the
+        # video decoders are not fork-safe.
+        chunksize = max(1, len(tasks) // (num_workers * 4))
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=get_context("spawn")) as executor:
+            results = list(executor.map(_process_episode, tasks, chunksize=chunksize))
+    else:
+        results = [_process_episode(task) for task in tasks]
+
+    num_cached = sum(cached for *_, cached in results)
+    logging.info(f"Recomputed the stats of {len(results) - num_cached} episodes, {num_cached} were cached.")
+
+    results.sort(key=lambda result: result[0])
+    # The quantiles are computed from the merged running stats of the episodes, rather than averaged
+    sketches_list = [
+        {key: RunningQuantileStats.from_sketch(sketch, quantile_list) for key, sketch in ep_sketches.items()}
+        for _, _, ep_sketches, _ in results
+    ]
+    return aggregate_stats([ep_stats for _, ep_stats, _, _ in results], sketches_list)
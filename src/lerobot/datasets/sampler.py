@@ -13,23 +13,35 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
 
+import numpy as np
 import torch
 
+# Number of indices converted to python ints at once when iterating
+_CHUNK_SIZE = 65536
+
 
 class EpisodeAwareSampler:
     def __init__(
         self,
-        dataset_from_indices: list[int],
-        dataset_to_indices: list[int],
-        episode_indices_to_use: list | None = None,
+        dataset_from_indices: Sequence[int],
+        dataset_to_indices: Sequence[int],
+        episode_indices_to_use: Iterable[int] | None = None,
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        seed: int | None = None,
+        num_replicas: int = 1,
+        rank: int = 0,
+        episode_weights: Sequence[float] | None = None,
+        num_samples: int | None = None,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
+        Frame indices are never materialized: the sampler only keeps the start and length of every used
+        episode and maps sample positions to frame indices with episode-offset arithmetic.
+
         Args:
             dataset_from_indices: List of indices containing the start of each episode in the dataset.
             dataset_to_indices: List of indices containing the end of each episode in the dataset.
@@ -38,24 +50,175 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            seed: Seed of the per-epoch permutation, which depends on (seed, epoch). If None, a seed is
+                drawn from the torch global random generator at the start of every epoch.
+            num_replicas: Number of distributed processes to shard the indices across. Leave it to 1 when
+                the dataloader is already sharded (e.g. by `accelerate`).
+            rank: Rank of the current process, in [0, num_replicas).
+            episode_weights: Optional sampling weight of each episode of the dataset (indexed like
+                `dataset_from_indices`). Episodes are then drawn with replacement proportionally to their
+                weight, and frames uniformly within the drawn episode.
+            num_samples: Number of samples per epoch with episode weights. Defaults to the number of frames.
         """
-        indices = []
-        for episode_idx, (start_index, end_index) in enumerate(
-            zip(dataset_from_indices, dataset_to_indices, strict=True)
-        ):
-            if episode_indices_to_use is None or episode_idx in episode_indices_to_use:
-                indices.extend(range(start_index + drop_n_first_frames, end_index - drop_n_last_frames))
-
-        self.indices = indices
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank should be in [0, {num_replicas}), got {rank}.")
+
+        from_indices = np.asarray(dataset_from_indices, dtype=np.int64) + drop_n_first_frames
+        to_indices = np.asarray(dataset_to_indices, dtype=np.int64) - drop_n_last_frames
+        if from_indices.shape != to_indices.shape:
+            raise ValueError("dataset_from_indices and dataset_to_indices should have the same length.")
+
+        keep = np.ones(len(from_indices), dtype=bool)
+        if episode_indices_to_use is not None:
+            selected = np.fromiter(set(episode_indices_to_use), dtype=np.int64)
+            selected = selected[(selected >= 0) & (selected < len(from_indices))]
+            keep = np.zeros(len(from_indices), dtype=bool)
+            keep[selected] = True
+
+        lengths = np.maximum(to_indices - from_indices, 0)
+        keep &= lengths > 0
+
+        self.episode_starts = from_indices[keep]
+        self.episode_lengths = lengths[keep]
+        # Position of the first frame of every used episode in the concatenation of used episodes
+        self.episode_offsets = np.cumsum(self.episode_lengths) - self.episode_lengths
+        self.num_frames = int(self.episode_lengths.sum())
+
+        self.episode_probabilities = None
+        if episode_weights is not None:
+            weights = np.asarray(episode_weights, dtype=np.float64)
+            if weights.shape != from_indices.shape:
+                raise ValueError("episode_weights should have one weight per episode of the dataset.")
+            if (weights < 0).any():
+                raise ValueError("episode_weights should be non-negative.")
+            weights = weights[keep]
+            if weights.sum() <= 0:
+                raise ValueError("The used episodes should have a positive total weight.")
+            self.episode_probabilities = weights / weights.sum()
+
+        self.num_samples = num_samples if num_samples is not None else self.num_frames
         self.shuffle = shuffle
+        self.seed = seed
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.epoch = 0
 
-    def __iter__(self) -> Iterator[int]:
+    @property
+    def indices(self) -> np.ndarray:
+        """All the frame indices used by the sampler, in dataset order. Materialized on every access."""
+        return self.positions_to_indices(np.arange(self.num_frames, dtype=np.int64))
+
+    def positions_to_indices(self, positions: np.ndarray) -> np.ndarray:
+        """Map positions in the concatenation of the used episodes to dataset frame indices."""
+        episodes = np.searchsorted(self.episode_offsets, positions, side="right") - 1
+        return self.episode_starts[episodes] + (positions - self.episode_offsets[episodes])
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed the next permutation, like `torch.utils.data.DistributedSampler`."""
+        self.epoch = epoch
+
+    def _generator(self) -> np.random.Generator:
+        if self.seed is None:
+            # Consistent across processes seeded identically, like the previous `torch.randperm`
+            return np.random.default_rng(int(torch.randint(0, 2**31 - 1, ()).item()))
+        return np.random.default_rng([self.seed, self.epoch])
+
+    def _epoch_positions(self) -> np.ndarray:
+        if self.episode_probabilities is not None:
+            rng = self._generator()
+            episodes = rng.choice(
+                len(self.episode_lengths), size=self.num_samples, p=self.episode_probabilities
+            )
+            frames = (rng.random(self.num_samples) * self.episode_lengths[episodes]).astype(np.int64)
+            return self.episode_offsets[episodes] + frames
         if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
-        else:
-            for i in self.indices:
-                yield i
+            return self._generator().permutation(self.num_frames)
+        return np.arange(self.num_frames, dtype=np.int64)
+
+    def __iter__(self) -> Iterator[int]:
+        positions = self._epoch_positions()
+        self.epoch += 1
+
+        if self.num_replicas > 1:
+            # Pad with the first positions so every rank gets the same number of samples
+            total_size = len(self) * self.num_replicas
+            positions = np.resize(positions, total_size)[self.rank :: self.num_replicas]
+
+        for start in range(0, len(positions), _CHUNK_SIZE):
+            yield from self.positions_to_indices(positions[start : start + _CHUNK_SIZE]).tolist()
+
+    def __len__(self) -> int:
+        num_samples = self.num_samples if self.episode_probabilities is not None else self.num_frames
+        return -(-num_samples // self.num_replicas)
+
+
+class WeightedMixtureSampler:
+    def __init__(
+        self,
+        source_num_frames: Sequence[int],
+        weights: Sequence[float],
+        batch_size: int,
+        num_samples: int | None = None,
+        seed: int = 0,
+        num_replicas: int = 1,
+        rank: int = 0,
+    ):
+        """Sampler of weighted mixtures of sources over concatenated datasets, e.g. a `MultiLeRobotDataset`.
+
+        Batches are not balanced: the number of frames of each source in a batch is drawn from a multinomial
+        distribution of the normalized weights, so that the mixture matches the weights in expectation over
+        batches, whatever the batch size.
+        Frames are drawn uniformly with replacement within their source. Indices are drawn per batch from a
+        generator seeded by (seed, epoch, rank), so that the sampling is deterministic and independent across
+        distributed processes, without materializing the indices of the epoch.
+
+        Args:
+            source_num_frames: Number of frames of every source, which are concatenated in this order.
+            weights: Sampling weight of every source.
+            batch_size: Batch size of the dataloader, per process. Indices are yielded batch by batch.
+            num_samples: Number of samples per epoch, across processes. Defaults to the number of frames.
+            seed: Seed of the sampling, combined with the epoch and the rank.
+            num_replicas: Number of distributed processes. Leave it to 1 when the dataloader is already
+                sharded (e.g. by `accelerate`), with a seed differing by process.
+            rank: Rank of the current process, in [0, num_replicas).
+        """
+        if not 0 <= rank < num_replicas:
+            raise ValueError(f"rank should be in [0, {num_replicas}), got {rank}.")
+        sizes = np.asarray(source_num_frames, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if sizes.shape != weights.shape:
+            raise ValueError("source_num_frames and weights should have one entry per source.")
+        if (weights < 0).any() or weights[sizes > 0].sum() <= 0:
+            raise ValueError("weights should be non-negative, with a positive weight on a non-empty source.")
+        weights = np.where(sizes > 0, weights, 0.0)
+
+        self.source_offsets = np.cumsum(sizes) - sizes
+        self.source_num_frames = sizes
+        self.batch_size = batch_size
+        self.probabilities = weights / weights.sum()
+        self.num_samples = num_samples if num_samples is not None else int(sizes.sum())
+        self.seed = seed
+        self.num_replicas = num_replicas
+        self.rank = rank
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed the next epoch, like `torch.utils.data.DistributedSampler`."""
+        self.epoch = epoch
+
+    @property
+    def num_batches(self) -> int:
+        return -(-self.num_samples // (self.batch_size * self.num_replicas))
+
+    def __iter__(self) -> Iterator[int]:
+        rng = np.random.default_rng([self.seed, self.epoch, self.rank])
+        self.epoch += 1
+
+        for _ in range(self.num_batches):
+            counts = rng.multinomial(self.batch_size, self.probabilities)
+            sources = np.repeat(np.arange(len(counts)), counts)
+            frames = (rng.random(self.batch_size) * self.source_num_frames[sources]).astype(np.int64)
+            yield from (self.source_offsets[sources] + frames)[rng.permutation(self.batch_size)].tolist()
 
     def __len__(self) -> int:
-        return len(self.indices)
+        return self.num_batches * self.batch_size
@@ -13,7 +13,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
 from collections.abc import Callable, Generator, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import datasets
@@ -22,6 +24,7 @@ import torch
 from datasets import load_dataset
 
 from lerobot.datasets.lerobot_dataset import CODEBASE_VERSION, LeRobotDatasetMetadata
+from lerobot.datasets.streaming_prefetch import PrefetchStats, StreamingPrefetcher
 from lerobot.datasets.utils import (
     Backtrackable,
     LookAheadError,
@@ -40,6 +43,24 @@ from lerobot.datasets.video_utils import (
 from lerobot.utils.constants import HF_LEROBOT_HOME, LOOKAHEAD_BACKTRACKTABLE, LOOKBACK_BACKTRACKTABLE
 
 
+@dataclass
+class _EpisodeSlice:
+    """Frames [start, end) of an episode held in memory to sample windows from.
+
+    `columns` holds the non-video features of the whole episode, stacked as tensors (numpy arrays for
+    scalars), and `videos` the uint8 video frames of [video_start, video_start + len(frames)), which cover
+    the delta-timestamp windows of the slice frames.
+    """
+
+    columns: dict[str, torch.Tensor | np.ndarray | list]
+    length: int
+    video_start: int
+    videos: dict[str, torch.Tensor]
+    # Frames of the slice not sampled yet are order[:remaining]
+    order: np.ndarray
+    remaining: int
+
+
 class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
     """LeRobotDataset with streaming capabilities.
 
@@ -94,6 +115,11 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         seed: int = 42,
         rng: np.random.Generator | None = None,
         shuffle: bool = True,
+        num_prefetch_shards: int = 0,
+        num_decode_threads: int = 4,
+        prefetch_window: int = 32,
+        episode_buffer_size: int = 0,
+        episode_slice_length: int | None = None,
     ):
         """Initialize a StreamingLeRobotDataset.
 
@@ -112,6 +138,20 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             seed (int, optional): Reproducibility random seed.
             rng (np.random.Generator | None, optional): Random number generator.
             shuffle (bool, optional): Whether to shuffle the dataset across exhaustions. Defaults to True.
+            num_prefetch_shards (int, optional): Number of shards read ahead concurrently by a
+                `StreamingPrefetcher`, with video frames decoded on a separate thread pool. When 0, frames are
+                read and decoded one at a time in the iterating thread. Defaults to 0.
+            num_decode_threads (int, optional): Number of threads decoding video frames when prefetching.
+                Defaults to 4.
+            prefetch_window (int, optional): Maximum number of frames read ahead per shard when prefetching.
+                Defaults to 32.
+            episode_buffer_size (int, optional): When positive, whole episodes are streamed instead of frames.
+                Up to `episode_buffer_size` episode slices are kept in memory, with the video frames of every
+                slice decoded at once, and frames are sampled with their delta-timestamp windows from random
+                slices of the buffer. Memory is then bounded by the number of episode slices rather than
+                `buffer_size`, and takes precedence over `buffer_size` and prefetching. Defaults to 0.
+            episode_slice_length (int | None, optional): Maximum number of frames per episode slice, to bound
+                the memory used by long episodes. Whole episodes when None. Defaults to None.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -128,6 +168,13 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         self.streaming = streaming
         self.buffer_size = buffer_size
+        self.num_prefetch_shards = num_prefetch_shards
+        self.num_decode_threads = num_decode_threads
+        self.prefetch_window = prefetch_window
+        self.episode_buffer_size = episode_buffer_size
+        self.episode_slice_length = episode_slice_length
+        # Throughput and latency of the last iteration when prefetching, per dataloader worker
+        self.prefetch_stats: PrefetchStats | None = None
 
         # We cache the video decoders to avoid re-initializing them at each frame (avoiding a ~10x slowdown)
         self.video_decoder_cache = None
@@ -183,17 +230,17 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         while True:
             yield rng.choice(elements)
 
-    # TODO(fracapuano): Implement multi-threaded prefetching to accelerate data loading.
-    # The current sequential iteration is a bottleneck. A producer-consumer pattern
-    # could be used with a ThreadPoolExecutor to run `make_frame` (especially video decoding)
-    # in parallel, feeding a queue from which this iterator will yield processed items.
     def __iter__(self) -> Iterator[dict[str, torch.Tensor]]:
-        if self.video_decoder_cache is None:
-            self.video_decoder_cache = VideoDecoderCache()
-
         # keep the same seed across exhaustions if shuffle is False, otherwise shuffle data across exhaustions
         rng = np.random.default_rng(self.seed) if not self.shuffle else self.rng
 
+        if self.episode_buffer_size > 0:
+            shards = {
+                idx: iter(safe_shard(self.hf_dataset, idx, self.num_shards)) for idx in range(self.num_shards)
+            }
+            yield from self._iter_episode_windows(rng, shards)
+            return
+
         buffer_indices_generator = self._iter_random_indices(rng, self.buffer_size)
 
         idx_to_backtrack_dataset = {
@@ -205,29 +252,190 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
         # the logic is to add 2 levels of randomness:
         # (1) sample one shard at random from the ones available, and
         # (2) sample one frame from the shard sampled at (1)
+        if self.num_prefetch_shards > 0:
+            frames = self._iter_prefetched_frames(rng, idx_to_backtrack_dataset)
+        else:
+            frames = self._iter_frames(rng, idx_to_backtrack_dataset)
+
         frames_buffer = []
+        for frame in frames:
+            if len(frames_buffer) == self.buffer_size:
+                i = next(buffer_indices_generator)  # samples a element from the buffer
+                yield frames_buffer[i]
+                frames_buffer[i] = frame
+            else:
+                frames_buffer.append(frame)
+
+        # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
+        rng.shuffle(frames_buffer)
+        yield from frames_buffer
+
+    def _iter_frames(
+        self, rng: np.random.Generator, idx_to_backtrack_dataset: dict[int, Backtrackable]
+    ) -> Iterator[dict[str, torch.Tensor]]:
+        if self.video_decoder_cache is None:
+            self.video_decoder_cache = VideoDecoderCache()
+
         while available_shards := list(idx_to_backtrack_dataset.keys()):
             shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
             backtrack_dataset = idx_to_backtrack_dataset[shard_key]  # selects which shard to iterate on
 
             try:
-                for frame in self.make_frame(backtrack_dataset):
-                    if len(frames_buffer) == self.buffer_size:
-                        i = next(buffer_indices_generator)  # samples a element from the buffer
-                        yield frames_buffer[i]
-                        frames_buffer[i] = frame
-                    else:
-                        frames_buffer.append(frame)
-                    break  # random shard sampled, switch shard
+                frame = next(self.make_frame(backtrack_dataset))
             except (
                 RuntimeError,
                 StopIteration,
             ):  # NOTE: StopIteration inside a generator throws a RuntimeError since python 3.7
                 del idx_to_backtrack_dataset[shard_key]  # Remove exhausted shard, onto another shard
+                continue
+            yield frame  # random shard sampled, switch shard
+
+    def _iter_prefetched_frames(
+        self, rng: np.random.Generator, idx_to_backtrack_dataset: dict[int, Backtrackable]
+    ) -> Iterator[dict[str, torch.Tensor]]:
+        prefetcher = StreamingPrefetcher(
+            idx_to_backtrack_dataset,
+            read_fn=self._read_frame,
+            decode_fn=self._decode_frame,
+            rng=rng,
+            num_active_shards=min(self.num_prefetch_shards, len(idx_to_backtrack_dataset)),
+            num_decode_threads=self.num_decode_threads,
+            window=self.prefetch_window,
+        )
+        self.prefetch_stats = prefetcher.stats
+        yield from prefetcher
 
-        # Once shards are all exhausted, shuffle the buffer and yield the remaining frames
-        rng.shuffle(frames_buffer)
-        yield from frames_buffer
+    def _iter_episode_windows(
+        self, rng: np.random.Generator, shards: dict[int, Iterator[dict]]
+    ) -> Iterator[dict[str, torch.Tensor]]:
+        """Samples every frame once, with its window, from a buffer of in-memory episode slices."""
+        if self.video_decoder_cache is None:
+            self.video_decoder_cache = VideoDecoderCache()
+
+        episode_slices = self._iter_episode_slices(rng, shards)
+        buffer = list(itertools.islice(episode_slices, self.episode_buffer_size))
+        while buffer:
+            i = int(rng.integers(len(buffer)))
+            episode_slice = buffer[i]
+            episode_slice.remaining -= 1
+            frame = self._make_window_frame(episode_slice, int(episode_slice.order[episode_slice.remaining]))
+
+            if episode_slice.remaining == 0:
+                # Replace the exhausted slice, or drop it once the shards are exhausted
+                next_slice = next(episode_slices, None)
+                if next_slice is not None:
+                    buffer[i] = next_slice
+                else:
+                    buffer[i] = buffer[-1]
+                    buffer.pop()
+
+            yield frame
+
+    def _iter_episode_slices(
+        self, rng: np.random.Generator, shards: dict[int, Iterator[dict]]
+    ) -> Iterator[_EpisodeSlice]:
+        # Rows of an episode are contiguous within a shard: group them, one random shard at a time
+        shard_episodes = {
+            key: itertools.groupby(shard, key=lambda row: row["episode_index"])
+            for key, shard in shards.items()
+        }
+        while available_shards := list(shard_episodes.keys()):
+            shard_key = next(self._infinite_generator_over_elements(rng, available_shards))
+            try:
+                _, rows = next(shard_episodes[shard_key])
+            except StopIteration:
+                del shard_episodes[shard_key]  # Remove exhausted shard, onto another shard
+                continue
+
+            columns = self._rows_to_columns([item_to_torch(row) for row in rows])
+            length = len(columns["frame_index"])
+            slice_length = self.episode_slice_length or length
+            for start in range(0, length, slice_length):
+                yield self._make_episode_slice(columns, length, start, min(start + slice_length, length), rng)
+
+    @staticmethod
+    def _rows_to_columns(rows: list[dict]) -> dict[str, torch.Tensor | np.ndarray | list]:
+        columns = {}
+        for key in rows[0]:
+            values = [row[key] for row in rows]
+            if isinstance(values[0], torch.Tensor):
+                columns[key] = torch.stack(values)
+            elif isinstance(values[0], int | float):
+                columns[key] = np.asarray(values)
+            else:
+                columns[key] = values
+        return columns
+
+    def _make_episode_slice(
+        self,
+        columns: dict[str, torch.Tensor | np.ndarray | list],
+        length: int,
+        start: int,
+        end: int,
+        rng: np.random.Generator,
+    ) -> _EpisodeSlice:
+        # Decode the video frames of the slice and of the windows of its frames, once per camera
+        video_deltas = [0]
+        for key in self.meta.video_keys:
+            if self.delta_indices is not None and key in self.delta_indices:
+                video_deltas.extend(self.delta_indices[key])
+        video_start = max(start + min(video_deltas), 0)
+        video_end = min(end + max(video_deltas), length)
+
+        videos = {}
+        if len(self.meta.video_keys) > 0:
+            ep_idx = int(columns["episode_index"][0])
+            # "timestamp" restarts from 0 for each episode, the timestamps within the .mp4 file are given by index/fps
+            current_ts = columns["index"][video_start:video_end] / self.fps
+            query_timestamps = {
+                key: np.clip(
+                    current_ts,
+                    self.meta.episodes[ep_idx][f"videos/{key}/from_timestamp"],
+                    self.meta.episodes[ep_idx][f"videos/{key}/to_timestamp"],
+                ).tolist()
+                for key in self.meta.video_keys
+            }
+            # Stored as uint8 to divide the memory by 4
+            for key, frames in self._query_videos(query_timestamps, ep_idx, return_uint8=True).items():
+                videos[key] = frames if frames.ndim == 4 else frames.unsqueeze(0)
+
+        order = rng.permutation(np.arange(start, end))
+        return _EpisodeSlice(columns, length, video_start, videos, order, remaining=len(order))
+
+    def _make_window_frame(self, episode_slice: _EpisodeSlice, frame_idx: int) -> dict:
+        """Makes a frame from an in-memory episode slice, padding windows at the episode boundaries."""
+        columns, length = episode_slice.columns, episode_slice.length
+        result = {
+            key: column[frame_idx].item() if isinstance(column, np.ndarray) else column[frame_idx]
+            for key, column in columns.items()
+        }
+
+        for key, delta_indices in (self.delta_indices or {}).items():
+            if key in self.meta.video_keys:
+                continue
+            indices = frame_idx + np.asarray(delta_indices)
+            # Frames outside of the episode repeat the closest frame of the episode, and are marked as padding
+            clamped = np.clip(indices, 0, length - 1)
+            column = columns[key]
+            result[key] = (
+                column[torch.from_numpy(clamped)] if isinstance(column, torch.Tensor) else column[clamped]
+            )
+            result[f"{key}_is_pad"] = torch.from_numpy((indices < 0) | (indices >= length))
+
+        for key, frames in episode_slice.videos.items():
+            if self.delta_indices is not None and key in self.delta_indices:
+                indices = frame_idx + np.asarray(self.delta_indices[key])
+                clamped = np.clip(indices, 0, length - 1)
+                result[key] = frames[torch.from_numpy(clamped - episode_slice.video_start)] / 255.0
+                result[f"{key}_is_pad"] = torch.from_numpy((indices < 0) | (indices >= length))
+            else:
+                result[key] = frames[frame_idx - episode_slice.video_start] / 255.0
+
+            if self.image_transforms is not None:
+                result[key] = self.image_transforms(result[key])
+
+        result["task"] = self.meta.tasks.iloc[int(result["task_index"])].name
+        return result
 
     def _get_window_steps(
         self, delta_timestamps: dict[str, list[float]] | None = None, dynamic_bounds: bool = False
@@ -300,6 +508,16 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
     def make_frame(self, dataset_iterator: Backtrackable) -> Generator:
         """Makes a frame starting from a dataset iterator"""
+        yield self._decode_frame(self._read_frame(dataset_iterator), self.video_decoder_cache)
+
+    def _read_frame(
+        self, dataset_iterator: Backtrackable
+    ) -> tuple[dict, list[dict], dict | None, dict | None]:
+        """Reads the next frame of a dataset iterator, leaving out its video frames.
+
+        Returns the item, the updates to apply to it, and the query and original timestamps of its video
+        frames (None when the dataset has no videos), to be decoded by `_decode_frame`.
+        """
         item = next(dataset_iterator)
         item = item_to_torch(item)
 
@@ -325,7 +543,7 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             updates.append(query_result)
             updates.append(padding)
 
-        # Load video frames, when needed
+        query_timestamps, original_timestamps = None, None
         if len(self.meta.video_keys) > 0:
             original_timestamps = self._make_timestamps_from_indices(current_ts, self.delta_indices)
 
@@ -333,7 +551,20 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
             query_timestamps = self._get_query_timestamps(
                 current_ts, self.delta_indices, episode_boundaries_ts
             )
-            video_frames = self._query_videos(query_timestamps, ep_idx)
+
+        return item, updates, query_timestamps, original_timestamps
+
+    def _decode_frame(
+        self,
+        read_output: tuple[dict, list[dict], dict | None, dict | None],
+        decoder_cache: VideoDecoderCache | None,
+    ) -> dict:
+        """Decodes the video frames of a frame read by `_read_frame` and assembles the frame."""
+        item, updates, query_timestamps, original_timestamps = read_output
+
+        # Load video frames, when needed
+        if query_timestamps is not None:
+            video_frames = self._query_videos(query_timestamps, item["episode_index"], decoder_cache)
 
             if self.image_transforms is not None:
                 image_keys = self.meta.camera_keys
@@ -355,7 +586,7 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         result["task"] = self.meta.tasks.iloc[item["task_index"]].name
 
-        yield result
+        return result
 
     def _get_query_timestamps(
         self,
@@ -378,19 +609,28 @@ class StreamingLeRobotDataset(torch.utils.data.IterableDataset):
 
         return query_timestamps
 
-    def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict:
+    def _query_videos(
+        self,
+        query_timestamps: dict[str, list[float]],
+        ep_idx: int,
+        decoder_cache: VideoDecoderCache | None = None,
+        return_uint8: bool = False,
+    ) -> dict:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
         """
 
+        if decoder_cache is None:
+            decoder_cache = self.video_decoder_cache
+
         item = {}
         for video_key, query_ts in query_timestamps.items():
             root = self.meta.url_root if self.streaming and not self.streaming_from_local else self.root
             video_path = f"{root}/{self.meta.get_video_file_path(ep_idx, video_key)}"
             frames = decode_video_frames_torchcodec(
-                video_path, query_ts, self.tolerance_s, decoder_cache=self.video_decoder_cache
+                video_path, query_ts, self.tolerance_s, decoder_cache=decoder_cache, return_uint8=return_uint8
             )
 
             item[video_key] = frames.squeeze(0) if len(query_ts) == 1 else frames
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Read-ahead engine for `StreamingLeRobotDataset`.
+
+Frames are produced in two stages: reading the Arrow rows of a frame (and its delta-timestamp neighbours)
+from a shard iterator, then decoding its video frames. Several shards are read concurrently on a thread
+pool, each with at most one read in flight and a bounded window of frames read ahead, and the video
+frames are decoded on a separate thread pool, while the consumer yields frames from randomly chosen
+shards in their read order.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from lerobot.datasets.video_utils import VideoDecoderCache
+
+
+@dataclass
+class PrefetchStats:
+    """Throughput and latency counters of a `StreamingPrefetcher`, summed over its threads."""
+
+    frames: int = 0
+    # Time spent reading Arrow rows and decoding videos, summed over the worker threads
+    read_s: float = 0.0
+    decode_s: float = 0.0
+    # Time the consumer waited for a frame to be ready
+    wait_s: float = 0.0
+    # Time between reading a frame and yielding it, summed over the yielded frames
+    latency_s: float = 0.0
+    start_time: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **durations: float) -> None:
+        with self._lock:
+            for name, value in durations.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def summary(self) -> dict[str, float]:
+        frames = max(self.frames, 1)
+        elapsed = time.perf_counter() - self.start_time
+        return {
+            "frames": self.frames,
+            "frames_per_s": self.frames / elapsed if elapsed > 0 else 0.0,
+            "read_ms_per_frame": 1e3 * self.read_s / frames,
+            "decode_ms_per_frame": 1e3 * self.decode_s / frames,
+            "wait_ms_per_frame": 1e3 * self.wait_s / frames,
+            "latency_ms": 1e3 * self.latency_s / frames,
+        }
+
+
+@dataclass
+class _ShardState:
+    iterator: Any
+    # Decode futures of the frames read ahead, with the time they were read, in read order
+    frames: deque = field(default_factory=deque)
+    read_future: Future | None = None
+    exhausted: bool = False
+
+
+class StreamingPrefetcher:
+    """Iterate over the frames of several shards, reading and decoding them ahead of the consumer.
+
+    Args:
+        shards: Iterators over the shards, e.g. `Backtrackable` datasets, keyed by shard index.
+        read_fn: Reads the next frame of a shard iterator, without its video frames. Raises StopIteration
+            (or RuntimeError, when raised from a generator) when the shard is exhausted.
+        decode_fn: Turns the output of `read_fn` into a frame, given the video decoder cache of the
+            calling thread, as torchcodec decoders must not be shared across threads.
+        rng: Random generator choosing the shard of every yielded frame.
+        num_active_shards: Number of shards read concurrently. The other shards are opened when an active
+            shard is exhausted.
+        num_decode_threads: Number of threads decoding video frames.
+        window: Maximum number of frames read ahead per shard.
+    """
+
+    def __init__(
+        self,
+        shards: dict[int, Any],
+        read_fn: Callable[[Any], Any],
+        decode_fn: Callable[[Any, VideoDecoderCache], dict],
+        rng: np.random.Generator,
+        num_active_shards: int = 4,
+        num_decode_threads: int = 4,
+        window: int = 32,
+    ):
+        if num_active_shards < 1 or num_decode_threads < 1 or window < 1:
+            raise ValueError("num_active_shards, num_decode_threads and window should be positive.")
+
+        self.read_fn = read_fn
+        self.decode_fn = decode_fn
+        self.rng = rng
+        self.num_active_shards = num_active_shards
+        self.num_decode_threads = num_decode_threads
+        self.window = window
+        self.stats = PrefetchStats()
+
+        self._pending_shards = deque(shards[key] for key in rng.permutation(list(shards)).tolist())
+        self._active: dict[int, _ShardState] = {}
+        self._next_shard_key = 0
+        self._thread_local = threading.local()
+        self._read_pool: ThreadPoolExecutor | None = None
+        self._decode_pool: ThreadPoolExecutor | None = None
+
+    def _decoder_cache(self) -> VideoDecoderCache:
+        if not hasattr(self._thread_local, "decoder_cache"):
+            self._thread_local.decoder_cache = VideoDecoderCache()
+        return self._thread_local.decoder_cache
+
+    def _decode(self, read_output: Any) -> dict:
+        start = time.perf_counter()
+        frame = self.decode_fn(read_output, self._decoder_cache())
+        self.stats.add(decode_s=time.perf_counter() - start)
+        return frame
+
+    def _read(self, state: _ShardState, num_frames: int) -> tuple[list[tuple[Future, float]], bool]:
+        frames = []
+        exhausted = False
+        start = time.perf_counter()
+        for _ in range(num_frames):
+            try:
+                read_output = self.read_fn(state.iterator)
+            except (RuntimeError, StopIteration):
+                exhausted = True
+                break
+            frames.append((self._decode_pool.submit(self._decode, read_output), time.perf_counter()))
+        self.stats.add(read_s=time.perf_counter() - start)
+        return frames, exhausted
+
+    def _collect_read(self, state: _ShardState) -> None:
+        frames, exhausted = state.read_future.result()
+        state.frames.extend(frames)
+        state.exhausted |= exhausted
+        state.read_future = None
+
+    def _schedule_read(self, state: _ShardState) -> None:
+        """Read ahead on a shard, unless it is exhausted, being read, or its window is full."""
+        if state.read_future is not None and state.read_future.done():
+            self._collect_read(state)
+        num_frames = self.window - len(state.frames)
+        if state.exhausted or state.read_future is not None or num_frames <= 0:
+            return
+        state.read_future = self._read_pool.submit(self._read, state, num_frames)
+
+    def _activate_shards(self) -> None:
+        while self._pending_shards and len(self._active) < self.num_active_shards:
+            state = _ShardState(self._pending_shards.popleft())
+            self._active[self._next_shard_key] = state
+            self._next_shard_key += 1
+            self._schedule_read(state)
+
+    def _next_frame(self, state: _ShardState) -> dict | None:
+        """Next frame of a shard, or None when the shard is exhausted."""
+        if not state.frames and state.read_future is not None:
+            start = time.perf_counter()
+            self._collect_read(state)
+            self.stats.add(wait_s=time.perf_counter() - start)
+        if not state.frames:
+            return None
+
+        future, read_time = state.frames.popleft()
+        start = time.perf_counter()
+        frame = future.result()
+        now = time.perf_counter()
+        self.stats.add(frames=1, wait_s=now - start, latency_s=now - read_time)
+        return frame
+
+    def __iter__(self) -> Iterator[dict]:
+        self._read_pool = ThreadPoolExecutor(self.num_active_shards, thread_name_prefix="stream-read")
+        self._decode_pool = ThreadPoolExecutor(self.num_decode_threads, thread_name_prefix="stream-decode")
+        try:
+            self._activate_shards()
+            while self._active:
+                for state in self._active.values():
+                    self._schedule_read(state)
+
+                shard_key = self.rng.choice(list(self._active))
+                state = self._active[shard_key]
+                frame = self._next_frame(state)
+                if frame is None:
+                    del self._active[shard_key]  # Remove exhausted shard, onto another shard
+                    self._activate_shards()
+                    continue
+
+                self._schedule_read(state)
+                yield frame
+        finally:
+            self._read_pool.shutdown(wait=True, cancel_futures=True)
+            self._decode_pool.shutdown(wait=True, cancel_futures=True)
@@ -257,3 +257,228 @@ class ImageTransforms(Transform):
 
     def forward(self, *inputs: Any) -> Any:
         return self.tf(*inputs)
+
+
+# Weights of the RGB channels in the grayscale conversion of torchvision
+_GRAYSCALE_WEIGHTS = (0.2989, 0.587, 0.114)
+
+
+def _uniform(low: float, high: float, size: int, device: torch.device) -> torch.Tensor:
+    # Per-sample parameter, broadcast over the (N, C, H, W) dimensions of the images of a sample
+    return torch.empty(size, device=device).uniform_(low, high).view(-1, 1, 1, 1, 1)
+
+
+def _blend(image: torch.Tensor, other: torch.Tensor, ratio: torch.Tensor) -> torch.Tensor:
+    # ratio * image + (1 - ratio) * other, in a single op
+    return torch.lerp(other, image, ratio).clamp_(0.0, 1.0)
+
+
+def _grayscale(image: torch.Tensor) -> torch.Tensor:
+    r, g, b = image.unbind(dim=-3)
+    weights = _GRAYSCALE_WEIGHTS
+    return (weights[0] * r + weights[1] * g + weights[2] * b).unsqueeze(-3)
+
+
+def _rgb_to_hsv(image: torch.Tensor) -> torch.Tensor:
+    r, g, b = image.unbind(dim=-3)
+    maxc, minc = image.amax(dim=-3), image.amin(dim=-3)
+    chroma = maxc - minc
+    equal = chroma == 0
+    ones = torch.ones_like(maxc)
+    saturation = chroma / torch.where(equal, ones, maxc)
+    chroma = torch.where(equal, ones, chroma)
+    rc, gc, bc = (maxc - r) / chroma, (maxc - g) / chroma, (maxc - b) / chroma
+    hue = torch.where(maxc == r, bc - gc, torch.where(maxc == g, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = torch.where(equal, torch.zeros_like(hue), hue)
+    hue = torch.fmod(hue / 6.0 + 1.0, 1.0)
+    return torch.stack((hue, saturation, maxc), dim=-3)
+
+
+def _hsv_to_rgb(image: torch.Tensor) -> torch.Tensor:
+    hue, saturation, value = image.unbind(dim=-3)
+    channels = []
+    for n in (5.0, 3.0, 1.0):
+        k = torch.fmod(n + hue * 6.0, 6.0)
+        channels.append(value - value * saturation * torch.clamp(torch.minimum(k, 4.0 - k), 0.0, 1.0))
+    return torch.stack(channels, dim=-3)
+
+
+def _adjust_brightness(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    return (image * factor).clamp_(0.0, 1.0)
+
+
+def _adjust_contrast(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    gray = _grayscale(image) if image.shape[-3] == 3 else image
+    return _blend(image, gray.mean(dim=(-3, -2, -1), keepdim=True), factor)
+
+
+def _adjust_saturation(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    if image.shape[-3] != 3:
+        return image
+    return _blend(image, _grayscale(image), factor)
+
+
+def _adjust_hue(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    if image.shape[-3] != 3:
+        return image
+    hsv = _rgb_to_hsv(image)
+    hue = torch.fmod(hsv[..., 0, :, :] + factor.squeeze(-3) + 1.0, 1.0)
+    return _hsv_to_rgb(torch.stack((hue, hsv[..., 1, :, :], hsv[..., 2, :, :]), dim=-3))
+
+
+def _adjust_sharpness(image: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    height, width = image.shape[-2:]
+    if height <= 2 or width <= 2:
+        return image
+    # Same smoothing kernel as `F.adjust_sharpness` (ones with a center weight of 5, divided by 13), as a
+    # 3x3 average pooling. The borders of the image are left unchanged.
+    flat = image.reshape(-1, 1, height, width)
+    degenerate = flat.clone()
+    degenerate[..., 1:-1, 1:-1] = (
+        torch.nn.functional.avg_pool2d(flat, 3, stride=1)
+        .mul_(9 / 13)
+        .add_(flat[..., 1:-1, 1:-1], alpha=4 / 13)
+    )
+    return _blend(image, degenerate.view_as(image), factor)
+
+
+class BatchedImageTransforms(Transform):
+    """Apply the transforms of an `ImageTransformsConfig` to a batch of images at once.
+
+    Where `ImageTransforms` transforms a single image (or the images of a single frame with delta timestamps),
+    this transforms a `(B, C, H, W)` or `(B, T, C, H, W)` batch, e.g. on the training device after the
+    transfer, with random parameters drawn per sample and shared by the `T` images of a sample. As with
+    `RandomSubsetApply`, every sample gets its own random subset of the transforms, and every transform is
+    applied to the samples that selected it in a single vectorized op.
+
+    ColorJitter, SharpnessJitter, RandomAffine (without shear) and Identity are vectorized, the other
+    transforms are applied sample by sample. With `random_order`, the order of the transforms is drawn per
+    batch rather than per sample. uint8 images are transformed in float and converted back.
+    """
+
+    def __init__(self, cfg: ImageTransformsConfig) -> None:
+        super().__init__()
+        self._cfg = cfg
+        self.image_transforms = ImageTransforms(cfg)
+        self.transforms = list(self.image_transforms.transforms.values())
+        total = sum(self.image_transforms.weights)
+        self.p = [weight / total for weight in self.image_transforms.weights]
+        self.n_subset = min(len(self.transforms), cfg.max_num_transforms)
+        self.random_order = cfg.random_order
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        if not self._cfg.enable or self.n_subset == 0 or len(images) == 0:
+            return images
+
+        dtype = images.dtype
+        x = images.to(torch.float32) / 255.0 if dtype == torch.uint8 else images.clone()
+        x = x.reshape(len(images), -1, *images.shape[-3:])
+
+        p = torch.tensor(self.p).expand(len(images), -1)
+        selected = torch.zeros(p.shape, dtype=torch.bool)
+        selected.scatter_(1, torch.multinomial(p, self.n_subset), True)
+        order = torch.randperm(len(self.transforms)) if self.random_order else range(len(self.transforms))
+        for tf_idx in order:
+            indices = selected[:, tf_idx].nonzero().squeeze(1).to(x.device)
+            if len(indices) > 0:
+                x[indices] = self._apply(self.transforms[tf_idx], x[indices])
+
+        x = x.view(images.shape)
+        if dtype == torch.uint8:
+            return x.mul_(255.0).round_().to(torch.uint8)
+        return x.to(dtype)
+
+    def _apply(self, transform: Callable, x: torch.Tensor) -> torch.Tensor:
+        """Apply a transform with per-sample parameters to a (b, N, C, H, W) float batch."""
+        batch_size, device = len(x), x.device
+        if isinstance(transform, v2.Identity):
+            return x
+        if isinstance(transform, SharpnessJitter):
+            return _adjust_sharpness(x, _uniform(*transform.sharpness, batch_size, device))
+        if isinstance(transform, v2.ColorJitter):
+            adjustments = [
+                (adjust, params)
+                for adjust, params in [
+                    (_adjust_brightness, transform.brightness),
+                    (_adjust_contrast, transform.contrast),
+                    (_adjust_saturation, transform.saturation),
+                    (_adjust_hue, transform.hue),
+                ]
+                if params is not None
+            ]
+            # Like ColorJitter, the adjustments are applied in a random order
+            for adjust_idx in torch.randperm(len(adjustments)).tolist():
+                adjust, params = adjustments[adjust_idx]
+                x = adjust(x, _uniform(*params, batch_size, device))
+            return x
+        if isinstance(transform, v2.RandomAffine) and self._is_vectorized_affine(transform):
+            return self._random_affine(transform, x)
+        # Not vectorized, every sample is transformed on its own
+        return torch.stack([transform(sample) for sample in x])
+
+    @staticmethod
+    def _is_vectorized_affine(transform: v2.RandomAffine) -> bool:
+        return (
+            transform.shear is None
+            and transform.center is None
+            and transform.fill == 0
+            and transform.interpolation in (v2.InterpolationMode.NEAREST, v2.InterpolationMode.BILINEAR)
+        )
+
+    @staticmethod
+    def _random_affine(transform: v2.RandomAffine, x: torch.Tensor) -> torch.Tensor:
+        batch_size, num_images, channels, height, width = x.shape
+        # Sampled like `RandomAffine.make_params`
+        angle = torch.empty(batch_size).uniform_(*transform.degrees).deg2rad_()
+        tx = torch.zeros(batch_size)
+        ty = torch.zeros(batch_size)
+        if transform.translate is not None:
+            max_dx, max_dy = transform.translate[0] * width, transform.translate[1] * height
+            tx = torch.empty(batch_size).uniform_(-max_dx, max_dx).round_()
+            ty = torch.empty(batch_size).uniform_(-max_dy, max_dy).round_()
+        scale = torch.ones(batch_size)
+        if transform.scale is not None:
+            scale = torch.empty(batch_size).uniform_(*transform.scale)
+
+        # Inverse of the rotation, scaling and translation around the image center, as computed by
+        # `F.affine`, mapping the output pixels to the input pixels, expressed in the normalized coordinates
+        # of `affine_grid`
+        cos, sin = angle.cos() / scale, angle.sin() / scale
+        shift_x = -cos * tx - sin * ty
+        shift_y = sin * tx - cos * ty
+        theta = torch.stack(
+            [
+                torch.stack([cos, sin * height / width, 2.0 * shift_x / width], dim=1),
+                torch.stack([-sin * width / height, cos, 2.0 * shift_y / height], dim=1),
+            ],
+            dim=1,
+        ).to(x.device, x.dtype)
+        theta = theta.repeat_interleave(num_images, dim=0)
+
+        flat = x.reshape(-1, channels, height, width)
+        grid = torch.nn.functional.affine_grid(theta, list(flat.shape), align_corners=False)
+        output = torch.nn.functional.grid_sample(
+            flat, grid, mode=transform.interpolation.value, padding_mode="zeros", align_corners=False
+        )
+        return output.view_as(x)
+
+
+def apply_image_transforms(
+    batch: dict[str, Any], image_transforms: Callable, camera_keys: Sequence[str]
+) -> dict[str, Any]:
+    """Apply image transforms to the camera frames of a collated batch, e.g. in the training loop or a
+    collate function.
+
+    Used when the dataset returns uint8 frames (`DatasetConfig.decode_to_uint8`), so that the augmentations
+    run on the training device after the transfer rather than in the dataloader workers. With
+    `BatchedImageTransforms`, each camera is transformed at once; other transforms are applied frame by
+    frame. In both cases, every frame gets its own random parameters, as when the dataset applies them.
+    """
+    for key in camera_keys:
+        if key not in batch:
+            continue
+        if isinstance(image_transforms, BatchedImageTransforms):
+            batch[key] = image_transforms(batch[key])
+        else:
+            batch[key] = torch.stack([image_transforms(frame) for frame in batch[key]])
+    return batch
@@ -72,7 +72,7 @@ def has_quantile_stats(stats: dict[str, dict] | None, quantile_list_keys: list[s
     return False
 
 
-def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
+def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> tuple[dict, dict]:
     """Process a single episode and return its statistics.
 
     Args:
@@ -80,7 +80,8 @@ def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
         episode_idx: Index of the episode to process
 
     Returns:
-        Dictionary containing episode statistics
+        Tuple of the dictionary containing episode statistics and the dictionary of the running stats
+        of each feature, used to merge the episode quantiles exactly
     """
     logging.info(f"Computing stats for episode {episode_idx}")
 
@@ -99,6 +100,7 @@ def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
             collected_data[key].append(value)
 
     ep_stats = {}
+    ep_sketches = {}
     for key, data_list in collected_data.items():
         if dataset.features[key]["dtype"] == "string":
             continue
@@ -114,8 +116,8 @@ def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
             axes_to_reduce = 0
             keepdims = data.ndim == 1
 
-        ep_stats[key] = get_feature_stats(
-            data, axis=axes_to_reduce, keepdims=keepdims, quantile_list=DEFAULT_QUANTILES
+        ep_stats[key], ep_sketches[key] = get_feature_stats(
+            data, axis=axes_to_reduce, keepdims=keepdims, quantile_list=DEFAULT_QUANTILES, return_sketch=True
         )
 
         if dataset.features[key]["dtype"] in ["image", "video"]:
@@ -123,7 +125,7 @@ def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
                 k: v if k == "count" else np.squeeze(v, axis=0) for k, v in ep_stats[key].items()
             }
 
-    return ep_stats
+    return ep_stats, ep_sketches
 
 
 def compute_quantile_stats_for_dataset(dataset: LeRobotDataset) -> dict[str, dict]:
@@ -143,13 +145,15 @@ def compute_quantile_stats_for_dataset(dataset: LeRobotDataset) -> dict[str, dic
     logging.info(f"Computing quantile statistics for dataset with {dataset.num_episodes} episodes")
 
     episode_stats_list = []
+    episode_sketches_list = []
     has_videos = len(dataset.meta.video_keys) > 0
 
     if has_videos:
         logging.info("Dataset contains video keys - using sequential processing for thread safety")
         for episode_idx in tqdm(range(dataset.num_episodes), desc="Processing episodes"):
-            ep_stats = process_single_episode(dataset, episode_idx)
+            ep_stats, ep_sketches = process_single_episode(dataset, episode_idx)
             episode_stats_list.append(ep_stats)
+            episode_sketches_list.append(ep_sketches)
     else:
         logging.info("Dataset has no video keys - using parallel processing for better performance")
         max_workers = min(dataset.num_episodes, 16)
@@ -164,19 +168,20 @@ def compute_quantile_stats_for_dataset(dataset: LeRobotDataset) -> dict[str, dic
             with tqdm(total=dataset.num_episodes, desc="Processing episodes") as pbar:
                 for future in concurrent.futures.as_completed(future_to_episode):
                     episode_idx = future_to_episode[future]
-                    ep_stats = future.result()
-                    episode_results[episode_idx] = ep_stats
+                    episode_results[episode_idx] = future.result()
                     pbar.update(1)
 
         for episode_idx in range(dataset.num_episodes):
             if episode_idx in episode_results:
-                episode_stats_list.append(episode_results[episode_idx])
+                ep_stats, ep_sketches = episode_results[episode_idx]
+                episode_stats_list.append(ep_stats)
+                episode_sketches_list.append(ep_sketches)
 
     if not episode_stats_list:
         raise ValueError("No episode data found for computing statistics")
 
     logging.info(f"Aggregating statistics from {len(episode_stats_list)} episodes")
-    return aggregate_stats(episode_stats_list)
+    return aggregate_stats(episode_stats_list, episode_sketches_list)
 
 
 def augment_dataset_with_quantile_stats(
@@ -17,6 +17,7 @@
 # https://github.com/cmjang/DM_Control_Python
 
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from copy import deepcopy
@@ -95,6 +96,7 @@ class DamiaoMotorsBus(MotorsBusBase):
         use_can_fd: bool = True,
         bitrate: int = 1000000,
         data_bitrate: int | None = 5000000,
+        async_io: bool = False,
     ):
         """
         Initialize the Damiao motors bus.
@@ -107,6 +109,9 @@ class DamiaoMotorsBus(MotorsBusBase):
             use_can_fd: Whether to use CAN FD mode (default: True for OpenArms)
             bitrate: Nominal bitrate in bps (default: 1000000 = 1 Mbps)
             data_bitrate: Data bitrate for CAN FD in bps (default: 5000000 = 5 Mbps), ignored if use_can_fd is False
+            async_io: If True, incoming frames are received and decoded into the state cache on a background
+                thread once connected, and position writes are sent without waiting for the responses of the
+                motors (default: False)
         """
         super().__init__(port, motors, calibration)
         self.port = port
@@ -147,6 +152,16 @@ class DamiaoMotorsBus(MotorsBusBase):
         # Defaults: Kp=10.0 (Stiffness), Kd=0.5 (Damping)
         self._gains: dict[str, dict[str, float]] = {name: {"kp": 10.0, "kd": 0.5} for name in self.motors}
 
+        # `time.perf_counter()` of the last state decoded for each motor
+        self._state_timestamps: dict[str, float] = dict.fromkeys(self.motors, 0.0)
+
+        # Asynchronous I/O: a `can.Notifier` owns the reception, and hands the frames to the waiting receivers
+        self.async_io = async_io
+        self._notifier: can.Notifier | None = None
+        self._frames = threading.Condition()
+        # Latest frame not consumed yet by a receiver, by recv_id
+        self._pending_frames: dict[int, can.Message] = {}
+
     @property
     def is_connected(self) -> bool:
         """Check if the CAN bus is connected."""
@@ -195,6 +210,10 @@ class DamiaoMotorsBus(MotorsBusBase):
             if handshake:
                 self._handshake()
 
+            if self.async_io:
+                self._pending_frames.clear()
+                self._notifier = can.Notifier(self.canbus, [self._on_frame], timeout=LONG_TIMEOUT_SEC)
+
             logger.debug(f"{self.__class__.__name__} connected via {self.can_interface}.")
         except Exception as e:
             self._is_connected = False
@@ -239,6 +258,10 @@ class DamiaoMotorsBus(MotorsBusBase):
             except Exception as e:
                 logger.warning(f"Failed to disable torque during disconnect: {e}")
 
+        if self._notifier is not None:
+            self._notifier.stop()
+            self._notifier = None
+
         if self.canbus:
             self.canbus.shutdown()
             self.canbus = None
@@ -260,7 +283,7 @@ class DamiaoMotorsBus(MotorsBusBase):
         recv_id = self._get_motor_recv_id(motor)
         data = [0xFF] * 7 + [command_byte]
         msg = can.Message(arbitration_id=motor_id, data=data, is_extended_id=False)
-        self.canbus.send(msg)
+        self._send(msg, recv_id)
         if msg := self._recv_motor_response(expected_recv_id=recv_id):
             self._process_response(motor_name, msg)
         else:
@@ -318,9 +341,37 @@ class DamiaoMotorsBus(MotorsBusBase):
         recv_id = self._get_motor_recv_id(motor)
         data = [motor_id & 0xFF, (motor_id >> 8) & 0xFF, CAN_CMD_REFRESH, 0, 0, 0, 0, 0]
         msg = can.Message(arbitration_id=CAN_PARAM_ID, data=data, is_extended_id=False)
-        self.canbus.send(msg)
+        self._send(msg, recv_id)
         return self._recv_motor_response(expected_recv_id=recv_id)
 
+    def _send(self, msg: can.Message, expected_recv_id: int) -> None:
+        """
+        Send a frame to a motor.
+
+        With asynchronous I/O, the pending frame of the motor is dropped first, so that the next receive only
+        returns its response to this frame.
+        """
+        if self._notifier is not None:
+            with self._frames:
+                self._pending_frames.pop(expected_recv_id, None)
+        self.canbus.send(msg)
+
+    def _on_frame(self, msg: can.Message) -> None:
+        """Notifier callback: decode a state frame into the cache and hand it to the waiting receivers."""
+        motor = self._recv_id_to_motor.get(msg.arbitration_id)
+        if motor is None:
+            return
+        self._process_response(motor, msg)
+        with self._frames:
+            self._pending_frames[msg.arbitration_id] = msg
+            self._frames.notify_all()
+
+    def _wait_for_frames(self, expected_recv_ids: list[int], timeout: float) -> dict[int, can.Message]:
+        """Wait for the frames received by the notifier from the given CAN IDs, and consume them."""
+        with self._frames:
+            self._frames.wait_for(lambda: all(i in self._pending_frames for i in expected_recv_ids), timeout)
+            return {i: self._pending_frames.pop(i) for i in expected_recv_ids if i in self._pending_frames}
+
     def _recv_motor_response(
         self, expected_recv_id: int | None = None, timeout: float = 0.001
     ) -> can.Message | None:
@@ -333,6 +384,14 @@ class DamiaoMotorsBus(MotorsBusBase):
         Returns:
             CAN message if received, None otherwise
         """
+        if self._notifier is not None:
+            if expected_recv_id is None:
+                with self._frames:
+                    if self._frames.wait_for(lambda: self._pending_frames, timeout):
+                        return self._pending_frames.pop(next(iter(self._pending_frames)))
+                return None
+            return self._wait_for_frames([expected_recv_id], timeout).get(expected_recv_id)
+
         try:
             start_time = time.time()
             messages_seen = []
@@ -371,6 +430,9 @@ class DamiaoMotorsBus(MotorsBusBase):
         Returns:
             Dictionary mapping recv_id to CAN message
         """
+        if self._notifier is not None:
+            return self._wait_for_frames(expected_recv_ids, timeout)
+
         responses = {}
         expected_set = set(expected_recv_ids)
         start_time = time.time()
@@ -440,9 +502,12 @@ class DamiaoMotorsBus(MotorsBusBase):
 
         data = self._encode_mit_packet(motor_type, kp, kd, position_degrees, velocity_deg_per_sec, torque)
         msg = can.Message(arbitration_id=motor_id, data=data, is_extended_id=False)
-        self.canbus.send(msg)
-
         recv_id = self._get_motor_recv_id(motor)
+        self._send(msg, recv_id)
+        if self._notifier is not None:
+            # The response is decoded into the state cache by the notifier
+            return
+
         if msg := self._recv_motor_response(expected_recv_id=recv_id):
             self._process_response(motor_name, msg)
         else:
@@ -473,9 +538,14 @@ class DamiaoMotorsBus(MotorsBusBase):
 
             data = self._encode_mit_packet(motor_type, kp, kd, position_degrees, velocity_deg_per_sec, torque)
             msg = can.Message(arbitration_id=motor_id, data=data, is_extended_id=False)
-            self.canbus.send(msg)
+            recv_id = self._get_motor_recv_id(motor)
+            self._send(msg, recv_id)
 
-            recv_id_to_motor[self._get_motor_recv_id(motor)] = motor_name
+            recv_id_to_motor[recv_id] = motor_name
+
+        if self._notifier is not None:
+            # The responses are decoded into the state cache by the notifier
+            return
 
         # Step 2: Collect responses and update state cache
         responses = self._recv_all_responses(list(recv_id_to_motor.keys()), timeout=SHORT_TIMEOUT_SEC)
@@ -536,6 +606,7 @@ class DamiaoMotorsBus(MotorsBusBase):
                 "temp_mos": float(t_mos),
                 "temp_rotor": float(t_rotor),
             }
+            self._state_timestamps[motor] = time.perf_counter()
         except Exception as e:
             logger.warning(f"Failed to decode response from {motor}: {e}")
 
@@ -615,16 +686,29 @@ class DamiaoMotorsBus(MotorsBusBase):
         motors: str | list[str] | None = None,
         *,
         num_retry: int = 0,
+        max_age_s: float | None = None,
     ) -> dict[str, MotorState]:
         """
         Read ALL motor states (position, velocity, torque) from multiple motors in ONE refresh cycle.
 
+        Args:
+            motors: Motors to read, all of them by default
+            max_age_s: If set, the motors whose cached state was decoded less than `max_age_s` seconds ago are
+                not refreshed. Every position write returns the state of the motors, so with `async_io` a
+                control loop reading at most one period old states does not wait for the bus.
+
         Returns:
             Dictionary mapping motor names to state dicts with keys: 'position', 'velocity', 'torque'
             Example: {'joint_1': {'position': 45.2, 'velocity': 1.3, 'torque': 0.5}, ...}
         """
         target_motors = self._get_motors_list(motors)
-        self._batch_refresh(target_motors)
+        if max_age_s is None:
+            self._batch_refresh(target_motors)
+        else:
+            now = time.perf_counter()
+            stale_motors = [m for m in target_motors if now - self._state_timestamps[m] > max_age_s]
+            if stale_motors:
+                self._batch_refresh(stale_motors)
 
         result = {}
         for motor in target_motors:
@@ -638,7 +722,7 @@ class DamiaoMotorsBus(MotorsBusBase):
             motor_id = self._get_motor_id(motor)
             data = [motor_id & 0xFF, (motor_id >> 8) & 0xFF, CAN_CMD_REFRESH, 0, 0, 0, 0, 0]
             msg = can.Message(arbitration_id=CAN_PARAM_ID, data=data, is_extended_id=False)
-            self.canbus.send(msg)
+            self._send(msg, self._get_motor_recv_id(motor))
             # Small delay to reduce bus congestion if necessary, though removed in sync_read previously
             # precise_sleep(PRECISE_SLEEP_SEC)
 
@@ -677,10 +761,17 @@ class DamiaoMotorsBus(MotorsBusBase):
 
                 data = self._encode_mit_packet(motor_type, kp, kd, float(value_degrees), 0.0, 0.0)
                 msg = can.Message(arbitration_id=motor_id, data=data, is_extended_id=False)
-                self.canbus.send(msg)
-                precise_sleep(PRECISE_TIMEOUT_SEC)
+                recv_id = self._get_motor_recv_id(motor)
+                self._send(msg, recv_id)
+                if self._notifier is None:
+                    # Spaces the frames, whose responses are received after all of them are sent
+                    precise_sleep(PRECISE_TIMEOUT_SEC)
+
+                recv_id_to_motor[recv_id] = motor_name
 
-                recv_id_to_motor[self._get_motor_recv_id(motor)] = motor_name
+            if self._notifier is not None:
+                # The responses are decoded into the state cache by the notifier
+                return
 
             # Step 2: Collect responses and update state cache
             responses = self._recv_all_responses(list(recv_id_to_motor.keys()), timeout=MEDIUM_TIMEOUT_SEC)
@@ -22,7 +22,14 @@ import logging
 from copy import deepcopy
 from enum import Enum
 
-from ..encoding_utils import decode_twos_complement, encode_twos_complement
+import numpy as np
+
+from ..encoding_utils import (
+    decode_twos_complement,
+    decode_twos_complement_array,
+    encode_twos_complement,
+    encode_twos_complement_array,
+)
 from ..motors_bus import Motor, MotorCalibration, NameOrID, SerialMotorsBus, Value, get_address
 from .tables import (
     AVAILABLE_BAUDRATES,
@@ -211,25 +218,41 @@ class DynamixelMotorsBus(SerialMotorsBus):
             self.write("Torque_Enable", motor, TorqueMode.ENABLED.value, num_retry=num_retry)
 
     def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
-            model = self._id_to_model(id_)
-            encoding_table = self.model_encoding_table.get(model)
-            if encoding_table and data_name in encoding_table:
-                n_bytes = encoding_table[data_name]
-                ids_values[id_] = encode_twos_complement(ids_values[id_], n_bytes)
+        encodings = self._get_encodings(data_name, tuple(ids_values))
+        if encodings is None:
+            return ids_values
+
+        for (id_, value), n_bytes in zip(ids_values.items(), encodings[0], strict=True):
+            if n_bytes >= 0:
+                ids_values[id_] = encode_twos_complement(value, n_bytes)
 
         return ids_values
 
     def _decode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
-            model = self._id_to_model(id_)
-            encoding_table = self.model_encoding_table.get(model)
-            if encoding_table and data_name in encoding_table:
-                n_bytes = encoding_table[data_name]
-                ids_values[id_] = decode_twos_complement(ids_values[id_], n_bytes)
+        encodings = self._get_encodings(data_name, tuple(ids_values))
+        if encodings is None:
+            return ids_values
+
+        for (id_, value), n_bytes in zip(ids_values.items(), encodings[0], strict=True):
+            if n_bytes >= 0:
+                ids_values[id_] = decode_twos_complement(value, n_bytes)
 
         return ids_values
 
+    def _encode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        n_bytes_array = self._get_encodings(data_name, ids)[1]
+        encoded = n_bytes_array >= 0
+        values = values.copy()
+        values[encoded] = encode_twos_complement_array(values[encoded], n_bytes_array[encoded])
+        return values
+
+    def _decode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        n_bytes_array = self._get_encodings(data_name, ids)[1]
+        encoded = n_bytes_array >= 0
+        values = values.copy()
+        values[encoded] = decode_twos_complement_array(values[encoded], n_bytes_array[encoded])
+        return values
+
     def _get_half_turn_homings(self, positions: dict[NameOrID, Value]) -> dict[NameOrID, Value]:
         """
         On Dynamixel Motors:
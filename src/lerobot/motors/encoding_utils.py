@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 
 def encode_sign_magnitude(value: int, sign_bit_index: int):
     """
@@ -65,3 +67,57 @@ def decode_twos_complement(value: int, n_bytes: int) -> int:
     if value & sign_bit:
         value -= 1 << bits
     return value
+
+
+def encode_sign_magnitude_array(values: np.ndarray, sign_bit_indices: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `encode_sign_magnitude`, with one sign bit index per value.
+    """
+    max_magnitudes = (1 << sign_bit_indices) - 1
+    magnitudes = np.abs(values)
+    too_large = magnitudes > max_magnitudes
+    if too_large.any():
+        idx = np.flatnonzero(too_large)[0]
+        raise ValueError(
+            f"Magnitude {magnitudes[idx]} exceeds {max_magnitudes[idx]} (max for "
+            f"sign_bit_index={sign_bit_indices[idx]})"
+        )
+
+    direction_bits = (values < 0).astype(np.int64)
+    return (direction_bits << sign_bit_indices) | magnitudes
+
+
+def decode_sign_magnitude_array(encoded_values: np.ndarray, sign_bit_indices: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `decode_sign_magnitude`, with one sign bit index per value.
+    """
+    direction_bits = (encoded_values >> sign_bit_indices) & 1
+    magnitudes = encoded_values & ((1 << sign_bit_indices) - 1)
+    return np.where(direction_bits == 1, -magnitudes, magnitudes)
+
+
+def encode_twos_complement_array(values: np.ndarray, n_bytes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `encode_twos_complement`, with one byte size per value.
+    """
+    bit_widths = n_bytes * 8
+    min_vals = -(1 << (bit_widths - 1))
+    max_vals = (1 << (bit_widths - 1)) - 1
+    out_of_range = (values < min_vals) | (values > max_vals)
+    if out_of_range.any():
+        idx = np.flatnonzero(out_of_range)[0]
+        raise ValueError(
+            f"Value {values[idx]} out of range for {n_bytes[idx]}-byte two's complement: "
+            f"[{min_vals[idx]}, {max_vals[idx]}]"
+        )
+
+    return np.where(values < 0, (1 << bit_widths) + values, values)
+
+
+def decode_twos_complement_array(values: np.ndarray, n_bytes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `decode_twos_complement`, with one byte size per value.
+    """
+    bits = n_bytes * 8
+    sign_bits = 1 << (bits - 1)
+    return np.where(values & sign_bits, values - (1 << bits), values)
@@ -17,7 +17,14 @@ from copy import deepcopy
 from enum import Enum
 from pprint import pformat
 
-from ..encoding_utils import decode_sign_magnitude, encode_sign_magnitude
+import numpy as np
+
+from ..encoding_utils import (
+    decode_sign_magnitude,
+    decode_sign_magnitude_array,
+    encode_sign_magnitude,
+    encode_sign_magnitude_array,
+)
 from ..motors_bus import Motor, MotorCalibration, NameOrID, SerialMotorsBus, Value, get_address
 from .tables import (
     FIRMWARE_MAJOR_VERSION,
@@ -309,25 +316,41 @@ class FeetechMotorsBus(SerialMotorsBus):
             self.write("Lock", motor, 1, num_retry=num_retry)
 
     def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
-            model = self._id_to_model(id_)
-            encoding_table = self.model_encoding_table.get(model)
-            if encoding_table and data_name in encoding_table:
-                sign_bit = encoding_table[data_name]
-                ids_values[id_] = encode_sign_magnitude(ids_values[id_], sign_bit)
+        encodings = self._get_encodings(data_name, tuple(ids_values))
+        if encodings is None:
+            return ids_values
+
+        for (id_, value), sign_bit in zip(ids_values.items(), encodings[0], strict=True):
+            if sign_bit >= 0:
+                ids_values[id_] = encode_sign_magnitude(value, sign_bit)
 
         return ids_values
 
     def _decode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
-            model = self._id_to_model(id_)
-            encoding_table = self.model_encoding_table.get(model)
-            if encoding_table and data_name in encoding_table:
-                sign_bit = encoding_table[data_name]
-                ids_values[id_] = decode_sign_magnitude(ids_values[id_], sign_bit)
+        encodings = self._get_encodings(data_name, tuple(ids_values))
+        if encodings is None:
+            return ids_values
+
+        for (id_, value), sign_bit in zip(ids_values.items(), encodings[0], strict=True):
+            if sign_bit >= 0:
+                ids_values[id_] = decode_sign_magnitude(value, sign_bit)
 
         return ids_values
 
+    def _encode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        sign_bits = self._get_encodings(data_name, ids)[1]
+        encoded = sign_bits >= 0
+        values = values.copy()
+        values[encoded] = encode_sign_magnitude_array(values[encoded], sign_bits[encoded])
+        return values
+
+    def _decode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        sign_bits = self._get_encodings(data_name, ids)[1]
+        encoded = sign_bits >= 0
+        values = values.copy()
+        values[encoded] = decode_sign_magnitude_array(values[encoded], sign_bits[encoded])
+        return values
+
     def _split_into_byte_chunks(self, value: int, length: int) -> list[int]:
         return _split_into_byte_chunks(value, length)
 
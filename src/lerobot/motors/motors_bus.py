@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import abc
 import logging
+from collections.abc import Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -30,6 +31,7 @@ from functools import cached_property
 from pprint import pformat
 from typing import Protocol, TypeAlias
 
+import numpy as np
 import serial
 from deepdiff import DeepDiff
 from tqdm import tqdm
@@ -178,6 +180,25 @@ class Motor:
     recv_id: int | None = None
 
 
+@dataclass
+class _CalibrationTable:
+    """Calibration and normalization mode of a list of motors, precomputed for the conversions of their values.
+
+    `rows` holds the (range_min, range_max, max_res, inverted, norm_mode) of every motor, for the per-value
+    conversions of dicts, and the arrays the same values in the order of the motors, for the vectorized
+    conversions.
+    """
+
+    rows: list[tuple[int, int, int, bool, MotorNormMode]]
+    range_min: np.ndarray
+    range_max: np.ndarray
+    max_res: np.ndarray
+    inverted: np.ndarray
+    range_m100_100: np.ndarray
+    range_0_100: np.ndarray
+    degrees: np.ndarray
+
+
 class PortHandler(Protocol):
     def __init__(self, port_name):
         self.is_open: bool
@@ -282,6 +303,32 @@ class GroupSyncWrite(Protocol):
     def txPacket(self): ...
 
 
+class _FlushingPacketHandler:
+    """Wraps the packet handler of a bus so that the response to a sync read request sent ahead by a pipelined
+    sync read is received before any other packet goes through it, see `SerialMotorsBus._flush_pending_sync_read`.
+
+    The sync reader and writer of the bus are built on this wrapper, so their packets go through it as well.
+    """
+
+    # Methods that only format a result, without communicating
+    _passthrough = frozenset({"getTxRxResult", "getRxPacketError", "getProtocolVersion"})
+
+    def __init__(self, bus: SerialMotorsBus, packet_handler: PacketHandler):
+        self._bus = bus
+        self._packet_handler = packet_handler
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._packet_handler, name)
+        if name in self._passthrough or not callable(attr):
+            return attr
+
+        def flushed(*args, **kwargs):
+            self._bus._flush_pending_sync_read()
+            return attr(*args, **kwargs)
+
+        return flushed
+
+
 class SerialMotorsBus(MotorsBusBase):
     """
     A SerialMotorsBus allows to efficiently read and write to motors connected via serial communication.
@@ -342,7 +389,6 @@ class SerialMotorsBus(MotorsBusBase):
         super().__init__(port, motors, calibration)
 
         self.port_handler: PortHandler
-        self.packet_handler: PacketHandler
         self.sync_reader: GroupSyncRead
         self.sync_writer: GroupSyncWrite
         self._comm_success: int
@@ -352,8 +398,39 @@ class SerialMotorsBus(MotorsBusBase):
         self._id_to_name_dict = {m.id: motor for motor, m in self.motors.items()}
         self._model_nb_to_model_dict = {v: k for k, v in self.model_number_table.items()}
 
+        # (addr, length, ids) the sync reader is set up for, and of the sync read request sent ahead by a
+        # pipelined sync read, whose response has not been received yet
+        self._sync_reader_key: tuple[int, int, tuple[int, ...]] | None = None
+        self._pending_sync_read: tuple[int, int, tuple[int, ...]] | None = None
+        # Per-motor entries of `model_encoding_table`, keyed by (data_name, ids), see `_get_encodings`
+        self._encodings: dict[tuple[str, tuple[int, ...]], tuple[list[int], np.ndarray] | None] = {}
+
         self._validate_motors()
 
+    @property
+    def packet_handler(self) -> PacketHandler:
+        """PacketHandler: Packet handler of the SDK, behind which every packet waits for the response to a
+        pending pipelined sync read to be received."""
+        return self._packet_handler
+
+    @packet_handler.setter
+    def packet_handler(self, packet_handler: PacketHandler) -> None:
+        self._packet_handler = _FlushingPacketHandler(self, packet_handler)
+
+    @property
+    def calibration(self) -> dict[str, MotorCalibration]:
+        """dict[str, MotorCalibration]: Calibration of the motors, by motor name.
+
+        Reassign it rather than modifying it in place, so that the tables derived from it for normalization
+        are rebuilt.
+        """
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: dict[str, MotorCalibration]) -> None:
+        self._calibration = calibration
+        self._calibration_tables: dict[tuple[int, ...], _CalibrationTable] = {}
+
     def __len__(self):
         return len(self.motors)
 
@@ -534,9 +611,11 @@ class SerialMotorsBus(MotorsBusBase):
         if disable_torque:
             self.port_handler.clearPort()
             self.port_handler.is_using = False
+            self._pending_sync_read = None
             self.disable_torque(num_retry=5)
 
         self.port_handler.closePort()
+        self._pending_sync_read = None
         logger.debug(f"{self.__class__.__name__} disconnected.")
 
     @classmethod
@@ -694,6 +773,7 @@ class SerialMotorsBus(MotorsBusBase):
         Raises:
             RuntimeError: The SDK failed to apply the change.
         """
+        self._flush_pending_sync_read()
         present_bus_baudrate = self.port_handler.getBaudRate()
         if present_bus_baudrate != baudrate:
             logger.info(f"Setting bus baud rate to {baudrate}. Previously {present_bus_baudrate}.")
@@ -838,65 +918,136 @@ class SerialMotorsBus(MotorsBusBase):
 
         return mins, maxes
 
-    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+    def _get_calibration_table(self, ids: tuple[int, ...]) -> _CalibrationTable:
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
-        normalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
+        table = self._calibration_tables.get(ids)
+        if table is None:
+            rows = []
+            for id_ in ids:
+                motor = self._id_to_name(id_)
+                min_ = self.calibration[motor].range_min
+                max_ = self.calibration[motor].range_max
+                if max_ == min_:
+                    raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
+                norm_mode = self.motors[motor].norm_mode
+                if norm_mode not in MotorNormMode:
+                    raise NotImplementedError
+                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
+                inverted = bool(self.apply_drive_mode and self.calibration[motor].drive_mode)
+                rows.append((min_, max_, max_res, inverted, norm_mode))
+
+            min_col, max_col, max_res_col, inverted_col, norm_mode_col = zip(*rows, strict=True)
+            table = _CalibrationTable(
+                rows=rows,
+                range_min=np.array(min_col, dtype=np.float64),
+                range_max=np.array(max_col, dtype=np.float64),
+                max_res=np.array(max_res_col, dtype=np.float64),
+                inverted=np.array(inverted_col),
+                range_m100_100=np.array([mode is MotorNormMode.RANGE_M100_100 for mode in norm_mode_col]),
+                range_0_100=np.array([mode is MotorNormMode.RANGE_0_100 for mode in norm_mode_col]),
+                degrees=np.array([mode is MotorNormMode.DEGREES for mode in norm_mode_col]),
+            )
+            self._calibration_tables[ids] = table
+
+        return table
+
+    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+        table = self._get_calibration_table(tuple(ids_values))
 
+        normalized_values = {}
+        for (id_, val), (min_, max_, max_res, inverted, norm_mode) in zip(
+            ids_values.items(), table.rows, strict=True
+        ):
             bounded_val = min(max_, max(min_, val))
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            if norm_mode is MotorNormMode.RANGE_M100_100:
                 norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
-                normalized_values[id_] = -norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+                normalized_values[id_] = -norm if inverted else norm
+            elif norm_mode is MotorNormMode.RANGE_0_100:
                 norm = ((bounded_val - min_) / (max_ - min_)) * 100
-                normalized_values[id_] = 100 - norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+                normalized_values[id_] = 100 - norm if inverted else norm
+            else:
                 mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
                 normalized_values[id_] = (val - mid) * 360 / max_res
-            else:
-                raise NotImplementedError
 
         return normalized_values
 
     def _unnormalize(self, ids_values: dict[int, float]) -> dict[int, int]:
-        if not self.calibration:
-            raise RuntimeError(f"{self} has no calibration registered.")
+        table = self._get_calibration_table(tuple(ids_values))
 
         unnormalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
-
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
-                val = -val if drive_mode else val
+        for (id_, val), (min_, max_, max_res, inverted, norm_mode) in zip(
+            ids_values.items(), table.rows, strict=True
+        ):
+            if norm_mode is MotorNormMode.RANGE_M100_100:
+                val = -val if inverted else val
                 bounded_val = min(100.0, max(-100.0, val))
                 unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
-                val = 100 - val if drive_mode else val
+            elif norm_mode is MotorNormMode.RANGE_0_100:
+                val = 100 - val if inverted else val
                 bounded_val = min(100.0, max(0.0, val))
                 unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+            else:
                 mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
                 unnormalized_values[id_] = int((val * max_res / 360) + mid)
-            else:
-                raise NotImplementedError
 
         return unnormalized_values
 
+    def _normalize_array(self, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_normalize`, for values ordered like `ids`."""
+        table = self._get_calibration_table(ids)
+        values = np.asarray(values, dtype=np.float64)
+
+        bounded_values = np.minimum(table.range_max, np.maximum(table.range_min, values))
+        ratios = (bounded_values - table.range_min) / (table.range_max - table.range_min)
+        range_m100_100 = (ratios * 200) - 100
+        range_m100_100 = np.where(table.inverted, -range_m100_100, range_m100_100)
+        range_0_100 = ratios * 100
+        range_0_100 = np.where(table.inverted, 100 - range_0_100, range_0_100)
+        mid = (table.range_min + table.range_max) / 2
+        degrees = (values - mid) * 360 / table.max_res
+
+        return np.where(
+            table.range_m100_100, range_m100_100, np.where(table.range_0_100, range_0_100, degrees)
+        )
+
+    def _unnormalize_array(self, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_unnormalize`, for values ordered like `ids`."""
+        table = self._get_calibration_table(ids)
+        values = np.asarray(values, dtype=np.float64)
+        span = table.range_max - table.range_min
+
+        range_m100_100 = np.where(table.inverted, -values, values)
+        range_m100_100 = np.minimum(100.0, np.maximum(-100.0, range_m100_100))
+        range_m100_100 = ((range_m100_100 + 100) / 200) * span + table.range_min
+        range_0_100 = np.where(table.inverted, 100 - values, values)
+        range_0_100 = np.minimum(100.0, np.maximum(0.0, range_0_100))
+        range_0_100 = (range_0_100 / 100) * span + table.range_min
+        mid = (table.range_min + table.range_max) / 2
+        degrees = (values * table.max_res / 360) + mid
+
+        raw_values = np.where(
+            table.range_m100_100, range_m100_100, np.where(table.range_0_100, range_0_100, degrees)
+        )
+        # Truncated towards zero, like `int`
+        return raw_values.astype(np.int64)
+
+    def _get_encodings(self, data_name: str, ids: tuple[int, ...]) -> tuple[list[int], np.ndarray] | None:
+        """Entries of `model_encoding_table` for `data_name` of the motors `ids`, as a list and an array, with
+        -1 for the motors on which it is not encoded. None when it is not encoded on any of them."""
+        key = (data_name, ids)
+        if key not in self._encodings:
+            entries = []
+            for id_ in ids:
+                encoding_table = self.model_encoding_table.get(self._id_to_model(id_))
+                entries.append(
+                    encoding_table[data_name] if encoding_table and data_name in encoding_table else -1
+                )
+            is_encoded = any(entry >= 0 for entry in entries)
+            self._encodings[key] = (entries, np.array(entries, dtype=np.int64)) if is_encoded else None
+        return self._encodings[key]
+
     @abc.abstractmethod
     def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
         pass
@@ -905,6 +1056,16 @@ class SerialMotorsBus(MotorsBusBase):
     def _decode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
         pass
 
+    @abc.abstractmethod
+    def _encode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_encode_sign`, for values ordered like `ids`."""
+        pass
+
+    @abc.abstractmethod
+    def _decode_sign_array(self, data_name: str, ids: tuple[int, ...], values: np.ndarray) -> np.ndarray:
+        """Vectorized :pymeth:`_decode_sign`, for values ordered like `ids`."""
+        pass
+
     def _serialize_data(self, value: int, length: int) -> list[int]:
         """
         Converts an unsigned integer value into a list of byte-sized integers to be sent via a communication
@@ -1117,14 +1278,22 @@ class SerialMotorsBus(MotorsBusBase):
         *,
         normalize: bool = True,
         num_retry: int = 0,
+        pipelined: bool = False,
     ) -> dict[str, Value]:
         """Read the same register from several motors at once.
 
+        See :pymeth:`sync_read_array` to get the values as an array.
+
         Args:
             data_name (str): Register name.
             motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
             normalize (bool, optional): Normalisation flag.  Defaults to `True`.
             num_retry (int, optional): Retry attempts.  Defaults to `0`.
+            pipelined (bool, optional): Send the request of the next read as soon as this one is received, so
+                that the next pipelined read of the same register only waits for the response, which may
+                already be there. Values are then as old as the previous read, which suits loops reading the
+                same register at a high rate (e.g. a leader arm) rather than read-then-write control loops,
+                as any other instruction first waits for the pending response.  Defaults to `False`.
 
         Returns:
             dict[str, Value]: Mapping *motor name → value*.
@@ -1144,9 +1313,126 @@ class SerialMotorsBus(MotorsBusBase):
 
         err_msg = f"Failed to sync read '{data_name}' on {ids=} after {num_retry + 1} tries."
         ids_values, _ = self._sync_read(
-            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
+            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg, pipelined=pipelined
+        )
+        if pipelined:
+            self._send_sync_read_ahead(addr, length, ids)
+
+        return self._decode_sync_read(data_name, ids_values, normalize)
+
+    @check_if_not_connected
+    def sync_read_array(
+        self,
+        data_name: str,
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+        pipelined: bool = False,
+    ) -> np.ndarray:
+        """Read the same register from several motors at once, as an array.
+
+        Args:
+            data_name (str): Register name.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+            pipelined (bool, optional): See :pymeth:`sync_read`.  Defaults to `False`.
+
+        Returns:
+            np.ndarray: Values in the order of *motors*, as float64 when normalised and int64 otherwise.
+        """
+
+        self._assert_protocol_is_compatible("sync_read")
+
+        names = self._get_motors_list(motors)
+        ids = [self.motors[motor].id for motor in names]
+        models = [self.motors[motor].model for motor in names]
+
+        if self._has_different_ctrl_tables:
+            assert_same_address(self.model_ctrl_table, models, data_name)
+
+        model = next(iter(models))
+        addr, length = get_address(self.model_ctrl_table, model, data_name)
+
+        err_msg = f"Failed to sync read '{data_name}' on {ids=} after {num_retry + 1} tries."
+        ids_values, _ = self._sync_read(
+            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg, pipelined=pipelined
         )
+        if pipelined:
+            self._send_sync_read_ahead(addr, length, ids)
+
+        return self._decode_array(data_name, tuple(ids), ids_values.values(), normalize)
 
+    @check_if_not_connected
+    def sync_read_registers(
+        self,
+        data_names: list[str],
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+        pipelined: bool = False,
+    ) -> dict[str, dict[str, Value]]:
+        """Read several registers from several motors at once, in a single sync read.
+
+        The registers are read as one block, from the lowest to the highest address, so they should be next
+        to each other in the control table (e.g. `"Present_Position"`, `"Present_Velocity"` and
+        `"Present_Load"`).
+
+        Args:
+            data_names (list[str]): Register names.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+            pipelined (bool, optional): See :pymeth:`sync_read`.  Defaults to `False`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*.
+        """
+
+        self._assert_protocol_is_compatible("sync_read")
+
+        names = self._get_motors_list(motors)
+        ids = [self.motors[motor].id for motor in names]
+        models = [self.motors[motor].model for motor in names]
+
+        model = next(iter(models))
+        addresses = {}
+        for data_name in data_names:
+            if self._has_different_ctrl_tables:
+                assert_same_address(self.model_ctrl_table, models, data_name)
+            addresses[data_name] = get_address(self.model_ctrl_table, model, data_name)
+        start_addr = min(addr for addr, _ in addresses.values())
+        block_length = max(addr + length for addr, length in addresses.values()) - start_addr
+
+        err_msg = f"Failed to sync read {data_names} on {ids=} after {num_retry + 1} tries."
+        self._sync_read(
+            start_addr,
+            block_length,
+            ids,
+            num_retry=num_retry,
+            raise_on_error=True,
+            err_msg=err_msg,
+            pipelined=pipelined,
+            get_data=False,
+        )
+
+        raw_values = {
+            data_name: {id_: self.sync_reader.getData(id_, addr, length) for id_ in ids}
+            for data_name, (addr, length) in addresses.items()
+        }
+        if pipelined:
+            self._send_sync_read_ahead(start_addr, block_length, ids)
+
+        return {
+            data_name: self._decode_sync_read(data_name, ids_values, normalize)
+            for data_name, ids_values in raw_values.items()
+        }
+
+    def _decode_sync_read(
+        self, data_name: str, ids_values: dict[int, int], normalize: bool
+    ) -> dict[str, Value]:
         ids_values = self._decode_sign(data_name, ids_values)
 
         if normalize and data_name in self.normalized_data:
@@ -1154,6 +1440,18 @@ class SerialMotorsBus(MotorsBusBase):
 
         return {self._id_to_name(id_): value for id_, value in ids_values.items()}
 
+    def _decode_array(
+        self, data_name: str, ids: tuple[int, ...], raw_values: Iterable[int], normalize: bool
+    ) -> np.ndarray:
+        values = np.fromiter(raw_values, np.int64, len(ids))
+        if self._get_encodings(data_name, ids) is not None:
+            values = self._decode_sign_array(data_name, ids, values)
+
+        if normalize and data_name in self.normalized_data:
+            values = self._normalize_array(ids, values)
+
+        return values
+
     def _sync_read(
         self,
         addr: int,
@@ -1163,10 +1461,26 @@ class SerialMotorsBus(MotorsBusBase):
         num_retry: int = 0,
         raise_on_error: bool = True,
         err_msg: str = "",
+        pipelined: bool = False,
+        get_data: bool = True,
     ) -> tuple[dict[int, int], int]:
+        key = (addr, length, tuple(motor_ids))
+        # The request of this read was sent ahead by the previous pipelined read, see `_send_sync_read_ahead`,
+        # so only its response is awaited
+        request_sent = pipelined and self._pending_sync_read == key
+        if request_sent:
+            self._pending_sync_read = None
+        else:
+            # Before the sync reader is set up for this read, as the pending response is parsed with its
+            # current parameters
+            self._flush_pending_sync_read()
+
         self._setup_sync_reader(motor_ids, addr, length)
         for n_try in range(1 + num_retry):
-            comm = self.sync_reader.txRxPacket()
+            if request_sent and n_try == 0:
+                comm = self.sync_reader.rxPacket()
+            else:
+                comm = self.sync_reader.txRxPacket()
             if self._is_comm_success(comm):
                 break
             logger.debug(
@@ -1177,29 +1491,40 @@ class SerialMotorsBus(MotorsBusBase):
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
 
-        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+        values = {}
+        if get_data:
+            values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
         return values, comm
 
+    def _send_sync_read_ahead(self, addr: int, length: int, motor_ids: list[int]) -> None:
+        """Send the request of the next pipelined sync read. To be called once the data of the sync reader has
+        been read, as the response overwrites it."""
+        self._setup_sync_reader(motor_ids, addr, length)
+        if self._is_comm_success(self.sync_reader.txPacket()):
+            self._pending_sync_read = (addr, length, tuple(motor_ids))
+
+    def _flush_pending_sync_read(self) -> None:
+        """Receive and discard the response to the request sent ahead by a pipelined sync read, as the bus is
+        half-duplex: no other instruction can be sent before the motors are done responding.
+
+        It is called by `packet_handler` before any packet is sent, so it only needs to be called directly
+        before changing the sync reader or the port.
+        """
+        if self._pending_sync_read is not None:
+            self._pending_sync_read = None
+            self.sync_reader.rxPacket()
+
     def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
+        # The parameters of the sync read packet are only rebuilt when the read changes
+        key = (addr, length, tuple(motor_ids))
+        if self._sync_reader_key == key:
+            return
         self.sync_reader.clearParam()
         self.sync_reader.start_address = addr
         self.sync_reader.data_length = length
         for id_ in motor_ids:
             self.sync_reader.addParam(id_)
-
-    # TODO(aliberts, pkooij): Implementing something like this could get even much faster read times if need be.
-    # Would have to handle the logic of checking if a packet has been sent previously though but doable.
-    # This could be at the cost of increase latency between the moment the data is produced by the motors and
-    # the moment it is used by a policy.
-    # def _async_read(self, motor_ids: list[int], address: int, length: int):
-    #     if self.sync_reader.start_address != address or self.sync_reader.data_length != length or ...:
-    #         self._setup_sync_reader(motor_ids, address, length)
-    #     else:
-    #         self.sync_reader.rxPacket()
-    #         self.sync_reader.txPacket()
-
-    #     for id_ in motor_ids:
-    #         value = self.sync_reader.getData(id_, address, length)
+        self._sync_reader_key = key
 
     @check_if_not_connected
     def sync_write(
@@ -1216,6 +1541,8 @@ class SerialMotorsBus(MotorsBusBase):
         can allow for lost packets. It is faster than :pymeth:`write` and should typically be used when
         frequency matters and losing some packets is acceptable (e.g. teleoperation loops).
 
+        See :pymeth:`sync_write_array` to write the values of an array.
+
         Args:
             data_name (str): Register name.
             values (Value | dict[str, Value]): Either a single value (applied to every motor) or a mapping
@@ -1240,6 +1567,49 @@ class SerialMotorsBus(MotorsBusBase):
         err_msg = f"Failed to sync write '{data_name}' with {ids_values=} after {num_retry + 1} tries."
         self._sync_write(addr, length, ids_values, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
 
+    @check_if_not_connected
+    def sync_write_array(
+        self,
+        data_name: str,
+        values: np.ndarray,
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> None:
+        """Write the same register on multiple motors, from an array.
+
+        Args:
+            data_name (str): Register name.
+            values (np.ndarray): Values in the order of *motors*.
+            motors (str | list[str] | None, optional): Motors to write. `None` (default) writes every motor.
+            normalize (bool, optional): If `True` (default) convert values from the user range to raw units.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+        """
+
+        names = self._get_motors_list(motors)
+        if len(values) != len(names):
+            raise ValueError(f"Expected {len(names)} values for {names}, got {len(values)}.")
+        ids = tuple(self.motors[motor].id for motor in names)
+        models = [self.motors[motor].model for motor in names]
+        if self._has_different_ctrl_tables:
+            assert_same_address(self.model_ctrl_table, models, data_name)
+
+        model = next(iter(models))
+        addr, length = get_address(self.model_ctrl_table, model, data_name)
+
+        if normalize and data_name in self.normalized_data:
+            values = self._unnormalize_array(ids, values)
+        else:
+            values = np.asarray(values, dtype=np.int64)
+
+        if self._get_encodings(data_name, ids) is not None:
+            values = self._encode_sign_array(data_name, ids, values)
+
+        ids_values = dict(zip(ids, values.tolist(), strict=True))
+        err_msg = f"Failed to sync write '{data_name}' with {ids_values=} after {num_retry + 1} tries."
+        self._sync_write(addr, length, ids_values, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
+
     def _sync_write(
         self,
         addr: int,
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Background polling of the state of a motors bus.
+
+A `MotorStatePoller` reads a set of registers from a bus on its own thread at a target rate, and publishes
+every read as an immutable `MotorStateSnapshot`. The control loop gets the latest snapshot without touching
+the bus, and can check how old it is.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from .motors_bus import MotorsBusBase, SerialMotorsBus, Value
+
+logger = logging.getLogger(__name__)
+
+# Default maximum age of the snapshots returned by `MotorStatePoller.latest`, in poll periods
+MAX_AGE_POLL_PERIODS = 5
+# Default maximum age of the snapshots when the bus is polled as fast as possible, in seconds
+DEFAULT_MAX_AGE_S = 0.1
+
+
+@dataclass(frozen=True)
+class MotorStateSnapshot:
+    """Values read from a bus in a single poll, as *register name → motor name → value*."""
+
+    values: dict[str, dict[str, Value]]
+    # `time.perf_counter()` when the read was started and when it was received
+    read_start: float
+    timestamp: float
+    # Index of the poll this snapshot comes from
+    seq: int
+
+    @property
+    def age_s(self) -> float:
+        return time.perf_counter() - self.timestamp
+
+
+class MotorStatePoller:
+    """Continuously read registers from a motors bus on a background thread.
+
+    The bus is not thread-safe: once the poller is started, every other access to the bus must be done
+    within `exclusive()`, which waits for the current poll to finish. A write done within `exclusive()` is
+    seen by every snapshot whose `read_start` is later than the moment `exclusive()` returned, see
+    `wait_for_update`.
+
+    Failures of the polls are counted and logged, and the snapshots stop being updated: `latest()` raises
+    when the latest snapshot is older than `max_age_s`. An unexpected error stops the polling thread, and is
+    raised again by `latest()` and `wait_for_update()`.
+
+    Args:
+        bus: Connected motors bus to poll.
+        data_names: Registers to read at every poll, e.g. `["Present_Position"]`. On a `SerialMotorsBus`,
+            several registers are read in a single sync read, see `SerialMotorsBus.sync_read_registers`.
+        fps: Target polling rate. The bus is polled as fast as possible when None.
+        motors: Motors to read. `None` (default) reads every motor.
+        normalize: Normalisation flag of the reads.  Defaults to `True`.
+        max_age_s: Maximum age of the snapshot returned by `latest()`. Defaults to `MAX_AGE_POLL_PERIODS`
+            poll periods, or `DEFAULT_MAX_AGE_S` when `fps` is None.
+    """
+
+    def __init__(
+        self,
+        bus: MotorsBusBase,
+        data_names: list[str],
+        fps: float | None = None,
+        motors: list[str] | None = None,
+        normalize: bool = True,
+        max_age_s: float | None = None,
+    ):
+        if fps is not None and fps <= 0:
+            raise ValueError(f"fps should be positive, got {fps}.")
+        if max_age_s is None:
+            max_age_s = MAX_AGE_POLL_PERIODS / fps if fps is not None else DEFAULT_MAX_AGE_S
+        if max_age_s <= 0:
+            raise ValueError(f"max_age_s should be positive, got {max_age_s}.")
+
+        self.bus = bus
+        self.data_names = data_names
+        self.fps = fps
+        self.motors = motors
+        self.normalize = normalize
+        self.max_age_s = max_age_s
+
+        self.lock = threading.RLock()
+        self._snapshot: MotorStateSnapshot | None = None
+        self._new_snapshot = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.num_errors = 0
+        self.last_error: Exception | None = None
+        # Error which stopped the polling thread
+        self._error: Exception | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _read(self) -> dict[str, dict[str, Value]]:
+        if isinstance(self.bus, SerialMotorsBus) and len(self.data_names) > 1:
+            return self.bus.sync_read_registers(self.data_names, self.motors, normalize=self.normalize)
+        if isinstance(self.bus, SerialMotorsBus):
+            return {
+                name: self.bus.sync_read(name, self.motors, normalize=self.normalize)
+                for name in self.data_names
+            }
+        return {name: self.bus.sync_read(name, self.motors) for name in self.data_names}
+
+    def poll(self) -> MotorStateSnapshot:
+        """Read the registers once and publish the snapshot."""
+        with self.lock:
+            read_start = time.perf_counter()
+            values = self._read()
+            timestamp = time.perf_counter()
+
+        seq = 0 if self._snapshot is None else self._snapshot.seq + 1
+        snapshot = MotorStateSnapshot(values, read_start, timestamp, seq)
+        # Publishing replaces a reference to an immutable snapshot, so readers never see a partial update
+        self._snapshot = snapshot
+        with self._new_snapshot:
+            self._new_snapshot.notify_all()
+        return snapshot
+
+    def _run(self) -> None:
+        try:
+            self._poll_loop()
+        except Exception as e:
+            logger.exception(f"{self.bus.__class__.__name__} state poller stopped")
+            self._error = e
+            with self._new_snapshot:
+                self._new_snapshot.notify_all()
+
+    def _poll_loop(self) -> None:
+        period = 1 / self.fps if self.fps is not None else 0.0
+        next_poll = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except (ConnectionError, RuntimeError) as e:
+                self.num_errors += 1
+                self.last_error = e
+                logger.warning(f"{self.bus.__class__.__name__} state poll failed: {e}")
+
+            next_poll += period
+            delay = next_poll - time.perf_counter()
+            if delay < 0:
+                # Overrun, restart the schedule from now instead of catching up
+                next_poll = time.perf_counter()
+            else:
+                self._stop_event.wait(delay)
+
+    def start(self) -> None:
+        """Read a first snapshot, then start polling in the background."""
+        if self.is_running:
+            return
+        self.poll()
+        self._error = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.bus.__class__.__name__}-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling, once the current poll is done. The bus can then be used directly again."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    @contextmanager
+    def exclusive(self) -> Iterator[MotorsBusBase]:
+        """Access the bus from another thread, between two polls."""
+        with self.lock:
+            yield self.bus
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def latest(self) -> MotorStateSnapshot:
+        """Latest snapshot, without waiting for the bus unless it is too old.
+
+        When it is older than `max_age_s`, e.g. after the polls were paused by `exclusive()`, a newer snapshot
+        is waited for, up to `max_age_s` seconds.
+
+        Raises:
+            TimeoutError: No snapshot younger than `max_age_s` could be read, e.g. because the polls fail.
+        """
+        self._raise_if_failed()
+        if self._snapshot is None:
+            raise RuntimeError("No motor state was read yet. Run `start()` first.")
+        if self._snapshot.age_s <= self.max_age_s:
+            return self._snapshot
+
+        with self._new_snapshot:
+            fresh = self._new_snapshot.wait_for(
+                lambda: self._error is not None or self._snapshot.age_s <= self.max_age_s, self.max_age_s
+            )
+        self._raise_if_failed()
+        if not fresh:
+            raise TimeoutError(
+                f"{self.bus.__class__.__name__} motor state is {self._snapshot.age_s * 1e3:.0f}ms old, more than "
+                f"{self.max_age_s * 1e3:.0f}ms ({self.num_errors} failed polls, last error: {self.last_error})."
+            )
+        return self._snapshot
+
+    def wait_for_update(self, since: float, timeout: float | None = None) -> MotorStateSnapshot:
+        """Wait for a snapshot whose read was started after `since`, a `time.perf_counter()` value.
+
+        Raises:
+            TimeoutError: No such snapshot was read within `timeout` seconds.
+        """
+        with self._new_snapshot:
+            ready = self._new_snapshot.wait_for(
+                lambda: (
+                    self._error is not None
+                    or (self._snapshot is not None and self._snapshot.read_start > since)
+                ),
+                timeout,
+            )
+        self._raise_if_failed()
+        if not ready:
+            raise TimeoutError(f"No motor state read after {since=} within {timeout}s.")
+        return self._snapshot
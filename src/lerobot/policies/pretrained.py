@@ -24,7 +24,7 @@ from typing import TypedDict, TypeVar
 import packaging
 import safetensors
 from huggingface_hub import HfApi, ModelCard, ModelCardData, hf_hub_download
-from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from huggingface_hub.constants import SAFETENSORS_INDEX_FILE, SAFETENSORS_SINGLE_FILE
 from huggingface_hub.errors import HfHubHTTPError
 from safetensors.torch import load_model as load_model_as_safetensor, save_model as save_model_as_safetensor
 from torch import Tensor, nn
@@ -34,6 +34,7 @@ from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.policies.utils import log_model_loading_keys
 from lerobot.utils.hub import HubMixin
+from lerobot.utils.io_utils import load_sharded_safetensors
 
 T = TypeVar("T", bound="PreTrainedPolicy")
 
@@ -109,7 +110,12 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
         if os.path.isdir(model_id):
             print("Loading weights from local directory")
             model_file = os.path.join(model_id, SAFETENSORS_SINGLE_FILE)
-            policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
+            index_file = os.path.join(model_id, SAFETENSORS_INDEX_FILE)
+            if not os.path.exists(model_file) and os.path.exists(index_file):
+                # Large policies may be checkpointed as sharded safetensors, see `AsyncCheckpointWriter`
+                policy = cls._load_as_sharded_safetensor(instance, index_file, config.device, strict)
+            else:
+                policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
         else:
             try:
                 model_file = hf_hub_download(
@@ -157,6 +163,22 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
             model.to(map_location)
         return model
 
+    @classmethod
+    def _load_as_sharded_safetensor(cls, model: T, index_file: str, map_location: str, strict: bool) -> T:
+        state_dict = load_sharded_safetensors(Path(index_file), device=map_location)
+        missing_keys, unexpected_keys = model.load_state_dict(state_dict, strict=False)
+        # Tied weights are saved once, under one of their names
+        model_state_dict = model.state_dict()
+        loaded_ptrs = {model_state_dict[key].data_ptr() for key in state_dict if key in model_state_dict}
+        missing_keys = [key for key in missing_keys if model_state_dict[key].data_ptr() not in loaded_ptrs]
+        if strict and (missing_keys or unexpected_keys):
+            raise RuntimeError(
+                f"Error loading the weights of {cls.__name__} from {index_file}: missing keys {missing_keys}, "
+                f"unexpected keys {unexpected_keys}"
+            )
+        log_model_loading_keys(missing_keys, unexpected_keys)
+        return model
+
     @abc.abstractmethod
     def get_optim_params(self) -> dict:
         """
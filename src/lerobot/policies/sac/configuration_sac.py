@@ -53,6 +53,30 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Maximum number of actors connected to the learner at the same time (e.g. a real robot and sim workers)
+    max_actors: int = 1
+    # Identifier sent by the actor to the learner, defaults to "<hostname>-<pid>"
+    actor_id: str | None = None
+    # Wire format of the transitions sent by the actor: "columnar" packs each episode into stacked
+    # per-key tensors with a compact binary encoding, "torch" keeps the legacy `torch.save` list of dicts.
+    transitions_encoding: str = "columnar"
+    # Optional compression of columnar batches ("lz4" or "zstd", requires the matching package)
+    transitions_compression: str | None = None
+    # Send image observations with values in [0, 1] as uint8 in columnar batches. Lossy (1/255 steps),
+    # so it is opt-in
+    quantize_images: bool = False
+
+    def __post_init__(self):
+        if self.max_actors < 1:
+            raise ValueError(f"max_actors must be at least 1, got {self.max_actors}")
+        if self.transitions_encoding not in ("columnar", "torch"):
+            raise ValueError(
+                f"transitions_encoding must be 'columnar' or 'torch', got '{self.transitions_encoding}'"
+            )
+        if self.transitions_compression not in (None, "lz4", "zstd"):
+            raise ValueError(
+                f"transitions_compression must be None, 'lz4' or 'zstd', got '{self.transitions_compression}'"
+            )
 
 
 @dataclass
@@ -127,6 +151,10 @@ class SACConfig(PreTrainedConfig):
     vision_encoder_name: str | None = None
     # Whether to freeze the vision encoder during training
     freeze_vision_encoder: bool = True
+    # Cache the frozen vision encoder features per replay buffer slot when transitions are added, so the
+    # learner never runs the encoder backbone. Ignored when the vision encoder is trainable. The DrQ image
+    # augmentation of the replay buffer is then not applied, as the features are those of the stored images.
+    cache_observation_features: bool = False
     # Hidden dimension size for the image encoder
     image_encoder_hidden_dim: int = 32
     # Whether to use a shared encoder for actor and critic
@@ -145,6 +173,10 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Whether to prepare the batches in a worker process from shared-memory storage, with pinned-memory
+    # staging and overlapped host to device copies on CUDA (requires storage_device="cpu"). It needs spare
+    # CPU cores to be faster than `async_prefetch`, hence off by default
+    multiprocess_prefetch: bool = False
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -169,6 +201,9 @@ class SACConfig(PreTrainedConfig):
     critic_target_update_weight: float = 0.005
     # Update-to-data ratio for the UTD algorithm (If you want enable utd_ratio, you need to set it to >1)
     utd_ratio: int = 1
+    # Sample the `utd_ratio` batches of an optimization step at once, and compute their frozen encoder
+    # features in one pass. The critics and their targets are still updated `utd_ratio` times, once per batch.
+    batched_utd: bool = False
     # Hidden dimension size for the state encoder
     state_encoder_hidden_dim: int = 256
     # Dimension of the latent space
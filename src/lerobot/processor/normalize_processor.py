@@ -252,12 +252,16 @@ class _NormalizationMixin:
         """
         new_observation = dict(observation)
         for key, feature in self.features.items():
+            if feature.type == FeatureType.ACTION or key not in new_observation:
+                continue
+            # Convert to tensor but preserve original dtype for adaptation logic
+            tensor = torch.as_tensor(new_observation[key])
             if self.normalize_observation_keys is not None and key not in self.normalize_observation_keys:
+                # uint8 images are still scaled to float32 in [0, 1], as they would be without normalization
+                if tensor.dtype == torch.uint8 and feature.type == FeatureType.VISUAL and not inverse:
+                    new_observation[key] = tensor.to(torch.float32).div_(255)
                 continue
-            if feature.type != FeatureType.ACTION and key in new_observation:
-                # Convert to tensor but preserve original dtype for adaptation logic
-                tensor = torch.as_tensor(new_observation[key])
-                new_observation[key] = self._apply_transform(tensor, key, feature.type, inverse=inverse)
+            new_observation[key] = self._apply_transform(tensor, key, feature.type, inverse=inverse)
         return new_observation
 
     def _normalize_action(self, action: Tensor, inverse: bool) -> Tensor:
@@ -302,6 +306,9 @@ class _NormalizationMixin:
         Raises:
             ValueError: If an unsupported normalization mode is encountered.
         """
+        if tensor.dtype == torch.uint8 and feature_type == FeatureType.VISUAL and not inverse:
+            return self._normalize_uint8_image(tensor, key)
+
         norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
         if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
             return tensor
@@ -396,6 +403,25 @@ class _NormalizationMixin:
         # If necessary stats are missing, return input unchanged.
         return tensor
 
+    def _normalize_uint8_image(self, tensor: Tensor, key: str) -> Tensor:
+        """
+        Scales uint8 images (e.g. from `LeRobotDataset(return_uint8_images=True)`) to float32 in [0, 1] and
+        normalizes them.
+
+        Image stats are computed in [0, 1], so MEAN_STD normalization of a uint8 image is the affine map
+        `x * 1 / (255 * std) - mean / std`, applied in a single pass on the device of the image.
+        """
+        norm_mode = self.norm_map.get(FeatureType.VISUAL, NormalizationMode.IDENTITY)
+        stats = self._tensor_stats.get(key, {})
+        if norm_mode != NormalizationMode.MEAN_STD or "mean" not in stats or "std" not in stats:
+            return self._apply_transform(tensor.to(torch.float32).div_(255), key, FeatureType.VISUAL)
+
+        if stats["mean"].device != tensor.device or stats["mean"].dtype != torch.float32:
+            self.to(device=tensor.device, dtype=torch.float32)
+        mean, std = self._tensor_stats[key]["mean"], self._tensor_stats[key]["std"]
+        denom = std + self.eps
+        return tensor.to(torch.float32).mul_(1 / (255 * denom)).add_(-mean / denom)
+
 
 @dataclass
 @ProcessorStepRegistry.register(name="normalizer_processor")
@@ -48,6 +48,7 @@ https://github.com/michel-aractingi/lerobot-hilserl-guide
 
 import logging
 import os
+import socket
 import time
 from functools import lru_cache
 from queue import Empty
@@ -70,11 +71,15 @@ from lerobot.teleoperators import gamepad, so_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import (
+    ThroughputMeter,
+    actor_id_metadata,
     bytes_to_state_dict,
     grpc_channel_options,
     python_object_to_bytes,
     receive_bytes_in_chunks,
     send_bytes_in_chunks,
+    stack_transitions,
+    transition_batch_to_bytes,
     transitions_to_bytes,
 )
 from lerobot.utils.random_utils import set_seed
@@ -119,6 +124,11 @@ def actor_cli(cfg: TrainRLServerPipelineConfig):
     init_logging(log_file=log_file, display_pid=display_pid)
     logging.info(f"Actor logging initialized, writing to {log_file}")
 
+    # Resolve the actor id once, so that all the streams of this actor share it with the learner
+    if cfg.policy.actor_learner_config.actor_id is None:
+        cfg.policy.actor_learner_config.actor_id = f"{socket.gethostname()}-{os.getpid()}"
+    logging.info(f"[ACTOR] Actor id: {cfg.policy.actor_learner_config.actor_id}")
+
     is_threaded = use_threads(cfg)
     shutdown_event = ProcessSignalHandler(is_threaded, display_pid=display_pid).shutdown_event
 
@@ -275,6 +285,9 @@ def act_with_policy(
     episode_total_steps = 0
 
     policy_timer = TimerManager("Policy inference", log=False)
+    transport_meter = ThroughputMeter()
+    # Version of the parameters received from the learner, used by the learner to measure staleness
+    policy_version = 0
 
     for interaction_step in range(cfg.policy.online_steps):
         start_time = time.perf_counter()
@@ -351,17 +364,33 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            # The episode was collected with the current parameters, tag it before loading new ones
+            episode_policy_version = policy_version
+            new_policy_version = update_policy_parameters(
+                policy=policy, parameters_queue=parameters_queue, device=device
+            )
+            if new_policy_version is not None:
+                policy_version = new_policy_version
 
             if len(list_transition_to_send_to_learner) > 0:
-                push_transitions_to_transport_queue(
+                num_bytes = push_transitions_to_transport_queue(
                     transitions=list_transition_to_send_to_learner,
                     transitions_queue=transitions_queue,
+                    encoding=cfg.policy.actor_learner_config.transitions_encoding,
+                    compression=cfg.policy.actor_learner_config.transitions_compression,
+                    quantize_images=cfg.policy.actor_learner_config.quantize_images,
+                    policy_version=episode_policy_version,
+                )
+                transport_meter.update(
+                    num_transitions=len(list_transition_to_send_to_learner), num_bytes=num_bytes
                 )
                 list_transition_to_send_to_learner = []
 
             stats = get_frequency_stats(policy_timer)
             policy_timer.reset()
+            transport_stats = transport_meter.report()
+            stats["Actor transitions sent [1/s]"] = transport_stats["transitions_per_s"]
+            stats["Actor transitions sent [MB/s]"] = transport_stats["mb_per_s"]
 
             # Calculate intervention rate
             intervention_rate = 0.0
@@ -376,6 +405,7 @@ def act_with_policy(
                         "Interaction step": interaction_step,
                         "Episode intervention": int(episode_intervention),
                         "Intervention rate": intervention_rate,
+                        "Policy version": episode_policy_version,
                         **stats,
                     }
                 )
@@ -491,7 +521,9 @@ def receive_policy(
         )
 
     try:
-        iterator = learner_client.StreamParameters(services_pb2.Empty())
+        iterator = learner_client.StreamParameters(
+            services_pb2.Empty(), metadata=actor_id_metadata(cfg.policy.actor_learner_config.actor_id)
+        )
         receive_bytes_in_chunks(
             iterator,
             parameters_queue,
@@ -545,7 +577,8 @@ def send_transitions(
         learner_client.SendTransitions(
             transitions_stream(
                 shutdown_event, transitions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_id_metadata(cfg.policy.actor_learner_config.actor_id),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -598,7 +631,8 @@ def send_interactions(
         learner_client.SendInteractions(
             interactions_stream(
                 shutdown_event, interactions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_id_metadata(cfg.policy.actor_learner_config.actor_id),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -649,56 +683,94 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
+def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device) -> int | None:
+    """Load the latest parameters received from the learner, if any.
+
+    Returns:
+        int | None: The version of the loaded parameters, or None if no new parameters were received.
+    """
     bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
-    if bytes_state_dict is not None:
-        logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
-
-        # TODO: check encoder parameter synchronization possible issues:
-        # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
-        #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
-        # Potential fixes:
-        # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
-        # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
-
-        # Load actor state dict
-        actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
-
-        # Load discrete critic if present
-        if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
-            discrete_critic_state_dict = move_state_dict_to_device(
-                state_dicts["discrete_critic"], device=device
-            )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
-            logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+    if bytes_state_dict is None:
+        return None
+
+    logging.info("[ACTOR] Load new parameters from Learner.")
+    state_dicts = bytes_to_state_dict(bytes_state_dict)
+
+    # TODO: check encoder parameter synchronization possible issues:
+    # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
+    #    instead of the updated encoder params from critic (which is optimized separately)
+    # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
+    # 3. Need to handle encoder params correctly for both actor and discrete_critic
+    # Potential fixes:
+    # - Send critic's encoder state when shared_encoder=True
+    # - Skip encoder params entirely when freeze_vision_encoder=True
+    # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
+
+    # Load actor state dict
+    actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
+    policy.actor.load_state_dict(actor_state_dict)
+
+    # Load discrete critic if present
+    if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
+        discrete_critic_state_dict = move_state_dict_to_device(state_dicts["discrete_critic"], device=device)
+        policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
+        logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
+
+    return int(state_dicts.get("version", 0))
 
 
 #  Utilities functions
 
 
-def push_transitions_to_transport_queue(transitions: list, transitions_queue):
-    """Send transitions to learner in smaller chunks to avoid network issues.
+def push_transitions_to_transport_queue(
+    transitions: list,
+    transitions_queue,
+    encoding: str = "columnar",
+    compression: str | None = None,
+    quantize_images: bool = False,
+    policy_version: int | None = None,
+) -> int:
+    """Serialize an episode worth of transitions and put it on the transport queue.
+
+    With the "columnar" encoding the transitions are stacked per key and sent as one compact binary
+    batch (see `transition_batch_to_bytes`) tagged with the policy version used to collect them,
+    otherwise the legacy `torch.save` list of dicts is used.
 
     Args:
         transitions: List of transitions to send
-        message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        transitions_queue: Queue to send messages to learner
+        encoding: "columnar" or "torch"
+        compression: Optional compression for columnar batches ("lz4" or "zstd")
+        quantize_images: Whether to send [0, 1] images as uint8 in columnar batches
+        policy_version: Version of the learner parameters used to collect the transitions
+
+    Returns:
+        int: The number of bytes put on the queue.
     """
-    transition_to_send_to_learner = []
-    for transition in transitions:
-        tr = move_transition_to_device(transition=transition, device="cpu")
-        for key, value in tr["state"].items():
-            if torch.isnan(value).any():
+    if encoding == "columnar":
+        batch = stack_transitions(transitions)
+        for key, value in batch["state"].items():
+            if value.is_floating_point() and torch.isnan(value).any():
                 logging.warning(f"Found NaN values in transition {key}")
 
-        transition_to_send_to_learner.append(tr)
+        metadata = {"policy_version": policy_version} if policy_version is not None else None
+        buffer = transition_batch_to_bytes(
+            batch, compression=compression, quantize_images=quantize_images, metadata=metadata
+        )
+    else:
+        transition_to_send_to_learner = []
+        for transition in transitions:
+            tr = move_transition_to_device(transition=transition, device="cpu")
+            for key, value in tr["state"].items():
+                if torch.isnan(value).any():
+                    logging.warning(f"Found NaN values in transition {key}")
+
+            transition_to_send_to_learner.append(tr)
+
+        buffer = transitions_to_bytes(transition_to_send_to_learner)
 
-    transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
+    transitions_queue.put(buffer)
+    return len(buffer)
 
 
 def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
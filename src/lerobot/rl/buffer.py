@@ -15,8 +15,10 @@
 # limitations under the License.
 
 import functools
+import logging
 from collections.abc import Callable, Sequence
 from contextlib import suppress
+from queue import Empty
 from typing import TypedDict
 
 import torch
@@ -36,6 +38,9 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Only present when the buffer caches the vision encoder features, see `enable_feature_cache`
+    observation_feature: dict[str, torch.Tensor] | None
+    next_observation_feature: dict[str, torch.Tensor] | None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -77,6 +82,34 @@ def random_shift(images: torch.Tensor, pad: int = 4):
     return random_crop_vectorized(images=images, output_size=(h, w))
 
 
+def augment_batch_images(
+    batch_state: dict[str, torch.Tensor],
+    batch_next_state: dict[str, torch.Tensor],
+    image_keys: Sequence[str],
+    augmentation_function: Callable,
+    batch_size: int,
+) -> None:
+    """Apply `augmentation_function` in place to the images of a sampled state and next_state batch."""
+    # Concatenate all images from state and next_state
+    all_images = []
+    for key in image_keys:
+        all_images.append(batch_state[key])
+        all_images.append(batch_next_state[key])
+
+    # Optimization: Batch all images and apply augmentation once
+    all_images_tensor = torch.cat(all_images, dim=0)
+    augmented_images = augmentation_function(all_images_tensor)
+
+    # Split the augmented images back to their sources
+    for i, key in enumerate(image_keys):
+        # Calculate offsets for the current image key:
+        # For each key, we have 2*batch_size images (batch_size for states, batch_size for next_states)
+        # States start at index i*2*batch_size and take up batch_size slots
+        batch_state[key] = augmented_images[i * 2 * batch_size : (i * 2 + 1) * batch_size]
+        # Next states start after the states at index (i*2+1)*batch_size and also take up batch_size slots
+        batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
+
+
 class ReplayBuffer:
     def __init__(
         self,
@@ -123,12 +156,21 @@ class ReplayBuffer:
         self.state_keys = state_keys if state_keys is not None else []
 
         self.image_augmentation_function = image_augmentation_function
+        # Picklable (not compiled) version of the augmentation, used by the sampling worker process
+        self.base_image_augmentation_function = image_augmentation_function
 
         if image_augmentation_function is None:
             base_function = functools.partial(random_shift, pad=4)
+            self.base_image_augmentation_function = base_function
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
 
+        # Optional per-slot cache of the frozen vision encoder features, see `enable_feature_cache`
+        self.feature_extractor: Callable | None = None
+        self.feature_cache_dtype = torch.float16
+        self.observation_features: dict[str, torch.Tensor] = {}
+        self.next_observation_features: dict[str, torch.Tensor] = {}
+
     def _initialize_storage(
         self,
         state: dict[str, torch.Tensor],
@@ -187,6 +229,81 @@ class ReplayBuffer:
     def __len__(self):
         return self.size
 
+    @property
+    def has_feature_cache(self) -> bool:
+        return self.feature_extractor is not None
+
+    def enable_feature_cache(
+        self,
+        feature_extractor: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]],
+        dtype: torch.dtype = torch.float16,
+        chunk_size: int = 256,
+    ) -> None:
+        """
+        Cache the vision encoder features of every stored observation, computed once at insertion time.
+
+        `sample` then returns the cached features under `observation_feature` and
+        `next_observation_feature`, so the learner can skip the convolutional backbone. The cache is only
+        valid for a frozen encoder, call `disable_feature_cache` if the encoder becomes trainable.
+        NOTE: The DrQ augmentation is not applied when the cache is enabled, the cached features are
+        those of the stored images. The cache must be enabled before creating a multiprocess iterator.
+
+        Args:
+            feature_extractor (Callable): Maps a batch of observations (the `state` dict of the stored
+                transitions) to a dict of image features per image key.
+            dtype (torch.dtype): Storage dtype of the cached features.
+            chunk_size (int): Number of already stored transitions encoded at once when filling the cache.
+        """
+        self.feature_extractor = feature_extractor
+        self.feature_cache_dtype = dtype
+        self.observation_features = {}
+        self.next_observation_features = {}
+
+        # Transitions are written from slot 0 onwards, so the first `size` slots hold the buffer content
+        for start in range(0, self.size, chunk_size):
+            end = min(start + chunk_size, self.size)
+            self._cache_features(torch.arange(start, end, device=self.storage_device))
+
+    def disable_feature_cache(self) -> None:
+        """Drop the cached features, `sample` goes back to returning only the raw observations."""
+        self.feature_extractor = None
+        self.observation_features = {}
+        self.next_observation_features = {}
+
+    def _cache_features(self, idx: torch.Tensor) -> None:
+        """Encode the stored observations at the slots `idx` and write their features to the cache."""
+        with torch.no_grad():
+            features = self.feature_extractor({key: val[idx] for key, val in self.states.items()})
+            next_features = None
+            if not self.optimize_memory:
+                next_features = self.feature_extractor(
+                    {key: val[idx] for key, val in self.next_states.items()}
+                )
+
+        if not self.observation_features:
+            self.observation_features = {
+                key: torch.empty(
+                    (self.capacity, *val.shape[1:]),
+                    dtype=self.feature_cache_dtype,
+                    device=self.storage_device,
+                )
+                for key, val in features.items()
+            }
+            # With optimize_memory the next features are read from the next slot, like the next states
+            self.next_observation_features = self.observation_features
+            if not self.optimize_memory:
+                self.next_observation_features = {
+                    key: torch.empty_like(val) for key, val in self.observation_features.items()
+                }
+
+        for key, val in features.items():
+            self.observation_features[key][idx] = val.to(self.storage_device, dtype=self.feature_cache_dtype)
+        if next_features is not None:
+            for key, val in next_features.items():
+                self.next_observation_features[key][idx] = val.to(
+                    self.storage_device, dtype=self.feature_cache_dtype
+                )
+
     def add(
         self,
         state: dict[str, torch.Tensor],
@@ -226,11 +343,85 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        if self.has_feature_cache:
+            self._cache_features(torch.tensor([self.position], device=self.storage_device))
+
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
-    def sample(self, batch_size: int) -> BatchTransition:
-        """Sample a random batch of transitions and collate them into batched tensors."""
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """Saves a columnar batch of transitions (leading dimension N on every tensor) in one bulk insert.
+
+        Equivalent to calling `add` N times in order, but writes each storage tensor with a single
+        indexed copy instead of one copy per transition.
+        """
+        num_transitions = action.shape[0]
+        if num_transitions == 0:
+            return
+
+        # Only the last `capacity` transitions would survive the ring buffer wrap-around anyway
+        if num_transitions > self.capacity:
+            state = {key: val[-self.capacity :] for key, val in state.items()}
+            next_state = {key: val[-self.capacity :] for key, val in next_state.items()}
+            action, reward = action[-self.capacity :], reward[-self.capacity :]
+            done, truncated = done[-self.capacity :], truncated[-self.capacity :]
+            if complementary_info is not None:
+                complementary_info = {key: val[-self.capacity :] for key, val in complementary_info.items()}
+            self.position = (self.position + num_transitions - self.capacity) % self.capacity
+            self.size = min(self.size + num_transitions - self.capacity, self.capacity)
+            num_transitions = self.capacity
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: val[:1] for key, val in state.items()},
+                action=action[:1],
+                complementary_info=(
+                    {key: val[:1] for key, val in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        idx = (torch.arange(num_transitions, device=self.storage_device) + self.position) % self.capacity
+
+        for key in self.states:
+            self.states[key][idx] = state[key].to(self.storage_device, dtype=self.states[key].dtype)
+
+            if not self.optimize_memory:
+                self.next_states[key][idx] = next_state[key].to(
+                    self.storage_device, dtype=self.next_states[key].dtype
+                )
+
+        self.actions[idx] = action.to(self.storage_device, dtype=self.actions.dtype)
+        self.rewards[idx] = reward.to(self.storage_device, dtype=self.rewards.dtype)
+        self.dones[idx] = done.to(self.storage_device, dtype=torch.bool)
+        self.truncateds[idx] = truncated.to(self.storage_device, dtype=torch.bool)
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    value = complementary_info[key].to(self.storage_device)
+                    self.complementary_info[key][idx] = value.reshape(
+                        self.complementary_info[key][idx].shape
+                    ).to(self.complementary_info[key].dtype)
+
+        if self.has_feature_cache:
+            self._cache_features(idx)
+
+        self.position = (self.position + num_transitions) % self.capacity
+        self.size = min(self.size + num_transitions, self.capacity)
+
+    def _sample_indices(self, batch_size: int) -> torch.Tensor:
+        """Draw the random storage indices of a batch, on the storage device."""
         if not self.initialized:
             raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
 
@@ -238,10 +429,16 @@ class ReplayBuffer:
         high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
 
         # Random indices for sampling - create on the same device as storage
-        idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        return torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
 
-        # Identify image keys that need augmentation
-        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
+    def sample(self, batch_size: int) -> BatchTransition:
+        """Sample a random batch of transitions and collate them into batched tensors."""
+        idx = self._sample_indices(batch_size)
+        batch_size = idx.shape[0]
+
+        # Identify image keys that need augmentation, cached features are never augmented
+        use_drq = self.use_drq and not self.has_feature_cache
+        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if use_drq else []
 
         # Create batched state and next_state
         batch_state = {}
@@ -260,25 +457,14 @@ class ReplayBuffer:
                 batch_next_state[key] = self.states[key][next_idx].to(self.device)
 
         # Apply image augmentation in a batched way if needed
-        if self.use_drq and image_keys:
-            # Concatenate all images from state and next_state
-            all_images = []
-            for key in image_keys:
-                all_images.append(batch_state[key])
-                all_images.append(batch_next_state[key])
-
-            # Optimization: Batch all images and apply augmentation once
-            all_images_tensor = torch.cat(all_images, dim=0)
-            augmented_images = self.image_augmentation_function(all_images_tensor)
-
-            # Split the augmented images back to their sources
-            for i, key in enumerate(image_keys):
-                # Calculate offsets for the current image key:
-                # For each key, we have 2*batch_size images (batch_size for states, batch_size for next_states)
-                # States start at index i*2*batch_size and take up batch_size slots
-                batch_state[key] = augmented_images[i * 2 * batch_size : (i * 2 + 1) * batch_size]
-                # Next states start after the states at index (i*2+1)*batch_size and also take up batch_size slots
-                batch_next_state[key] = augmented_images[(i * 2 + 1) * batch_size : (i + 1) * 2 * batch_size]
+        if image_keys:
+            augment_batch_images(
+                batch_state=batch_state,
+                batch_next_state=batch_next_state,
+                image_keys=image_keys,
+                augmentation_function=self.image_augmentation_function,
+                batch_size=batch_size,
+            )
 
         # Sample other tensors
         batch_actions = self.actions[idx].to(self.device)
@@ -293,7 +479,7 @@ class ReplayBuffer:
             for key in self.complementary_info_keys:
                 batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
             action=batch_actions,
             reward=batch_rewards,
@@ -303,11 +489,26 @@ class ReplayBuffer:
             complementary_info=batch_complementary_info,
         )
 
+        # Return the cached encoder features in full precision
+        if self.has_feature_cache:
+            next_idx = (idx + 1) % self.capacity if self.optimize_memory else idx
+            batch["observation_feature"] = {
+                key: val[idx].to(self.device, dtype=torch.float32)
+                for key, val in self.observation_features.items()
+            }
+            batch["next_observation_feature"] = {
+                key: val[next_idx].to(self.device, dtype=torch.float32)
+                for key, val in self.next_observation_features.items()
+            }
+
+        return batch
+
     def get_iterator(
         self,
         batch_size: int,
         async_prefetch: bool = True,
         queue_size: int = 2,
+        multiprocess_prefetch: bool = False,
     ):
         """
         Creates an infinite iterator that yields batches of transitions.
@@ -317,10 +518,26 @@ class ReplayBuffer:
             batch_size (int): Size of batches to sample
             async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
             queue_size (int): Number of batches to prefetch (default: 2)
+            multiprocess_prefetch (bool): Whether to prepare the batches in a worker process from
+                shared-memory storage, see `ReplayBufferProcessSampler`. Takes precedence over
+                `async_prefetch` and requires a CPU storage device.
 
         Yields:
             BatchTransition: Batched transitions
         """
+        if multiprocess_prefetch:
+            if torch.device(self.storage_device).type == "cpu":
+                sampler = ReplayBufferProcessSampler(self, batch_size=batch_size, num_slots=queue_size)
+                try:
+                    yield from sampler
+                finally:
+                    sampler.close()
+                return
+            logging.warning(
+                "Multiprocess prefetching requires a CPU storage device, falling back to thread prefetching."
+            )
+            async_prefetch = True
+
         while True:  # Create an infinite loop
             if async_prefetch:
                 # Get the standard iterator
@@ -735,6 +952,296 @@ class ReplayBuffer:
         return transitions
 
 
+def _sampler_worker(
+    storage: dict,
+    slots: list[dict],
+    request_queue,
+    ready_queue,
+    augmentation_function: Callable | None,
+    image_keys: list[str],
+    optimize_memory: bool,
+    capacity: int,
+    shutdown_event,
+) -> None:
+    """Worker process loop of `ReplayBufferProcessSampler`.
+
+    Receives `(slot_id, indices)` requests, gathers the transitions from the shared storage into the
+    shared slot tensors, applies the DrQ augmentation and reports the slot as ready.
+    """
+    # Gathering is memory bound, keep the worker from competing with the training intra-op threads
+    torch.set_num_threads(1)
+    while not shutdown_event.is_set():
+        try:
+            slot_id, idx = request_queue.get(timeout=0.1)
+        except Empty:
+            continue
+
+        slot = slots[slot_id]
+        batch_size = idx.shape[0]
+        next_idx = (idx + 1) % capacity if optimize_memory else idx
+        next_states = storage["states"] if optimize_memory else storage["next_states"]
+
+        batch_state = {}
+        batch_next_state = {}
+        for key in storage["states"]:
+            batch_state[key] = torch.index_select(
+                storage["states"][key], 0, idx, out=slot["state"][key][:batch_size]
+            )
+            batch_next_state[key] = torch.index_select(
+                next_states[key], 0, next_idx, out=slot["next_state"][key][:batch_size]
+            )
+
+        if augmentation_function is not None and image_keys:
+            augment_batch_images(
+                batch_state=batch_state,
+                batch_next_state=batch_next_state,
+                image_keys=image_keys,
+                augmentation_function=augmentation_function,
+                batch_size=batch_size,
+            )
+            for key in image_keys:
+                slot["state"][key][:batch_size].copy_(batch_state[key])
+                slot["next_state"][key][:batch_size].copy_(batch_next_state[key])
+
+        for key in ("actions", "rewards", "dones", "truncateds"):
+            torch.index_select(storage[key], 0, idx, out=slot[key][:batch_size])
+        for key, value in storage["complementary_info"].items():
+            torch.index_select(value, 0, idx, out=slot["complementary_info"][key][:batch_size])
+
+        next_features = (
+            storage["observation_features"] if optimize_memory else storage["next_observation_features"]
+        )
+        for key, value in storage["observation_features"].items():
+            torch.index_select(value, 0, idx, out=slot["observation_feature"][key][:batch_size])
+            torch.index_select(
+                next_features[key], 0, next_idx, out=slot["next_observation_feature"][key][:batch_size]
+            )
+
+        ready_queue.put((slot_id, batch_size))
+
+
+class ReplayBufferProcessSampler:
+    """
+    Prepares replay buffer batches in a worker process and stages them for the training device.
+
+    The buffer storage is moved to shared memory, so the worker process reads the transitions added by
+    the training process without copies. The training process only draws the random indices; the
+    worker gathers the transitions and applies the DrQ augmentation into a ring of shared-memory slots,
+    outside of the training process GIL. When the target device is CUDA, ready slots are copied into
+    pinned host buffers and transferred with non-blocking copies on a dedicated CUDA stream, so the
+    transfer of the next batch overlaps with the computation on the current one. On CPU-only hosts the
+    batches are simply copied out of the slots.
+
+    NOTE: Like the threaded iterator, the worker may read slots that are concurrently overwritten by
+    `add`, which is fine for sampling purposes.
+    """
+
+    def __init__(self, replay_buffer: ReplayBuffer, batch_size: int, num_slots: int = 2):
+        import torch.multiprocessing as mp
+
+        if not replay_buffer.initialized:
+            raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+        if torch.device(replay_buffer.storage_device).type != "cpu":
+            raise ValueError("ReplayBufferProcessSampler requires a CPU storage device.")
+
+        self.replay_buffer = replay_buffer
+        self.batch_size = batch_size
+        self.num_slots = max(num_slots, 2)
+        self.device = torch.device(replay_buffer.device)
+        self.use_cuda = self.device.type == "cuda" and torch.cuda.is_available()
+
+        rb = replay_buffer
+        storage = {
+            "states": rb.states,
+            "next_states": None if rb.optimize_memory else rb.next_states,
+            "actions": rb.actions,
+            "rewards": rb.rewards,
+            "dones": rb.dones,
+            "truncateds": rb.truncateds,
+            "complementary_info": rb.complementary_info if rb.has_complementary_info else {},
+            "observation_features": rb.observation_features,
+            "next_observation_features": None if rb.optimize_memory else rb.next_observation_features,
+        }
+        # In place: the tensors used by `add` are now backed by shared memory
+        self._share(storage)
+        self.slots = [self._allocate_like(storage, pin_memory=False) for _ in range(self.num_slots)]
+        self._share(self.slots)
+
+        # Double buffered pinned staging, each buffer guarded by the event of its last H2D copy
+        self.pinned = []
+        self.pinned_events = []
+        self.copy_stream = None
+        if self.use_cuda:
+            self.pinned = [self._allocate_like(storage, pin_memory=True) for _ in range(2)]
+            self.pinned_events = [None, None]
+            self.copy_stream = torch.cuda.Stream(device=self.device)
+        self._next_pinned = 0
+
+        use_drq = rb.use_drq and not rb.has_feature_cache
+        image_keys = [k for k in rb.states if k.startswith(OBS_IMAGE)] if use_drq else []
+        ctx = mp.get_context("spawn")
+        self.request_queue = ctx.Queue()
+        self.ready_queue = ctx.Queue()
+        self.shutdown_event = ctx.Event()
+        self.worker = ctx.Process(
+            target=_sampler_worker,
+            args=(
+                storage,
+                self.slots,
+                self.request_queue,
+                self.ready_queue,
+                rb.base_image_augmentation_function if use_drq else None,
+                image_keys,
+                rb.optimize_memory,
+                rb.capacity,
+                self.shutdown_event,
+            ),
+            daemon=True,
+        )
+        self.worker.start()
+        self._closed = False
+
+    def _allocate_like(self, storage: dict, pin_memory: bool) -> dict:
+        def empty_like(tensor: torch.Tensor) -> torch.Tensor:
+            return torch.empty(
+                (self.batch_size, *tensor.shape[1:]), dtype=tensor.dtype, pin_memory=pin_memory
+            )
+
+        return {
+            "state": {key: empty_like(val) for key, val in storage["states"].items()},
+            "next_state": {key: empty_like(val) for key, val in storage["states"].items()},
+            "actions": empty_like(storage["actions"]),
+            "rewards": empty_like(storage["rewards"]),
+            "dones": empty_like(storage["dones"]),
+            "truncateds": empty_like(storage["truncateds"]),
+            "complementary_info": {
+                key: empty_like(val) for key, val in storage["complementary_info"].items()
+            },
+            "observation_feature": {
+                key: empty_like(val) for key, val in storage["observation_features"].items()
+            },
+            "next_observation_feature": {
+                key: empty_like(val) for key, val in storage["observation_features"].items()
+            },
+        }
+
+    @staticmethod
+    def _share(tree) -> None:
+        if isinstance(tree, torch.Tensor):
+            tree.share_memory_()
+        elif isinstance(tree, dict):
+            for value in tree.values():
+                ReplayBufferProcessSampler._share(value)
+        elif isinstance(tree, list):
+            for value in tree:
+                ReplayBufferProcessSampler._share(value)
+
+    def _request(self, slot_id: int) -> None:
+        self.request_queue.put((slot_id, self.replay_buffer._sample_indices(self.batch_size)))
+
+    def _wait_ready(self) -> tuple[int, int]:
+        while True:
+            try:
+                return self.ready_queue.get(timeout=1.0)
+            except Empty:
+                if not self.worker.is_alive():
+                    raise RuntimeError("The replay buffer sampling worker died.") from None
+
+    @staticmethod
+    def _copy_tree(src: dict, dst: dict, batch_size: int) -> None:
+        for key, value in src.items():
+            if isinstance(value, dict):
+                ReplayBufferProcessSampler._copy_tree(value, dst[key], batch_size)
+            else:
+                dst[key][:batch_size].copy_(value[:batch_size])
+
+    def _to_batch_transition(self, tree: dict, batch_size: int, non_blocking: bool) -> BatchTransition:
+        def move(tensor: torch.Tensor) -> torch.Tensor:
+            return tensor[:batch_size].to(self.device, non_blocking=non_blocking, copy=True)
+
+        batch = BatchTransition(
+            state={key: move(val) for key, val in tree["state"].items()},
+            action=move(tree["actions"]),
+            reward=move(tree["rewards"]),
+            next_state={key: move(val) for key, val in tree["next_state"].items()},
+            done=move(tree["dones"]).float(),
+            truncated=move(tree["truncateds"]).float(),
+            complementary_info=(
+                {key: move(val) for key, val in tree["complementary_info"].items()}
+                if self.replay_buffer.has_complementary_info
+                else None
+            ),
+        )
+        if tree["observation_feature"]:
+            batch["observation_feature"] = {
+                key: move(val).float() for key, val in tree["observation_feature"].items()
+            }
+            batch["next_observation_feature"] = {
+                key: move(val).float() for key, val in tree["next_observation_feature"].items()
+            }
+        return batch
+
+    def _stage(self) -> tuple[BatchTransition, torch.cuda.Event | None]:
+        """Take the next ready slot, start its transfer to the device and request a new batch for it."""
+        slot_id, batch_size = self._wait_ready()
+
+        if not self.use_cuda:
+            batch = self._to_batch_transition(self.slots[slot_id], batch_size, non_blocking=False)
+            self._request(slot_id)
+            return batch, None
+
+        pinned_id = self._next_pinned
+        self._next_pinned = (self._next_pinned + 1) % len(self.pinned)
+        # The previous H2D copy out of this pinned buffer must be finished before overwriting it
+        if self.pinned_events[pinned_id] is not None:
+            self.pinned_events[pinned_id].synchronize()
+
+        self._copy_tree(self.slots[slot_id], self.pinned[pinned_id], batch_size)
+        # The slot content now lives in the pinned buffer, the worker can refill it
+        self._request(slot_id)
+
+        with torch.cuda.stream(self.copy_stream):
+            batch = self._to_batch_transition(self.pinned[pinned_id], batch_size, non_blocking=True)
+            event = torch.cuda.Event()
+            event.record(self.copy_stream)
+        self.pinned_events[pinned_id] = event
+        return batch, event
+
+    def __iter__(self):
+        for slot_id in range(self.num_slots):
+            self._request(slot_id)
+
+        pending = self._stage()
+        while not self._closed:
+            batch, event = pending
+            if event is not None:
+                # Make the compute stream wait for the transfer, then start the next transfer
+                torch.cuda.current_stream(self.device).wait_event(event)
+                for tensor in _iter_tensors(batch):
+                    tensor.record_stream(torch.cuda.current_stream(self.device))
+            pending = self._stage()
+            yield batch
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.shutdown_event.set()
+        # The worker leaves its loop within 0.1s, but the shutdown of its interpreter takes about a second
+        self.worker.join(timeout=10.0)
+        if self.worker.is_alive():
+            self.worker.terminate()
+            self.worker.join()
+
+
+def _iter_tensors(tree):
+    if isinstance(tree, torch.Tensor):
+        yield tree
+    elif isinstance(tree, dict):
+        for value in tree.values():
+            yield from _iter_tensors(value)
+
+
 # Utility function to guess shapes/dtypes from a tensor
 def guess_feature_info(t, name: str):
     """
@@ -831,4 +1338,15 @@ def concatenate_batch_transitions(
                 else:
                     left_info[key] = right_info[key]
 
+    # Cached encoder features are only kept when both batches carry them
+    for feature_key in ("observation_feature", "next_observation_feature"):
+        left_features = left_batch_transitions.get(feature_key)
+        right_features = right_batch_transition.get(feature_key)
+        if left_features is None or right_features is None:
+            left_batch_transitions.pop(feature_key, None)
+            continue
+        left_batch_transitions[feature_key] = {
+            key: torch.cat([left_features[key], right_features[key]], dim=0) for key in left_features
+        }
+
     return left_batch_transitions
@@ -16,6 +16,7 @@
 
 import logging
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any
 
@@ -105,17 +106,20 @@ class GymManipulatorConfig:
 
 def reset_follower_position(robot_arm: Robot, target_position: np.ndarray) -> None:
     """Reset robot arm to target position using smooth trajectory."""
-    current_position_dict = robot_arm.bus.sync_read("Present_Position")
-    current_position = np.array(
-        [current_position_dict[name] for name in current_position_dict], dtype=np.float32
-    )
-    trajectory = torch.from_numpy(
-        np.linspace(current_position, target_position, 50)
-    )  # NOTE: 30 is just an arbitrary number
-    for pose in trajectory:
-        action_dict = dict(zip(current_position_dict, pose, strict=False))
-        robot_arm.bus.sync_write("Goal_Position", action_dict)
-        precise_sleep(0.015)
+    # The background state poller of the arm, if any, is paused while the bus is used directly
+    state_poller = getattr(robot_arm, "state_poller", None)
+    with state_poller.exclusive() if state_poller is not None else nullcontext():
+        current_position_dict = robot_arm.bus.sync_read("Present_Position")
+        current_position = np.array(
+            [current_position_dict[name] for name in current_position_dict], dtype=np.float32
+        )
+        trajectory = torch.from_numpy(
+            np.linspace(current_position, target_position, 50)
+        )  # NOTE: 30 is just an arbitrary number
+        for pose in trajectory:
+            action_dict = dict(zip(current_position_dict, pose, strict=False))
+            robot_arm.bus.sync_write("Goal_Position", action_dict)
+            precise_sleep(0.015)
 
 
 class RobotEnv(gym.Env):
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any
 
@@ -163,7 +164,10 @@ class MotorCurrentProcessorStep(ObservationProcessorStep):
         if self.robot is None:
             raise ValueError("Robot is not set")
 
-        present_current_dict = self.robot.bus.sync_read("Present_Current")  # type: ignore[attr-defined]
+        # The background state poller of the robot, if any, is paused while the bus is used directly
+        state_poller = getattr(self.robot, "state_poller", None)
+        with state_poller.exclusive() if state_poller is not None else nullcontext():
+            present_current_dict = self.robot.bus.sync_read("Present_Current")  # type: ignore[attr-defined]
         motor_currents = torch.tensor(
             [present_current_dict[name] for name in self.robot.bus.motors],  # type: ignore[attr-defined]
             dtype=torch.float32,
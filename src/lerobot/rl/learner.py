@@ -48,6 +48,7 @@ import logging
 import os
 import shutil
 import time
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pprint import pformat
@@ -66,7 +67,7 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import BatchTransition, ReplayBuffer, concatenate_batch_transitions
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so_follower  # noqa: F401
@@ -76,7 +77,9 @@ from lerobot.transport import services_pb2_grpc
 from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
+    bytes_to_transition_batch,
     bytes_to_transitions,
+    is_columnar_transitions_buffer,
     state_to_bytes,
 )
 from lerobot.utils.constants import (
@@ -100,7 +103,13 @@ from lerobot.utils.utils import (
     init_logging,
 )
 
-from .learner_service import MAX_WORKERS, SHUTDOWN_TIMEOUT, LearnerService
+from .learner_service import (
+    MAX_WORKERS,
+    SHUTDOWN_TIMEOUT,
+    ActorIngestionTracker,
+    InteractionStepCounter,
+    LearnerService,
+)
 
 
 @parser.wrap()
@@ -287,6 +296,7 @@ def add_actor_information_and_train(
     clip_grad_norm_value = cfg.policy.grad_clip_norm
     online_step_before_learning = cfg.policy.online_step_before_learning
     utd_ratio = cfg.policy.utd_ratio
+    batched_utd = cfg.policy.batched_utd and utd_ratio > 1
     fps = cfg.env.fps
     log_freq = cfg.log_freq
     save_freq = cfg.save_freq
@@ -295,6 +305,7 @@ def add_actor_information_and_train(
     saving_checkpoint = cfg.save_checkpoint
     online_steps = cfg.policy.online_steps
     async_prefetch = cfg.policy.async_prefetch
+    multiprocess_prefetch = cfg.policy.multiprocess_prefetch
 
     # Initialize logging for multiprocessing
     if not use_threads(cfg):
@@ -315,14 +326,18 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    # Incremented on every push, actors report the version they collected their transitions with
+    policy_version = 0
+    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy, version=policy_version)
 
     last_time_policy_pushed = time.time()
 
     optimizers, lr_scheduler = make_optimizers_and_scheduler(cfg=cfg, policy=policy)
 
     # If we are resuming, we need to load the training state
-    resume_optimization_step, resume_interaction_step = load_training_state(cfg=cfg, optimizers=optimizers)
+    resume_optimization_step, resume_interaction_step, resume_actor_interaction_steps = load_training_state(
+        cfg=cfg, optimizers=optimizers
+    )
 
     log_training_info(cfg=cfg, policy=policy)
 
@@ -338,10 +353,30 @@ def add_actor_information_and_train(
         )
         batch_size: int = batch_size // 2  # We will sample from both replay buffer
 
+    if cfg.policy.cache_observation_features:
+        feature_extractor = make_observation_feature_extractor(policy=policy, device=device)
+        if feature_extractor is None:
+            logging.warning("The vision encoder is trainable, observation features will not be cached.")
+        else:
+            logging.info("Caching the vision encoder features in the replay buffers")
+            buffers = [buffer for buffer in (replay_buffer, offline_replay_buffer) if buffer is not None]
+            if any(buffer.use_drq for buffer in buffers):
+                logging.warning(
+                    "The DrQ image augmentation is not applied with cached vision encoder features: the "
+                    "critic and actor are trained on the features of the stored, unaugmented, images."
+                )
+            for buffer in buffers:
+                buffer.enable_feature_cache(feature_extractor)
+
+    # With batched UTD the batches of all the critic updates of an optimization step are sampled at once
+    sample_batch_size = batch_size * utd_ratio if batched_utd else batch_size
+
     logging.info("Starting learner thread")
-    interaction_message = None
     optimization_step = resume_optimization_step if resume_optimization_step is not None else 0
-    interaction_step_shift = resume_interaction_step if resume_interaction_step is not None else 0
+    # Every actor counts its interaction steps, the metrics are logged against their total
+    interaction_step_counter = InteractionStepCounter(
+        total=resume_interaction_step or 0, per_actor=resume_actor_interaction_steps
+    )
 
     dataset_repo_id = None
     if cfg.dataset is not None:
@@ -351,6 +386,8 @@ def add_actor_information_and_train(
     online_iterator = None
     offline_iterator = None
 
+    ingestion_tracker = ActorIngestionTracker()
+
     # NOTE: THIS IS THE MAIN LOOP OF THE LEARNER
     while True:
         # Exit the training loop if shutdown is requested
@@ -366,14 +403,16 @@ def add_actor_information_and_train(
             device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
+            ingestion_tracker=ingestion_tracker,
         )
 
         # Process all available interaction messages sent by the actor server
-        interaction_message = process_interaction_messages(
+        process_interaction_messages(
             interaction_message_queue=interaction_message_queue,
-            interaction_step_shift=interaction_step_shift,
+            interaction_step_counter=interaction_step_counter,
             wandb_logger=wandb_logger,
             shutdown_event=shutdown_event,
+            ingestion_tracker=ingestion_tracker,
         )
 
         # Wait until the replay buffer has enough samples to start training
@@ -382,24 +421,31 @@ def add_actor_information_and_train(
 
         if online_iterator is None:
             online_iterator = replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=sample_batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                multiprocess_prefetch=multiprocess_prefetch,
             )
 
         if offline_replay_buffer is not None and offline_iterator is None:
             offline_iterator = offline_replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=sample_batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                multiprocess_prefetch=multiprocess_prefetch,
             )
 
         time_for_one_optimization_step = time.time()
+        utd_batches = sample_utd_batches(
+            policy=policy,
+            online_iterator=online_iterator,
+            offline_iterator=offline_iterator,
+            utd_ratio=utd_ratio,
+            batched=batched_utd,
+        )
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
-            batch = next(online_iterator)
-
-            if dataset_repo_id is not None:
-                batch_offline = next(offline_iterator)
-                batch = concatenate_batch_transitions(
-                    left_batch_transitions=batch, right_batch_transition=batch_offline
-                )
+            batch = next(utd_batches)
 
             actions = batch[ACTION]
             rewards = batch["reward"]
@@ -409,7 +455,7 @@ def add_actor_information_and_train(
             check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
             observation_features, next_observation_features = get_observation_features(
-                policy=policy, observations=observations, next_observations=next_observations
+                policy=policy, observations=observations, next_observations=next_observations, batch=batch
             )
 
             # Create a batch dictionary with all required elements for the forward method
@@ -451,13 +497,7 @@ def add_actor_information_and_train(
             policy.update_target_networks()
 
         # Sample for the last update in the UTD ratio
-        batch = next(online_iterator)
-
-        if dataset_repo_id is not None:
-            batch_offline = next(offline_iterator)
-            batch = concatenate_batch_transitions(
-                left_batch_transitions=batch, right_batch_transition=batch_offline
-            )
+        batch = next(utd_batches)
 
         actions = batch[ACTION]
         rewards = batch["reward"]
@@ -468,7 +508,7 @@ def add_actor_information_and_train(
         check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
         observation_features, next_observation_features = get_observation_features(
-            policy=policy, observations=observations, next_observations=next_observations
+            policy=policy, observations=observations, next_observations=next_observations, batch=batch
         )
 
         # Create a batch dictionary with all required elements for the forward method
@@ -480,6 +520,7 @@ def add_actor_information_and_train(
             "done": done,
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
+            "complementary_info": batch["complementary_info"],
         }
 
         critic_output = policy.forward(forward_batch, model="critic")
@@ -550,7 +591,10 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            policy_version += 1
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue, policy=policy, version=policy_version
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -562,6 +606,8 @@ def add_actor_information_and_train(
             if offline_replay_buffer is not None:
                 training_infos["offline_replay_buffer_size"] = len(offline_replay_buffer)
             training_infos["Optimization step"] = optimization_step
+            training_infos["Policy version"] = policy_version
+            training_infos.update(ingestion_tracker.report(current_policy_version=policy_version))
 
             # Log training metrics
             if wandb_logger:
@@ -594,7 +640,7 @@ def add_actor_information_and_train(
                 cfg=cfg,
                 optimization_step=optimization_step,
                 online_steps=online_steps,
-                interaction_message=interaction_message,
+                interaction_step_counter=interaction_step_counter,
                 policy=policy,
                 optimizers=optimizers,
                 replay_buffer=replay_buffer,
@@ -649,7 +695,7 @@ def start_learner(
     )
 
     server = grpc.server(
-        ThreadPoolExecutor(max_workers=MAX_WORKERS),
+        ThreadPoolExecutor(max_workers=MAX_WORKERS * cfg.policy.actor_learner_config.max_actors),
         options=[
             ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
             ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
@@ -678,7 +724,7 @@ def save_training_checkpoint(
     cfg: TrainRLServerPipelineConfig,
     optimization_step: int,
     online_steps: int,
-    interaction_message: dict | None,
+    interaction_step_counter: InteractionStepCounter,
     policy: nn.Module,
     optimizers: dict[str, Optimizer],
     replay_buffer: ReplayBuffer,
@@ -692,7 +738,7 @@ def save_training_checkpoint(
     This function performs the following steps:
     1. Creates a checkpoint directory with the current optimization step
     2. Saves the policy model, configuration, and optimizer states
-    3. Saves the current interaction step for resuming training
+    3. Saves the interaction steps of the actors and their total for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
     5. Saves the replay buffer as a dataset for later use
     6. If an offline replay buffer exists, saves it as a separate dataset
@@ -701,7 +747,7 @@ def save_training_checkpoint(
         cfg: Training configuration
         optimization_step: Current optimization step
         online_steps: Total number of online steps
-        interaction_message: Dictionary containing interaction information
+        interaction_step_counter: Interaction steps of the actors
         policy: Policy model to save
         optimizers: Dictionary of optimizers
         replay_buffer: Replay buffer to save as dataset
@@ -711,7 +757,6 @@ def save_training_checkpoint(
     """
     logging.info(f"Checkpoint policy after step {optimization_step}")
     _num_digits = max(6, len(str(online_steps)))
-    interaction_step = interaction_message["Interaction step"] if interaction_message is not None else 0
 
     # Create checkpoint directory
     checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, online_steps, optimization_step)
@@ -726,10 +771,10 @@ def save_training_checkpoint(
         scheduler=None,
     )
 
-    # Save interaction step manually
+    # Save interaction steps manually
     training_state_dir = os.path.join(checkpoint_dir, TRAINING_STATE_DIR)
     os.makedirs(training_state_dir, exist_ok=True)
-    training_state = {"step": optimization_step, "interaction_step": interaction_step}
+    training_state = {"step": optimization_step, **interaction_step_counter.state_dict()}
     torch.save(training_state, os.path.join(training_state_dir, "training_state.pt"))
 
     # Update the "last" symlink
@@ -885,10 +930,12 @@ def load_training_state(
         optimizers (Optimizer | dict): Optimizers to load state into
 
     Returns:
-        tuple: (optimization_step, interaction_step) or (None, None) if not resuming
+        tuple: (optimization_step, interaction_step, actor_interaction_steps) or (None, None, None) if not
+        resuming. The interaction step is the total over the actors, and `actor_interaction_steps` the
+        interaction step of every actor.
     """
     if not cfg.resume:
-        return None, None
+        return None, None, None
 
     # Construct path to the last checkpoint directory
     checkpoint_dir = os.path.join(cfg.output_dir, CHECKPOINTS_DIR, LAST_CHECKPOINT_LINK)
@@ -902,16 +949,18 @@ def load_training_state(
         # Load interaction step separately from training_state.pt
         training_state_path = os.path.join(checkpoint_dir, TRAINING_STATE_DIR, "training_state.pt")
         interaction_step = 0
+        actor_interaction_steps = {}
         if os.path.exists(training_state_path):
             training_state = torch.load(training_state_path, weights_only=False)  # nosec B614: Safe usage of torch.load
             interaction_step = training_state.get("interaction_step", 0)
+            actor_interaction_steps = training_state.get("actor_interaction_steps", {})
 
         logging.info(f"Resuming from step {step}, interaction step {interaction_step}")
-        return step, interaction_step
+        return step, interaction_step, actor_interaction_steps
 
     except Exception as e:
         logging.error(f"Failed to load training state: {e}")
-        return None, None
+        return None, None, None
 
 
 def log_training_info(cfg: TrainRLServerPipelineConfig, policy: nn.Module) -> None:
@@ -1018,7 +1067,10 @@ def initialize_offline_replay_buffer(
 
 
 def get_observation_features(
-    policy: SACPolicy, observations: torch.Tensor, next_observations: torch.Tensor
+    policy: SACPolicy,
+    observations: torch.Tensor,
+    next_observations: torch.Tensor,
+    batch: BatchTransition | None = None,
 ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
     """
     Get observation features from the policy encoder. It act as cache for the observation features.
@@ -1029,6 +1081,7 @@ def get_observation_features(
         policy: The policy model
         observations: The current observations
         next_observations: The next observations
+        batch: The sampled batch, its features are used as is when the replay buffer caches them
 
     Returns:
         tuple: observation_features, next_observation_features
@@ -1037,6 +1090,9 @@ def get_observation_features(
     if policy.config.vision_encoder_name is None or not policy.config.freeze_vision_encoder:
         return None, None
 
+    if batch is not None and batch.get("observation_feature") is not None:
+        return batch["observation_feature"], batch["next_observation_feature"]
+
     with torch.no_grad():
         observation_features = policy.actor.encoder.get_cached_image_features(observations)
         next_observation_features = policy.actor.encoder.get_cached_image_features(next_observations)
@@ -1044,6 +1100,118 @@ def get_observation_features(
     return observation_features, next_observation_features
 
 
+def make_observation_feature_extractor(
+    policy: SACPolicy, device: torch.device
+) -> Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None:
+    """
+    Build the function used by the replay buffers to cache the vision encoder features.
+
+    Args:
+        policy: The policy model
+        device: The device the policy runs on
+
+    Returns:
+        The feature extractor, or None when the vision encoder is trainable and its features can't be cached
+    """
+    if policy.config.vision_encoder_name is None or not policy.config.freeze_vision_encoder:
+        return None
+
+    encoder = policy.actor.encoder
+
+    def extract(observations: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        images = {key: observations[key].to(device) for key in encoder.image_keys}
+        return encoder.get_cached_image_features(images)
+
+    return extract
+
+
+def split_minibatches(batch: dict, num_minibatches: int) -> list[dict]:
+    """
+    Split a batch of transitions into `num_minibatches` contiguous minibatches of the same size.
+
+    Row `j` of the batch goes to minibatch `j // (batch_size // num_minibatches)`.
+
+    Args:
+        batch: Batch of transitions, whose tensors (possibly nested in dicts) share their first dimension
+        num_minibatches: Number of minibatches, which must divide the batch size
+
+    Returns:
+        The minibatches, in order
+    """
+    batch_size = batch["reward"].shape[0]
+    if batch_size % num_minibatches != 0:
+        raise ValueError(
+            f"Cannot split a batch of {batch_size} transitions into {num_minibatches} minibatches."
+        )
+    minibatch_size = batch_size // num_minibatches
+
+    def select(value, i: int):
+        if isinstance(value, torch.Tensor) and value.ndim > 0 and value.shape[0] == batch_size:
+            return value[i * minibatch_size : (i + 1) * minibatch_size]
+        if isinstance(value, dict):
+            return {key: select(val, i) for key, val in value.items()}
+        return value
+
+    return [{key: select(value, i) for key, value in batch.items()} for i in range(num_minibatches)]
+
+
+def sample_utd_batches(
+    policy: SACPolicy,
+    online_iterator: Iterator[BatchTransition],
+    offline_iterator: Iterator[BatchTransition] | None,
+    utd_ratio: int,
+    batched: bool = False,
+) -> Iterator[BatchTransition]:
+    """
+    Yield the `utd_ratio` batches of the critic updates of an optimization step.
+
+    Every batch concatenates an online batch and, when there is an offline replay buffer, an offline batch.
+    When `batched`, the iterators yield `utd_ratio` batches stacked along the batch dimension: they are
+    sampled once, the frozen encoder features of all of them are computed in a single pass, and they are
+    split into contiguous minibatches (see `split_minibatches`), the i-th online and offline minibatches
+    making the i-th batch. Otherwise every batch is sampled right before it is used.
+
+    Args:
+        policy: The policy model, whose encoder computes the observation features when batched
+        online_iterator: Iterator over the batches of the online replay buffer
+        offline_iterator: Iterator over the batches of the offline replay buffer, if any
+        utd_ratio: Number of critic updates per optimization step
+        batched: Whether the iterators yield the batches of all the updates at once
+
+    Returns:
+        Iterator over the batches of the critic updates
+    """
+    if batched:
+        stacked_batches = [next(online_iterator)]
+        if offline_iterator is not None:
+            stacked_batches.append(next(offline_iterator))
+        minibatches = []
+        for stacked_batch in stacked_batches:
+            observation_features, next_observation_features = get_observation_features(
+                policy=policy,
+                observations=stacked_batch["state"],
+                next_observations=stacked_batch["next_state"],
+                batch=stacked_batch,
+            )
+            if observation_features is not None:
+                stacked_batch["observation_feature"] = observation_features
+                stacked_batch["next_observation_feature"] = next_observation_features
+            minibatches.append(split_minibatches(stacked_batch, utd_ratio))
+
+    for i in range(utd_ratio):
+        if batched:
+            batch = minibatches[0][i]
+            batch_offline = minibatches[1][i] if offline_iterator is not None else None
+        else:
+            batch = next(online_iterator)
+            batch_offline = next(offline_iterator) if offline_iterator is not None else None
+        if batch_offline is not None:
+            batch = concatenate_batch_transitions(
+                left_batch_transitions=batch, right_batch_transition=batch_offline
+            )
+        yield batch
+
+
 def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.learner == "threads"
 
@@ -1094,11 +1262,14 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
-    logging.debug("[LEARNER] Pushing actor policy to the queue")
+def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module, version: int = 0):
+    logging.debug(f"[LEARNER] Pushing actor policy version {version} to the queue")
 
     # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    state_dicts = {
+        "policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu"),
+        "version": version,
+    }
 
     # Add discrete critic if it exists
     if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
@@ -1112,16 +1283,34 @@ def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
 
 
 def process_interaction_message(
-    message, interaction_step_shift: int, wandb_logger: WandBLogger | None = None
+    message,
+    interaction_step_counter: InteractionStepCounter,
+    wandb_logger: WandBLogger | None = None,
+    actor_id: str = "",
 ):
-    """Process a single interaction message with consistent handling."""
+    """Process a single interaction message with consistent handling.
+
+    The metrics are logged as they are and under the prefix of the actor, against the total interaction
+    step over the actors, which only grows, unlike the interaction steps of the actors which interleave.
+    """
     message = bytes_to_python_object(message)
-    # Shift interaction step for consistency with checkpointed state
-    message["Interaction step"] += interaction_step_shift
+    interaction_step_counter.update(actor_id, message["Interaction step"])
+    metrics = {key: value for key, value in message.items() if key != "Interaction step"}
+    message["Actor id"] = actor_id
+    message["Interaction step"] = interaction_step_counter.total
 
     # Log if logger available
     if wandb_logger:
-        wandb_logger.log_dict(d=message, mode="train", custom_step_key="Interaction step")
+        wandb_logger.log_dict(
+            d={
+                **metrics,
+                **{f"Actor {actor_id} {key}": value for key, value in metrics.items()},
+                f"Actor {actor_id} interaction step": interaction_step_counter.actor_step(actor_id),
+                "Interaction step": message["Interaction step"],
+            },
+            mode="train",
+            custom_step_key="Interaction step",
+        )
 
     return message
 
@@ -1133,9 +1322,14 @@ def process_transitions(
     device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
+    ingestion_tracker: ActorIngestionTracker | None = None,
 ):
     """Process all available transitions from the queue.
 
+    Queue items are `(actor_id, bytes)` tuples put by the `LearnerService`. Columnar batches (see
+    `transition_batch_to_bytes`) are inserted in bulk, legacy buffers (a `torch.save` list of
+    transitions) are inserted one transition at a time.
+
     Args:
         transition_queue: Queue for receiving transitions from the actor
         replay_buffer: Replay buffer to add transitions to
@@ -1143,57 +1337,134 @@ def process_transitions(
         device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
+        ingestion_tracker: Optional tracker updated with the per-actor transitions, bytes and policy version
     """
     while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
+        actor_id, buffer = transition_queue.get()
+        policy_version = None
+
+        if is_columnar_transitions_buffer(buffer):
+            batch = bytes_to_transition_batch(buffer)
+            policy_version = batch["metadata"].get("policy_version")
+            num_transitions = process_transition_batch(
+                batch=batch,
+                replay_buffer=replay_buffer,
+                offline_replay_buffer=offline_replay_buffer,
+                device=device,
+                dataset_repo_id=dataset_repo_id,
+            )
+        else:
+            transition_list = bytes_to_transitions(buffer=buffer)
+            num_transitions = len(transition_list)
+
+            for transition in transition_list:
+                transition = move_transition_to_device(transition=transition, device=device)
+
+                # Skip transitions with NaN values
+                if check_nan_in_transition(
+                    observations=transition["state"],
+                    actions=transition[ACTION],
+                    next_state=transition["next_state"],
+                ):
+                    logging.warning("[LEARNER] NaN detected in transition, skipping")
+                    continue
+
+                replay_buffer.add(**transition)
+
+                # Add to offline buffer if it's an intervention
+                if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
+                    TeleopEvents.IS_INTERVENTION
+                ):
+                    offline_replay_buffer.add(**transition)
+
+        if ingestion_tracker is not None:
+            ingestion_tracker.update(
+                actor_id=actor_id,
+                num_transitions=num_transitions,
+                num_bytes=len(buffer),
+                policy_version=policy_version,
+            )
+
+
+def process_transition_batch(
+    batch: dict,
+    replay_buffer: ReplayBuffer,
+    offline_replay_buffer: ReplayBuffer | None,
+    device: str,
+    dataset_repo_id: str | None,
+) -> int:
+    """Bulk insert a decoded columnar transition batch, dropping the rows that contain NaN values.
 
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
+    Returns:
+        int: The number of transitions in the batch (including the dropped ones).
+    """
+    num_transitions = batch[ACTION].shape[0]
+    valid = torch.ones(num_transitions, dtype=torch.bool)
+    for tensor in [*batch["state"].values(), *batch["next_state"].values(), batch[ACTION]]:
+        if tensor.is_floating_point():
+            valid &= ~torch.isnan(tensor.reshape(num_transitions, -1)).any(dim=1)
+
+    if not valid.all():
+        logging.warning(f"[LEARNER] NaN detected in {int((~valid).sum())} transitions, skipping")
+
+    def select(mask: torch.Tensor) -> dict:
+        selected = {
+            "state": {key: val[mask].to(device) for key, val in batch["state"].items()},
+            "next_state": {key: val[mask].to(device) for key, val in batch["next_state"].items()},
+            "complementary_info": None,
+        }
+        for key in (ACTION, "reward", "done", "truncated"):
+            selected[key] = batch[key][mask].to(device)
+        if batch["complementary_info"] is not None:
+            selected["complementary_info"] = {
+                key: val[mask].to(device) for key, val in batch["complementary_info"].items()
+            }
+        return selected
 
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
-                continue
+    replay_buffer.add_batch(**select(valid))
 
-            replay_buffer.add(**transition)
+    # Add to offline buffer the transitions flagged as interventions
+    complementary_info = batch["complementary_info"] or {}
+    is_intervention = complementary_info.get(TeleopEvents.IS_INTERVENTION.value)
+    if dataset_repo_id is not None and is_intervention is not None:
+        intervention_mask = valid & is_intervention.reshape(num_transitions).bool()
+        if intervention_mask.any():
+            offline_replay_buffer.add_batch(**select(intervention_mask))
 
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+    return num_transitions
 
 
 def process_interaction_messages(
     interaction_message_queue: Queue,
-    interaction_step_shift: int,
+    interaction_step_counter: InteractionStepCounter,
     wandb_logger: WandBLogger | None,
     shutdown_event: any,
+    ingestion_tracker: ActorIngestionTracker | None = None,
 ) -> dict | None:
     """Process all available interaction messages from the queue.
 
     Args:
         interaction_message_queue: Queue for receiving interaction messages
-        interaction_step_shift: Amount to shift interaction step by
+        interaction_step_counter: Interaction steps of the actors, updated with every message
         wandb_logger: Logger for tracking progress
         shutdown_event: Event to signal shutdown
+        ingestion_tracker: Optional tracker updated with the policy version of the episode of every message,
+            the only source of it for actors sending legacy transition buffers
 
     Returns:
         dict | None: The last interaction message processed, or None if none were processed
     """
     last_message = None
     while not interaction_message_queue.empty() and not shutdown_event.is_set():
-        message = interaction_message_queue.get()
+        actor_id, message = interaction_message_queue.get()
         last_message = process_interaction_message(
             message=message,
-            interaction_step_shift=interaction_step_shift,
+            interaction_step_counter=interaction_step_counter,
             wandb_logger=wandb_logger,
+            actor_id=actor_id,
         )
+        if ingestion_tracker is not None and last_message.get("Policy version") is not None:
+            ingestion_tracker.update_policy_version(actor_id, last_message["Policy version"])
 
     return last_message
 
@@ -16,22 +16,33 @@
 # limitations under the License.
 
 import logging
+import threading
 import time
 from multiprocessing import Event, Queue
 
 from lerobot.rl.queue import get_last_item_from_queue
 from lerobot.transport import services_pb2, services_pb2_grpc
-from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
+from lerobot.transport.utils import (
+    ThroughputMeter,
+    get_actor_id,
+    receive_bytes_in_chunks,
+    send_bytes_in_chunks,
+)
 
-MAX_WORKERS = 3  # Stream parameters, send transitions and interactions
+MAX_WORKERS = 3  # Per actor: stream parameters, send transitions and interactions
 SHUTDOWN_TIMEOUT = 10
 
 
 class LearnerService(services_pb2_grpc.LearnerServiceServicer):
     """
     Implementation of the LearnerService gRPC service
-    This service is used to send parameters to the Actor and receive transitions and interactions from the Actor
+    This service is used to send parameters to the Actors and receive transitions and interactions from them
     check transport.proto for the gRPC service definition
+
+    Several actors can be connected at the same time. Each actor identifies itself through the
+    `actor-id` call metadata (see `actor_id_metadata`); the received transitions and interactions are
+    put on the queues as `(actor_id, bytes)` tuples, and every parameters update is broadcast to all
+    the `StreamParameters` streams.
     """
 
     def __init__(
@@ -50,68 +61,223 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
 
+        # Latest parameters read from the queue, shared by all the parameters streams.
+        # Only one stream at a time reads the queue, the others wait for the version to change.
+        self._queue_reader_lock = threading.Lock()
+        self._parameters_updated = threading.Condition()
+        self._latest_parameters: bytes | None = None
+        self._parameters_version = 0
+
+        self._actors_lock = threading.Lock()
+        self.connected_actors: dict[str, set[str]] = {}
+
+    def _register_stream(self, actor_id: str, stream: str) -> None:
+        with self._actors_lock:
+            streams = self.connected_actors.setdefault(actor_id, set())
+            if not streams:
+                logging.info(f"[LEARNER] Actor {actor_id} connected ({len(self.connected_actors)} actors)")
+            streams.add(stream)
+
+    def _unregister_stream(self, actor_id: str, stream: str) -> None:
+        with self._actors_lock:
+            streams = self.connected_actors.get(actor_id, set())
+            streams.discard(stream)
+            if not streams:
+                self.connected_actors.pop(actor_id, None)
+                logging.info(f"[LEARNER] Actor {actor_id} disconnected ({len(self.connected_actors)} actors)")
+
+    def _wait_for_parameters(self, last_sent_version: int) -> tuple[bytes | None, int]:
+        """Return the latest parameters and their version, waiting up to `queue_get_timeout` for new ones."""
+        if self._queue_reader_lock.acquire(blocking=False):
+            try:
+                buffer = get_last_item_from_queue(
+                    self.parameters_queue, block=True, timeout=self.queue_get_timeout
+                )
+                if buffer is not None:
+                    with self._parameters_updated:
+                        self._latest_parameters = buffer
+                        self._parameters_version += 1
+                        self._parameters_updated.notify_all()
+            finally:
+                self._queue_reader_lock.release()
+        else:
+            with self._parameters_updated:
+                self._parameters_updated.wait_for(
+                    lambda: self._parameters_version > last_sent_version, timeout=self.queue_get_timeout
+                )
+
+        with self._parameters_updated:
+            return self._latest_parameters, self._parameters_version
+
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to stream parameters from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to stream parameters from the Actor {actor_id}")
+        self._register_stream(actor_id, "parameters")
 
         last_push_time = 0
+        last_sent_version = 0
 
-        while not self.shutdown_event.is_set():
-            time_since_last_push = time.time() - last_push_time
-            if time_since_last_push < self.seconds_between_pushes:
-                self.shutdown_event.wait(self.seconds_between_pushes - time_since_last_push)
-                # Continue, because we could receive a shutdown event,
-                # and it's checked in the while loop
-                continue
-
-            logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
-                self.parameters_queue, block=True, timeout=self.queue_get_timeout
-            )
+        try:
+            while not self.shutdown_event.is_set():
+                time_since_last_push = time.time() - last_push_time
+                if time_since_last_push < self.seconds_between_pushes:
+                    self.shutdown_event.wait(self.seconds_between_pushes - time_since_last_push)
+                    # Continue, because we could receive a shutdown event,
+                    # and it's checked in the while loop
+                    continue
 
-            if buffer is None:
-                continue
+                buffer, version = self._wait_for_parameters(last_sent_version)
 
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+                if buffer is None or version == last_sent_version:
+                    continue
 
-            last_push_time = time.time()
-            logging.info("[LEARNER] Parameters sent")
+                logging.info(f"[LEARNER] Push parameters to the Actor {actor_id}")
+                yield from send_bytes_in_chunks(
+                    buffer,
+                    services_pb2.Parameters,
+                    log_prefix=f"[LEARNER] Sending parameters to {actor_id}",
+                    silent=True,
+                )
 
-        logging.info("[LEARNER] Stream parameters finished")
+                last_sent_version = version
+                last_push_time = time.time()
+                logging.info(f"[LEARNER] Parameters sent to the Actor {actor_id}")
+        finally:
+            self._unregister_stream(actor_id, "parameters")
+
+        logging.info(f"[LEARNER] Stream parameters to the Actor {actor_id} finished")
         return services_pb2.Empty()
 
-    def SendTransitions(self, request_iterator, _context):  # noqa: N802
+    def SendTransitions(self, request_iterator, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive transitions from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to receive transitions from the Actor {actor_id}")
+        self._register_stream(actor_id, "transitions")
 
-        receive_bytes_in_chunks(
-            request_iterator,
-            self.transition_queue,
-            self.shutdown_event,
-            log_prefix="[LEARNER] transitions",
-        )
+        try:
+            receive_bytes_in_chunks(
+                request_iterator,
+                self.transition_queue,
+                self.shutdown_event,
+                log_prefix=f"[LEARNER] transitions from {actor_id}",
+                queue_item_tag=actor_id,
+            )
+        finally:
+            self._unregister_stream(actor_id, "transitions")
 
-        logging.debug("[LEARNER] Finished receiving transitions")
+        logging.debug(f"[LEARNER] Finished receiving transitions from the Actor {actor_id}")
         return services_pb2.Empty()
 
-    def SendInteractions(self, request_iterator, _context):  # noqa: N802
+    def SendInteractions(self, request_iterator, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive interactions from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to receive interactions from the Actor {actor_id}")
+        self._register_stream(actor_id, "interactions")
 
-        receive_bytes_in_chunks(
-            request_iterator,
-            self.interaction_message_queue,
-            self.shutdown_event,
-            log_prefix="[LEARNER] interactions",
-        )
+        try:
+            receive_bytes_in_chunks(
+                request_iterator,
+                self.interaction_message_queue,
+                self.shutdown_event,
+                log_prefix=f"[LEARNER] interactions from {actor_id}",
+                queue_item_tag=actor_id,
+            )
+        finally:
+            self._unregister_stream(actor_id, "interactions")
 
-        logging.debug("[LEARNER] Finished receiving interactions")
+        logging.debug(f"[LEARNER] Finished receiving interactions from the Actor {actor_id}")
         return services_pb2.Empty()
 
     def Ready(self, request, context):  # noqa: N802
         return services_pb2.Empty()
+
+
+class ActorIngestionTracker:
+    """Tracks, per actor, the rate of ingested transitions and the policy version lag of their data.
+
+    The lag (staleness) of an actor is the number of policy versions pushed by the learner since the
+    version the actor used to collect its last batch of transitions. Columnar batches carry this version;
+    with the legacy `torch.save` encoding, it is taken from the interaction message the actor sends at the
+    end of every episode (see `update_policy_version`).
+    """
+
+    def __init__(self):
+        self.total = ThroughputMeter()
+        self.per_actor: dict[str, ThroughputMeter] = {}
+        self.policy_versions: dict[str, int] = {}
+
+    def update(
+        self, actor_id: str, num_transitions: int, num_bytes: int, policy_version: int | None = None
+    ) -> None:
+        self.total.update(num_transitions=num_transitions, num_bytes=num_bytes)
+        self.per_actor.setdefault(actor_id, ThroughputMeter()).update(
+            num_transitions=num_transitions, num_bytes=num_bytes
+        )
+        if policy_version is not None:
+            self.update_policy_version(actor_id, policy_version)
+
+    def update_policy_version(self, actor_id: str, policy_version: int) -> None:
+        # Versions only increase, but the messages of an actor can be processed out of order
+        self.policy_versions[actor_id] = max(
+            policy_version, self.policy_versions.get(actor_id, policy_version)
+        )
+
+    def report(self, current_policy_version: int) -> dict[str, float]:
+        """Return the rates since the previous report and the current staleness of every actor."""
+        total_stats = self.total.report()
+        stats = {
+            "Learner transitions received [1/s]": total_stats["transitions_per_s"],
+            "Learner transitions received [MB/s]": total_stats["mb_per_s"],
+            "Number of actors": float(len(self.per_actor)),
+        }
+        for actor_id, meter in self.per_actor.items():
+            actor_stats = meter.report()
+            stats[f"Actor {actor_id} transitions received [1/s]"] = actor_stats["transitions_per_s"]
+            if actor_id in self.policy_versions:
+                stats[f"Actor {actor_id} policy version lag"] = float(
+                    current_policy_version - self.policy_versions[actor_id]
+                )
+        return stats
+
+
+class InteractionStepCounter:
+    """Counts the interaction steps of every actor, and their total over the actors.
+
+    Every actor counts its interaction steps from zero, so the steps of several actors interleave. The total,
+    which only grows, is the step of the interaction metrics, and is saved with the checkpoints along with
+    the steps of every actor (see `state_dict`), to resume the counts.
+    """
+
+    def __init__(self, total: int = 0, per_actor: dict[str, int] | None = None):
+        # Counts of the resumed run
+        self._resumed_total = total
+        self._resumed_per_actor = dict(per_actor or {})
+        # Latest step reported by every actor, and the steps of its previous runs when it restarted
+        self._steps: dict[str, int] = {}
+        self._restart_offsets: dict[str, int] = {}
+
+    def update(self, actor_id: str, interaction_step: int) -> None:
+        last_step = self._steps.get(actor_id, 0)
+        if interaction_step < last_step:
+            # The actor restarted, and counts from zero again
+            self._restart_offsets[actor_id] = self._restart_offsets.get(actor_id, 0) + last_step
+        self._steps[actor_id] = interaction_step
+
+    def actor_step(self, actor_id: str) -> int:
+        return (
+            self._resumed_per_actor.get(actor_id, 0)
+            + self._restart_offsets.get(actor_id, 0)
+            + self._steps.get(actor_id, 0)
+        )
+
+    @property
+    def total(self) -> int:
+        return self._resumed_total + sum(self._restart_offsets.values()) + sum(self._steps.values())
+
+    def state_dict(self) -> dict:
+        actor_ids = self._resumed_per_actor.keys() | self._steps.keys()
+        return {
+            "interaction_step": self.total,
+            "actor_interaction_steps": {actor_id: self.actor_step(actor_id) for actor_id in actor_ids},
+        }
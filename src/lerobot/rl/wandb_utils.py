@@ -19,7 +19,7 @@ import re
 from glob import glob
 from pathlib import Path
 
-from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from huggingface_hub.constants import SAFETENSORS_INDEX_FILE, SAFETENSORS_SINGLE_FILE
 from termcolor import colored
 
 from lerobot.configs.train import TrainPipelineConfig
@@ -117,6 +117,7 @@ class WandBLogger:
         # Check if this is a PEFT model (has adapter files instead of model.safetensors)
         adapter_model_file = pretrained_model_dir / "adapter_model.safetensors"
         standard_model_file = pretrained_model_dir / SAFETENSORS_SINGLE_FILE
+        sharded_index_file = pretrained_model_dir / SAFETENSORS_INDEX_FILE
 
         if adapter_model_file.exists():
             # PEFT model: add adapter files and configs
@@ -131,6 +132,11 @@ class WandBLogger:
         elif standard_model_file.exists():
             # Standard model: add the single safetensors file
             artifact.add_file(standard_model_file)
+        elif sharded_index_file.exists():
+            # Sharded model: add the index and the shards
+            artifact.add_file(sharded_index_file)
+            for shard_file in sorted(pretrained_model_dir.glob("model-*-of-*.safetensors")):
+                artifact.add_file(shard_file)
         else:
             logging.warning(
                 f"No {SAFETENSORS_SINGLE_FILE} or adapter_model.safetensors found in {pretrained_model_dir}. "
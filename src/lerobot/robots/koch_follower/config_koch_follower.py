@@ -37,3 +37,7 @@ class KochFollowerConfig(RobotConfig):
 
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
+
+    # Read the state of the motors on a background thread at this rate, so that `get_observation` returns the
+    # latest state without waiting for the bus. Read on demand when None.
+    motor_state_poll_fps: float | None = None
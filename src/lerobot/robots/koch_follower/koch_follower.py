@@ -16,6 +16,7 @@
 
 import logging
 import time
+from contextlib import nullcontext
 from functools import cached_property
 
 from lerobot.cameras.utils import make_cameras_from_configs
@@ -24,6 +25,7 @@ from lerobot.motors.dynamixel import (
     DynamixelMotorsBus,
     OperatingMode,
 )
+from lerobot.motors.state_poller import MotorStatePoller
 from lerobot.processor import RobotAction, RobotObservation
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
 
@@ -60,6 +62,7 @@ class KochFollower(Robot):
             },
             calibration=self.calibration,
         )
+        self.state_poller: MotorStatePoller | None = None
         self.cameras = make_cameras_from_configs(config.cameras)
 
     @property
@@ -102,6 +105,11 @@ class KochFollower(Robot):
             cam.connect()
 
         self.configure()
+        if self.config.motor_state_poll_fps is not None:
+            self.state_poller = MotorStatePoller(
+                self.bus, ["Present_Position"], fps=self.config.motor_state_poll_fps
+            )
+            self.state_poller.start()
         logger.info(f"{self} connected.")
 
     @property
@@ -181,11 +189,18 @@ class KochFollower(Robot):
             self.bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.bus.motors[motor].id}")
 
+    def _read_present_position(self) -> dict[str, float]:
+        if self.state_poller is None:
+            return self.bus.sync_read("Present_Position")
+        snapshot = self.state_poller.latest()
+        logger.debug(f"{self} motor state age: {snapshot.age_s * 1e3:.1f}ms")
+        return snapshot.values["Present_Position"]
+
     @check_if_not_connected
     def get_observation(self) -> RobotObservation:
         # Read arm position
         start = time.perf_counter()
-        obs_dict = self.bus.sync_read("Present_Position")
+        obs_dict = self._read_present_position()
         obs_dict = {f"{motor}.pos": val for motor, val in obs_dict.items()}
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
@@ -219,16 +234,20 @@ class KochFollower(Robot):
         # Cap goal position when too far away from present position.
         # /!\ Slower fps expected due to reading from the follower.
         if self.config.max_relative_target is not None:
-            present_pos = self.bus.sync_read("Present_Position")
+            present_pos = self._read_present_position()
             goal_present_pos = {key: (g_pos, present_pos[key]) for key, g_pos in goal_pos.items()}
             goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
 
-        # Send goal position to the arm
-        self.bus.sync_write("Goal_Position", goal_pos)
+        # Send goal position to the arm, between two reads of the state poller
+        with self.state_poller.exclusive() if self.state_poller is not None else nullcontext():
+            self.bus.sync_write("Goal_Position", goal_pos)
         return {f"{motor}.pos": val for motor, val in goal_pos.items()}
 
     @check_if_not_connected
     def disconnect(self):
+        if self.state_poller is not None:
+            self.state_poller.stop()
+            self.state_poller = None
         self.bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
             cam.disconnect()
@@ -64,6 +64,14 @@ class LeKiwiHostConfig:
     # If robot jitters decrease the frequency and monitor cpu load with `top` in cmd
     max_loop_freq_hz: int = 30
 
+    # Format of the observations: "json" sends the images as base64 JPEGs, "binary" sends the JPEG bytes,
+    # which clients older than the binary format do not read
+    wire_format: str = "json"
+
+    def __post_init__(self):
+        if self.wire_format not in ("binary", "json"):
+            raise ValueError(f"`wire_format` is expected to be 'binary' or 'json', got {self.wire_format}.")
+
 
 @RobotConfig.register_subclass("lekiwi_client")
 @dataclass
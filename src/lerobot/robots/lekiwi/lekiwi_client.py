@@ -22,6 +22,7 @@ from functools import cached_property
 import cv2
 import numpy as np
 
+from lerobot.cameras.zmq.protocol import decode_message, is_binary_message
 from lerobot.processor import RobotAction, RobotObservation
 from lerobot.utils.constants import ACTION, OBS_STATE
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
@@ -140,8 +141,8 @@ class LeKiwiClient(Robot):
     def calibrate(self) -> None:
         pass
 
-    def _poll_and_get_latest_message(self) -> str | None:
-        """Polls the ZMQ socket for a limited time and returns the latest message string."""
+    def _poll_and_get_latest_message(self) -> bytes | None:
+        """Polls the ZMQ socket for a limited time and returns the latest message."""
         zmq = self._zmq
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -159,7 +160,7 @@ class LeKiwiClient(Robot):
         last_msg = None
         while True:
             try:
-                msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
+                msg = self.zmq_observation_socket.recv(zmq.NOBLOCK)
                 last_msg = msg
             except zmq.Again:
                 break
@@ -169,10 +170,18 @@ class LeKiwiClient(Robot):
 
         return last_msg
 
-    def _parse_observation_json(self, obs_string: str) -> RobotObservation | None:
-        """Parses the JSON observation string."""
+    def _parse_observation(self, message: bytes) -> RobotObservation | None:
+        """Parses the observation message, in the binary format or the former JSON format of the host."""
+        if is_binary_message(message):
+            try:
+                state, frames = decode_message(message, names=list(self._cameras_ft))
+            except (ValueError, KeyError) as e:
+                logging.error(f"Error decoding binary observation: {e}")
+                return None
+            return {**state, **frames}
+
         try:
-            return json.loads(obs_string)
+            return json.loads(message)
         except json.JSONDecodeError as e:
             logging.error(f"Error decoding JSON observation: {e}")
             return None
@@ -203,12 +212,12 @@ class LeKiwiClient(Robot):
 
         obs_dict: RobotObservation = {**flat_state, OBS_STATE: state_vec}
 
-        # Decode images
+        # Decode images, which are already decoded in binary messages
         current_frames: dict[str, np.ndarray] = {}
-        for cam_name, image_b64 in observation.items():
+        for cam_name, image in observation.items():
             if cam_name not in self._cameras_ft:
                 continue
-            frame = self._decode_image_from_b64(image_b64)
+            frame = image if isinstance(image, np.ndarray) else self._decode_image_from_b64(image)
             if frame is not None:
                 current_frames[cam_name] = frame
 
@@ -223,17 +232,17 @@ class LeKiwiClient(Robot):
         If no new data arrives or decoding fails, returns the last known values.
         """
 
-        # 1. Get the latest message string from the socket
-        latest_message_str = self._poll_and_get_latest_message()
+        # 1. Get the latest message from the socket
+        latest_message = self._poll_and_get_latest_message()
 
         # 2. If no message, return cached data
-        if latest_message_str is None:
+        if latest_message is None:
             return self.last_frames, self.last_remote_state
 
-        # 3. Parse the JSON message
-        observation = self._parse_observation_json(latest_message_str)
+        # 3. Parse the message
+        observation = self._parse_observation(latest_message)
 
-        # 4. If JSON parsing failed, return cached data
+        # 4. If parsing failed, return cached data
         if observation is None:
             return self.last_frames, self.last_remote_state
 
@@ -24,6 +24,8 @@ import cv2
 import draccus
 import zmq
 
+from lerobot.cameras.zmq.protocol import encode_message
+
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
 
@@ -50,6 +52,7 @@ class LeKiwiHost:
         self.connection_time_s = config.connection_time_s
         self.watchdog_timeout_ms = config.watchdog_timeout_ms
         self.max_loop_freq_hz = config.max_loop_freq_hz
+        self.wire_format = config.wire_format
 
     def disconnect(self):
         self.zmq_observation_socket.close()
@@ -99,19 +102,25 @@ def main(cfg: LeKiwiServerConfig):
 
             last_observation = robot.get_observation()
 
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
+            if host.wire_format == "binary":
+                # Send the images as JPEG bytes after the state
+                images = {cam_key: last_observation.pop(cam_key) for cam_key in robot.cameras}
+                message = encode_message(last_observation, images, quality=90)
+            else:
+                # Encode ndarrays to base64 strings
+                for cam_key, _ in robot.cameras.items():
+                    ret, buffer = cv2.imencode(
+                        ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
+                    )
+                    if ret:
+                        last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
+                    else:
+                        last_observation[cam_key] = ""
+                message = json.dumps(last_observation).encode("utf-8")
 
             # Send the observation to the remote agent
             try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
+                host.zmq_observation_socket.send(message, flags=zmq.NOBLOCK, copy=False)
             except zmq.Again:
                 logging.info("Dropping observation, no client connected")
 
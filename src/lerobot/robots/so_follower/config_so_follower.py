@@ -42,6 +42,15 @@ class SOFollowerConfig:
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
 
+    # Read the state of the motors on a background thread at this rate, so that `get_observation` returns the
+    # latest state without waiting for the bus. Read on demand when None.
+    motor_state_poll_fps: float | None = None
+
+    # Capture the cameras on background threads and return, for every camera, the frame captured closest to
+    # the read of the motor state, at most this far from it to be counted as aligned. The latest frame of every
+    # camera is returned when None.
+    camera_sync_tolerance_ms: float | None = None
+
 
 @RobotConfig.register_subclass("so101_follower")
 @RobotConfig.register_subclass("so100_follower")
@@ -16,15 +16,18 @@
 
 import logging
 import time
+from contextlib import nullcontext
 from functools import cached_property
 from typing import TypeAlias
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.motors.feetech import (
     FeetechMotorsBus,
     OperatingMode,
 )
+from lerobot.motors.state_poller import MotorStatePoller
 from lerobot.processor import RobotAction, RobotObservation
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
 
@@ -61,7 +64,14 @@ class SOFollower(Robot):
             },
             calibration=self.calibration,
         )
+        self.state_poller: MotorStatePoller | None = None
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group: CameraGroup | None = None
+        if config.camera_sync_tolerance_ms is not None and self.cameras:
+            self.camera_group = CameraGroup(self.cameras, tolerance_s=config.camera_sync_tolerance_ms / 1e3)
+        # `time.perf_counter()` when the state and the frames of the last observation were captured, when the
+        # cameras are synchronized
+        self.capture_timestamps: dict[str, float] = {}
 
     @property
     def _motors_ft(self) -> dict[str, type]:
@@ -103,6 +113,13 @@ class SOFollower(Robot):
             cam.connect()
 
         self.configure()
+        if self.config.motor_state_poll_fps is not None:
+            self.state_poller = MotorStatePoller(
+                self.bus, ["Present_Position"], fps=self.config.motor_state_poll_fps
+            )
+            self.state_poller.start()
+        if self.camera_group is not None:
+            self.camera_group.start()
         logger.info(f"{self} connected.")
 
     @property
@@ -175,15 +192,41 @@ class SOFollower(Robot):
             self.bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.bus.motors[motor].id}")
 
+    def _read_present_position(self) -> dict[str, float]:
+        return self._read_timed_present_position()[0]
+
+    def _read_timed_present_position(self) -> tuple[dict[str, float], float]:
+        """Present position of the motors, and the `time.perf_counter()` value it was read at."""
+        if self.state_poller is None:
+            start = time.perf_counter()
+            present_pos = self.bus.sync_read("Present_Position")
+            return present_pos, (start + time.perf_counter()) / 2
+        snapshot = self.state_poller.latest()
+        logger.debug(f"{self} motor state age: {snapshot.age_s * 1e3:.1f}ms")
+        return snapshot.values["Present_Position"], (snapshot.read_start + snapshot.timestamp) / 2
+
     @check_if_not_connected
     def get_observation(self) -> RobotObservation:
         # Read arm position
         start = time.perf_counter()
-        obs_dict = self.bus.sync_read("Present_Position")
+        obs_dict, state_time = self._read_timed_present_position()
         obs_dict = {f"{motor}.pos": val for motor, val in obs_dict.items()}
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
+        if self.camera_group is not None:
+            # Capture images from cameras, aligned to the state
+            start = time.perf_counter()
+            frames = self.camera_group.read_aligned(state_time)
+            self.capture_timestamps = {"state": state_time}
+            for cam_key, frame in frames.items():
+                obs_dict[cam_key] = frame.frame
+                self.capture_timestamps[cam_key] = frame.timestamp
+            dt_ms = (time.perf_counter() - start) * 1e3
+            offsets = ", ".join(f"{k} {(f.timestamp - state_time) * 1e3:+.1f}ms" for k, f in frames.items())
+            logger.debug(f"{self} read aligned cameras: {dt_ms:.1f}ms ({offsets})")
+            return obs_dict
+
         # Capture images from cameras
         for cam_key, cam in self.cameras.items():
             start = time.perf_counter()
@@ -213,16 +256,23 @@ class SOFollower(Robot):
         # Cap goal position when too far away from present position.
         # /!\ Slower fps expected due to reading from the follower.
         if self.config.max_relative_target is not None:
-            present_pos = self.bus.sync_read("Present_Position")
+            present_pos = self._read_present_position()
             goal_present_pos = {key: (g_pos, present_pos[key]) for key, g_pos in goal_pos.items()}
             goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
 
-        # Send goal position to the arm
-        self.bus.sync_write("Goal_Position", goal_pos)
+        # Send goal position to the arm, between two reads of the state poller
+        with self.state_poller.exclusive() if self.state_poller is not None else nullcontext():
+            self.bus.sync_write("Goal_Position", goal_pos)
         return {f"{motor}.pos": val for motor, val in goal_pos.items()}
 
     @check_if_not_connected
     def disconnect(self):
+        if self.state_poller is not None:
+            self.state_poller.stop()
+            self.state_poller = None
+        if self.camera_group is not None:
+            self.camera_group.stop()
+            logger.info(f"{self} camera sync: {self.camera_group.stats()}")
         self.bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
             cam.disconnect()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Recompute the stats of a LeRobot dataset, e.g. after editing or aggregating datasets.
+
+Per-episode stats are computed in a process pool and cached by a hash of the episode content, so that
+only the episodes which changed since the last run are recomputed. The aggregated stats are written to
+`meta/stats.json` of the dataset. The data and video files of the dataset which are not in its root yet are
+downloaded from the hub first.
+
+Usage Examples:
+
+Recompute the stats of a local dataset with 16 workers:
+    lerobot-dataset-stats \
+        --repo_id lerobot/pusht \
+        --root /path/to/pusht \
+        --num_workers 16
+
+Recompute from scratch, without reading or writing the stats cache:
+    lerobot-dataset-stats \
+        --repo_id lerobot/pusht \
+        --use_cache false
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from lerobot.configs import parser
+from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+from lerobot.datasets.recompute_stats import recompute_dataset_stats
+from lerobot.datasets.utils import write_stats
+from lerobot.utils.constants import HF_LEROBOT_HOME
+from lerobot.utils.utils import init_logging
+
+
+@dataclass
+class DatasetStatsConfig:
+    repo_id: str
+    root: str | None = None
+    # Number of worker processes computing the episode stats, 0 to compute them in the main process
+    num_workers: int = 8
+    # Per-episode stats are cached in `cache_dir`, keyed by a hash of the episode content
+    use_cache: bool = True
+    cache_dir: str = str(HF_LEROBOT_HOME / "stats_cache")
+    # Backend used to decode the sampled video frames, defaults to torchcodec when available
+    video_backend: str | None = None
+
+
+def dataset_file_paths(meta: LeRobotDatasetMetadata) -> set[Path]:
+    """Data and video files of every episode of the dataset, relative to its root."""
+    paths = set()
+    for ep_idx in range(meta.total_episodes):
+        paths.add(meta.get_data_file_path(ep_idx))
+        paths.update(meta.get_video_file_path(ep_idx, key) for key in meta.video_keys)
+    return paths
+
+
+@parser.wrap()
+def dataset_stats(cfg: DatasetStatsConfig) -> None:
+    meta = LeRobotDatasetMetadata(cfg.repo_id, root=cfg.root)
+    # The metadata only pulls meta/, while the stats are computed from the data and video files
+    missing_files = [str(path) for path in dataset_file_paths(meta) if not (meta.root / path).is_file()]
+    if missing_files:
+        logging.info(f"Downloading {len(missing_files)} data and video files of {cfg.repo_id}")
+        meta.pull_from_repo(allow_patterns=missing_files)
+
+    logging.info(f"Recomputing the stats of {cfg.repo_id} ({meta.total_episodes} episodes)")
+
+    start = time.perf_counter()
+    stats = recompute_dataset_stats(
+        meta,
+        num_workers=cfg.num_workers,
+        cache_dir=cfg.cache_dir if cfg.use_cache else None,
+        video_backend=cfg.video_backend,
+    )
+    write_stats(stats, meta.root)
+    logging.info(f"Wrote the stats to {meta.root} in {time.perf_counter() - start:.1f}s")
+
+
+def main() -> None:
+    init_logging()
+    dataset_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,7 @@ from pathlib import Path
 from pprint import pformat
 from typing import Any
 
+import numpy as np
 
 from lerobot.cameras import (  # noqa: F401
     CameraConfig,  # noqa: F401
@@ -80,6 +81,7 @@ from lerobot.cameras import (  # noqa: F401
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.cameras.reachy2_camera.configuration_reachy2_camera import Reachy2CameraConfig  # noqa: F401
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.shared_memory.configuration_shared_memory import SharedMemoryCameraConfig  # noqa: F401
 from lerobot.cameras.zmq.configuration_zmq import ZMQCameraConfig  # noqa: F401
 from lerobot.common.vision_config import VisionConfig, load_vision_config
 from lerobot.configs import parser
@@ -130,7 +132,7 @@ from lerobot.teleoperators import (  # noqa: F401
     so_leader,
 )
 from lerobot.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop
-from lerobot.utils.constants import ACTION, OBS_STR
+from lerobot.utils.constants import ACTION, CAPTURE_TIMESTAMPS, OBS_STR
 from lerobot.utils.control_utils import (
     init_keyboard_listener,
     is_headless,
@@ -435,6 +437,11 @@ def record_loop(
         if dataset is not None and save_to_dataset:
             action_frame = build_dataset_frame(dataset.features, action_values, prefix=ACTION)
             frame = {**observation_frame, **action_frame, "task": single_task}
+            if CAPTURE_TIMESTAMPS in dataset.features:
+                names = dataset.features[CAPTURE_TIMESTAMPS]["names"]
+                frame[CAPTURE_TIMESTAMPS] = np.array(
+                    [robot.capture_timestamps[name] - start_episode_t for name in names]
+                )
             dataset.add_frame(frame)
 
         if display_data:
@@ -507,6 +514,15 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             use_videos=cfg.dataset.video,
         ),
     )
+    camera_group = getattr(robot, "camera_group", None)
+    if camera_group is not None:
+        # Capture time of the state and of every frame in seconds since the start of the episode, to align them
+        # after recording. It is not an observation, so that policies do not take it as an input.
+        dataset_features[CAPTURE_TIMESTAMPS] = {
+            "dtype": "float64",
+            "shape": (len(camera_group.cameras) + 1,),
+            "names": ["state", *camera_group.cameras],
+        }
     # Single representation per camera: gripper=IBR, top=RAW (no _ibr/_mask keys).
 
     camera_stream_map: dict[str, str] | None = None
@@ -30,6 +30,7 @@ from lerobot.configs import parser
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.sampler import EpisodeAwareSampler
+from lerobot.datasets.transforms import BatchedImageTransforms, apply_image_transforms
 from lerobot.datasets.utils import cycle
 from lerobot.envs.factory import make_env, make_env_pre_post_processors
 from lerobot.envs.utils import close_envs
@@ -42,9 +43,11 @@ from lerobot.utils.import_utils import register_third_party_plugins
 from lerobot.utils.logging_utils import AverageMeter, MetricsTracker
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.train_utils import (
+    AsyncCheckpointWriter,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
+    prune_checkpoints,
     save_checkpoint,
     update_last_checkpoint,
 )
@@ -387,11 +390,14 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     if hasattr(cfg.policy, "drop_n_last_frames"):
         shuffle = False
         sampler = EpisodeAwareSampler(
-            dataset.meta.episodes["dataset_from_index"],
-            dataset.meta.episodes["dataset_to_index"],
+            # Read from the episodes index, without loading the episodes metadata
+            dataset.meta.episode_index.array["dataset_from_index"],
+            dataset.meta.episode_index.array["dataset_to_index"],
             episode_indices_to_use=dataset.episodes,
             drop_n_last_frames=cfg.policy.drop_n_last_frames,
             shuffle=True,
+            # Same permutation on every process, the dataloader is sharded by accelerate
+            seed=cfg.seed,
         )
     else:
         shuffle = True
@@ -415,6 +421,17 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     )
     dl_iter = cycle(dataloader)
 
+    # With uint8 frames, the image transforms are applied to the batch on the training device
+    device_image_transforms = None
+    if cfg.dataset.decode_to_uint8 and cfg.dataset.image_transforms.enable:
+        device_image_transforms = BatchedImageTransforms(cfg.dataset.image_transforms)
+
+    checkpoint_writer = None
+    if cfg.save_checkpoint and cfg.async_checkpoint and is_main_process:
+        checkpoint_writer = AsyncCheckpointWriter(
+            max_shard_size=cfg.checkpoint_max_shard_size, keep_last_n=cfg.keep_last_n_checkpoints
+        )
+
     policy.train()
 
     train_metrics = {
@@ -444,6 +461,8 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     for _ in range(step, cfg.steps):
         start_time = time.perf_counter()
         batch = next(dl_iter)
+        if device_image_transforms is not None:
+            batch = apply_image_transforms(batch, device_image_transforms, dataset.meta.camera_keys)
         batch = preprocessor(batch)
         train_tracker.dataloading_s = time.perf_counter() - start_time
 
@@ -489,19 +508,33 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
             if is_main_process:
                 logging.info(f"Checkpoint policy after step {step}")
                 checkpoint_dir = get_step_checkpoint_dir(cfg.output_dir, cfg.steps, step)
-                save_checkpoint(
-                    checkpoint_dir=checkpoint_dir,
-                    step=step,
-                    cfg=cfg,
-                    policy=accelerator.unwrap_model(policy),
-                    optimizer=optimizer,
-                    scheduler=lr_scheduler,
-                    preprocessor=preprocessor,
-                    postprocessor=postprocessor,
-                )
-                update_last_checkpoint(checkpoint_dir)
-                if wandb_logger:
-                    wandb_logger.log_policy(checkpoint_dir)
+                if checkpoint_writer is not None:
+                    checkpoint_writer.save(
+                        checkpoint_dir=checkpoint_dir,
+                        step=step,
+                        cfg=cfg,
+                        policy=accelerator.unwrap_model(policy),
+                        optimizer=optimizer,
+                        scheduler=lr_scheduler,
+                        preprocessor=preprocessor,
+                        postprocessor=postprocessor,
+                        on_saved=wandb_logger.log_policy if wandb_logger else None,
+                    )
+                else:
+                    save_checkpoint(
+                        checkpoint_dir=checkpoint_dir,
+                        step=step,
+                        cfg=cfg,
+                        policy=accelerator.unwrap_model(policy),
+                        optimizer=optimizer,
+                        scheduler=lr_scheduler,
+                        preprocessor=preprocessor,
+                        postprocessor=postprocessor,
+                    )
+                    update_last_checkpoint(checkpoint_dir)
+                    prune_checkpoints(checkpoint_dir.parent, cfg.keep_last_n_checkpoints)
+                    if wandb_logger:
+                        wandb_logger.log_policy(checkpoint_dir)
 
             accelerator.wait_for_everyone()
 
@@ -557,6 +590,10 @@ def train(cfg: TrainPipelineConfig, accelerator: Accelerator | None = None):
     if eval_env:
         close_envs(eval_env)
 
+    if checkpoint_writer is not None:
+        # Wait for the last checkpoint to be written
+        checkpoint_writer.close()
+
     if is_main_process:
         logging.info("End of training")
 
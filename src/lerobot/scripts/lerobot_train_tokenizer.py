@@ -202,16 +202,18 @@ def process_episode(args):
         states = []
         actions = []
 
-        for abs_idx in range(from_idx, to_idx):
-            # map absolute index to relative index if needed
-            if dataset._absolute_to_relative_idx is not None:
-                if abs_idx not in dataset._absolute_to_relative_idx:
-                    # this episode's frames aren't in the filtered dataset
-                    return None
-                rel_idx = dataset._absolute_to_relative_idx[abs_idx]
-            else:
-                rel_idx = abs_idx
+        # map absolute indices to relative indices if needed
+        abs_indices = list(range(from_idx, to_idx))
+        if dataset._absolute_to_relative_idx is not None:
+            try:
+                rel_indices = dataset._to_relative_indices(abs_indices)
+            except KeyError:
+                # this episode's frames aren't in the filtered dataset
+                return None
+        else:
+            rel_indices = abs_indices
 
+        for rel_idx in rel_indices:
             frame = dataset.hf_dataset[rel_idx]
 
             # get state (could be from observation.state or other state key)
@@ -28,3 +28,7 @@ class KochLeaderConfig(TeleoperatorConfig):
     # Sets the arm in torque mode with the gripper motor set to this value. This makes it possible to squeeze
     # the gripper and have it spring back to an open position on its own.
     gripper_open_pos: float = 50.0
+
+    # Read the state of the motors on a background thread at this rate, so that `get_action` returns the
+    # latest state without waiting for the bus. Read on demand when None.
+    motor_state_poll_fps: float | None = None
@@ -23,6 +23,7 @@ from lerobot.motors.dynamixel import (
     DynamixelMotorsBus,
     OperatingMode,
 )
+from lerobot.motors.state_poller import MotorStatePoller
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
 
 from ..teleoperator import Teleoperator
@@ -56,6 +57,7 @@ class KochLeader(Teleoperator):
             },
             calibration=self.calibration,
         )
+        self.state_poller: MotorStatePoller | None = None
 
     @property
     def action_features(self) -> dict[str, type]:
@@ -79,6 +81,11 @@ class KochLeader(Teleoperator):
             self.calibrate()
 
         self.configure()
+        if self.config.motor_state_poll_fps is not None:
+            self.state_poller = MotorStatePoller(
+                self.bus, ["Present_Position"], fps=self.config.motor_state_poll_fps
+            )
+            self.state_poller.start()
         logger.info(f"{self} connected.")
 
     @property
@@ -159,10 +166,17 @@ class KochLeader(Teleoperator):
             self.bus.setup_motor(motor)
             print(f"'{motor}' motor id set to {self.bus.motors[motor].id}")
 
+    def _read_present_position(self) -> dict[str, float]:
+        if self.state_poller is None:
+            return self.bus.sync_read("Present_Position")
+        snapshot = self.state_poller.latest()
+        logger.debug(f"{self} motor state age: {snapshot.age_s * 1e3:.1f}ms")
+        return snapshot.values["Present_Position"]
+
     @check_if_not_connected
     def get_action(self) -> dict[str, float]:
         start = time.perf_counter()
-        action = self.bus.sync_read("Present_Position")
+        action = self._read_present_position()
         action = {f"{motor}.pos": val for motor, val in action.items()}
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read action: {dt_ms:.1f}ms")
@@ -174,5 +188,8 @@ class KochLeader(Teleoperator):
 
     @check_if_not_connected
     def disconnect(self) -> None:
+        if self.state_poller is not None:
+            self.state_poller.stop()
+            self.state_poller = None
         self.bus.disconnect()
         logger.info(f"{self} disconnected.")
@@ -19,6 +19,8 @@ import io
 import json
 import logging
 import pickle  # nosec B403: Safe usage for internal serialization only
+import struct
+import time
 from multiprocessing.synchronize import Event as MpEvent
 from queue import Queue
 from typing import Any
@@ -26,6 +28,7 @@ from typing import Any
 import torch
 
 from lerobot.transport import services_pb2
+from lerobot.utils.constants import ACTION, OBS_IMAGE
 from lerobot.utils.transition import Transition
 
 # FIX for protobuf: Assign the enum to a variable and ignore the type error once
@@ -34,6 +37,19 @@ TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Columnar transition batches start with this magic so the learner can tell them apart
+# from the legacy `torch.save` list of transitions.
+COLUMNAR_MAGIC = b"LRCT"
+COLUMNAR_VERSION = 1
+# magic, version, compression code, header length
+_COLUMNAR_PREFIX = struct.Struct("<4sBBI")
+_COMPRESSION_CODES = {None: 0, "lz4": 1, "zstd": 2}
+_COMPRESSION_NAMES = {code: name for name, code in _COMPRESSION_CODES.items()}
+_TRANSITION_GROUPS = ("state", "next_state", "complementary_info")
+
+# gRPC metadata key used by actors to identify themselves to the learner
+ACTOR_ID_METADATA_KEY = "actor-id"
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -70,7 +86,13 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
     logging_method(f"{log_prefix} Published {sent_bytes / 1024 / 1024} MB")
 
 
-def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEvent, log_prefix: str = ""):
+def receive_bytes_in_chunks(
+    iterator,
+    queue: Queue | None,
+    shutdown_event: MpEvent,
+    log_prefix: str = "",
+    queue_item_tag: str | None = None,
+):
     bytes_buffer = io.BytesIO()
     step = 0
 
@@ -96,7 +118,10 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             logging.debug(f"{log_prefix} Received data at step end size {bytes_buffer_size(bytes_buffer)}")
 
             if queue is not None:
-                queue.put(bytes_buffer.getvalue())
+                if queue_item_tag is not None:
+                    queue.put((queue_item_tag, bytes_buffer.getvalue()))
+                else:
+                    queue.put(bytes_buffer.getvalue())
             else:
                 return bytes_buffer.getvalue()
 
@@ -150,6 +175,250 @@ def transitions_to_bytes(transitions: list[Transition]) -> bytes:
     return bytes_buffer.getvalue()
 
 
+def stack_transitions(transitions: list[Transition]) -> dict[str, Any]:
+    """Stack a list of transitions into a single columnar batch on the CPU.
+
+    Every tensor gets its leading batch dimension of size 1 squeezed (as `ReplayBuffer.add` does) and is
+    stacked along a new first dimension, so each key maps to a `(num_transitions, ...)` tensor.
+    """
+    if len(transitions) == 0:
+        raise ValueError("Cannot stack an empty list of transitions.")
+
+    def stack(values: list) -> torch.Tensor:
+        if isinstance(values[0], torch.Tensor):
+            return torch.stack([v.detach().squeeze(0).cpu() for v in values])
+        return torch.as_tensor(values)
+
+    first = transitions[0]
+    batch = {
+        "state": {key: stack([t["state"][key] for t in transitions]) for key in first["state"]},
+        ACTION: stack([t[ACTION] for t in transitions]),
+        "reward": torch.as_tensor([float(t["reward"]) for t in transitions], dtype=torch.float32),
+        "next_state": {
+            key: stack([t["next_state"][key] for t in transitions]) for key in first["next_state"]
+        },
+        "done": torch.as_tensor([bool(t["done"]) for t in transitions], dtype=torch.bool),
+        "truncated": torch.as_tensor([bool(t["truncated"]) for t in transitions], dtype=torch.bool),
+        "complementary_info": None,
+    }
+    if first.get("complementary_info") is not None:
+        batch["complementary_info"] = {
+            key: stack([t["complementary_info"][key] for t in transitions])
+            for key in first["complementary_info"]
+        }
+    return batch
+
+
+def _compress(payload: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return payload
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.compress(payload)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(payload)
+    raise ValueError(f"Unsupported compression '{compression}', expected one of {list(_COMPRESSION_CODES)}")
+
+
+def _decompress(payload: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return payload
+    if compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.decompress(payload)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unsupported compression '{compression}'")
+
+
+def _is_quantizable_image(key: str, tensor: torch.Tensor) -> bool:
+    return (
+        key.startswith(OBS_IMAGE)
+        and tensor.is_floating_point()
+        and tensor.numel() > 0
+        and bool(tensor.min() >= 0.0)
+        and bool(tensor.max() <= 1.0)
+    )
+
+
+def transition_batch_to_bytes(
+    batch: dict[str, Any],
+    compression: str | None = None,
+    quantize_images: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> bytes:
+    """Encode a columnar transition batch (see `stack_transitions`) to a compact binary buffer.
+
+    The layout is a fixed prefix (magic, version, compression, header length), a JSON header describing
+    every tensor (group, key, dtype, shape, offset) and the raw tensor bytes, optionally compressed.
+    Image tensors with values in [0, 1] are sent as uint8 when `quantize_images` is True.
+    `metadata` is an optional JSON-serializable dict (e.g. the policy version used to collect the batch)
+    returned under the "metadata" key by `bytes_to_transition_batch`.
+    """
+    if compression not in _COMPRESSION_CODES:
+        raise ValueError(
+            f"Unsupported compression '{compression}', expected one of {list(_COMPRESSION_CODES)}"
+        )
+
+    entries = []
+    for group in _TRANSITION_GROUPS:
+        for key, tensor in (batch.get(group) or {}).items():
+            entries.append((group, key, tensor))
+    for key in (ACTION, "reward", "done", "truncated"):
+        entries.append((None, key, batch[key]))
+
+    tensors_meta = []
+    payload = bytearray()
+    for group, key, tensor in entries:
+        tensor = tensor.detach().cpu()
+        scale = None
+        if quantize_images and _is_quantizable_image(key, tensor):
+            tensor = tensor.mul(255.0).round_().to(torch.uint8)
+            scale = 255.0
+        elif tensor.dtype == torch.bfloat16:
+            tensor = tensor.float()
+        data = tensor.contiguous().numpy().tobytes()
+        tensors_meta.append(
+            {
+                "group": group,
+                "key": key,
+                "dtype": str(tensor.dtype).removeprefix("torch."),
+                "shape": list(tensor.shape),
+                "offset": len(payload),
+                "scale": scale,
+            }
+        )
+        payload += data
+
+    header = json.dumps(
+        {
+            "num_transitions": int(batch["reward"].shape[0]),
+            "tensors": tensors_meta,
+            "metadata": metadata or {},
+        }
+    ).encode("utf-8")
+    prefix = _COLUMNAR_PREFIX.pack(
+        COLUMNAR_MAGIC, COLUMNAR_VERSION, _COMPRESSION_CODES[compression], len(header)
+    )
+    return prefix + header + _compress(bytes(payload), compression)
+
+
+def transitions_to_columnar_bytes(
+    transitions: list[Transition],
+    compression: str | None = None,
+    quantize_images: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> bytes:
+    return transition_batch_to_bytes(
+        stack_transitions(transitions),
+        compression=compression,
+        quantize_images=quantize_images,
+        metadata=metadata,
+    )
+
+
+def is_columnar_transitions_buffer(buffer: bytes) -> bool:
+    return buffer[: len(COLUMNAR_MAGIC)] == COLUMNAR_MAGIC
+
+
+def bytes_to_transition_batch(buffer: bytes) -> dict[str, Any]:
+    """Decode a buffer produced by `transition_batch_to_bytes` back into a columnar batch of CPU tensors."""
+    magic, version, compression_code, header_len = _COLUMNAR_PREFIX.unpack_from(buffer, 0)
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError("Buffer is not a columnar transition batch")
+    if version != COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar transition batch version {version}")
+
+    header_start = _COLUMNAR_PREFIX.size
+    header = json.loads(bytes(buffer[header_start : header_start + header_len]).decode("utf-8"))
+    payload = bytearray(
+        _decompress(bytes(buffer[header_start + header_len :]), _COMPRESSION_NAMES[compression_code])
+    )
+
+    batch: dict[str, Any] = {group: {} for group in _TRANSITION_GROUPS}
+    for meta in header["tensors"]:
+        dtype = getattr(torch, meta["dtype"])
+        shape = meta["shape"]
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        if numel == 0:
+            tensor = torch.empty(shape, dtype=dtype)
+        else:
+            tensor = torch.frombuffer(payload, dtype=dtype, count=numel, offset=meta["offset"]).reshape(shape)
+        if meta["scale"] is not None:
+            tensor = tensor.to(torch.float32).div_(meta["scale"])
+
+        if meta["group"] is None:
+            batch[meta["key"]] = tensor
+        else:
+            batch[meta["group"]][meta["key"]] = tensor
+
+    if not batch["complementary_info"]:
+        batch["complementary_info"] = None
+    batch["metadata"] = header.get("metadata", {})
+    return batch
+
+
+class ThroughputMeter:
+    """Counts transitions and bytes moved over the transport and reports rates since the last report.
+
+    Example:
+    ```python
+    meter = ThroughputMeter()
+    meter.update(num_transitions=len(transitions), num_bytes=len(buffer))
+    stats = meter.report()  # {"transitions_per_s": ..., "mb_per_s": ..., ...}
+    ```
+    """
+
+    def __init__(self):
+        self.total_transitions = 0
+        self.total_bytes = 0
+        self._window_transitions = 0
+        self._window_bytes = 0
+        self._window_start = time.perf_counter()
+
+    def update(self, num_transitions: int, num_bytes: int) -> None:
+        self.total_transitions += num_transitions
+        self.total_bytes += num_bytes
+        self._window_transitions += num_transitions
+        self._window_bytes += num_bytes
+
+    def report(self) -> dict[str, float]:
+        """Return the rates over the window since the previous call and start a new window."""
+        now = time.perf_counter()
+        elapsed = max(now - self._window_start, 1e-9)
+        stats = {
+            "transitions_per_s": self._window_transitions / elapsed,
+            "mb_per_s": self._window_bytes / elapsed / 1024 / 1024,
+            "total_transitions": float(self.total_transitions),
+            "total_mb": self.total_bytes / 1024 / 1024,
+        }
+        self._window_transitions = 0
+        self._window_bytes = 0
+        self._window_start = now
+        return stats
+
+
+def actor_id_metadata(actor_id: str) -> tuple[tuple[str, str]]:
+    """gRPC call metadata identifying the actor issuing the call."""
+    return ((ACTOR_ID_METADATA_KEY, actor_id),)
+
+
+def get_actor_id(context) -> str:
+    """Return the actor id sent in the call metadata, falling back to the peer address."""
+    for key, value in context.invocation_metadata() or ():
+        if key == ACTOR_ID_METADATA_KEY:
+            return value
+    return context.peer()
+
+
 def grpc_channel_options(
     max_receive_message_length: int = MAX_MESSAGE_SIZE,
     max_send_message_length: int = MAX_MESSAGE_SIZE,
@@ -35,6 +35,7 @@ REWARD = "next.reward"
 TRUNCATED = "next.truncated"
 DONE = "next.done"
 INFO = "info"
+CAPTURE_TIMESTAMPS = "capture_timestamps"
 
 ROBOTS = "robots"
 TELEOPERATORS = "teleoperators"
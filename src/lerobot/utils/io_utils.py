@@ -19,6 +19,10 @@ from pathlib import Path
 from typing import TypeVar
 
 import imageio
+import torch
+from huggingface_hub import split_torch_state_dict_into_shards
+from huggingface_hub.constants import SAFETENSORS_INDEX_FILE
+from safetensors.torch import load_file, save_file
 
 JsonLike = str | int | float | bool | None | list["JsonLike"] | dict[str, "JsonLike"] | tuple["JsonLike", ...]
 T = TypeVar("T", bound=JsonLike)
@@ -109,3 +113,31 @@ def deserialize_json_into_object(fpath: Path, obj: T) -> T:
     # Perform the in-place/recursive deserialization
     updated_obj = _deserialize(obj, data)
     return updated_obj
+
+
+def save_sharded_safetensors(
+    state_dict: dict[str, torch.Tensor], save_dir: Path, max_shard_size: int | str = "5GB"
+) -> None:
+    """Save a state dict as `model.safetensors`, or as `model-0000i-of-0000n.safetensors` shards with a
+    `model.safetensors.index.json` index when it is larger than `max_shard_size`.
+
+    Tensors sharing their memory (e.g. tied weights) must be saved under a single name.
+    """
+    split = split_torch_state_dict_into_shards(state_dict, max_shard_size=max_shard_size)
+    for filename, tensor_names in split.filename_to_tensors.items():
+        shard = {name: state_dict[name] for name in tensor_names}
+        save_file(shard, save_dir / filename, metadata={"format": "pt"})
+    if split.is_sharded:
+        index = {"metadata": split.metadata, "weight_map": split.tensor_to_filename}
+        with open(save_dir / SAFETENSORS_INDEX_FILE, "w") as f:
+            json.dump(index, f, indent=2)
+
+
+def load_sharded_safetensors(index_file: Path, device: str = "cpu") -> dict[str, torch.Tensor]:
+    """Load the state dict of sharded safetensors, given the path of their index."""
+    with open(index_file) as f:
+        weight_map = json.load(f)["weight_map"]
+    state_dict = {}
+    for filename in sorted(set(weight_map.values())):
+        state_dict.update(load_file(index_file.parent / filename, device=device))
+    return state_dict
@@ -13,13 +13,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import os
+import shutil
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import torch
+from safetensors.torch import save_file
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
 
 from lerobot.configs.train import TrainPipelineConfig
-from lerobot.datasets.utils import load_json, write_json
+from lerobot.datasets.utils import flatten_dict, load_json, write_json
 from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
@@ -27,10 +35,13 @@ from lerobot.processor import PolicyProcessorPipeline
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
+    OPTIMIZER_PARAM_GROUPS,
+    OPTIMIZER_STATE,
     PRETRAINED_MODEL_DIR,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
+from lerobot.utils.io_utils import save_sharded_safetensors
 from lerobot.utils.random_utils import load_rng_state, save_rng_state
 
 
@@ -56,10 +67,28 @@ def load_training_step(save_dir: Path) -> int:
 
 def update_last_checkpoint(checkpoint_dir: Path) -> Path:
     last_checkpoint_dir = checkpoint_dir.parent / LAST_CHECKPOINT_LINK
-    if last_checkpoint_dir.is_symlink():
-        last_checkpoint_dir.unlink()
     relative_target = checkpoint_dir.relative_to(checkpoint_dir.parent)
-    last_checkpoint_dir.symlink_to(relative_target)
+    # The new link replaces the previous one atomically, so that `last` always points to a checkpoint
+    tmp_link = checkpoint_dir.parent / f".{LAST_CHECKPOINT_LINK}.{os.getpid()}.tmp"
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(relative_target)
+    os.replace(tmp_link, last_checkpoint_dir)
+    return last_checkpoint_dir
+
+
+def prune_checkpoints(checkpoints_dir: Path, keep_last_n: int) -> None:
+    """Remove all but the `keep_last_n` most recent step checkpoints, never removing the `last` one."""
+    if keep_last_n <= 0:
+        return
+    last_checkpoint_dir = checkpoints_dir / LAST_CHECKPOINT_LINK
+    last_target = last_checkpoint_dir.resolve() if last_checkpoint_dir.is_symlink() else None
+    step_dirs = sorted(
+        (path for path in checkpoints_dir.iterdir() if path.name.isdigit() and path.is_dir()),
+        key=lambda path: int(path.name),
+    )
+    for path in step_dirs[:-keep_last_n]:
+        if path.resolve() != last_target:
+            shutil.rmtree(path)
 
 
 def save_checkpoint(
@@ -167,3 +196,158 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+class AsyncCheckpointWriter:
+    """Write training checkpoints in a background thread.
+
+    `save` copies the policy weights and the optimizer state to CPU memory (pinned when they live on a GPU,
+    and reused across checkpoints), writes the small files (configs, processors, scheduler, rng and step),
+    and returns. Training then only stalls for the copy, while a background thread writes the weights and
+    optimizer state. The checkpoint is written to a temporary directory which is renamed once complete,
+    before `last` is pointed to it and old checkpoints are pruned.
+
+    The layout is the one of `save_checkpoint`, except that policy weights larger than `max_shard_size`
+    are written as sharded safetensors. At most one checkpoint is written at a time.
+
+    Args:
+        max_shard_size: Maximum size of a safetensors file of the policy weights, e.g. "5GB".
+        keep_last_n: Number of most recent checkpoints to keep, 0 to keep all of them.
+    """
+
+    def __init__(self, max_shard_size: int | str = "5GB", keep_last_n: int = 0):
+        self.max_shard_size = max_shard_size
+        self.keep_last_n = keep_last_n
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-writer")
+        self._future: Future | None = None
+        self._buffers: dict[str, torch.Tensor] = {}
+
+    def _snapshot(self, prefix: str, state_dict: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Copy tensors to reused CPU buffers. Tensors sharing their memory (tied weights) are copied once."""
+        snapshot = {}
+        copied = set()
+        for name, tensor in state_dict.items():
+            if not isinstance(tensor, torch.Tensor):
+                snapshot[name] = tensor
+                continue
+            ptr = (tensor.data_ptr(), tensor.dtype, tensor.shape, tensor.stride())
+            if tensor.numel() > 0 and ptr in copied:
+                continue
+            copied.add(ptr)
+            buffer = self._buffers.get(f"{prefix}/{name}")
+            if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+                buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda)
+                self._buffers[f"{prefix}/{name}"] = buffer
+            buffer.copy_(tensor.detach(), non_blocking=tensor.is_cuda)
+            snapshot[name] = buffer
+        return snapshot
+
+    def _snapshot_optimizer(
+        self, optimizer: Optimizer | dict[str, Optimizer]
+    ) -> dict[str, tuple[dict, list]]:
+        # Same layout as `save_optimizer_state`, with one sub-directory per optimizer of a dict
+        optimizers = optimizer if isinstance(optimizer, dict) else {"": optimizer}
+        snapshots = {}
+        for name, opt in optimizers.items():
+            state = opt.state_dict()
+            param_groups = state.pop("param_groups")
+            snapshots[name] = (self._snapshot(f"optimizer/{name}", flatten_dict(state)), param_groups)
+        return snapshots
+
+    def save(
+        self,
+        checkpoint_dir: Path,
+        step: int,
+        cfg: TrainPipelineConfig,
+        policy: PreTrainedPolicy,
+        optimizer: Optimizer | dict[str, Optimizer],
+        scheduler: LRScheduler | None = None,
+        preprocessor: PolicyProcessorPipeline | None = None,
+        postprocessor: PolicyProcessorPipeline | None = None,
+        on_saved: Callable[[Path], None] | None = None,
+    ) -> float:
+        """Snapshot the training state and write it in the background.
+
+        Args:
+            on_saved: Called from the writer thread with the checkpoint directory once it is complete, e.g.
+                to upload it.
+
+        Returns:
+            The time training stalled, in seconds.
+        """
+        start = time.perf_counter()
+        self.wait()
+
+        tmp_dir = checkpoint_dir.with_name(f"{checkpoint_dir.name}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        pretrained_dir = tmp_dir / PRETRAINED_MODEL_DIR
+        pretrained_dir.mkdir(parents=True)
+
+        model_state = None
+        if cfg.peft is not None:
+            # Only the adapter weights, which are small, are saved
+            policy.save_pretrained(pretrained_dir)
+            policy.config.save_pretrained(pretrained_dir)
+        else:
+            policy.config._save_pretrained(pretrained_dir)
+            model_to_save = policy.module if hasattr(policy, "module") else policy
+            model_state = self._snapshot("model", model_to_save.state_dict())
+        cfg.save_pretrained(pretrained_dir)
+        if preprocessor is not None:
+            preprocessor.save_pretrained(pretrained_dir)
+        if postprocessor is not None:
+            postprocessor.save_pretrained(pretrained_dir)
+        save_training_state(tmp_dir, step, optimizer=None, scheduler=scheduler)
+        optimizer_state = self._snapshot_optimizer(optimizer)
+        if torch.cuda.is_available():
+            # Wait for the non-blocking copies to the pinned buffers
+            torch.cuda.synchronize()
+
+        stall_s = time.perf_counter() - start
+        self._future = self._executor.submit(
+            self._write, checkpoint_dir, tmp_dir, model_state, optimizer_state, stall_s, on_saved
+        )
+        return stall_s
+
+    def _write(
+        self,
+        checkpoint_dir: Path,
+        tmp_dir: Path,
+        model_state: dict[str, torch.Tensor] | None,
+        optimizer_state: dict[str, tuple[dict, list]],
+        stall_s: float,
+        on_saved: Callable[[Path], None] | None,
+    ) -> None:
+        start = time.perf_counter()
+        if model_state is not None:
+            save_sharded_safetensors(model_state, tmp_dir / PRETRAINED_MODEL_DIR, self.max_shard_size)
+        for name, (flat_state, param_groups) in optimizer_state.items():
+            save_dir = tmp_dir / TRAINING_STATE_DIR / name
+            save_dir.mkdir(parents=True, exist_ok=True)
+            save_file(flat_state, save_dir / OPTIMIZER_STATE)
+            write_json(param_groups, save_dir / OPTIMIZER_PARAM_GROUPS)
+
+        if checkpoint_dir.exists():
+            shutil.rmtree(checkpoint_dir)
+        os.replace(tmp_dir, checkpoint_dir)
+        update_last_checkpoint(checkpoint_dir)
+        prune_checkpoints(checkpoint_dir.parent, self.keep_last_n)
+
+        write_s = time.perf_counter() - start
+        logging.info(
+            f"Checkpoint {checkpoint_dir} written in the background in {write_s:.2f}s, "
+            f"training stalled {stall_s:.2f}s instead of {stall_s + write_s:.2f}s"
+        )
+        if on_saved is not None:
+            on_saved(checkpoint_dir)
+
+    def wait(self) -> None:
+        """Wait for the checkpoint being written, raising the error of the writer thread if any."""
+        if self._future is not None:
+            future, self._future = self._future, None
+            future.result()
+
+    def close(self) -> None:
+        self.wait()
+        self._executor.shutdown()
@@ -0,0 +1,151 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the time-aligned reads of CameraGroup."""
+
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras import camera_group as camera_group_module
+from lerobot.cameras.camera_group import CameraGroup
+from lerobot.utils.errors import DeviceNotConnectedError
+
+
+class FakeClock:
+    """Stands for the `time` module of camera_group, whose `perf_counter()` is set by the tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class FakeCamera:
+    """Camera returning the frames pushed by the tests, whose capture time is that of the clock."""
+
+    def __init__(self):
+        self.frames = queue.Queue()
+
+    def push(self, value: int) -> None:
+        self.frames.put(np.full((2, 2, 3), value, dtype=np.uint8))
+
+    def read(self) -> np.ndarray:
+        frame = self.frames.get()
+        if frame is None:
+            raise DeviceNotConnectedError("Disconnected.")
+        return frame
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(camera_group_module, "time", clock)
+    return clock
+
+
+def make_group(clock: FakeClock, names: list[str], **kwargs) -> tuple[CameraGroup, dict[str, FakeCamera]]:
+    cameras = {name: FakeCamera() for name in names}
+    for camera in cameras.values():
+        camera.push(0)
+    group = CameraGroup(cameras, **kwargs)
+    group.start(timeout_s=1.0)
+    return group, cameras
+
+
+def stop_group(group: CameraGroup) -> None:
+    for camera in group.cameras.values():
+        camera.frames.put(None)
+    group.stop()
+
+
+def capture(group: CameraGroup, clock: FakeClock, name: str, timestamp: float) -> None:
+    """Capture a frame of a camera at `timestamp`, and wait for it to be in the history."""
+    clock.now = timestamp
+    group.cameras[name].push(int(1e3 * timestamp))
+    deadline = time.monotonic() + 1.0
+    while group.latest()[name].timestamp != timestamp:
+        assert time.monotonic() < deadline, f"Frame of {name} at {timestamp} was not captured."
+        time.sleep(0.001)
+
+
+def test_nearest_frames_are_returned(clock) -> None:
+    group, _ = make_group(clock, ["front", "wrist"], tolerance_s=0.005)
+    try:
+        for timestamp in (0.010, 0.020, 0.030):
+            capture(group, clock, "front", timestamp)
+        for timestamp in (0.012, 0.028):
+            capture(group, clock, "wrist", timestamp)
+
+        aligned = group.read_aligned(0.021)
+        assert aligned["front"].timestamp == 0.020
+        assert aligned["wrist"].timestamp == 0.028
+        assert aligned["front"].seq == 2 and aligned["wrist"].seq == 2
+        assert aligned["wrist"].frame[0, 0, 0] == 28
+
+        stats = group.stats()
+        assert stats["num_reads"] == 1
+        assert stats["max_skew_ms"] == pytest.approx(8.0)
+        assert stats["mean_offset_ms"]["front"] == pytest.approx(-1.0)
+        assert stats["mean_offset_ms"]["wrist"] == pytest.approx(7.0)
+        # The wrist frame is further than the tolerance from the target time, but still returned
+        assert stats["out_of_tolerance"] == {"front": 0, "wrist": 1}
+    finally:
+        stop_group(group)
+
+
+def test_read_waits_for_a_closer_frame(clock) -> None:
+    group, _ = make_group(clock, ["front", "wrist"], tolerance_s=0.01)
+    try:
+        capture(group, clock, "front", 0.1)
+        # The latest wrist frame is older than the target time by more than the tolerance
+        threading.Timer(0.05, capture, args=(group, clock, "wrist", 0.1)).start()
+        aligned = group.read_aligned(0.1, timeout_s=2.0)
+        assert aligned["wrist"].timestamp == 0.1
+        assert group.stats()["out_of_tolerance"] == {"front": 0, "wrist": 0}
+
+        # Without a new frame, the closest one is returned once the read times out
+        start = time.monotonic()
+        aligned = group.read_aligned(0.2, timeout_s=0.05)
+        assert time.monotonic() - start >= 0.04
+        assert aligned["front"].timestamp == 0.1 and aligned["wrist"].timestamp == 0.1
+        assert group.stats()["out_of_tolerance"] == {"front": 1, "wrist": 1}
+    finally:
+        stop_group(group)
+
+
+def test_history_is_limited(clock) -> None:
+    group, _ = make_group(clock, ["front"], tolerance_s=0.005, history_size=3)
+    try:
+        for timestamp in (0.01, 0.02, 0.03, 0.04, 0.05):
+            capture(group, clock, "front", timestamp)
+        assert [frame.seq for frame in group._frames["front"]] == [3, 4, 5]
+
+        # The frame closest to the target time is no longer kept: the oldest one kept is returned
+        aligned = group.read_aligned(0.01, timeout_s=0.0)
+        assert aligned["front"].timestamp == 0.03
+        assert group.stats()["out_of_tolerance"] == {"front": 1}
+    finally:
+        stop_group(group)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        CameraGroup({"front": FakeCamera()}, tolerance_s=-1.0)
+    with pytest.raises(ValueError):
+        CameraGroup({"front": FakeCamera()}, history_size=0)
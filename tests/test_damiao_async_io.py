@@ -0,0 +1,140 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the asynchronous CAN I/O of DamiaoMotorsBus, against motors simulated on a virtual bus."""
+
+import os
+import threading
+import time
+
+import pytest
+
+can = pytest.importorskip("can")
+
+from lerobot.motors import Motor, MotorNormMode  # noqa: E402
+from lerobot.motors.damiao import (  # noqa: E402
+    CAN_CMD_REFRESH,
+    CAN_PARAM_ID,
+    DamiaoMotorsBus,
+    damiao as damiao_module,  # noqa: E402
+)
+
+RECV_ID_OFFSET = 0x10
+MOTOR_IDS = [1, 2, 3]
+
+
+class SimulatedMotors(threading.Thread):
+    """Answers every frame sent to a motor with its state frame, holding the last commanded position."""
+
+    def __init__(self, channel: str):
+        super().__init__(daemon=True)
+        # Encoded position of every motor, at the middle of the range
+        self.positions = dict.fromkeys(MOTOR_IDS, 1 << 15)
+        self.num_refreshes = 0
+        self.bus = can.Bus(interface="virtual", channel=channel)
+        self.stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self.stop_event.is_set():
+            msg = self.bus.recv(timeout=0.05)
+            if msg is None:
+                continue
+            if msg.arbitration_id == CAN_PARAM_ID and msg.data[2] == CAN_CMD_REFRESH:
+                motor_id = msg.data[0] | (msg.data[1] << 8)
+                self.num_refreshes += 1
+            elif msg.arbitration_id in self.positions:
+                motor_id = msg.arbitration_id
+                if any(byte != 0xFF for byte in msg.data[:7]):
+                    # MIT control frame
+                    self.positions[motor_id] = (msg.data[0] << 8) | msg.data[1]
+            else:
+                continue
+            position = self.positions[motor_id]
+            data = [motor_id, position >> 8, position & 0xFF, 0x7F, 0xF7, 0xFF, 30, 31]
+            self.bus.send(
+                can.Message(arbitration_id=motor_id + RECV_ID_OFFSET, data=data, is_extended_id=False)
+            )
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.join()
+        self.bus.shutdown()
+
+
+@pytest.fixture
+def bus_and_motors(request):
+    channel = f"lerobot-test-damiao-{os.getpid()}-{request.node.name}"
+    simulated_motors = SimulatedMotors(channel)
+    simulated_motors.start()
+    motors = {
+        f"joint_{id_}": Motor(id_, "dm4310", MotorNormMode.DEGREES, "dm4310", id_ + RECV_ID_OFFSET)
+        for id_ in MOTOR_IDS
+    }
+    bus = DamiaoMotorsBus(channel, motors, can_interface="virtual", async_io=True)
+    bus.connect(handshake=False)
+    try:
+        yield bus, simulated_motors
+    finally:
+        if bus.is_connected:
+            bus.disconnect(disable_torque=False)
+        simulated_motors.stop()
+
+
+def wait_for_states(bus: DamiaoMotorsBus, since: float, timeout: float = 1.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while min(bus._state_timestamps.values()) <= since and time.perf_counter() < deadline:
+        time.sleep(0.001)
+
+
+def test_write_responses_are_decoded_in_the_background(bus_and_motors, monkeypatch) -> None:
+    bus, simulated_motors = bus_and_motors
+
+    def no_sleep(seconds):
+        raise AssertionError("Asynchronous writes must not sleep between motors.")
+
+    monkeypatch.setattr(damiao_module, "precise_sleep", no_sleep)
+    goal = {"joint_1": 10.0, "joint_2": -20.0, "joint_3": 30.0}
+    start = time.perf_counter()
+    bus.sync_write("Goal_Position", goal)
+
+    # The states carried by the responses to the writes are decoded by the notifier, and read from the cache
+    wait_for_states(bus, since=start)
+    states = bus.sync_read_all_states(max_age_s=1.0)
+    assert simulated_motors.num_refreshes == 0
+    for motor, position in goal.items():
+        assert states[motor]["position"] == pytest.approx(position, abs=0.05)
+        assert states[motor]["temp_rotor"] == 31
+
+
+def test_stale_states_are_refreshed(bus_and_motors) -> None:
+    bus, simulated_motors = bus_and_motors
+    states = bus.sync_read_all_states()
+    assert simulated_motors.num_refreshes == len(MOTOR_IDS)
+    for state in states.values():
+        assert state["position"] == pytest.approx(0.0, abs=0.05)
+        assert state["temp_mos"] == 30
+
+    # Fresh states are not refreshed again
+    bus.sync_read_all_states(max_age_s=1.0)
+    assert simulated_motors.num_refreshes == len(MOTOR_IDS)
+    assert bus.read("Present_Position", "joint_2") == pytest.approx(0.0, abs=0.05)
+
+
+def test_disconnect_stops_the_notifier(bus_and_motors) -> None:
+    bus, _ = bus_and_motors
+    notifier = bus._notifier
+    assert notifier is not None
+    bus.disconnect(disable_torque=False)
+    assert bus._notifier is None
+    assert all(not thread.is_alive() for thread in notifier._readers if isinstance(thread, threading.Thread))
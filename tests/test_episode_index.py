@@ -0,0 +1,87 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for EpisodeIndex: save/load round-trip, and staleness once the episodes metadata changes."""
+
+from pathlib import Path
+
+import datasets
+import numpy as np
+
+from lerobot.datasets.episode_index import EpisodeIndex, episodes_files_signature
+from lerobot.datasets.utils import EPISODES_DIR
+
+VIDEO_KEY = "observation.images.front"
+
+
+def write_episodes(root: Path, lengths: list[int]) -> datasets.Dataset:
+    """Write the episodes metadata of episodes of the given lengths, all in the first data and video files."""
+    to_index = np.cumsum(lengths).tolist()
+    from_index = [0, *to_index[:-1]]
+    episodes = datasets.Dataset.from_dict(
+        {
+            "episode_index": list(range(len(lengths))),
+            "dataset_from_index": from_index,
+            "dataset_to_index": to_index,
+            "data/chunk_index": [0] * len(lengths),
+            "data/file_index": [0] * len(lengths),
+            f"videos/{VIDEO_KEY}/chunk_index": [0] * len(lengths),
+            f"videos/{VIDEO_KEY}/file_index": [i // 2 for i in range(len(lengths))],
+            f"videos/{VIDEO_KEY}/from_timestamp": [i / 30 for i in from_index],
+            f"videos/{VIDEO_KEY}/to_timestamp": [i / 30 for i in to_index],
+        }
+    )
+    path = root / EPISODES_DIR / "chunk-000" / "file-000.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    episodes.to_parquet(path)
+    return episodes
+
+
+def build_index(root: Path, episodes: datasets.Dataset) -> EpisodeIndex:
+    signature = episodes_files_signature(root)
+    index = EpisodeIndex.from_episodes(episodes, [VIDEO_KEY])
+    index.save(root, signature)
+    return index
+
+
+def test_save_load_round_trip(tmp_path: Path) -> None:
+    episodes = write_episodes(tmp_path, [10, 5, 7])
+    index = build_index(tmp_path, episodes)
+
+    loaded = EpisodeIndex.load(tmp_path, [VIDEO_KEY])
+    assert loaded is not None
+    assert len(loaded) == 3
+    np.testing.assert_array_equal(loaded.array, index.array)
+    assert loaded[1]["dataset_from_index"] == 10 and loaded[1]["dataset_to_index"] == 15
+    assert loaded.data_files() == [(0, 0)]
+    assert loaded.video_files(VIDEO_KEY) == [(0, 0), (0, 1)]
+    assert loaded.video_files(VIDEO_KEY, episodes=[0, 1]) == [(0, 0)]
+
+
+def test_stale_index_is_rebuilt(tmp_path: Path) -> None:
+    build_index(tmp_path, write_episodes(tmp_path, [10, 5]))
+    # An episode is recorded: the episodes file changes, and the index no longer matches it
+    episodes = write_episodes(tmp_path, [10, 5, 8])
+    assert EpisodeIndex.load(tmp_path, [VIDEO_KEY]) is None
+
+    build_index(tmp_path, episodes)
+    loaded = EpisodeIndex.load(tmp_path, [VIDEO_KEY])
+    assert loaded is not None
+    assert len(loaded) == 3
+    assert loaded[2]["dataset_to_index"] == 23
+
+
+def test_index_of_other_cameras_is_not_loaded(tmp_path: Path) -> None:
+    build_index(tmp_path, write_episodes(tmp_path, [10, 5]))
+    assert EpisodeIndex.load(tmp_path, []) is None
@@ -0,0 +1,76 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the interaction steps of several actors feeding one learner."""
+
+from lerobot.rl.learner import process_interaction_message
+from lerobot.rl.learner_service import InteractionStepCounter
+from lerobot.transport.utils import python_object_to_bytes
+
+
+class FakeWandBLogger:
+    def __init__(self):
+        self.logs = []
+
+    def log_dict(self, d, step=None, mode="train", custom_step_key=None):
+        self.logs.append((d, custom_step_key))
+
+
+def test_total_interaction_step_only_grows() -> None:
+    counter = InteractionStepCounter()
+    totals = []
+    # The steps of the actors interleave
+    for actor_id, step in [("a", 100), ("b", 10), ("a", 200), ("b", 50), ("b", 80)]:
+        counter.update(actor_id, step)
+        totals.append(counter.total)
+    assert totals == sorted(totals)
+    assert counter.total == 280
+    assert counter.actor_step("a") == 200 and counter.actor_step("b") == 80
+
+    # An actor which restarts counts from zero again, its previous steps are kept
+    counter.update("b", 5)
+    assert counter.actor_step("b") == 85
+    assert counter.total == 285
+
+
+def test_resumed_counts() -> None:
+    counter = InteractionStepCounter()
+    counter.update("a", 100)
+    counter.update("b", 30)
+    state = counter.state_dict()
+    assert state == {"interaction_step": 130, "actor_interaction_steps": {"a": 100, "b": 30}}
+
+    resumed = InteractionStepCounter(
+        total=state["interaction_step"], per_actor=state["actor_interaction_steps"]
+    )
+    resumed.update("a", 20)
+    resumed.update("c", 7)
+    assert resumed.total == 157
+    assert resumed.state_dict()["actor_interaction_steps"] == {"a": 120, "b": 30, "c": 7}
+
+
+def test_interaction_messages_are_logged_per_actor_against_the_total_step() -> None:
+    counter = InteractionStepCounter()
+    logger = FakeWandBLogger()
+    for actor_id, step, reward in [("a", 100, 1.0), ("b", 10, 2.0), ("a", 150, 3.0)]:
+        message = python_object_to_bytes({"Episodic reward": reward, "Interaction step": step})
+        process_interaction_message(message, counter, wandb_logger=logger, actor_id=actor_id)
+
+    steps = [d["Interaction step"] for d, custom_step_key in logger.logs]
+    assert all(custom_step_key == "Interaction step" for _, custom_step_key in logger.logs)
+    assert steps == [100, 110, 160]
+    last, _ = logger.logs[-1]
+    assert last["Actor a Episodic reward"] == 3.0
+    assert last["Actor a interaction step"] == 150
+    assert last["Episodic reward"] == 3.0
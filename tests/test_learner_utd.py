@@ -0,0 +1,126 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batched sampling of the UTD critic updates of the SAC learner."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from lerobot.rl.learner import sample_utd_batches, split_minibatches
+from lerobot.utils.constants import ACTION
+
+IMAGE_KEY = "observation.image"
+
+
+def make_batch(rows: torch.Tensor) -> dict:
+    """Batch of transitions whose tensors all hold the id of their row."""
+    rows = rows.float()
+    return {
+        "state": {IMAGE_KEY: rows[:, None]},
+        ACTION: rows[:, None],
+        "reward": rows,
+        "next_state": {IMAGE_KEY: rows[:, None] + 0.5},
+        "done": torch.zeros_like(rows),
+        "truncated": torch.zeros_like(rows),
+        "complementary_info": {"discrete_penalty": -rows},
+    }
+
+
+class FakeEncoder:
+    def __init__(self):
+        self.num_calls = 0
+
+    def get_cached_image_features(self, observations: dict) -> dict:
+        self.num_calls += 1
+        return {IMAGE_KEY: 10 * observations[IMAGE_KEY]}
+
+
+def make_policy(frozen_encoder: bool) -> SimpleNamespace:
+    config = SimpleNamespace(vision_encoder_name="encoder", freeze_vision_encoder=frozen_encoder)
+    return SimpleNamespace(config=config, actor=SimpleNamespace(encoder=FakeEncoder()))
+
+
+def test_split_minibatches_is_contiguous() -> None:
+    minibatches = split_minibatches(make_batch(torch.arange(6)), num_minibatches=3)
+    for i, minibatch in enumerate(minibatches):
+        expected = torch.arange(2 * i, 2 * i + 2).float()
+        torch.testing.assert_close(minibatch["reward"], expected)
+        torch.testing.assert_close(minibatch["state"][IMAGE_KEY][:, 0], expected)
+        torch.testing.assert_close(minibatch["complementary_info"]["discrete_penalty"], -expected)
+    with pytest.raises(ValueError):
+        split_minibatches(make_batch(torch.arange(5)), num_minibatches=3)
+
+
+@pytest.mark.parametrize("with_offline", [False, True])
+def test_batched_minibatches_match_sequential_batches(with_offline: bool) -> None:
+    utd_ratio, batch_size = 3, 2
+    online_rows = torch.arange(utd_ratio * batch_size)
+    offline_rows = 100 + online_rows
+
+    def sequential_iterator(rows):
+        return iter(make_batch(chunk) for chunk in rows.split(batch_size))
+
+    sequential = list(
+        sample_utd_batches(
+            policy=make_policy(frozen_encoder=False),
+            online_iterator=sequential_iterator(online_rows),
+            offline_iterator=sequential_iterator(offline_rows) if with_offline else None,
+            utd_ratio=utd_ratio,
+        )
+    )
+    batched = list(
+        sample_utd_batches(
+            policy=make_policy(frozen_encoder=False),
+            online_iterator=iter([make_batch(online_rows)]),
+            offline_iterator=iter([make_batch(offline_rows)]) if with_offline else None,
+            utd_ratio=utd_ratio,
+            batched=True,
+        )
+    )
+
+    # The i-th critic update gets the i-th online (and offline) minibatch, as with sequential sampling
+    assert len(batched) == len(sequential) == utd_ratio
+    for i, (batched_batch, sequential_batch) in enumerate(zip(batched, sequential, strict=True)):
+        expected = online_rows[i * batch_size : (i + 1) * batch_size].float()
+        if with_offline:
+            expected = torch.cat([expected, 100 + expected])
+        torch.testing.assert_close(batched_batch["reward"], expected)
+        torch.testing.assert_close(sequential_batch["reward"], expected)
+        torch.testing.assert_close(batched_batch["state"][IMAGE_KEY], sequential_batch["state"][IMAGE_KEY])
+        torch.testing.assert_close(
+            batched_batch["complementary_info"]["discrete_penalty"],
+            sequential_batch["complementary_info"]["discrete_penalty"],
+        )
+
+
+def test_frozen_encoder_features_are_computed_once_per_stacked_batch() -> None:
+    policy = make_policy(frozen_encoder=True)
+    batches = list(
+        sample_utd_batches(
+            policy=policy,
+            online_iterator=iter([make_batch(torch.arange(6))]),
+            offline_iterator=iter([make_batch(100 + torch.arange(6))]),
+            utd_ratio=3,
+            batched=True,
+        )
+    )
+    # State and next state of the online and offline stacked batches
+    assert policy.actor.encoder.num_calls == 4
+    for batch in batches:
+        torch.testing.assert_close(batch["observation_feature"][IMAGE_KEY], 10 * batch["state"][IMAGE_KEY])
+        torch.testing.assert_close(
+            batch["next_observation_feature"][IMAGE_KEY], 10 * batch["next_state"][IMAGE_KEY]
+        )
@@ -0,0 +1,109 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the pool of frames of OpenCVCamera, and the consumers keeping its frames."""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import PIL.Image
+import pytest
+
+from lerobot.cameras.camera_group import CameraGroup
+from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+from lerobot.datasets.image_writer import AsyncImageWriter
+
+HEIGHT, WIDTH = 4, 6
+
+
+class FakeVideoCapture:
+    """Capture whose n-th frame (from 1) is filled with the value n."""
+
+    def __init__(self):
+        self.num_frames = 0
+
+    def read(self, image=None):
+        self.num_frames += 1
+        return True, np.full((HEIGHT, WIDTH, 3), self.num_frames % 256, dtype=np.uint8)
+
+
+@pytest.fixture(autouse=True)
+def connected(monkeypatch):
+    monkeypatch.setattr(OpenCVCamera, "is_connected", property(lambda self: self.videocapture is not None))
+
+
+def make_camera(num_buffers: int) -> OpenCVCamera:
+    camera = OpenCVCamera(
+        OpenCVCameraConfig(index_or_path=0, width=WIDTH, height=HEIGHT, num_buffers=num_buffers)
+    )
+    camera.videocapture = FakeVideoCapture()
+    camera.capture_width, camera.capture_height = WIDTH, HEIGHT
+    return camera
+
+
+def test_kept_frames_are_intact_or_detected() -> None:
+    camera = make_camera(num_buffers=3)
+    kept = []
+    for _ in range(10):
+        frame = camera.read()
+        assert not frame.flags.writeable
+        kept.append((camera.frame_seq, frame))
+
+    num_current = 0
+    for seq, frame in kept:
+        if camera.is_frame_current(seq):
+            num_current += 1
+            np.testing.assert_array_equal(frame, np.full_like(frame, seq + 1))
+        else:
+            # Overwritten by a later frame of the pool
+            assert not np.array_equal(frame, np.full_like(frame, seq + 1))
+    assert num_current == 3
+
+
+def test_image_writer_keeps_the_frames_of_the_pool(tmp_path: Path) -> None:
+    camera = make_camera(num_buffers=2)
+    writer = AsyncImageWriter(num_processes=0, num_threads=1)
+    try:
+        paths = []
+        for i in range(8):
+            paths.append(tmp_path / f"frame_{i}.png")
+            writer.save_image(camera.read(), paths[-1])
+        writer.wait_until_done()
+    finally:
+        writer.stop()
+
+    for i, path in enumerate(paths):
+        np.testing.assert_array_equal(np.asarray(PIL.Image.open(path)), np.full((HEIGHT, WIDTH, 3), i + 1))
+
+
+def test_camera_group_keeps_the_frames_of_the_pool() -> None:
+    camera = make_camera(num_buffers=2)
+    group = CameraGroup({"front": camera}, history_size=8)
+    group.start()
+    try:
+        # Frames keep coming, until the history is full
+        deadline = time.perf_counter() + 1.0
+        while len(group._frames["front"]) < 8 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        frames = group.read_aligned()
+    finally:
+        group.stop()
+
+    assert frames["front"].frame.flags.writeable
+    history = list(group._frames["front"])
+    assert len(history) == 8
+    for timestamped_frame in history:
+        expected = (timestamped_frame.seq + 1) % 256
+        np.testing.assert_array_equal(timestamped_frame.frame, np.full((HEIGHT, WIDTH, 3), expected))
@@ -0,0 +1,86 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the decoding of the compressed frames of OpenCVCamera with `mjpeg_passthrough`."""
+
+import cv2
+import numpy as np
+import pytest
+
+from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig, camera_opencv
+
+
+def make_jpeg(width: int, height: int) -> np.ndarray:
+    ramp = np.linspace(0, 255, width, dtype=np.float32)
+    image = np.broadcast_to(ramp, (height, width))
+    image = np.stack([image, image[::-1], np.full_like(image, 128)], axis=-1).astype(np.uint8)
+    ok, buffer = cv2.imencode(".jpg", image)
+    assert ok
+    return buffer
+
+
+@pytest.fixture
+def decode_flags(monkeypatch):
+    """Flags of the calls to `cv2.imdecode` by OpenCVCamera."""
+    flags = []
+    imdecode = cv2.imdecode
+
+    def spy(buffer, flag):
+        flags.append(flag)
+        return imdecode(buffer, flag)
+
+    monkeypatch.setattr(camera_opencv.cv2, "imdecode", spy)
+    return flags
+
+
+@pytest.mark.parametrize(
+    "capture_size, size, flag",
+    [
+        # Scaled by 1/8 exactly
+        ((640, 480), (80, 60), cv2.IMREAD_REDUCED_COLOR_8),
+        # 1/8 of the width is below the output width
+        ((640, 480), (100, 60), cv2.IMREAD_REDUCED_COLOR_4),
+        ((640, 480), (320, 180), cv2.IMREAD_REDUCED_COLOR_2),
+        # 1/2 of the height is below the output height
+        ((640, 480), (320, 250), cv2.IMREAD_COLOR),
+    ],
+)
+def test_decode_jpeg_scale(decode_flags, capture_size, size, flag) -> None:
+    camera = OpenCVCamera(
+        OpenCVCameraConfig(
+            index_or_path=0,
+            width=size[0],
+            height=size[1],
+            capture_width=capture_size[0],
+            capture_height=capture_size[1],
+            mjpeg_passthrough=True,
+        )
+    )
+    image = camera._decode_jpeg(make_jpeg(*capture_size))
+    assert decode_flags == [flag]
+    assert image.shape == (size[1], size[0], 3)
+
+
+def test_decode_jpeg_without_resize(decode_flags) -> None:
+    camera = OpenCVCamera(OpenCVCameraConfig(index_or_path=0, width=64, height=48, mjpeg_passthrough=True))
+    jpeg = make_jpeg(64, 48)
+    image = camera._decode_jpeg(jpeg)
+    assert decode_flags == [cv2.IMREAD_COLOR]
+    np.testing.assert_array_equal(image, cv2.imdecode(jpeg, cv2.IMREAD_COLOR))
+
+
+def test_decode_jpeg_failure() -> None:
+    camera = OpenCVCamera(OpenCVCameraConfig(index_or_path=0, width=64, height=48, mjpeg_passthrough=True))
+    with pytest.raises(RuntimeError):
+        camera._decode_jpeg(np.zeros(16, dtype=np.uint8))
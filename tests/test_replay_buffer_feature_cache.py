@@ -0,0 +1,118 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cache of vision encoder features of the replay buffer: cache hits and invalidation."""
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.rl.learner import make_observation_feature_extractor
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+IMAGE_KEY = f"{OBS_IMAGE}.front"
+
+
+def make_transitions(num_transitions: int) -> list[dict]:
+    """Transitions whose images are filled with the index of their observation, chained as in an episode."""
+
+    def observation(i: int) -> dict:
+        return {OBS_STATE: torch.full((1, 2), float(i)), IMAGE_KEY: torch.full((1, 3, 4, 4), i / 8)}
+
+    return [
+        {
+            "state": observation(i),
+            ACTION: torch.zeros(1, 2),
+            "reward": float(i),
+            "next_state": observation(i + 1),
+            "done": False,
+            "truncated": False,
+        }
+        for i in range(num_transitions)
+    ]
+
+
+class CountingExtractor:
+    def __init__(self):
+        self.num_encoded = 0
+
+    def __call__(self, observations: dict) -> dict:
+        self.num_encoded += observations[IMAGE_KEY].shape[0]
+        return {IMAGE_KEY: observations[IMAGE_KEY].mean(dim=(2, 3))}
+
+
+def no_augmentation(images):
+    raise AssertionError("Cached features must not be sampled with augmented images.")
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_sampled_features_are_those_of_the_stored_observations(optimize_memory: bool) -> None:
+    buffer = ReplayBuffer(
+        capacity=4,
+        device="cpu",
+        state_keys=[OBS_STATE, IMAGE_KEY],
+        image_augmentation_function=no_augmentation,
+        optimize_memory=optimize_memory,
+    )
+    transitions = make_transitions(7)
+    for transition in transitions[:2]:
+        buffer.add(**transition)
+
+    extractor = CountingExtractor()
+    buffer.enable_feature_cache(extractor)
+    # The transitions already stored are encoded when the cache is enabled, the others when they are added,
+    # overwriting the features of the slots they replace
+    for transition in transitions[2:]:
+        buffer.add(**transition)
+    num_encoded = extractor.num_encoded
+
+    batch = buffer.sample(16)
+    assert extractor.num_encoded == num_encoded
+    expected = extractor(batch["state"])[IMAGE_KEY]
+    expected_next = extractor(batch["next_state"])[IMAGE_KEY]
+    torch.testing.assert_close(batch["observation_feature"][IMAGE_KEY], expected)
+    torch.testing.assert_close(batch["next_observation_feature"][IMAGE_KEY], expected_next)
+    # Only the last 4 transitions are left in the buffer
+    assert batch["reward"].min() >= 3
+
+
+def test_disabled_cache_samples_observations_only() -> None:
+    buffer = ReplayBuffer(capacity=4, device="cpu", state_keys=[OBS_STATE, IMAGE_KEY], use_drq=False)
+    for transition in make_transitions(3):
+        buffer.add(**transition)
+    buffer.enable_feature_cache(CountingExtractor())
+    assert "observation_feature" in buffer.sample(2)
+
+    buffer.disable_feature_cache()
+    batch = buffer.sample(2)
+    assert "observation_feature" not in batch
+    assert "next_observation_feature" not in batch
+
+
+@pytest.mark.parametrize(
+    "vision_encoder_name, freeze_vision_encoder, cached",
+    [("encoder", True, True), ("encoder", False, False), (None, True, False)],
+)
+def test_features_are_only_cached_for_a_frozen_encoder(
+    vision_encoder_name: str | None, freeze_vision_encoder: bool, cached: bool
+) -> None:
+    config = SimpleNamespace(
+        vision_encoder_name=vision_encoder_name, freeze_vision_encoder=freeze_vision_encoder
+    )
+    encoder = SimpleNamespace(image_keys=[IMAGE_KEY], get_cached_image_features=lambda images: images)
+    policy = SimpleNamespace(config=config, actor=SimpleNamespace(encoder=encoder))
+    extractor = make_observation_feature_extractor(policy=policy, device=torch.device("cpu"))
+    assert (extractor is not None) == cached
@@ -0,0 +1,121 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the sampling of the replay buffer in a worker process."""
+
+import inspect
+
+import torch
+
+from lerobot.policies.sac.configuration_sac import SACConfig
+from lerobot.rl.buffer import ReplayBuffer, ReplayBufferProcessSampler
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+IMAGE_KEY = f"{OBS_IMAGE}.front"
+CAPACITY = 16
+
+
+def add_transitions(buffer: ReplayBuffer, start: int, stop: int) -> None:
+    """Add transitions whose tensors are filled with their index, chained as in an episode."""
+
+    def observation(i: int) -> dict:
+        return {OBS_STATE: torch.full((1, 2), float(i)), IMAGE_KEY: torch.full((1, 3, 4, 4), float(i))}
+
+    for i in range(start, stop):
+        buffer.add(
+            state=observation(i),
+            action=torch.full((1, 2), float(i)),
+            reward=float(i),
+            next_state=observation(i + 1),
+            done=i == stop - 1,
+            truncated=False,
+        )
+
+
+def make_buffer(num_transitions: int) -> ReplayBuffer:
+    buffer = ReplayBuffer(CAPACITY, device="cpu", state_keys=[OBS_STATE, IMAGE_KEY], use_drq=False)
+    add_transitions(buffer, 0, num_transitions)
+    return buffer
+
+
+def record_indices(buffer: ReplayBuffer) -> list[torch.Tensor]:
+    """Record the indices drawn for the batches, in the order they are requested from the worker."""
+    indices = []
+    sample_indices = buffer._sample_indices
+
+    def recording_sample_indices(batch_size: int) -> torch.Tensor:
+        indices.append(sample_indices(batch_size))
+        return indices[-1]
+
+    buffer._sample_indices = recording_sample_indices
+    return indices
+
+
+def test_batches_match_the_buffer() -> None:
+    buffer = make_buffer(num_transitions=10)
+    indices = record_indices(buffer)
+    sampler = ReplayBufferProcessSampler(buffer, batch_size=6, num_slots=2)
+    try:
+        iterator = iter(sampler)
+        for i in range(5):
+            batch = next(iterator)
+            # Batches are gathered by the worker in the order their indices were drawn
+            idx = indices[i]
+            assert batch["state"][OBS_STATE].shape == (6, 2)
+            torch.testing.assert_close(batch["state"][OBS_STATE], buffer.states[OBS_STATE][idx])
+            torch.testing.assert_close(batch["state"][IMAGE_KEY], buffer.states[IMAGE_KEY][idx])
+            torch.testing.assert_close(batch["next_state"][IMAGE_KEY], buffer.next_states[IMAGE_KEY][idx])
+            torch.testing.assert_close(batch[ACTION], buffer.actions[idx])
+            torch.testing.assert_close(batch["reward"], buffer.rewards[idx])
+            torch.testing.assert_close(batch["done"], buffer.dones[idx].float())
+            torch.testing.assert_close(batch["next_state"][OBS_STATE], batch["state"][OBS_STATE] + 1)
+    finally:
+        sampler.close()
+
+    # The worker left its loop rather than being terminated
+    assert not sampler.worker.is_alive()
+    assert sampler.worker.exitcode == 0
+    # Closing twice is a no-op
+    sampler.close()
+
+
+def test_iterator_samples_added_transitions_and_closes_the_sampler(monkeypatch) -> None:
+    samplers = []
+    init = ReplayBufferProcessSampler.__init__
+
+    def recording_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        samplers.append(self)
+
+    monkeypatch.setattr(ReplayBufferProcessSampler, "__init__", recording_init)
+    buffer = make_buffer(num_transitions=4)
+    iterator = buffer.get_iterator(batch_size=64, multiprocess_prefetch=True)
+    try:
+        assert next(iterator)["reward"].max() < 4
+        # The storage is shared in place: the worker reads the transitions added by this process
+        add_transitions(buffer, 4, CAPACITY)
+        rewards = torch.cat([next(iterator)["reward"] for _ in range(4)])
+        assert rewards.max() >= 4
+        torch.testing.assert_close(buffer.states[OBS_STATE][rewards.long(), 0], rewards)
+    finally:
+        iterator.close()
+
+    assert len(samplers) == 1
+    assert not samplers[0].worker.is_alive()
+    assert samplers[0].worker.exitcode == 0
+
+
+def test_multiprocess_prefetch_is_off_by_default() -> None:
+    assert SACConfig().multiprocess_prefetch is False
+    assert inspect.signature(ReplayBuffer.get_iterator).parameters["multiprocess_prefetch"].default is False
@@ -0,0 +1,52 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for WeightedMixtureSampler: mixture proportions, source bounds, determinism."""
+
+import numpy as np
+import pytest
+
+from lerobot.datasets.sampler import WeightedMixtureSampler
+
+
+@pytest.mark.parametrize(
+    "weights, batch_size",
+    [([0.95, 0.05], 8), ([0.7, 0.3], 4), ([1.0, 2.0, 1.0], 3)],
+)
+def test_empirical_mixture_matches_weights(weights: list[float], batch_size: int) -> None:
+    """Over many batches, the share of frames of every source matches its normalized weight, even when the
+    batch size cannot hold the exact proportions."""
+    source_num_frames = [100, 50, 30][: len(weights)]
+    sampler = WeightedMixtureSampler(source_num_frames, weights, batch_size, num_samples=batch_size * 20_000)
+    indices = np.fromiter(iter(sampler), dtype=np.int64)
+    assert len(indices) == len(sampler)
+
+    sources = np.searchsorted(np.cumsum(source_num_frames), indices, side="right")
+    shares = np.bincount(sources, minlength=len(weights)) / len(indices)
+    np.testing.assert_allclose(shares, np.asarray(weights) / sum(weights), atol=0.01)
+
+
+def test_empty_source_is_never_drawn() -> None:
+    sampler = WeightedMixtureSampler([10, 0, 10], [1.0, 1.0, 1.0], batch_size=4, num_samples=400)
+    indices = np.fromiter(iter(sampler), dtype=np.int64)
+    assert indices.min() >= 0 and indices.max() < 20
+
+
+def test_sampling_is_deterministic_per_epoch() -> None:
+    sampler = WeightedMixtureSampler([10, 20], [0.5, 0.5], batch_size=4, num_samples=40, seed=3)
+    sampler.set_epoch(1)
+    first = list(sampler)
+    sampler.set_epoch(1)
+    assert list(sampler) == first
+    assert list(sampler) != first
@@ -0,0 +1,76 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for SharedFrameRing: publishing and reading frames, and readers lapped by the writer."""
+
+import os
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.shared_memory.frame_ring import SharedFrameRing
+
+SHAPE = (4, 6, 3)
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing.create(f"lerobot_test_{os.getpid()}", SHAPE, num_slots=3)
+    yield ring
+    ring.close()
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def test_publish_and_read(ring: SharedFrameRing) -> None:
+    assert ring.latest_seq == -1
+    assert ring.read_latest() is None
+
+    reader = SharedFrameRing.attach(ring.name)
+    try:
+        assert ring.publish(make_frame(1), timestamp=10.0) == 0
+        assert ring.publish(make_frame(2), timestamp=11.0) == 1
+        seq, timestamp, frame = reader.read_latest()
+        assert (seq, timestamp) == (1, 11.0)
+        np.testing.assert_array_equal(frame, make_frame(2))
+        assert not frame.flags.writeable
+        assert reader.wait_for_frame(after_seq=0, timeout_s=0.1) == 1
+        with pytest.raises(TimeoutError):
+            reader.wait_for_frame(after_seq=1, timeout_s=0.01)
+        del frame
+    finally:
+        reader.close()
+
+
+def test_lapped_view_is_not_current(ring: SharedFrameRing) -> None:
+    ring.publish(make_frame(1))
+    seq, _, view = ring.read_latest()
+    _, _, copy = ring.read_latest(copy=True)
+
+    # The writer wraps around the 3 slots, and overwrites the slot of the frame read
+    for value in range(2, 5):
+        ring.publish(make_frame(value))
+        assert ring.is_current(seq) == (value < 4)
+
+    np.testing.assert_array_equal(view, make_frame(4))
+    np.testing.assert_array_equal(copy, make_frame(1))
+    assert ring.read_latest()[0] == 3
+    del view
+
+
+def test_frame_of_other_shape_is_rejected(ring: SharedFrameRing) -> None:
+    with pytest.raises(ValueError):
+        ring.publish(np.zeros((2, 2, 3), dtype=np.uint8))
@@ -0,0 +1,80 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for MotorStatePoller: fresh snapshots, stale snapshots after failed polls, errors of the thread."""
+
+import time
+
+import pytest
+
+from lerobot.motors.state_poller import MotorStatePoller
+
+
+class FakeBus:
+    """Bus whose reads return an increasing position, or raise `error` once it is set."""
+
+    def __init__(self):
+        self.num_reads = 0
+        self.error: Exception | None = None
+
+    def sync_read(self, data_name, motors=None):
+        if self.error is not None:
+            raise self.error
+        self.num_reads += 1
+        return {"motor": self.num_reads}
+
+
+def test_latest_is_fresh() -> None:
+    bus = FakeBus()
+    poller = MotorStatePoller(bus, ["Present_Position"], fps=200)  # type: ignore[arg-type]
+    poller.start()
+    try:
+        first = poller.latest()
+        second = poller.wait_for_update(first.read_start, timeout=1.0)
+        assert second.values["Present_Position"]["motor"] > first.values["Present_Position"]["motor"]
+        assert poller.latest().age_s <= poller.max_age_s
+    finally:
+        poller.stop()
+
+
+def test_latest_raises_when_polls_keep_failing() -> None:
+    bus = FakeBus()
+    poller = MotorStatePoller(bus, ["Present_Position"], fps=200, max_age_s=0.05)  # type: ignore[arg-type]
+    poller.start()
+    try:
+        bus.error = ConnectionError("no status packet")
+        time.sleep(0.1)
+        with pytest.raises(TimeoutError, match="no status packet"):
+            poller.latest()
+        assert poller.num_errors > 0
+    finally:
+        poller.stop()
+
+
+def test_latest_reraises_the_error_which_stopped_the_thread() -> None:
+    bus = FakeBus()
+    poller = MotorStatePoller(bus, ["Present_Position"], fps=200)  # type: ignore[arg-type]
+    poller.start()
+    try:
+        bus.error = KeyError("Present_Position")
+        deadline = time.perf_counter() + 1.0
+        while poller.is_running and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert not poller.is_running
+        with pytest.raises(KeyError):
+            poller.latest()
+        with pytest.raises(KeyError):
+            poller.wait_for_update(time.perf_counter(), timeout=1.0)
+    finally:
+        poller.stop()
@@ -0,0 +1,58 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the mergeable running stats: aggregated episode sketches match the stats of the full data."""
+
+import numpy as np
+
+from lerobot.datasets.compute_stats import RunningQuantileStats, aggregate_stats, get_feature_stats
+
+
+def make_episodes(seed: int = 0) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # Episodes of different lengths and ranges, so that the histograms of the sketches need rebinning
+    return [
+        rng.normal(loc=i, scale=i + 1, size=(length, 3)).astype(np.float32)
+        for i, length in enumerate([40, 300, 1, 120])
+    ]
+
+
+def test_aggregated_sketches_match_full_data_stats() -> None:
+    episodes = make_episodes()
+    stats_list, sketches_list = [], []
+    for data in episodes:
+        stats, sketch = get_feature_stats(data, axis=0, keepdims=False, return_sketch=True)
+        stats_list.append({"observation.state": stats})
+        sketches_list.append({"observation.state": sketch})
+
+    aggregated = aggregate_stats(stats_list, sketches_list)["observation.state"]
+    full = get_feature_stats(np.concatenate(episodes), axis=0, keepdims=False)
+
+    for key in ("min", "max", "mean", "std", "count"):
+        np.testing.assert_allclose(aggregated[key], full[key], rtol=1e-5)
+    # Quantiles come from histograms, whose bin width bounds the error
+    bin_width = (full["max"] - full["min"]) / 5000
+    for key in ("q01", "q10", "q50", "q90", "q99"):
+        np.testing.assert_allclose(aggregated[key], full[key], atol=4 * bin_width.max())
+
+
+def test_sketch_round_trip() -> None:
+    running_stats = RunningQuantileStats()
+    running_stats.update(make_episodes()[1])
+    rebuilt = RunningQuantileStats.from_sketch(running_stats.to_sketch())
+
+    expected, actual = running_stats.get_statistics(), rebuilt.get_statistics()
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        np.testing.assert_allclose(actual[key], expected[key])
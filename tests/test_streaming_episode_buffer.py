@@ -0,0 +1,100 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the episode shuffle buffer of StreamingLeRobotDataset, created from the training config."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from lerobot.configs.default import DatasetConfig
+from lerobot.datasets.factory import make_dataset
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+REPO_ID = "lerobot/test_streaming_episode_buffer"
+NUM_EPISODES = 8
+EPISODE_LENGTH = 6
+
+
+@pytest.fixture(scope="module")
+def dataset_root(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("datasets") / "episode_buffer"
+    features = {
+        OBS_STATE: {"dtype": "float32", "shape": (2,), "names": None},
+        ACTION: {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = LeRobotDataset.create(REPO_ID, fps=10, root=root, features=features, use_videos=False)
+    for episode_index in range(NUM_EPISODES):
+        for frame_index in range(EPISODE_LENGTH):
+            state = np.array([episode_index, frame_index], dtype=np.float32)
+            dataset.add_frame({OBS_STATE: state, ACTION: state, "task": "test"})
+        dataset.save_episode()
+    dataset.finalize()
+    return root
+
+
+def make_streaming_dataset(root: Path, episode_buffer_size: int, episode_slice_length: int | None = None):
+    cfg = SimpleNamespace(
+        dataset=DatasetConfig(
+            repo_id=REPO_ID,
+            root=str(root),
+            streaming=True,
+            use_imagenet_stats=False,
+            streaming_episode_buffer_size=episode_buffer_size,
+            streaming_episode_slice_length=episode_slice_length,
+        ),
+        policy=SimpleNamespace(
+            reward_delta_indices=None, action_delta_indices=[0, 1], observation_delta_indices=None
+        ),
+        num_workers=1,
+        tolerance_s=1e-4,
+    )
+    return make_dataset(cfg)
+
+
+def streamed_episodes(dataset) -> list[int]:
+    frames = list(dataset)
+    # Every frame is streamed once, with its window
+    assert sorted((int(frame["episode_index"]), int(frame["frame_index"])) for frame in frames) == [
+        (episode_index, frame_index)
+        for episode_index in range(NUM_EPISODES)
+        for frame_index in range(EPISODE_LENGTH)
+    ]
+    for frame in frames:
+        assert frame[ACTION].shape == (2, 2)
+    return [int(frame["episode_index"]) for frame in frames]
+
+
+def num_episode_switches(episodes: list[int]) -> int:
+    return sum(previous != current for previous, current in zip(episodes, episodes[1:], strict=False))
+
+
+def test_config_enables_the_episode_buffer(dataset_root: Path) -> None:
+    dataset = make_streaming_dataset(dataset_root, episode_buffer_size=4, episode_slice_length=3)
+    assert dataset.episode_buffer_size == 4
+    assert dataset.episode_slice_length == 3
+
+
+def test_streamed_episodes_are_mixed_across_the_buffer(dataset_root: Path) -> None:
+    # With a buffer of a single episode, episodes are streamed one after the other
+    episodes = streamed_episodes(make_streaming_dataset(dataset_root, episode_buffer_size=1))
+    assert num_episode_switches(episodes) == NUM_EPISODES - 1
+
+    episodes = streamed_episodes(make_streaming_dataset(dataset_root, episode_buffer_size=4))
+    # The frames of the episodes of the buffer are interleaved
+    assert num_episode_switches(episodes) > 2 * NUM_EPISODES
+    assert len(set(episodes[: 2 * EPISODE_LENGTH])) > 2
@@ -0,0 +1,104 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the columnar transition batches: binary round-trip, and bulk insertion in the replay buffer."""
+
+import torch
+
+from lerobot.rl.buffer import ReplayBuffer
+from lerobot.transport.utils import (
+    bytes_to_transition_batch,
+    is_columnar_transitions_buffer,
+    stack_transitions,
+    transition_batch_to_bytes,
+)
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+
+IMAGE_KEY = f"{OBS_IMAGE}.front"
+
+
+def make_transitions(num_transitions: int, seed: int = 0) -> list[dict]:
+    generator = torch.Generator().manual_seed(seed)
+    transitions = []
+    for i in range(num_transitions):
+        transitions.append(
+            {
+                "state": {
+                    OBS_STATE: torch.randn(1, 4, generator=generator),
+                    IMAGE_KEY: torch.rand(1, 3, 8, 8, generator=generator),
+                },
+                ACTION: torch.randn(1, 2, generator=generator),
+                "reward": float(i),
+                "next_state": {
+                    OBS_STATE: torch.randn(1, 4, generator=generator),
+                    IMAGE_KEY: torch.rand(1, 3, 8, 8, generator=generator),
+                },
+                "done": i == num_transitions - 1,
+                "truncated": False,
+                "complementary_info": {"discrete_penalty": torch.tensor([float(-i)])},
+            }
+        )
+    return transitions
+
+
+def assert_batches_equal(left: dict, right: dict, atol: float = 0.0) -> None:
+    for group in ("state", "next_state", "complementary_info"):
+        assert left[group].keys() == right[group].keys()
+        for key in left[group]:
+            torch.testing.assert_close(left[group][key], right[group][key], atol=atol, rtol=0.0)
+    for key in (ACTION, "reward", "done", "truncated"):
+        torch.testing.assert_close(left[key], right[key], atol=atol, rtol=0.0)
+
+
+def test_columnar_round_trip() -> None:
+    batch = stack_transitions(make_transitions(5))
+    buffer = transition_batch_to_bytes(batch, metadata={"policy_version": 3})
+    assert is_columnar_transitions_buffer(buffer)
+
+    decoded = bytes_to_transition_batch(buffer)
+    assert decoded["metadata"] == {"policy_version": 3}
+    assert_batches_equal(decoded, batch)
+
+
+def test_columnar_round_trip_with_quantized_images() -> None:
+    batch = stack_transitions(make_transitions(5))
+    decoded = bytes_to_transition_batch(transition_batch_to_bytes(batch, quantize_images=True))
+    assert decoded["state"][IMAGE_KEY].dtype == torch.float32
+    # Images are sent as uint8, within half a quantization step of the original values
+    assert_batches_equal(decoded, batch, atol=0.5 / 255 + 1e-6)
+
+
+def test_add_batch_matches_add() -> None:
+    # More transitions than the capacity, so that both wrap around the ring buffer
+    transitions = make_transitions(13)
+    state_keys = [OBS_STATE, IMAGE_KEY]
+    one_by_one = ReplayBuffer(capacity=8, device="cpu", state_keys=state_keys, use_drq=False)
+    in_bulk = ReplayBuffer(capacity=8, device="cpu", state_keys=state_keys, use_drq=False)
+
+    for transition in transitions:
+        one_by_one.add(**transition)
+    in_bulk.add_batch(**stack_transitions(transitions[:3]))
+    in_bulk.add_batch(**stack_transitions(transitions[3:]))
+
+    assert in_bulk.position == one_by_one.position
+    assert len(in_bulk) == len(one_by_one)
+    for key in state_keys:
+        torch.testing.assert_close(in_bulk.states[key], one_by_one.states[key])
+        torch.testing.assert_close(in_bulk.next_states[key], one_by_one.next_states[key])
+    torch.testing.assert_close(in_bulk.actions, one_by_one.actions)
+    torch.testing.assert_close(in_bulk.rewards, one_by_one.rewards)
+    torch.testing.assert_close(in_bulk.dones, one_by_one.dones)
+    torch.testing.assert_close(
+        in_bulk.complementary_info["discrete_penalty"], one_by_one.complementary_info["discrete_penalty"]
+    )
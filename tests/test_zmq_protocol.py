@@ -0,0 +1,90 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the binary messages of the ZMQ camera: encoding and decoding of the data and images."""
+
+import cv2
+import numpy as np
+import pytest
+
+from lerobot.cameras.zmq.protocol import (
+    decode_message,
+    encode_message,
+    is_binary_message,
+    jpeg_frame,
+    message_image_names,
+    pack_message,
+)
+
+
+def make_images() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    # Smooth images, which JPEG compresses with a small error
+    ramp = np.linspace(0, 255, 64, dtype=np.float32)
+    smooth = np.stack([np.add.outer(ramp, ramp) / 2] * 3, axis=-1).astype(np.uint8)
+    return {"front": smooth[:48], "wrist": rng.integers(0, 256, (16, 24, 3), dtype=np.uint8)}
+
+
+def test_raw_round_trip() -> None:
+    images = make_images()
+    data = {"timestamps": {"front": 1.5, "wrist": 1.6}}
+    message = encode_message(data, images, codec="raw")
+    assert is_binary_message(message)
+    assert message_image_names(message) == ["front", "wrist"]
+
+    decoded_data, decoded_images = decode_message(message)
+    assert decoded_data == data
+    assert decoded_images.keys() == images.keys()
+    for name, image in images.items():
+        np.testing.assert_array_equal(decoded_images[name], image)
+        assert decoded_images[name].flags.writeable
+
+
+def test_jpeg_round_trip() -> None:
+    image = make_images()["front"]
+    _, decoded_images = decode_message(encode_message({}, {"front": image}, codec="jpeg", quality=95))
+    decoded = decoded_images["front"]
+    assert decoded.shape == image.shape and decoded.dtype == np.uint8
+    assert np.abs(decoded.astype(np.int16) - image).mean() < 2
+
+
+def test_mjpeg_round_trip() -> None:
+    # JPEG compressed by a camera, which holds the colors of the scene: here an RGB image with distinct channels
+    rgb = make_images()["front"].copy()
+    rgb[..., 0] //= 4
+    ok, jpeg = cv2.imencode(".jpg", cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR), [int(cv2.IMWRITE_JPEG_QUALITY), 95])
+    assert ok
+
+    message = pack_message({"timestamps": {"front": 2.0}}, [jpeg_frame("front", jpeg.tobytes(), rgb.shape)])
+    assert message_image_names(message) == ["front"]
+    data, decoded_images = decode_message(message)
+    assert data == {"timestamps": {"front": 2.0}}
+    decoded = decoded_images["front"]
+    assert decoded.shape == rgb.shape and decoded.dtype == np.uint8
+    # Decoded to RGB
+    assert np.abs(decoded.astype(np.int16) - rgb).mean() < 2
+
+
+def test_only_requested_images_are_decoded() -> None:
+    images = make_images()
+    _, decoded_images = decode_message(encode_message({}, images, codec="raw"), names=["wrist"])
+    assert list(decoded_images) == ["wrist"]
+    np.testing.assert_array_equal(decoded_images["wrist"], images["wrist"])
+
+
+def test_json_message_is_rejected() -> None:
+    message = b'{"front": ""}'
+    assert not is_binary_message(message)
+    with pytest.raises(ValueError):
+        decode_message(message)